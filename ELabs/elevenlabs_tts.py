@@ -1,12 +1,12 @@
 # generate audio using ElevenLabs
 import os
 import pandas as pd
-import numpy as np
 from elevenlabs import play, save
 from elevenlabs.client import ElevenLabs
 import utilities.utilities as u
 import utilities.config as conf
 from utilities.elevenlabs_model import DEFAULT_ELEVENLABS_MODEL_ID
+from utilities import audio_cache, gcs_uploader, master_store, tts_engine
 from ELabs import elevenlabs_utilities
 import time
 import sys
@@ -14,6 +14,13 @@ import sys
 from typing import Optional
 audio_client: Optional[ElevenLabs] = None
 
+
+# Create a response object that mimics what PlayHT returns for consistency
+class AudioResponse:
+    def __init__(self, content):
+        self.content = content
+        self.status_code = 200
+
 def retry_with_backoff(func, max_retries=3, base_delay=1, max_delay=60, backoff_factor=2):
     """
     Retry a function with exponential backoff
@@ -78,9 +85,17 @@ def main(
         output_file_path: str = None,
         item_id_column: str = 'item_id',
         audio_base_dir: str = None,
-        output_format: str = "mp3_44100_128"
+        output_format: str = "mp3_44100_128",
+        max_workers: Optional[int] = None
         ):
-        
+    """
+    Generate ElevenLabs audio for every row of ``input_file_path``.
+
+    Rows are dispatched concurrently through ``utilities.tts_engine``;
+    ``max_workers`` caps requests in flight (defaults to the ElevenLabs
+    limit in ``tts_engine.PROVIDER_LIMITS`` or ELEVENLABS_MAX_CONCURRENCY).
+    """
+
     # basically we want to iterate through rows,
     # specifying the column (language) we want translated.
     # We assume that our caller has already massaged our input file as needed
@@ -88,7 +103,8 @@ def main(
     # item_id,labels,en,es-CO,de,context
 
     inputData = pd.read_csv(input_file_path)
-    masterData = pd.read_csv(master_file_path) if master_file_path else None
+    # Indexed master cache: one upsert per clip, CSV exported once at the end
+    masterData = master_store.get_store(master_file_path) if master_file_path else None
 
     # build API call
     # Initialize ElevenLabs client once per call
@@ -110,48 +126,45 @@ def main(
     voice_id = configured_voice_id
     print(f"Using configured voice_id '{voice_id}' for language '{lang_code}' (display voice: '{voice}')")
 
-    total_items = len(inputData)
-    for idx, (index, ourRow) in enumerate(inputData.iterrows(), 1):
-        try:
-            print(f"\n📊 Progress: {idx}/{total_items} ({idx/total_items*100:.1f}%) - Processing '{ourRow['item_id']}'")
-            
-            result = processRow(index, ourRow, lang_code=lang_code, voice=voice, voice_id=voice_id, \
-                                audio_base_dir=audio_base_dir, masterData=masterData, \
-                                headers=None, output_format=output_format, model_id=model_id)
-            
-            # replace with match once we are past python 3.10
-            if result == 'Error':
-                stats['Errors']+= 1
-            elif result == 'NoTask':
-                stats['NoTask']+= 1
-            elif result == 'Success':
-                stats['Processed']+= 1
-            else:
-                # Handle any unexpected return values as errors
-                print(f"⚠️ Unexpected result from processRow: {result} - counting as error")
-                stats['Errors']+= 1
-                
-            # Show running totals every 10 items
-            if idx % 10 == 0:
-                print(f"📈 Running totals: ✅ {stats['Processed']} processed, ❌ {stats['Errors']} errors, ⏭️  {stats['NoTask']} skipped")
-                
-        except KeyboardInterrupt:
-            print(f"\n🛑 Process interrupted by user at item {idx}/{total_items}")
-            print(f"📊 Final stats: ✅ {stats['Processed']} processed, ❌ {stats['Errors']} errors, ⏭️  {stats['NoTask']} skipped")
-            print(f"💡 You can resume by running the same command again - it will skip already generated files.")
-            sys.exit(0)
-        except Exception as e:
-            print(f"❌ Unexpected error processing '{ourRow['item_id']}': {str(e)}")
-            stats['Errors']+= 1
-    
+    limiter = tts_engine.get_limiter('ElevenLabs', max_concurrency=max_workers)
+    print(f"Dispatching with up to {limiter.max_concurrency} concurrent ElevenLabs requests "
+          f"({limiter.rate_per_minute:g}/min)")
+
+    def _process(index, ourRow):
+        return processRow(index, ourRow, lang_code=lang_code, voice=voice, voice_id=voice_id, \
+                          audio_base_dir=audio_base_dir, masterData=masterData, \
+                          headers=None, output_format=output_format, model_id=model_id)
+
+    stats.update(tts_engine.run_rows(
+        inputData.iterrows(),
+        _process,
+        total=len(inputData),
+        max_workers=limiter.max_concurrency,
+        label=lang_code,
+    ))
+
+    # Wait for this run's background GCS uploads and surface per-file failures
+    stats['UploadErrors'] = len(gcs_uploader.flush(lang_code))
+
+    if masterData is not None:
+        masterData.export_csv()
+
     # start tracking voice
     stats['Voice'] = voice
 
+    cache = audio_cache.get_cache()
+    if cache:
+        cache_stats = cache.stats(lang_code)
+        stats['CacheHits'] = cache_stats['hits']
+        stats['CacheMisses'] = cache_stats['misses']
+
     # Store stats for retrieval by dashboard
     u.store_stats(lang_code, stats['Errors'], stats['NoTask'], stats['Voice'])
 
     print(f"Processed: {stats['Processed']}, Errors: {stats['Errors']}, \
           No Task: {stats['NoTask']}")
+    if cache:
+        print(f"Audio cache: {stats['CacheHits']} hits, {stats['CacheMisses']} misses")
     
     # Return stats for use by the calling function
     return stats
@@ -189,6 +202,8 @@ def processRow(index, ourRow, lang_code, voice, voice_id, \
     # Show what we're about to generate
     print(f"🎵 Generating audio for '{ourRow['item_id']}': {translation_text[:100]}{'...' if len(translation_text) > 100 else ''}")
     
+    target_path = u.audio_file_path(ourRow['labels'], ourRow['item_id'], audio_base_dir, lang_code)
+
     def generate_audio_with_retry():
         audio = audio_client.text_to_speech.convert(
             text=translation_text,
@@ -197,33 +212,35 @@ def processRow(index, ourRow, lang_code, voice, voice_id, \
             output_format=output_format
         )
 
-        # Create a response object that mimics what PlayHT returns for consistency
-        class AudioResponse:
-            def __init__(self, content):
-                self.content = content
-                self.status_code = 200
-        
-        # The new API returns audio data directly as bytes
-        if hasattr(audio, 'content'):
-            audio_bytes = audio.content
-        elif hasattr(audio, '__iter__') and not isinstance(audio, (str, bytes)):
-            # If it's a generator, convert to bytes
-            audio_bytes = b''.join(audio)
-        else:
-            # If it's already bytes
-            audio_bytes = audio
-            
-        return AudioResponse(audio_bytes)
+        # The SDK returns a generator of MP3 chunks; pipe them straight into a
+        # temp file next to the target (hashing as we go) instead of joining
+        # the whole clip in memory. A failed attempt removes its temp file.
+        return u.stream_audio_to_temp(audio, target_path)
     
+    # Identical (text, voice, model, format) requests reuse previously paid-for audio
+    cache = audio_cache.get_cache()
+    cache_key = audio_cache.cache_key(translation_text, voice_id, model_id, output_format) if cache else None
+
+    audioData = None
     try:
-        # Use retry mechanism for the API call
-        audioData = retry_with_backoff(generate_audio_with_retry, max_retries=3, base_delay=2)
-        
-        if audioData is None:
-            print(f"❌ Failed to generate audio for '{ourRow['item_id']}' after all retries")
-            return 'Error'
-        
-        print(f"✅ Successfully generated {len(audioData.content)} bytes of audio for '{ourRow['item_id']}'")
+        cached_bytes = cache.get(cache_key, tag=lang_code) if cache else None
+        if cached_bytes:
+            audioData = AudioResponse(cached_bytes)
+            print(f"♻️  Reusing cached audio ({len(cached_bytes)} bytes) for '{ourRow['item_id']}'")
+        else:
+            # Use retry mechanism for the API call; the limiter holds a request slot
+            # and pauses every worker when ElevenLabs answers 429.
+            limiter = tts_engine.get_limiter('ElevenLabs')
+            audioData = retry_with_backoff(lambda: limiter.call(generate_audio_with_retry), max_retries=3, base_delay=2)
+
+            if audioData is None:
+                print(f"❌ Failed to generate audio for '{ourRow['item_id']}' after all retries")
+                return 'Error'
+
+            print(f"✅ Successfully generated {audioData.size} bytes of audio for '{ourRow['item_id']}' "
+                  f"(sha256 {audioData.sha256[:12]})")
+            if cache:
+                cache.put_file(cache_key, audioData.temp_path)
         
         # Use our unified save_audio function with ID3 tags
         service = 'ElevenLabs'
@@ -243,17 +260,17 @@ def processRow(index, ourRow, lang_code, voice, voice_id, \
             return result
         else:
             print(f'Generated audio for {ourRow["item_id"]}')
+            if isinstance(audioData, u.StreamedAudio):
+                audioData.discard()
             
             # Still need to update master data for tracking
             if masterData is not None:
-                masterData[lang_code] = \
-                    np.where(masterData["item_id"] == ourRow["item_id"], \
-                    translation_text, masterData[lang_code])
-
-                # write as we go, so erroring out doesn't lose progress
-                masterData.to_csv("translation_master.csv", index=False)
+                u.update_master(masterData, ourRow["item_id"], lang_code, translation_text,
+                                service='ElevenLabs', voice=voice, model_id=model_id)
             return 'Success'
 
     except Exception as e:
+        if isinstance(audioData, u.StreamedAudio):
+            audioData.discard()
         print(f'❌ Failed to generate audio for {ourRow["item_id"]}: {translation_text[:50]}... - Error: {e}')
         return 'Error'
@@ -24,6 +24,10 @@ def get_client(explicit_api_key: Optional[str] = None) -> ElevenLabs:
         raise RuntimeError(
             "Missing ElevenLabs API key. Set ELEVEN_API_KEY or pass api_key explicitly."
         )
+    # ELEVENLABS_BASE_URL lets tests point the client at a local fake TTS server.
+    base_url = os.getenv("ELEVENLABS_BASE_URL")
+    if base_url:
+        return ElevenLabs(api_key=api_key, base_url=base_url)
     return ElevenLabs(api_key=api_key)
 
 def list_voices(lang_code, gender_filter=None, client: Optional[ElevenLabs] = None):
@@ -52,15 +52,21 @@ import requests
 from dataclasses import dataclass, replace
 from datetime import datetime
 import utilities.utilities as u
+from utilities import audio_cache, gcs_uploader, master_store, tts_engine
 from . import voice_mapping
 import utilities.config as conf
 
 # Constants for API v2 - Updated to new PlayHt API
-API_URL = "https://api.play.ht/api/v2/tts/stream"
+# PLAYHT_API_URL lets tests point requests at a local fake TTS server.
+API_URL = os.environ.get("PLAYHT_API_URL", "https://api.play.ht/api/v2/tts/stream")
 RATE_LIMIT = 10
 
-start_time = time.perf_counter()
-request_count = 0
+
+# Create a response object that mimics the old audioData structure
+class AudioResponse:
+    def __init__(self, content):
+        self.content = content
+        self.status_code = 200
 
 # Called to process each row of the input csv (now dataframe)
 def processRow(index, ourRow, lang_code, voice, \
@@ -70,10 +76,8 @@ def processRow(index, ourRow, lang_code, voice, \
     retrySeconds = 1 # sort of arbitrary backoff to recheck status
     service = 'PlayHt'
 
-    # used to limit number of requests to < 10 per minute
-    global request_count
-    global start_time
-    global rate_limit
+    # Shared limiter keeps us under RATE_LIMIT requests per minute across workers
+    limiter = tts_engine.get_limiter('PlayHt')
 
     # we should potentially filter these out when we generate diffs
     # instead of waiting until now. But at some point we might
@@ -127,33 +131,33 @@ def processRow(index, ourRow, lang_code, voice, \
     if '<' in ssml_text and '>' in ssml_text:
         data["text_type"] = "ssml"
 
-    # current plan allows 10 requests per minute, so wait for end of minute after 10 requests
-    request_count += 1
-    if request_count > RATE_LIMIT:
-      print(f"🕒 Waiting to avoid exceeding rate limit of {RATE_LIMIT} requests per minute...")
-      end_time = time.perf_counter()
-      time_left = 60 - (end_time - start_time)
-      time.sleep(time_left)
-      start_time = time.perf_counter()
-      request_count = 1
+    # Identical (text, voice, engine, format) requests reuse previously paid-for audio
+    cache = audio_cache.get_cache()
+    if cache:
+        cache_key = audio_cache.cache_key(
+            data["text"], voice, data["voice_engine"], f"{data['output_format']}_{data['sample_rate']}"
+        )
+        cached_bytes = cache.get(cache_key, tag=lang_code)
+        if cached_bytes:
+            print(f"♻️  Reusing cached audio ({len(cached_bytes)} bytes) for item {ourRow['item_id']}")
+            return u.save_audio(ourRow, lang_code, service, AudioResponse(cached_bytes), audio_base_dir, masterData, voice)
 
     ## Use a While loop so we can retry odd failure cases
     while True and errorCount < 5:
         try:
-            response = requests.post(API_URL, headers=headers, json=data, timeout=30)
+            # current plan allows RATE_LIMIT requests per minute; the limiter's
+            # token bucket spaces requests out instead of sleeping per minute
+            with limiter.slot():
+                response = requests.post(API_URL, headers=headers, json=data, timeout=30)
             
             # Handle different status codes for v2 API
             if response.status_code == 200:
                 # v2 API returns audio content directly
                 print(f"✅ PlayHt v2 API success for item {ourRow['item_id']} - received {len(response.content)} bytes")
                 
-                # Create a response object that mimics the old audioData structure
-                class AudioResponse:
-                    def __init__(self, content):
-                        self.content = content
-                        self.status_code = 200
-                
                 audioData = AudioResponse(response.content)
+                if cache:
+                    cache.put(cache_key, response.content)
                 
                 if ourRow['labels'] != float('nan'):
                     return u.save_audio(ourRow, lang_code, service, audioData, audio_base_dir, masterData, voice)
@@ -170,9 +174,11 @@ def processRow(index, ourRow, lang_code, voice, \
                 
             elif response.status_code == 429:
                 # Rate limit exceeded
-                retry_after = response.headers.get('Retry-After', retrySeconds * 2)
+                retry_after = tts_engine.parse_retry_after(
+                    response.headers.get('Retry-After'), default=retrySeconds * 2)
                 print(f"Rate limit exceeded for item {ourRow['item_id']}. Waiting {retry_after} seconds...")
-                time.sleep(int(retry_after))
+                # Pause every worker, not just this one, until the window reopens
+                limiter.backoff(retry_after)
                 errorCount += 1
                 continue
                 
@@ -236,6 +242,8 @@ Args:
     api_key (str, optional): The api key authenticating our API calls. If not provided, it will be read from the environment variable 'PLAY_DOT_HT_API_KEY'.
     item_id_column (str, optional): column name in the input file for stable and unique item ID. Defaults to 'item_id'.
     audio_dir (str, optional): The directory to store the audio files. Defaults to "audio_files/{lang_code}/".
+    max_workers (int, optional): Requests in flight at once. Defaults to the PlayHt entry in
+        utilities.tts_engine.PROVIDER_LIMITS (or PLAYHT_MAX_CONCURRENCY).
 """
 def main(
         input_file_path: str,
@@ -247,7 +255,8 @@ def main(
         api_key: str = None,
         output_file_path: str = None,
         item_id_column: str = 'item_id',
-        audio_base_dir: str = None
+        audio_base_dir: str = None,
+        max_workers: Optional[int] = None
         ):
         
 
@@ -270,15 +279,16 @@ def main(
         raise ImportError("pandas is required for CSV processing. Install with: pip install pandas")
     
     inputData = pd.read_csv(input_file_path)
-    masterData = pd.read_csv(master_file_path) if master_file_path else None
+    # Indexed master cache: one upsert per clip, CSV exported once at the end
+    masterData = master_store.get_store(master_file_path) if master_file_path else None
 
     # Rename columns to match lang_codes used in the script
     if masterData is not None:
-        masterData = masterData.rename(columns={'en': 'en-US',
-                                                 'de': 'de-DE',
-                                                 'es': 'es-CO',
-                                                 'fr': 'fr-CA',
-                                                 'nl': 'nl-NL'})
+        masterData.rename_columns({'en': 'en-US',
+                                   'de': 'de-DE',
+                                   'es': 'es-CO',
+                                   'fr': 'fr-CA',
+                                   'nl': 'nl-NL'})
 
     # build API call for v2 API
     headers = {
@@ -289,28 +299,46 @@ def main(
     }
     
     stats = {'Errors': 0, 'Processed' : 0, 'NoTask': 0}
-    for index, ourRow in inputData.iterrows():
+    limiter = tts_engine.get_limiter('PlayHt', max_concurrency=max_workers)
 
-        result = processRow(index, ourRow, lang_code=lang_code, voice=voice, \
-                            audio_base_dir=audio_base_dir, masterData=masterData, \
-                            headers=headers, ssml=False)
-        
-        # replace with match once we are past python 3.10
-        if result == 'Error':
-            stats['Errors']+= 1
-        elif result == 'NoTask':
-            stats['NoTask']+= 1
-        elif result == 'Success':
-            stats['Processed']+= 1
+    def _process(index, ourRow):
+        return processRow(index, ourRow, lang_code=lang_code, voice=voice, \
+                          audio_base_dir=audio_base_dir, masterData=masterData, \
+                          headers=headers, ssml=False)
+
+    stats.update(tts_engine.run_rows(
+        inputData.iterrows(),
+        _process,
+        total=len(inputData),
+        max_workers=limiter.max_concurrency,
+        label=lang_code,
+    ))
+
+    # Wait for this run's background GCS uploads and surface per-file failures
+    stats['UploadErrors'] = len(gcs_uploader.flush(lang_code))
+
+    if masterData is not None:
+        masterData.export_csv()
     
     # start tracking voice
     stats['Voice'] = voice
 
+    cache = audio_cache.get_cache()
+    if cache:
+        cache_stats = cache.stats(lang_code)
+        stats['CacheHits'] = cache_stats['hits']
+        stats['CacheMisses'] = cache_stats['misses']
+
     # Store stats for retrieval by dashboard
     u.store_stats(lang_code, stats['Errors'], stats['NoTask'], stats['Voice'])
 
     print(f"Processed: {stats['Processed']}, Errors: {stats['Errors']}, \
           No Task: {stats['NoTask']}")
+    if cache:
+        print(f"Audio cache: {stats['CacheHits']} hits, {stats['CacheMisses']} misses")
+
+    # Return stats for use by the calling function
+    return stats
 
 if __name__ == "__main__":
     main(*sys.argv[1:])
@@ -4,11 +4,14 @@ import numpy as np
 import sys
 import argparse
 import sqlite3
+import time
 from pathlib import Path
 import utilities.config as conf
 import utilities.utilities as u
+from utilities import master_store, regen_planner, tts_engine
 from utilities.elevenlabs_model import DEFAULT_ELEVENLABS_MODEL_ID
-from typing import Optional, Set
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Set, Tuple
 
 # TTS imports are now conditional - moved to where they're actually used
 
@@ -16,6 +19,14 @@ from typing import Optional, Set
 # language_dict = conf.get_languages()
 
 
+class LanguageGenerationError(RuntimeError):
+    """Raised after a run in which one or more languages failed to generate."""
+
+    def __init__(self, languages: List[str]):
+        self.languages = list(languages)
+        super().__init__(f"Generation failed for: {', '.join(self.languages)}")
+
+
 def _load_translation_data_from_csv(csv_path: str) -> pd.DataFrame:
     print(f"Loading source translations from: {csv_path}")
     try:
@@ -191,6 +202,35 @@ def _filter_rows_by_tasks(translation_data: pd.DataFrame, tasks_filter: Optional
     return filtered
 
 
+def _resolve_languages(selection, language_dict: dict) -> List[str]:
+    """
+    Turn a language selection into configured display names.
+
+    Accepts display names or locale codes (case-insensitive), either as a
+    list or a comma-separated string; "all" selects every configured language.
+    Unknown entries are passed through so the caller can report them.
+    """
+    tokens = selection.split(',') if isinstance(selection, str) else list(selection)
+    tokens = [str(t).strip() for t in tokens if str(t).strip()]
+    if any(t.lower() in ('all', '*') for t in tokens):
+        return list(language_dict.keys())
+
+    lookup = {}
+    for name, cfg in language_dict.items():
+        lookup[name.lower()] = name
+        code = str(cfg.get('lang_code') or '').lower()
+        if code:
+            lookup.setdefault(code, name)
+            lookup.setdefault(code.replace('-', '_'), name)
+
+    resolved = []
+    for token in tokens:
+        name = lookup.get(token.lower(), token)
+        if name not in resolved:
+            resolved.append(name)
+    return resolved
+
+
 def generate_audio(
     language,
     force_regenerate: bool = False,
@@ -199,10 +239,26 @@ def generate_audio(
     translation_source: str = "draft",
     sqlite_db_path: str = "tmp/itembank_by_task_regen.sqlite",
     model_id: str = DEFAULT_ELEVENLABS_MODEL_ID,
-    tasks_filter: Optional[Set[str]] = None
+    tasks_filter: Optional[Set[str]] = None,
+    max_workers: Optional[int] = None,
+    plan_only: bool = False,
+    audio_inventory: str = "local"
 ):
+    """
+    Generate missing or stale audio for one or more languages.
+
+    Translation data and the master cache are loaded once and shared by every
+    language. ``language`` is a display name, a comma-separated list of names
+    or locale codes, a list of those, or "all". ``audio_inventory`` picks
+    where the planner looks for existing clips: the local audio folder
+    ("local") or one listing of ``audio/<lang_code>/`` in the draft bucket
+    ("gcs").
+
+    Returns:
+        dict: ``{language: plan summary}`` in plan-only mode, otherwise None
+    """
     print("=== Starting Audio Generation for Levante Translations ===")
-    print(f"Target Language: {language}")
+    print(f"Target Language: {language if isinstance(language, str) else ', '.join(language)}")
     print(f"Using simplified folder structure: audio_files/<language_code>/")
     print("Audio quality: mp3_44100_128 (dashboard-aligned default)")
     if force_regenerate:
@@ -219,6 +275,11 @@ def generate_audio(
     except Exception as e:
         print(f"⚠️  Warning: Could not load latest language configuration: {e}")
         language_dict = {}
+
+    languages = _resolve_languages(language, language_dict)
+    if not languages:
+        print("No languages selected; nothing to generate.")
+        return
     
     if translation_source == "draft":
         print("Using runtime draft-bucket source (generated at run time)")
@@ -286,7 +347,9 @@ def generate_audio(
     if selected_translation_source == "csv":
         # Never overwrite the source CSV with a task-filtered subset.
         # The partner dashboard reads this file from GCS, so truncating it would hide items.
-        if tasks_filter is None:
+        if plan_only:
+            print("Skipping source CSV writeback in plan-only mode.")
+        elif tasks_filter is None:
             translationData.to_csv(input_file_name, encoding='utf-8', errors='replace')
         else:
             print("Skipping source CSV writeback because --tasks filter is active.")
@@ -294,66 +357,38 @@ def generate_audio(
     masterData = None
     if selected_translation_source == "csv":
         master_file_path = "translation_master.csv"
-        # The "master file" of already generated strings
-        if os.path.exists(master_file_path):
-            try:
-                print(f"Loading existing master file: {master_file_path}")
-                # Try robust parser first
-                try:
-                    from utilities.robust_csv_parser import parse_csv_robust
-                    master_data_list = parse_csv_robust(master_file_path)
-                    masterData = pd.DataFrame(master_data_list)
-                    print(f"SUCCESS: Loaded {len(masterData)} rows with {len(masterData.columns)} columns using robust parser")
-                except Exception as robust_error:
-                    print(f"Robust parser failed for master file: {robust_error}")
-                    print("Falling back to standard pandas parsing...")
-                    masterData = pd.read_csv(master_file_path)
-                    print(f"SUCCESS: Loaded {len(masterData)} rows with {len(masterData.columns)} columns")
-
-            except pd.errors.ParserError as e:
-                print(f"ERROR: The master CSV file '{master_file_path}' is corrupted or has formatting issues.")
-                print(f"Details: {str(e)}")
-                print(f"Solution: Use the robust CSV parser to fix it:")
-                print(f"  python utilities/robust_csv_parser.py {master_file_path} {master_file_path}_fixed")
-                print(f"Or delete '{master_file_path}' and run the script again to create a fresh one.")
-                return
-
-            except Exception as e:
-                print(f"ERROR: Failed to read master file '{master_file_path}'")
-                print(f"Details: {str(e)}")
-                print(f"Solution: Check file permissions, try the robust parser, or delete the file to create a fresh one.")
-                return
-
-            # Add any missing language columns that might be needed
-            for lang_config in language_dict.values():
-                lang_code_temp = lang_config['lang_code']
-                if lang_code_temp not in masterData.columns:
-                    masterData[lang_code_temp] = None
-                    print(f"Added missing column {lang_code_temp} to master data")
+        # The "master file" of already generated strings. It lives in an indexed
+        # SQLite store (tmp/translation_master.sqlite) and is exported back to
+        # translation_master.csv for the dashboard; an existing CSV is imported.
+        try:
+            masterData = master_store.get_store(master_file_path)
+        except Exception as e:
+            print(f"ERROR: Failed to load master cache from '{master_file_path}'")
+            print(f"Details: {str(e)}")
+            print(f"Solution: Use the robust CSV parser to fix it:")
+            print(f"  python utilities/robust_csv_parser.py {master_file_path} {master_file_path}_fixed")
+            print(f"Or delete '{master_file_path}' and {master_store.DEFAULT_DB_PATH} and run the script again to create a fresh one.")
+            return
 
-        else:
+        config_lang_codes = [lang_config['lang_code'] for lang_config in language_dict.values()]
+        if masterData.is_empty():
             # Create a "null state" generation status file
             # so that we know what needs to be generated
-            masterData = translationData.copy(deep=True)
+            baseline = translationData.copy(deep=True)
 
             # Initialize all language columns from config
-            for lang_config in language_dict.values():
-                lang_code = lang_config['lang_code']
-                masterData[lang_code] = None
-            masterData.to_csv(master_file_path, index=False, encoding='utf-8', errors='replace')
-            # Create baseline masterData
+            for lang_code_temp in config_lang_codes:
+                baseline[lang_code_temp] = None
+            masterData.replace_from_dataframe(baseline)
+        else:
+            print(f"Loaded master cache: {master_file_path} ({masterData.db_path})")
+            # Add any missing language columns that might be needed
+            for lang_code_temp in masterData.ensure_columns(config_lang_codes):
+                print(f"Added missing column {lang_code_temp} to master data")
 
         # add blank rows in master data for any missing items that are in translation data
-        blank_row = [""] * (len(masterData.columns) - 1)
-        currently_tracked_ids = list(masterData["item_id"])
-        modified_master_data = False
-        for item in translationData["item_id"]:
-            if item not in currently_tracked_ids:
-              masterData.loc[len(masterData)] = [item, *blank_row]
-              modified_master_data = True
-
-        if modified_master_data:
-          masterData.to_csv(master_file_path, encoding='utf-8', errors='replace', index=False)
+        masterData.ensure_items(translationData["item_id"])
+        masterData.export_csv()
     else:
         print("Using SQLite-backed generation state; skipping translation_master.csv cache.")
 
@@ -363,33 +398,100 @@ def generate_audio(
     # translationData is the exported csv from Crowdin
     # masterData is our state of generated audio files
 
+    # Plan every requested locale against the data loaded once above
+    jobs = []
+    for name in languages:
+        if name not in language_dict:
+            print(f"❌ Unknown language '{name}'; skipping")
+            continue
+        job = _plan_language(
+            name,
+            language_dict[name],
+            translationData,
+            masterData,
+            master_file_path,
+            audio_base_dir,
+            force_regenerate=force_regenerate,
+            force_id=force_id,
+            model_id=model_id,
+            plan_only=plan_only,
+            audio_inventory=audio_inventory,
+        )
+        if job is not None:
+            jobs.append(job)
+
+    if plan_only:
+        for job in jobs:
+            print(f"\n📋 PLAN-ONLY MODE: nothing generated for {job['language']}")
+        return {job['language']: job['summary'] for job in jobs}
+
+    # One diff file per locale so concurrent languages don't overwrite each other
+    for job in jobs:
+        job['diff_file_name'] = (
+            diff_file_name if len(languages) == 1
+            else diff_file_name.replace('.csv', f".{job['lang_code']}.csv")
+        )
+
+    results, failed = _dispatch_languages(
+        jobs,
+        master_file_path=master_file_path,
+        audio_base_dir=audio_base_dir,
+        model_id=model_id,
+        max_workers=max_workers,
+    )
+    for job in jobs:
+        _report_language(job, results.get(job['language']), translationData)
+    if failed:
+        raise LanguageGenerationError(failed)
+
+
+def _plan_language(
+    language: str,
+    our_language: dict,
+    translationData: pd.DataFrame,
+    masterData,
+    master_file_path: Optional[str],
+    audio_base_dir: str,
+    force_regenerate: bool = False,
+    force_id: bool = False,
+    model_id: str = DEFAULT_ELEVENLABS_MODEL_ID,
+    plan_only: bool = False,
+    audio_inventory: str = "local",
+) -> Optional[dict]:
+    """
+    Decide which items of one language need audio.
+
+    Returns:
+        dict: Job description (language, lang_code, service, voice, voice_id,
+        plan, summary, diffData), or None when the language can't be generated
+    """
     # get lang_code from language config
-    our_language = language_dict[language]
     lang_code = our_language['lang_code']
     # We need to support different services for different languages
     service = our_language['service']
     voice = our_language['voice']
     voice_id = str(our_language.get('voice_id') or '').strip()
 
-    if service == 'ElevenLabs' and not voice_id:
+    if service == 'ElevenLabs' and not voice_id and not plan_only:
         print(
             f"❌ Missing voice_id for '{language}' ({lang_code}). "
             "ElevenLabs generation is now voice-id-first; "
             "configure language_config with voice_id. "
             f"Current display voice: '{voice}'."
         )
-        return
+        return None
     
     # If force-regenerate is enabled, clear master cache for this language
-    if force_regenerate and masterData is not None and master_file_path:
+    if force_regenerate and plan_only:
+        print("📋 PLAN-ONLY MODE: master cache left untouched")
+    elif force_regenerate and masterData is not None and master_file_path:
         try:
-            if lang_code not in masterData.columns:
+            if lang_code not in masterData.columns():
                 print(f"Master data missing column {lang_code}; creating it before clearing cache...")
-                masterData[lang_code] = None
             else:
                 print(f"🧹 Clearing translation cache for language column '{lang_code}' in {master_file_path}")
-                masterData[lang_code] = None
-            masterData.to_csv(master_file_path, index=False, encoding='utf-8', errors='replace')
+            masterData.clear_column(lang_code)
+            masterData.export_csv()
             print(f"✅ Cleared master cache for {lang_code}")
         except Exception as e:
             print(f"⚠️  Warning: Failed to clear master cache for {lang_code}: {e}")
@@ -408,6 +510,91 @@ def generate_audio(
     # Don't rename the column we're currently working with to avoid cache issues
     # Do not rename masterData language columns implicitly
 
+    # Plan the whole locale in one vectorized pass (translations x master cache x
+    # audio inventory); only files the master cache can't vouch for get an ID3 check.
+    plan_start = time.perf_counter()
+    inventory = None
+    if audio_inventory == "gcs":
+        inventory = regen_planner.gcs_inventory(lang_code)
+        print(f"Listed {len(inventory)} clips for {lang_code} in the draft bucket")
+    plan = regen_planner.build_plan(
+        translationData,
+        lang_code,
+        voice,
+        service,
+        model_id=model_id if service == 'ElevenLabs' else None,
+        audio_base_dir=audio_base_dir,
+        master=masterData,
+        inventory=inventory,
+        force=force_regenerate,
+    )
+    job = {
+        'language': language,
+        'lang_code': lang_code,
+        'service': service,
+        'voice': voice,
+        'voice_id': voice_id,
+        'plan': plan,
+        'summary': regen_planner.summarize_plan(plan, lang_code, time.perf_counter() - plan_start),
+    }
+    if plan_only:
+        return job
+
+    needs_audio = regen_planner.needs_generation(plan)
+    check_mask = plan["status"] == "unverified"
+    if force_id:
+        # Files without ID3 tags are only caught by reading the tags themselves
+        check_mask |= plan["status"] == "up-to-date"
+    if check_mask.any():
+        from utilities.audio_validation import needs_regeneration
+
+        expected_model_id = model_id if service == 'ElevenLabs' else None
+        verified = 0
+        print(f"🔍 Checking ID3 tags for {int(check_mask.sum())} files not covered by the master cache...")
+        for idx in plan.index[check_mask]:
+            row = plan.loc[idx]
+            needs_regen, reason = needs_regeneration(
+                row["audio_path"],
+                row["text"],
+                voice,
+                service,
+                lang_code,
+                force_id,
+                current_model_id=expected_model_id
+            )
+            if needs_regen:
+                print(f'🔄 Audio needs regeneration: {reason}')
+                plan.loc[idx, "reason"] = reason
+                needs_audio.loc[idx] = True
+            elif masterData is not None and row["status"] == "unverified":
+                # Backfill the master cache so the next plan trusts this file
+                u.update_master(masterData, row["item_id"], lang_code, row["text"],
+                                service=service, voice=voice, model_id=expected_model_id or "")
+                verified += 1
+        if verified:
+            masterData.export_csv()
+            print(f"✅ Recorded {verified} verified files in the master cache")
+
+    for _, row in plan[needs_audio].iterrows():
+        print(f'Need to generate audio for: {row["item_id"]} -> {row["audio_path"]} ({row["reason"]})')
+
+    job['diffData'] = translationData.loc[needs_audio.values]
+    return job
+
+
+def _run_language(
+    job: dict,
+    master_file_path: Optional[str],
+    audio_base_dir: str,
+    model_id: str = DEFAULT_ELEVENLABS_MODEL_ID,
+    max_workers: Optional[int] = None,
+):
+    """Write the job's diff file and hand it to the language's TTS provider."""
+    language = job['language']
+    lang_code = job['lang_code']
+    diffData = job['diffData']
+    diff_file_name = job['diff_file_name']
+
     # remove the diff file to reset
     if os.path.exists(diff_file_name):
         try:
@@ -417,149 +604,123 @@ def generate_audio(
             import stat
             os.chmod(diff_file_name, stat.S_IWRITE)
             os.remove(diff_file_name)
-            
-    # Initialize diffData to an empty DataFrame before the loop
-    diffData = pd.DataFrame()
+
+    if diffData.empty:
+        print(f"No new audio files needed for {language} - all translations are up to date!")
+        return None  # No processing occurred
+
+    # diff_file_name contains the items that need audio
+    # Write diff data and ensure file is properly closed
+    with open(diff_file_name, 'w', encoding='utf-8', errors='replace') as f:
+        diffData.to_csv(f)
+    retry_seconds = 1
     
-    for index, ourRow in translationData.iterrows():
-        translation_text = None
-        if lang_code in ourRow:
-            candidate_text = ourRow[lang_code]
-            if not (pd.isna(candidate_text) or candidate_text == '' or candidate_text is None):
-                translation_text = candidate_text
-
-        if translation_text is None:
-            print(f"Warning: No translation found for exact locale {lang_code} in row {ourRow['item_id']}")
-            continue
-        if u.is_placeholder_translation(translation_text):
-            print(
-                f"Skipping placeholder translation for exact locale {lang_code} in row {ourRow['item_id']}: "
-                f"{translation_text}"
-            )
-            continue
+    print(f"\nStarting audio generation for {language}...")
+    print(f"Processing {len(diffData)} items that need audio generation")
+    
+    if job['service'] == 'PlayHt':
+        # Import PlayHT only when needed
+        try:
+            from PlayHt import playHt_tts
+        except ImportError as e:
+            print(f"Error importing PlayHT: {e}")
+            print("PlayHT dependencies may not be properly installed or configured")
+            return None
             
-        print(f'Our lang: {lang_code} our row lang: {translation_text[:50]}...')
-        
-        # Ensure scalar string item_id even if duplicate column names exist
-        item_id_raw = ourRow['item_id']
+        result = playHt_tts.main(
+            input_file_path = diff_file_name, 
+            lang_code = lang_code,
+            retry_seconds= retry_seconds,
+            master_file_path=master_file_path, 
+            voice=job['voice'], 
+            audio_base_dir = audio_base_dir,
+            max_workers=max_workers)
+    else:
+        # Import ElevenLabs only when needed
         try:
-            # If duplicate labels caused a Series, take first non-null
-            if hasattr(item_id_raw, 'iloc'):
-                item_id = str(item_id_raw.iloc[0])
-            else:
-                item_id = str(item_id_raw)
-        except Exception:
-            item_id = str(item_id_raw)
-        
-        # Check if audio file needs regeneration (text/voice validation)
-        from utilities.utilities import audio_file_path
-        from utilities.audio_validation import needs_regeneration
-        
-        # Safely coerce task name to string
-        task_name_val = ourRow.get('labels', 'general')
-        task_name = str(task_name_val.iloc[0]) if hasattr(task_name_val, 'iloc') else str(task_name_val)
-        expected_audio_path = audio_file_path(task_name, item_id, audio_base_dir, lang_code)
-        
-        if not force_regenerate:
-            # Use validation system to check if regeneration is needed
-            expected_model_id = model_id if service == 'ElevenLabs' else None
-            needs_regen, reason = needs_regeneration(
-                expected_audio_path,
-                translation_text,
-                voice,
-                service,
-                lang_code,
-                force_id,
-                current_model_id=expected_model_id
-            )
+            from ELabs import elevenlabs_tts
+        except ImportError as e:
+            print(f"Error importing ElevenLabs: {e}")
+            print("ElevenLabs dependencies may not be properly installed or configured")
+            return None
             
-            if not needs_regen:
-                print(f'✅ Audio file is up to date: {expected_audio_path}')
-                continue
-            else:
-                print(f'🔄 Audio needs regeneration: {reason}')
-        else:
-            print(f'🔄 FORCE MODE: Regenerating existing file: {expected_audio_path}')
-        
-        print(f'Need to generate audio for: {item_id} -> {expected_audio_path}')
+        result = elevenlabs_tts.main(
+            input_file_path = diff_file_name, 
+            lang_code = lang_code,
+            retry_seconds= retry_seconds,
+            master_file_path=master_file_path, 
+            voice=job['voice'], 
+            voice_id=job['voice_id'],
+            audio_base_dir = audio_base_dir,
+            model_id=model_id,
+            output_format = "mp3_44100_128",
+            max_workers=max_workers
+        )
+    
+    print(f"Audio generation completed for {language}")
+    return result
+
 
+def _dispatch_languages(jobs, **run_kwargs) -> Tuple[Dict[str, Optional[dict]], List[str]]:
+    """
+    Run every language job; returns ``({language: provider stats}, failed languages)``.
+
+    Languages run side by side, one thread each; every request still goes
+    through its provider's process-wide limiter in ``utilities/tts_engine.py``,
+    so ElevenLabs and PlayHt languages fill both providers' quotas at once
+    while languages on the same provider share that provider's slots. A
+    failing language is reported and recorded in the failed list (stats
+    ``None``) without stopping the others. Ctrl-C stops every language
+    through ``tts_engine.STOP_REQUESTED`` and exits like a single-language run.
+    """
+    results: Dict[str, Optional[dict]] = {}
+    failed: List[str] = []
+
+    def collect(language: str, run) -> None:
         try:
-            # Create a DataFrame with the same columns as translationData if diffData is empty
-            if diffData.empty:
-                diffData = pd.DataFrame(columns=translationData.columns)
-            if isinstance(diffData, pd.DataFrame):
-                diffData.loc[len(diffData)] = ourRow
-            else:
-                print("The variable 'diffData' exists but is not a DataFrame")
-        except NameError:
-            # This block should never be reached now that we initialize diffData
-            starterRow = {'item_id': ourRow['item_id'], 'labels': ourRow['labels']}
-            # Add all language columns from config
-            for lang_config in language_dict.values():
-                lang_code = lang_config['lang_code']
-                starterRow[lang_code] = ourRow[lang_code]
-            diffData = pd.DataFrame(starterRow, index=[0])
-
-    if not diffData.empty:
-
-        # for debugging
-        #print(f'Writing diff data {diffData}')
-
-        # diff_file_name contains the items that need audio
-        # Write diff data and ensure file is properly closed
-        with open(diff_file_name, 'w', encoding='utf-8', errors='replace') as f:
-            diffData.to_csv(f)
-        retry_seconds = 1
-        
-        print(f"\nStarting audio generation for {language}...")
-        print(f"Processing {len(diffData)} items that need audio generation")
-        
-        # Initialize result variable
-        result = None
-        
-        if service == 'PlayHt':
-            # Import PlayHT only when needed
-            try:
-                from PlayHt import playHt_tts
-            except ImportError as e:
-                print(f"Error importing PlayHT: {e}")
-                print("PlayHT dependencies may not be properly installed or configured")
-                return None
-                
-            result = playHt_tts.main(
-                input_file_path = diff_file_name, 
-                lang_code = lang_code,
-                retry_seconds= retry_seconds,
-                master_file_path=master_file_path, 
-                voice=voice, 
-                audio_base_dir = audio_base_dir)
-        else:
-            # Import ElevenLabs only when needed
-            try:
-                from ELabs import elevenlabs_tts
-            except ImportError as e:
-                print(f"Error importing ElevenLabs: {e}")
-                print("ElevenLabs dependencies may not be properly installed or configured")
-                return None
-                
-            result = elevenlabs_tts.main(
-                input_file_path = diff_file_name, 
-                lang_code = lang_code,
-                retry_seconds= retry_seconds,
-                master_file_path=master_file_path, 
-                voice=voice, 
-                voice_id=voice_id,
-                audio_base_dir = audio_base_dir,
-                model_id=model_id,
-                output_format = "mp3_44100_128"
-            )
-        
-        print(f"Audio generation completed for {language}")
-        
-    else:
-        print(f"No new audio files needed for {language} - all translations are up to date!")
-        result = None  # No processing occurred
-    
+            results[language] = run()
+        except Exception as e:
+            print(f"❌ Generation failed for {language}: {e}")
+            results[language] = None
+            failed.append(language)
+
+    if len(jobs) <= 1:
+        for job in jobs:
+            collect(job['language'], lambda: _run_language(job, **run_kwargs))
+        return results, failed
+
+    print(f"\n🚀 Generating {len(jobs)} languages concurrently: "
+          + ", ".join(f"{job['lang_code']} ({job['service']})" for job in jobs))
+    tts_engine.STOP_REQUESTED.clear()
+    executor = ThreadPoolExecutor(max_workers=len(jobs), thread_name_prefix='lang')
+    futures = {executor.submit(_run_language, job, **run_kwargs): job for job in jobs}
+    try:
+        for future in as_completed(futures):
+            collect(futures[future]['language'], future.result)
+    except KeyboardInterrupt:
+        # Ctrl-C only reaches this thread: tell every language's run_rows to
+        # stop submitting rows, and drop languages that have not started yet
+        tts_engine.STOP_REQUESTED.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+        print("\n🛑 Process interrupted by user; stopping all languages")
+        print("💡 You can resume by running the same command again - it will skip already generated files.")
+        sys.exit(0)
+    executor.shutdown(wait=True)
+    # Report failures in the order the languages were requested
+    order = [job['language'] for job in jobs]
+    failed.sort(key=order.index)
+    return results, failed
+
+
+def _report_language(job: dict, result, translationData: pd.DataFrame) -> None:
+    """Print the final statistics block for one language."""
+    language = job['language']
+    lang_code = job['lang_code']
+    service = job['service']
+    voice = job['voice']
+    plan = job['plan']
+    diffData = job['diffData']
+
     # Display final statistics
     print(f"\nFinal Statistics for {language}:")
     print(f"   Language: {language}")
@@ -567,7 +728,7 @@ def generate_audio(
     print(f"   Service: {service}")
     print(f"   Voice (display): {voice[:50]}..." if len(voice) > 50 else f"   Voice (display): {voice}")
     if service == 'ElevenLabs':
-        print(f"   Voice ID: {voice_id}")
+        print(f"   Voice ID: {job['voice_id']}")
     
     # Show actual processing results if available
     if result and hasattr(result, '__getitem__') and result:
@@ -576,6 +737,11 @@ def generate_audio(
         print(f"   Items with no task assigned: {result.get('NoTask', 0)}")
         total_attempted = result.get('Processed', 0) + result.get('Errors', 0) + result.get('NoTask', 0)
         print(f"   Items attempted this run: {total_attempted}")
+        if 'CacheHits' in result:
+            print(f"   Audio cache hits (no TTS charge): {result.get('CacheHits', 0)}")
+            print(f"   Audio cache misses (synthesized): {result.get('CacheMisses', 0)}")
+        if result.get('UploadErrors'):
+            print(f"   ⚠️  GCS uploads failed: {result['UploadErrors']} (files kept locally)")
     else:
         print(f"   Items attempted this run: {len(diffData) if not diffData.empty else 0}")
     
@@ -583,14 +749,8 @@ def generate_audio(
     print(f"   Total items in dataset: {len(translationData)}")
     
     # Count items with valid translations
-    valid_translation_count = 0
-    empty_translation_count = 0
-    for index, row in translationData.iterrows():
-        translation = row.get(lang_code, '')
-        if pd.isna(translation) or translation == '' or translation is None or u.is_placeholder_translation(translation):
-            empty_translation_count += 1
-        else:
-            valid_translation_count += 1
+    empty_translation_count = int(plan["status"].isin(regen_planner.SKIPPED_STATUSES).sum())
+    valid_translation_count = len(plan) - empty_translation_count
     
     print(f"   Items with valid {lang_code} translations: {valid_translation_count}")
     if empty_translation_count > 0:
@@ -625,7 +785,7 @@ def generate_audio(
     """
 
 def main(
-    language: str,
+    language,
     user_id: str = None,
     api_key: str = None,
     force_regenerate: bool = False,
@@ -635,7 +795,10 @@ def main(
     translation_source: str = "draft",
     sqlite_db_path: str = "tmp/itembank_by_task_regen.sqlite",
     model_id: str = DEFAULT_ELEVENLABS_MODEL_ID,
-    tasks: str = None
+    tasks: str = None,
+    max_workers: Optional[int] = None,
+    plan_only: bool = False,
+    audio_inventory: str = "local"
 ):
     master_file_path = "translation_master.csv"
     preserve_master_bytes = None
@@ -666,15 +829,21 @@ def main(
                 return
             audio_base_dir = "audio_files"
             
-            items_to_regenerate = validate_audio_files_for_language(
-                language, language_dict, translation_data, audio_base_dir, force_id
-            )
-            
-            if not items_to_regenerate.empty:
-                print(f"\n📝 Items that need regeneration saved to: needed_item_bank_translations.csv")
-                items_to_regenerate.to_csv("needed_item_bank_translations.csv", index=False)
-            else:
-                print(f"\n✅ All audio files for {language} are up to date!")
+            languages = _resolve_languages(language, language_dict)
+            for language_name in languages:
+                items_to_regenerate = validate_audio_files_for_language(
+                    language_name, language_dict, translation_data, audio_base_dir, force_id
+                )
+                
+                needed_file = "needed_item_bank_translations.csv"
+                if len(languages) > 1:
+                    needed_file = needed_file.replace(
+                        '.csv', f".{language_dict.get(language_name, {}).get('lang_code', language_name)}.csv")
+                if not items_to_regenerate.empty:
+                    print(f"\n📝 Items that need regeneration saved to: {needed_file}")
+                    items_to_regenerate.to_csv(needed_file, index=False)
+                else:
+                    print(f"\n✅ All audio files for {language_name} are up to date!")
                 
         except Exception as e:
             print(f"❌ Validation failed: {e}")
@@ -699,7 +868,7 @@ def main(
                     )
     else:
         # Normal audio generation
-        generate_audio(
+        return generate_audio(
             language=language,
             force_regenerate=force_regenerate,
             hi_fi=hi_fi,
@@ -707,12 +876,15 @@ def main(
             translation_source=translation_source,
             sqlite_db_path=sqlite_db_path,
             model_id=model_id,
-            tasks_filter=_parse_task_filter(tasks)
+            tasks_filter=_parse_task_filter(tasks),
+            max_workers=max_workers,
+            plan_only=plan_only,
+            audio_inventory=audio_inventory
         )
         
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Generate speech audio for translations')
-    parser.add_argument('language', help='Language to generate audio for (e.g., German, Spanish, French, Dutch, English)')
+    parser.add_argument('language', help='Language(s) to generate audio for: a name (e.g., German), a comma-separated list of names or locale codes (e.g., "German,es-CO"), or "all". Multiple languages share one data load and run concurrently.')
     parser.add_argument('--force', '-f', action='store_true', 
                         help='Force regenerate: regenerates ALL audio items using the current voice from config')
     parser.add_argument('--force-id', action='store_true', 
@@ -736,20 +908,34 @@ if __name__ == "__main__":
     )
     parser.add_argument('--tasks', default=None,
                         help='Comma-separated task labels to process (matches CSV labels column). Use "all" or omit to process all tasks.')
+    parser.add_argument('--concurrency', type=int, default=None,
+                        help='Max concurrent TTS requests (default: per-provider limit from utilities/tts_engine.py)')
+    parser.add_argument('--plan-only', action='store_true',
+                        help='Print how many items are new/changed/missing and the estimated character cost, then exit')
+    parser.add_argument('--audio-inventory', choices=['local', 'gcs'], default='local',
+                        help='Where the planner looks for existing clips: the local audio_files/<lang_code>/ folder (default) '
+                             'or one listing of audio/<lang_code>/ in the draft bucket (ASSETS_DRAFT_BUCKET)')
     
     args = parser.parse_args()
     
-    main(language=args.language, 
-         user_id=args.user_id, 
-         api_key=args.api_key,
-         force_regenerate=args.force,
-         hi_fi=args.hi_fi,
-         validate_only=args.validate_only,
-         force_id=args.force_id,
-         translation_source=args.translation_source,
-         sqlite_db_path=args.sqlite_db,
-         model_id=args.model_id,
-         tasks=args.tasks)
+    try:
+        main(language=args.language, 
+             user_id=args.user_id, 
+             api_key=args.api_key,
+             force_regenerate=args.force,
+             hi_fi=args.hi_fi,
+             validate_only=args.validate_only,
+             force_id=args.force_id,
+             translation_source=args.translation_source,
+             sqlite_db_path=args.sqlite_db,
+             model_id=args.model_id,
+             tasks=args.tasks,
+             max_workers=args.concurrency,
+             plan_only=args.plan_only,
+             audio_inventory=args.audio_inventory)
+    except LanguageGenerationError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
 
 # IF we're happy with the output then
 # gsutil rsync -d -r <src> gs://<bucket> 
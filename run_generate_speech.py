@@ -132,18 +132,18 @@ def main():
         print("Cancelled.")
         sys.exit(0)
 
-    # Run generation per language
-    any_errors = False
-    for name in selected_names:
-        try:
-            print("\n" + "="*80)
-            print(f"Starting generate_speech for: {name}")
-            gen.main(language=name, force_regenerate=args.force)
-        except Exception as e:
-            any_errors = True
-            print(f"Error generating for {name}: {e}")
-
-    if any_errors:
+    # One generate_speech run for all selected languages: translations and the
+    # master cache are loaded once and the languages are generated concurrently.
+    try:
+        print("\n" + "="*80)
+        print(f"Starting generate_speech for: {', '.join(selected_names)}")
+        gen.main(language=selected_names, force_regenerate=args.force)
+    except gen.LanguageGenerationError as e:
+        # The other languages finished; report the failed ones and exit non-zero
+        print(f"\n{e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error generating for {', '.join(selected_names)}: {e}")
         sys.exit(1)
     print("\nAll selected generations finished.")
 
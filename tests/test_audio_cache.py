@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Tests for the content-addressed TTS audio cache (utilities/audio_cache.py)."""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utilities import audio_cache
+
+
+def test_cache_key_normalization() -> bool:
+    base = audio_cache.cache_key("Great job!", "voice-1", "eleven_v3", "mp3_44100_128")
+    assert base == audio_cache.cache_key("  Great   job! ", "voice-1", "eleven_v3", "mp3_44100_128")
+    assert base != audio_cache.cache_key("Great job!", "voice-2", "eleven_v3", "mp3_44100_128")
+    assert base != audio_cache.cache_key("Great job!", "voice-1", "eleven_multilingual_v2", "mp3_44100_128")
+    assert base != audio_cache.cache_key("Great job!", "voice-1", "eleven_v3", "mp3_22050_32")
+    return True
+
+
+def test_hits_misses_and_lru_eviction() -> bool:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = audio_cache.AudioCache(tmpdir, max_bytes=250)
+        keys = [audio_cache.cache_key(f"text {i}", "v", "m", "f") for i in range(3)]
+
+        assert cache.get(keys[0], tag="de-DE") is None
+        cache.put(keys[0], b"a" * 100)
+        cache.put(keys[1], b"b" * 100)
+        assert cache.get(keys[0], tag="de-DE") == b"a" * 100  # keys[0] is now most recent
+        cache.put(keys[2], b"c" * 100)  # over budget: evicts keys[1]
+
+        assert cache.get(keys[1], tag="de-DE") is None
+        assert cache.get(keys[2], tag="es-CO") == b"c" * 100
+        assert cache.stats("de-DE")["hits"] == 1
+        assert cache.stats("de-DE")["misses"] == 2
+        assert cache.stats()["hits"] == 2
+        assert cache.stats()["entries"] == 2
+
+        # A new instance rebuilds the index from disk in mtime order
+        time.sleep(0.01)
+        reopened = audio_cache.AudioCache(tmpdir, max_bytes=250)
+        assert reopened.stats()["entries"] == 2
+        assert reopened.stats()["bytes"] == 200
+    return True
+
+
+def main() -> int:
+    try:
+        test_cache_key_normalization()
+        test_hits_misses_and_lru_eviction()
+    except AssertionError as exc:
+        print(f"FAIL: {exc}")
+        return 1
+    except Exception as exc:
+        print(f"ERROR: {exc}")
+        return 1
+    print("PASS: audio cache tests")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
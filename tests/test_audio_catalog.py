@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Tests for the incremental ID3 metadata catalog (utilities/audio_catalog.py)
+and the tools that can query it.
+
+Copies of tests/test_audio_with_metadata.mp3 form a small audio tree in a temp
+directory; reads are counted by wrapping the catalog's file reader.
+"""
+
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utilities import audio_catalog
+from utilities import itembank_by_task_regen_report as regen
+from utilities import utilities as u
+from utilities.audio_validation import needs_regeneration, read_audio_metadata
+
+SAMPLE_MP3 = Path(__file__).resolve().parent / "test_audio_with_metadata.mp3"
+
+
+def build_tree(root):
+    """audio_files/es/{a,b,c}.mp3 plus a legacy audio_files/vocab/es-CO/shared/d.mp3."""
+    audio = Path(root) / "audio_files"
+    paths = []
+    for rel in ["es/a.mp3", "es/b.mp3", "es/c.mp3", "vocab/es-CO/shared/d.mp3"]:
+        path = audio / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(SAMPLE_MP3, path)
+        u.write_id3_tags(str(path), {"text": f"text {path.stem}", "voice": "Clara", "service": "ElevenLabs"})
+        paths.append(str(path))
+    return audio, paths
+
+
+class CountingReader:
+    def __init__(self):
+        self.paths = []
+        self._read = audio_catalog._read_file
+
+    def __call__(self, path, stat):
+        self.paths.append(os.path.basename(path))
+        return self._read(path, stat)
+
+
+def test_refresh_rereads_only_changed_files() -> bool:
+    reader = CountingReader()
+    audio_catalog._read_file = reader
+    try:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            audio, paths = build_tree(tmpdir)
+            catalog = audio_catalog.AudioCatalog(os.path.join(tmpdir, "catalog.sqlite"))
+
+            stats = catalog.refresh(str(audio))
+            assert (stats["added"], stats["unchanged"], stats["failed"]) == (4, 0, 0), stats
+            assert catalog.tags(paths[0]) == u.read_id3_tags(paths[0])
+            assert catalog.custom_fields(paths[0]) == read_audio_metadata(paths[0])
+
+            # Edit one file, delete one, add a broken one
+            u.write_id3_tags(paths[1], {"text": "edited"})
+            os.remove(paths[2])
+            (audio / "es" / "broken.mp3").write_bytes(b"not an mp3")
+            reader.paths.clear()
+            stats = catalog.refresh(str(audio))
+            assert sorted(reader.paths) == ["b.mp3", "broken.mp3"], reader.paths
+            assert (stats["updated"], stats["added"], stats["removed"], stats["unchanged"], stats["failed"]) == (1, 1, 1, 2, 1), stats
+            assert catalog.custom_fields(paths[1])["text"] == "edited"
+            assert catalog.custom_fields(str(audio / "es" / "broken.mp3")) is None
+
+            # Single-file lookups re-read a stale entry without a full refresh
+            u.write_id3_tags(paths[0], {"voice": "Other"})
+            reader.paths.clear()
+            assert catalog.custom_fields(paths[0])["voice"] == "Other"
+            assert catalog.custom_fields(paths[0])["voice"] == "Other"
+            assert reader.paths == ["a.mp3"]
+
+            # A fresh process reuses the stored rows
+            reopened = audio_catalog.AudioCatalog(os.path.join(tmpdir, "catalog.sqlite"))
+            reader.paths.clear()
+            assert reopened.refresh(str(audio))["unchanged"] == 4 and reader.paths == []
+            reopened.close()
+            catalog.close()
+    finally:
+        audio_catalog._read_file = reader._read
+    return True
+
+
+def test_tools_query_the_catalog() -> bool:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        audio, paths = build_tree(tmpdir)
+        catalog = audio_catalog.AudioCatalog(os.path.join(tmpdir, "catalog.sqlite"))
+        cwd = os.getcwd()
+        os.chdir(tmpdir)
+        try:
+            catalog.refresh("audio_files")
+            assert u.count_audio_files("es", catalog=catalog) == u.count_audio_files("es") == "4"
+        finally:
+            os.chdir(cwd)
+
+        assert needs_regeneration(paths[0], "text a", "Clara", "ElevenLabs", "es", catalog=catalog) == \
+            needs_regeneration(paths[0], "text a", "Clara", "ElevenLabs", "es")
+        assert needs_regeneration(paths[0], "new text", "Clara", "ElevenLabs", "es", catalog=catalog)[0]
+
+        conn = sqlite3.connect(":memory:")
+        regen.ensure_db(conn)
+        with_catalog = regen.seed_from_audio_directory(
+            conn, audio_base_dir=audio, lang_code="es", run_id=1, catalog=catalog
+        )
+        without = regen.seed_from_audio_directory(conn, audio_base_dir=audio, lang_code="es", run_id=2)
+        assert with_catalog == without and with_catalog["seeded"] == 3, (with_catalog, without)
+        conn.close()
+        catalog.close()
+    return True
+
+
+def main() -> int:
+    try:
+        test_refresh_rereads_only_changed_files()
+        test_tools_query_the_catalog()
+    except AssertionError as exc:
+        print(f"FAIL: {exc}")
+        return 1
+    except Exception as exc:
+        print(f"ERROR: {exc}")
+        return 1
+    print("PASS: audio catalog tests")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Tests for single-pass CLAP quality scoring (validate_audio/quality.py).
+
+A stand-in CLAP model/processor (numpy only) counts text and audio forward
+passes so we can check that prompt embeddings are computed once per process,
+each clip is encoded once, and the batched matrix-product scores match the
+old one-prompt-at-a-time cosine loop.
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from validate_audio import quality
+from validate_audio import validator
+
+
+class FakeInputs(dict):
+    pass
+
+
+class FakeProcessor:
+    def __call__(self, text=None, audios=None, return_tensors="pt", padding=False, sampling_rate=None):
+        return FakeInputs(text=text) if text is not None else FakeInputs(audios=audios)
+
+
+class FakeClap:
+    def __init__(self, dim: int = 16):
+        self.dim = dim
+        self.text_passes = 0
+        self.audio_clips = 0
+
+    def _vector(self, seed: int) -> np.ndarray:
+        return np.random.default_rng(seed).normal(size=self.dim).astype(np.float32)
+
+    def get_text_features(self, text):
+        self.text_passes += 1
+        return np.stack([self._vector(sum(map(ord, t))) * 3.0 for t in text])
+
+    def get_audio_features(self, audios):
+        self.audio_clips += len(audios)
+        return np.stack([self._vector(int(a[0])) for a in audios])
+
+
+def install_fake_clap() -> FakeClap:
+    model = FakeClap()
+    quality._CLAP_MODEL = model
+    quality._CLAP_PROCESSOR = FakeProcessor()
+    quality._PROMPT_EMBEDS = None
+    return model
+
+
+def reference_scores(model: FakeClap, clip) -> dict:
+    """The old per-prompt loop: one cosine per (clip, prompt)."""
+    audio = model._vector(int(clip[0]))
+
+    def cos(u, v):
+        return float(np.dot(u, v) / (np.linalg.norm(u) * np.linalg.norm(v)))
+
+    q = [cos(audio, model._vector(sum(map(ord, p)))) for p in quality.QUALITY_PROMPTS]
+    n = [cos(audio, model._vector(sum(map(ord, p)))) for p in quality.NOISE_PROMPTS]
+    qs, ns = sum(q) / len(q), sum(n) / len(n)
+    return {"quality_score": qs, "noise_score": ns, "quality_confidence": max(0.0, qs - ns)}
+
+
+def test_batch_scores_match_per_prompt_loop() -> bool:
+    model = install_fake_clap()
+    try:
+        return _check_batch_scores(model)
+    finally:
+        quality._CLAP_MODEL = quality._CLAP_PROCESSOR = quality._PROMPT_EMBEDS = None
+
+
+def _check_batch_scores(model: FakeClap) -> bool:
+    clips = [np.full(480, float(i)) for i in range(5)]
+    scores = quality.assess_audio_quality_batch(clips)
+    assert model.text_passes == 1 and model.audio_clips == 5
+    for clip, got in zip(clips, scores):
+        want = reference_scores(model, clip)
+        for key in want:
+            assert abs(got[key] - want[key]) < 1e-5, (key, got[key], want[key])
+
+    # Prompt embeddings are cached; a single clip costs one audio encode
+    single = quality.assess_audio_quality_with_clap("unused.mp3", audio_data=clips[2])
+    assert model.text_passes == 1 and model.audio_clips == 6
+    assert abs(single["quality_score"] - scores[2]["quality_score"]) < 1e-6
+    return True
+
+
+def test_session_scores_quality_per_block() -> bool:
+    calls = []
+
+    def batch_scorer(audios, sample_rate):
+        calls.append(len(audios))
+        return [{"quality_score": float(a), "noise_score": 0.0, "quality_confidence": float(a)} for a in audios]
+
+    class EchoTranscriber:
+        def transcribe(self, audio_file_path, language=None, audio=None):
+            return {"text": "ok", "language": language}
+
+    session = validator.ValidationSession(
+        transcriber=EchoTranscriber(),
+        audio_loader=lambda path, include_quality: {"asr": None, "clap": len(path), "clap_sr": 48000},
+        quality_batch_scorer=batch_scorer,
+        quality_batch_size=4,
+    )
+    paths = ["a" * (i + 1) for i in range(10)]
+    results = list(session.iter_validate(paths, expected_texts=["ok"] * 10))
+    assert calls == [4, 4, 2], calls
+    assert [r["quality"]["quality_score"] for r in results] == [float(i + 1) for i in range(10)]
+    return True
+
+
+def main() -> int:
+    try:
+        test_batch_scores_match_per_prompt_loop()
+        test_session_scores_quality_per_block()
+    except AssertionError as exc:
+        print(f"FAIL: {exc}")
+        return 1
+    except Exception as exc:
+        print(f"ERROR: {exc}")
+        return 1
+    print("PASS: CLAP quality tests")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
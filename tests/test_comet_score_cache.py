@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent COMET segment score cache
+(translation_grading/comet_cache.py) and its use in xcomet/run_xcomet.py
+(run_api, run_api_multi) and translation_grading/pipeline.run_comet_stage.
+
+A deterministic stand-in for the COMET model replaces the model loaders, so
+the tests can count how many segments actually reach the model.
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from test_translation_grading_pipeline import make_args, write_fixture_csv
+from test_xcomet_multi_lang import FakeComet
+from translation_grading import comet_cache as cc
+from translation_grading import pipeline
+from xcomet import run_xcomet as rx
+
+
+def fake_scores(samples):
+    return FakeComet().predict(samples)["scores"]
+
+
+def test_cache_keys_and_reuse() -> bool:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "scores.sqlite"
+        samples = [
+            {"src": "cat", "mt": "Katze"},
+            {"src": "dog", "mt": "Hund"},
+            {"src": "cat", "mt": "Katze"},
+            {"src": "cat", "mt": "Katze", "ref": "Katze"},
+        ]
+        seen = []
+
+        def predict(todo):
+            seen.append(len(todo))
+            return fake_scores(todo)
+
+        cache = cc.CometScoreCache(path, "model-a")
+        scores, from_cache, stats = cc.score_samples(samples, predict, cache)
+        assert seen == [3], "duplicates are scored once; a reference makes a different segment"
+        assert scores == fake_scores(samples) and from_cache == [False] * 4
+        assert (stats["segments"], stats["cached"], stats["scored"]) == (4, 0, 3)
+        assert len(cache) == 3
+        cache.close()
+
+        seen.clear()
+        reopened = cc.CometScoreCache(path, "model-a")
+        edited = samples + [{"src": "dog", "mt": "Hündin"}]
+        scores, from_cache, stats = cc.score_samples(edited, predict, reopened)
+        assert seen == [1] and from_cache == [True] * 4 + [False]
+        assert scores == fake_scores(edited) and (stats["cached"], stats["scored"]) == (4, 1)
+
+        seen.clear()
+        _, from_cache, _ = cc.score_samples(edited, predict, cc.CometScoreCache(path, "model-b"))
+        assert seen == [4] and not any(from_cache), "scores are kept per model"
+
+        try:
+            cc.score_samples([{"src": "x", "mt": "y"}], lambda todo: [], reopened)
+            raise AssertionError("a short prediction list must raise")
+        except ValueError:
+            pass
+    return True
+
+
+def test_xcomet_reruns_score_only_changed_segments() -> bool:
+    models = []
+
+    def fake_load(model):
+        models.append(FakeComet())
+        return models[-1]
+
+    saved = rx.load_comet_model
+    rx.load_comet_model = fake_load
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmpdir = Path(tmp)
+            cache = cc.CometScoreCache(tmpdir / "scores.sqlite", "fake")
+            de = rx.Inputs(src=["one", "two", "three"], hyp=["eins", "zwei", "drei"], ref=None, item_ids=["1", "2", "3"])
+            fr = rx.Inputs(src=["one", "two"], hyp=["un", "deux"], ref=None, item_ids=["1", "2"])
+            out = {"de": tmpdir / "de.json", "fr": tmpdir / "fr.json"}
+
+            rx.run_api_multi("fake", {"de": de, "fr": fr}, out, spans=False, cache=cache)
+            first = {lang: json.loads(path.read_text(encoding="utf-8")) for lang, path in out.items()}
+            assert len(models) == 1 and models[0].calls[0] == sorted(models[0].calls[0], reverse=True)
+            assert first["de"]["cache"]["scored"] == 3 and first["fr"]["cache"]["cached"] == 0
+
+            # Unchanged inputs: nothing is scored and the model is never loaded
+            models.clear()
+            rx.run_api_multi("fake", {"de": de, "fr": fr}, out, spans=False, cache=cache)
+            assert models == []
+            again = {lang: json.loads(path.read_text(encoding="utf-8")) for lang, path in out.items()}
+            assert [s["score"] for s in again["de"]["segments"]] == [s["score"] for s in first["de"]["segments"]]
+            assert again["de"]["system_score"] == first["de"]["system_score"]
+            assert again["de"]["cache"] == {"segments": 3, "cached": 3, "scored": 0, "cache_path": str(cache.path)}
+
+            # One edited translation goes through the model, alone
+            de.hyp[1] = "ZWEI"
+            rx.run_api(model="fake", inputs=de, out_json=out["de"], spans=False, cache=cache)
+            assert len(models) == 1 and len(models[0].calls) == 1 and len(models[0].calls[0]) == 1
+            result = json.loads(out["de"].read_text(encoding="utf-8"))
+            assert (result["cache"]["cached"], result["cache"]["scored"]) == (2, 1)
+            assert result["segments"][1]["mt"] == "ZWEI"
+            assert result["segments"][1]["score"] == fake_scores([{"src": "two", "mt": "ZWEI"}])[0]
+
+            report = tmpdir / "report.md"
+            rx.generate_report(de.item_ids, out["de"], report)
+            assert "Score cache: 2 of 3 segments reused, 1 scored" in report.read_text(encoding="utf-8")
+    finally:
+        rx.load_comet_model = saved
+    return True
+
+
+def test_pipeline_comet_stage_uses_cache() -> bool:
+    loads = []
+
+    def fake_load(model_name):
+        loads.append(model_name)
+        return FakeComet()
+
+    saved = pipeline.load_comet_model
+    pipeline.load_comet_model = fake_load
+    try:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            csv_path = Path(tmpdir) / "fixture.csv"
+            write_fixture_csv(str(csv_path))
+            args = make_args(str(csv_path), tmpdir)
+            args.run_comet = True
+            args.comet_cache_path = str(Path(tmpdir) / "comet.sqlite")
+
+            rows, _ = pipeline.materialize_pairs(args)
+            pipeline.run_comet_stage(rows, args)
+            assert loads == ["Unbabel/wmt22-cometkiwi-da"]
+            first = [row.scores["comet"] for row in rows]
+
+            loads.clear()
+            rows, _ = pipeline.materialize_pairs(args)
+            rows[0].target_text += " (neu)"
+            pipeline.run_comet_stage(rows, args)
+            assert len(loads) == 1
+            assert [row.scores["comet"] for row in rows][1:] == first[1:]
+            assert [row.metadata["comet_cached"] for row in rows] == [False, True, True, True]
+
+            pipeline.write_outputs(rows, args)
+            summary = json.loads(Path(args.summary_json).read_text(encoding="utf-8"))["summary"]
+            assert summary["comet_cache"] == {"segments": 4, "cached": 3, "scored": 1}
+            md_text = Path(args.report_md).read_text(encoding="utf-8")
+            assert "COMET scores reused from cache: **3** / 4 (1 scored this run)" in md_text
+
+            loads.clear()
+            pipeline.run_comet_stage(rows, args)
+            assert loads == [], "a fully cached run must not load the model"
+    finally:
+        pipeline.load_comet_model = saved
+    return True
+
+
+def main() -> int:
+    try:
+        test_cache_keys_and_reuse()
+        test_xcomet_reruns_score_only_changed_segments()
+        test_pipeline_comet_stage_uses_cache()
+    except AssertionError as exc:
+        print(f"FAIL: {exc}")
+        return 1
+    except Exception as exc:
+        print(f"ERROR: {exc}")
+        return 1
+    print("PASS: COMET score cache tests")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Tests for the cached Crowdin screenshot index in
+translation_grading/gemini_quality_evaluator.py (CrowdinScreenshotIndex,
+attach_crowdin_screenshots).
+
+A local HTTP server stands in for the Crowdin strings/screenshots listings
+(with ETags and 304 answers) and for the signed image URLs, which stop
+working once the server rotates their signatures.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from translation_grading import gemini_quality_evaluator as evaluator
+
+TOKEN_ENV = "TEST_CROWDIN_SCREENSHOT_TOKEN"
+
+
+class FakeCrowdin:
+    """Strings + screenshots listings for project 1 and the images they point at."""
+
+    def __init__(self, n_strings=700, n_screenshots=12):
+        self.lock = threading.Lock()
+        self.strings = [{"id": 1000 + i, "identifier": f"item_{i}"} for i in range(n_strings)]
+        self.images = {}
+        self.screenshots = []
+        for i in range(n_screenshots):
+            shot_id = 50 + i
+            # Screenshots 50 and 51 have identical content
+            self.images[shot_id] = b"PNG" + (b"shared" if i < 2 else str(i).encode()) * 100
+            self.screenshots.append({
+                "id": shot_id,
+                "name": f"item_{i}.png",
+                "updatedAt": "2026-01-01T00:00:00+00:00",
+                "tags": [{"stringId": 1000 + i, "position": {"x": i}}],
+            })
+        self.signature = 1
+        self.page_requests = 0
+        self.not_modified = 0
+        self.image_requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, body=b"", headers=None):
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                parsed = urllib.parse.urlsplit(self.path)
+                query = dict(urllib.parse.parse_qsl(parsed.query))
+                if parsed.path.startswith("/img/"):
+                    self._image(int(parsed.path.rsplit("/", 1)[-1].split(".")[0]), query)
+                    return
+                assert self.headers["Authorization"] == "Bearer token"
+                kind = parsed.path.rsplit("/", 1)[-1]
+                offset, limit = int(query["offset"]), int(query["limit"])
+                with fake.lock:
+                    rows = fake.listing(kind)[offset:offset + limit]
+                body = json.dumps({"data": [{"data": row} for row in rows]}).encode()
+                etag = '"' + hashlib.md5(body).hexdigest() + '"'
+                with fake.lock:
+                    fake.page_requests += 1
+                    if self.headers.get("If-None-Match") == etag:
+                        fake.not_modified += 1
+                        self._send(304)
+                        return
+                self._send(200, body, {"ETag": etag, "Content-Type": "application/json"})
+
+            def _image(self, shot_id, query):
+                with fake.lock:
+                    fake.image_requests += 1
+                    fake.in_flight += 1
+                    fake.max_in_flight = max(fake.max_in_flight, fake.in_flight)
+                    valid = query.get("sig") == str(fake.signature)
+                time.sleep(0.05)
+                with fake.lock:
+                    fake.in_flight -= 1
+                if not valid:
+                    self._send(403, b"expired")
+                else:
+                    self._send(200, fake.images[shot_id], {"Content-Type": "image/png"})
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def listing(self, kind):
+        if kind == "strings":
+            return self.strings
+        base = f"http://127.0.0.1:{self.server.server_port}/img"
+        return [dict(shot, url=f"{base}/{shot['id']}.png?sig={self.signature}") for shot in self.screenshots]
+
+    def counters(self):
+        with self.lock:
+            counts = (self.page_requests, self.not_modified, self.image_requests)
+            self.page_requests = self.not_modified = self.image_requests = 0
+        return counts
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def make_items(count=12):
+    return [
+        evaluator.EvaluationItem(f"item_{i}", "vocab", f"word {i}", "de", f"Wort {i}", "OBJECT_NAMING")
+        for i in range(count)
+    ] + [evaluator.EvaluationItem("untagged", "vocab", "x", "de", "x", "OBJECT_NAMING")]
+
+
+def attach(cache_dir, items, max_age=0):
+    return evaluator.attach_crowdin_screenshots(
+        items,
+        project_id="1",
+        api_key_env=TOKEN_ENV,
+        cache_dir=cache_dir,
+        eligible_labels=["vocab"],
+        index_max_age=max_age,
+        workers=6,
+    )
+
+
+def test_index_refreshes_changed_pages_and_downloads_once() -> bool:
+    saved = (evaluator.CROWDIN_API_BASE, os.environ.get(TOKEN_ENV))
+    os.environ[TOKEN_ENV] = "token"
+    with tempfile.TemporaryDirectory() as tmpdir, FakeCrowdin() as crowdin:
+        evaluator.CROWDIN_API_BASE = f"http://127.0.0.1:{crowdin.server.server_port}"
+        cache_dir = Path(tmpdir) / "shots"
+        try:
+            items = make_items()
+            stats = attach(cache_dir, items)
+            assert stats["items_with_screenshots"] == 12 and stats["matched_identifiers"] == 12, stats
+            assert stats["screenshots_downloaded"] == 12 and stats["pages_fetched"] == 3, stats
+            assert crowdin.counters() == (3, 0, 12)
+            assert 1 < crowdin.max_in_flight <= 6, crowdin.max_in_flight
+            assert items[3].screenshots[0].path.read_bytes() == crowdin.images[53]
+            assert items[3].screenshots[0].position == {"x": 3} and not items[-1].screenshots
+            # Content-addressed: identical images share one file
+            assert items[0].screenshots[0].path == items[1].screenshots[0].path
+            assert len(list(cache_dir.glob("*.png"))) == 11
+
+            # Unchanged project: every page revalidates as 304, nothing is downloaded
+            items = make_items()
+            stats = attach(cache_dir, items)
+            assert (stats["screenshots_downloaded"], stats["screenshots_reused"], stats["pages_not_modified"]) == (0, 12, 3), stats
+            assert crowdin.counters() == (3, 3, 0)
+            assert items[5].screenshots[0].path.read_bytes() == crowdin.images[55]
+
+            # One screenshot replaced; the signed URLs rotate too
+            crowdin.images[55] = b"PNG new content"
+            crowdin.screenshots[5]["updatedAt"] = "2026-02-01T00:00:00+00:00"
+            crowdin.signature += 1
+            items = make_items()
+            stats = attach(cache_dir, items)
+            assert (stats["pages_fetched"], stats["pages_not_modified"], stats["screenshots_downloaded"]) == (1, 2, 1), stats
+            assert crowdin.counters() == (3, 2, 1)
+            assert items[5].screenshots[0].path.read_bytes() == b"PNG new content"
+
+            # Within max_age the listings are not requested at all
+            items = make_items()
+            stats = attach(cache_dir, items, max_age=3600)
+            assert stats["items_with_screenshots"] == 12 and crowdin.counters() == (0, 0, 0), stats
+
+            # A stale index whose signed URLs expired is refreshed once and the download retried
+            items[7].screenshots[0].path.unlink()
+            crowdin.signature += 1
+            items = make_items()
+            stats = attach(cache_dir, items, max_age=3600)
+            assert stats["items_with_screenshots"] == 12 and stats["screenshots_downloaded"] == 1, stats
+            assert crowdin.counters() == (3, 2, 2)
+            assert items[7].screenshots[0].path.read_bytes() == crowdin.images[57]
+        finally:
+            evaluator.CROWDIN_API_BASE = saved[0]
+            if saved[1] is None:
+                os.environ.pop(TOKEN_ENV, None)
+            else:
+                os.environ[TOKEN_ENV] = saved[1]
+    return True
+
+
+def main() -> int:
+    try:
+        test_index_refreshes_changed_pages_and_downloads_once()
+    except AssertionError as exc:
+        print(f"FAIL: {exc}")
+        return 1
+    except Exception as exc:
+        print(f"ERROR: {exc}")
+        return 1
+    print("PASS: Crowdin screenshot index tests")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent embedding cache (translation_grading/embedding_cache.py).
+
+A tiny deterministic stand-in model replaces SentenceTransformer so the test
+runs without downloading weights; it counts how many strings it encodes.
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from translation_grading import embedding_cache as ec
+
+
+class CountingModel:
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, inputs, batch_size=32, convert_to_numpy=True, normalize_embeddings=True, show_progress_bar=False):
+        self.encoded.extend(inputs)
+        vecs = np.array([[len(t), sum(map(ord, t)) % 97, 1.0] for t in inputs], dtype=np.float32)
+        return vecs / np.linalg.norm(vecs, axis=1, keepdims=True)
+
+
+def make_embedder(cache_dir, model_name="sentence-transformers/LaBSE"):
+    model = CountingModel()
+    embedder = ec.Embedder(model_name, cache_dir=cache_dir, model_loader=lambda name, device: model)
+    return embedder, model
+
+
+def test_reruns_only_encode_new_strings() -> bool:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        embedder, model = make_embedder(tmpdir)
+        texts = ["Hallo Welt", "Gut gemacht", "Hallo  Welt"]  # whitespace variant shares a key
+        first = embedder.encode(texts, "passage")
+        assert first.shape == (3, 3) and first.dtype == np.float32
+        assert model.encoded == ["Hallo Welt", "Gut gemacht"]
+        assert np.allclose(first[0], first[2])
+
+        # LaBSE ignores the e5 prefix, so source-side "query" lookups reuse the same rows
+        embedder.encode(["Gut gemacht"], "query")
+        assert len(model.encoded) == 2
+
+        # A fresh process only encodes the edited string
+        rerun, model2 = make_embedder(tmpdir)
+        second = rerun.encode(["Hallo Welt", "Sehr gut gemacht"], "passage")
+        assert model2.encoded == ["Sehr gut gemacht"]
+        assert np.allclose(second[0], first[0])
+        assert rerun.hits == 1 and rerun.encoded == 1
+    return True
+
+
+def test_e5_prefixes_are_separate_and_all_hits_skip_model_load() -> bool:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        embedder, model = make_embedder(tmpdir, "intfloat/multilingual-e5-large")
+        embedder.encode(["Hola"], "query")
+        embedder.encode(["Hola"], "passage")
+        assert model.encoded == ["query: Hola", "passage: Hola"]
+
+        loads = []
+        cached = ec.Embedder("intfloat/multilingual-e5-large", cache_dir=tmpdir,
+                             model_loader=lambda name, device: loads.append(name))
+        cached.encode(["Hola"], "passage")
+        assert loads == []
+    return True
+
+
+def main() -> int:
+    try:
+        test_reruns_only_encode_new_strings()
+        test_e5_prefixes_are_separate_and_all_hits_skip_model_load()
+    except AssertionError as exc:
+        print(f"FAIL: {exc}")
+        return 1
+    except Exception as exc:
+        print(f"ERROR: {exc}")
+        return 1
+    print("PASS: embedding cache tests")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
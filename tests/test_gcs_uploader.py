@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Tests for the process-wide GCS uploader in utilities/gcs_uploader.py.
+
+A fake storage client stands in for google-cloud-storage: its blobs record
+the metadata sent with each upload and fail for object names containing
+``fail``. The atexit drain is checked in a child process that queues an
+upload and exits without calling flush().
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utilities import gcs_uploader
+
+
+class FakeBlob:
+    def __init__(self, client, bucket_name, name):
+        self.client = client
+        self.bucket_name = bucket_name
+        self.name = name
+        self.metadata = None
+
+    def upload_from_filename(self, file_path, content_type=None):
+        time.sleep(self.client.delay)
+        if "fail" in self.name:
+            raise RuntimeError("503 backend error")
+        with self.client.lock:
+            self.client.uploads.append((self.bucket_name, self.name, file_path, content_type, self.metadata))
+            if self.client.log_path:
+                with open(self.client.log_path, "a", encoding="utf-8") as handle:
+                    handle.write(self.name + "\n")
+
+
+class FakeBucket:
+    def __init__(self, client, name):
+        self.client = client
+        self.name = name
+
+    def blob(self, name):
+        return FakeBlob(self.client, self.name, name)
+
+
+class FakeStorageClient:
+    """Records uploads (optionally appending object names to ``log_path``)."""
+
+    def __init__(self, delay=0.0, log_path=None):
+        self.delay = delay
+        self.log_path = log_path
+        self.lock = threading.Lock()
+        self.uploads = []
+
+    def bucket(self, name):
+        return FakeBucket(self, name)
+
+
+def install(client):
+    """Point gcs_uploader at ``client``; returns the state to restore."""
+    saved = (gcs_uploader.GCS_AVAILABLE, gcs_uploader._client, gcs_uploader._client_initialized)
+    gcs_uploader.GCS_AVAILABLE = True
+    gcs_uploader._client = client
+    gcs_uploader._client_initialized = True
+    return saved
+
+
+def restore(saved):
+    gcs_uploader.GCS_AVAILABLE, gcs_uploader._client, gcs_uploader._client_initialized = saved
+
+
+def test_enqueue_and_flush_per_language() -> bool:
+    client = FakeStorageClient(delay=0.2)
+    saved = install(client)
+    try:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            clip = Path(tmpdir) / "clip.mp3"
+            clip.write_bytes(b"ID3 audio")
+            start = time.time()
+            for i in range(6):
+                assert gcs_uploader.enqueue_upload(str(clip), "draft", f"audio/de/item_{i}.mp3",
+                                                   metadata={"voice": "Anna", "version": 2}, tag="de")
+            assert gcs_uploader.enqueue_upload(str(clip), "draft", "audio/de/fail_1.mp3", tag="de")
+            assert gcs_uploader.enqueue_upload(str(clip), "draft", "audio/fr/item_0.mp3", tag="fr")
+            assert time.time() - start < 0.2, "enqueue must not wait for the upload"
+
+            failures = gcs_uploader.flush("de")
+            assert failures == [("gs://draft/audio/de/fail_1.mp3", "503 backend error")], failures
+            de_uploads = [u for u in client.uploads if u[1].startswith("audio/de/")]
+            assert len(de_uploads) == 6
+            # Metadata travels with the upload request, stringified
+            assert de_uploads[0][3] == "audio/mpeg" and de_uploads[0][4] == {"voice": "Anna", "version": "2"}
+
+            # fr was not flushed with de; it is still pending and drains on its own flush
+            assert any(entry[0] == "fr" for entry in gcs_uploader._pending)
+            assert gcs_uploader.flush("fr") == [] and gcs_uploader.flush() == []
+            assert ("draft", "audio/fr/item_0.mp3") in [(u[0], u[1]) for u in client.uploads]
+    finally:
+        restore(saved)
+    return True
+
+
+def test_enqueue_without_client() -> bool:
+    saved = install(None)
+    try:
+        assert gcs_uploader.enqueue_upload("missing.mp3", "draft", "audio/x.mp3") is False
+        assert gcs_uploader.flush() == []
+    finally:
+        restore(saved)
+    return True
+
+
+def test_atexit_drains_pending_uploads() -> bool:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        clip = Path(tmpdir) / "clip.mp3"
+        clip.write_bytes(b"ID3 audio")
+        marker = Path(tmpdir) / "uploaded.txt"
+        script = f"""
+import sys
+sys.path.insert(0, {os.path.dirname(os.path.abspath(__file__))!r})
+from test_gcs_uploader import FakeStorageClient, gcs_uploader, install
+
+install(FakeStorageClient(delay=0.2, log_path={str(marker)!r}))
+gcs_uploader.enqueue_upload({str(clip)!r}, "draft", "audio/de/late.mp3", tag="de")
+gcs_uploader.enqueue_upload({str(clip)!r}, "draft", "audio/de/fail_late.mp3", tag="de")
+# Exit without flush(); the atexit hook must wait for the queued uploads
+"""
+        proc = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, timeout=60)
+        assert proc.returncode == 0, proc.stderr
+        assert marker.read_text(encoding="utf-8").split() == ["audio/de/late.mp3"]
+        assert "1 ok, 1 failed" in proc.stdout, proc.stdout
+        assert "Failed to upload gs://draft/audio/de/fail_late.mp3" in proc.stdout, proc.stdout
+    return True
+
+
+def main() -> int:
+    try:
+        test_enqueue_and_flush_per_language()
+        test_enqueue_without_client()
+        test_atexit_drains_pending_uploads()
+    except AssertionError as exc:
+        print(f"FAIL: {exc}")
+        return 1
+    except Exception as exc:
+        print(f"ERROR: {exc}")
+        return 1
+    print("PASS: GCS uploader tests")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Tests for the concurrent, batched evaluator in
+translation_grading/gemini_quality_evaluator.py (plan_batches,
+build_batch_prompt, ConcurrentEvaluator).
+
+A local fake Gemini server judges every numbered item of a batched prompt
+(or the single item of a one-item prompt). It answers the first request with
+429 and leaves one item out of any batch containing ``drop-me`` so the
+adaptive limiter and the split-and-retry path are exercised.
+"""
+
+import json
+import os
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from translation_grading import gemini_judge as gj
+from translation_grading import gemini_quality_evaluator as evaluator
+
+NUMBERED_ITEM = re.compile(r'^(\d+)\. Source text: "(.*)"\n   Translation: "(.*)"$', re.MULTILINE)
+SINGLE_ITEM = re.compile(r'^Source text: "(.*)"\nTranslation: "(.*)"$', re.MULTILINE)
+
+
+def judged(hypothesis):
+    if "WRONG" in hypothesis:
+        return {"score": 2, "errors": [{"severity": "critical", "description": "meaning changed"}], "notes": "bad"}
+    return {"score": 5, "errors": [], "notes": "ok"}
+
+
+class FakeGeminiServer:
+    """Threaded HTTP/1.1 server returning one judgement per numbered item."""
+
+    def __init__(self, failures=(429,), latency: float = 0.05, reject=None):
+        self.failures = list(failures)
+        self.reject = reject
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.batch_sizes = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                prompt = json.loads(self.rfile.read(length))["contents"][0]["parts"][0]["text"]
+                numbered = NUMBERED_ITEM.findall(prompt)
+                with server.lock:
+                    server.requests += 1
+                    status = server.failures.pop(0) if server.failures else 200
+                    if server.reject and server.reject in prompt:
+                        status = 400
+                    if status == 200:
+                        server.batch_sizes.append(len(numbered) or 1)
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                time.sleep(server.latency)
+                with server.lock:
+                    server.in_flight -= 1
+                if status != 200:
+                    body = b'{"error": "slow down"}'
+                    self.send_response(status)
+                    self.send_header("Retry-After", "0")
+                else:
+                    if numbered:
+                        items = [dict(judged(hyp), index=int(idx)) for idx, _, hyp in numbered]
+                        if len(items) > 1 and any(src == "drop-me" for _, src, _ in numbered):
+                            items.pop()
+                        text = json.dumps({"items": items})
+                    else:
+                        text = json.dumps(judged(SINGLE_ITEM.search(prompt).group(2)))
+                    body = json.dumps({"candidates": [{"content": {"parts": [{"text": text}]}}]}).encode()
+                    self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/v1beta"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def make_items():
+    items = []
+    for lang in ("de", "es-CO"):
+        for i in range(12):
+            items.append(evaluator.EvaluationItem(f"obj_{i}", "theory-of-mind", f"word {i}", lang, f"Wort {i}", "OBJECT_NAMING"))
+        for i in range(8):
+            hypothesis = "WRONG answer" if i == 3 else f"Weiter {i}"
+            items.append(evaluator.EvaluationItem(f"next_{i}", "general", f"next {i}", lang, hypothesis, "FEEDBACK_TRANSITION"))
+        for i in range(5):
+            source = "drop-me" if i == 2 else f"How often {i}?"
+            items.append(evaluator.EvaluationItem(f"school_q{i}", "survey", source, lang, f"Wie oft {i}?", "SURVEY"))
+    return items
+
+
+def test_plan_batches_groups_and_respects_budget() -> bool:
+    items = make_items()
+    shot = evaluator.ScreenshotAttachment(Path("shot.png"), 1, "shot.png")
+    items.append(evaluator.EvaluationItem("obj_x", "theory-of-mind", "apple", "de", "Apfel", "OBJECT_NAMING", [shot]))
+
+    batches = evaluator.plan_batches(items, token_budget=10_000, max_items=evaluator.BATCH_SIZE)
+    assert sorted(len(batch) for batch in batches) == [1, 5, 5, 8, 8, 12, 12], [len(b) for b in batches]
+    for batch in batches:
+        assert len({evaluator.batch_group_key(item) for item in batch}) == 1
+    assert sum(len(batch) for batch in batches) == len(items)
+
+    small = evaluator.plan_batches(items, token_budget=40)
+    assert max(len(batch) for batch in small) < 12 and sum(len(batch) for batch in small) == len(items)
+    assert max(len(batch) for batch in evaluator.plan_batches(items, max_items=3)) == 3
+
+    prompt = evaluator.build_batch_prompt([item for item in items if item.template_key == "SURVEY"][:3])
+    assert "Audience context" in prompt and len(NUMBERED_ITEM.findall(prompt)) == 3
+    assert not SINGLE_ITEM.search(prompt)
+    return True
+
+
+def test_concurrent_evaluation_splits_and_backs_off() -> bool:
+    items = make_items()
+    with FakeGeminiServer() as server:
+        limiter = gj.AdaptiveRateLimiter(0, min_backoff_interval=0.01)
+        client = gj.GeminiClient("test-key", api_base=server.url, backoff=0.01, limiter=limiter)
+        seen = []
+        concurrent = evaluator.ConcurrentEvaluator("test-key", workers=4, client=client)
+        rows = concurrent.evaluate(items, on_result=lambda item, row: seen.append(item.identifier))
+
+    assert [(row["identifier"], row["language"]) for row in rows] == [(i.identifier, i.target_lang) for i in items]
+    assert len(seen) == len(items)
+    flagged = {(row["identifier"], row["language"]) for row in rows if row["human_review"] == "yes"}
+    assert flagged == {("next_3", "de"), ("next_3", "es-CO")}, flagged
+    assert all(row["score"] == 5 for row in rows if row["identifier"] != "next_3")
+
+    # 6 batches; each survey batch (5 items, one "drop-me") is split until "drop-me" is alone
+    assert concurrent.stats["batches"] == 6 and concurrent.stats["splits"] >= 4, concurrent.stats
+    assert server.requests < len(items), server.requests
+    assert max(server.batch_sizes) == 12
+    assert limiter.throttles == 1 and limiter.interval == limiter.base_interval
+    assert 1 < server.max_in_flight <= 4, server.max_in_flight
+    return True
+
+
+def test_evaluate_items_raises_after_fallback() -> bool:
+    with FakeGeminiServer(failures=[400, 400]) as server:
+        client = gj.GeminiClient("test-key", api_base=server.url, backoff=0.01)
+        item = evaluator.EvaluationItem("next_0", "general", "next", "de", "Weiter", "FEEDBACK_TRANSITION")
+        try:
+            evaluator.evaluate_items([item], "test-key", "model-a", "model-b", 0, client=client)
+            raise AssertionError("a 400 from both models must propagate")
+        except gj.GeminiHTTPError as exc:
+            assert exc.status == 400
+        assert server.requests == 2
+        rows = evaluator.evaluate_items([item], "test-key", "model-a", "model-b", 0, client=client)
+        assert rows[0]["score"] == 5
+    return True
+
+
+def main() -> int:
+    try:
+        test_plan_batches_groups_and_respects_budget()
+        test_concurrent_evaluation_splits_and_backs_off()
+        test_evaluate_items_raises_after_fallback()
+    except AssertionError as exc:
+        print(f"FAIL: {exc}")
+        return 1
+    except Exception as exc:
+        print(f"ERROR: {exc}")
+        return 1
+    print("PASS: concurrent Gemini evaluator tests")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
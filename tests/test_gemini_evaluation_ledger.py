@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Tests for the checkpointed evaluation ledger
+(translation_grading/gemini_quality_evaluator.EvaluationLedger) and its use
+in gemini_quality_evaluator.main and run_gemini_all.main.
+
+gemini_quality_evaluator.main runs against the fake Gemini server from
+test_gemini_concurrent_evaluator.py, which can be told to reject one batch so
+the run fails part-way through.
+"""
+
+import csv
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from test_gemini_concurrent_evaluator import FakeGeminiServer
+from translation_grading import gemini_quality_evaluator as evaluator
+from translation_grading import run_gemini_all
+
+ROWS = [
+    ("happy", "theory-of-mind", "happy", "gluecklich"),
+    ("sad", "theory-of-mind", "sad", "traurig"),
+    ("next", "general", "next", "weiter"),
+    ("great_job", "general", "great job", "gut gemacht"),
+    ("story_q1", "hostile-attribution", "BOOM why?", "Warum?"),
+]
+
+
+def write_csv(path, rows):
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=["identifier", "labels", "en", "de"])
+        writer.writeheader()
+        for identifier, labels, en, de in rows:
+            writer.writerow({"identifier": identifier, "labels": labels, "en": en, "de": de})
+
+
+def read_csv(path):
+    with path.open("r", encoding="utf-8", newline="") as handle:
+        return list(csv.DictReader(handle))
+
+
+def test_ledger_keys_and_reload() -> bool:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "run.ledger.jsonl"
+        item = evaluator.EvaluationItem("happy", "theory-of-mind", "happy", "de", "gluecklich", "OBJECT_NAMING")
+        ledger = evaluator.EvaluationLedger(path, "model-a")
+        assert ledger.get(item) is None
+        row = evaluator.result_row(item, {"score": 5, "errors": [], "notes": "ok"})
+        ledger.record(item, row)
+        with path.open("a", encoding="utf-8") as handle:
+            handle.write('{"key": "trunc')  # interrupted write
+
+        reloaded = evaluator.EvaluationLedger(path, "model-a")
+        assert len(reloaded) == 1 and reloaded.get(item) == row
+        assert evaluator.EvaluationLedger(path, "model-b").get(item) is None
+        edited = evaluator.EvaluationItem("happy", "theory-of-mind", "happy", "de", "froh", "OBJECT_NAMING")
+        done, pending = reloaded.split([item, edited])
+        assert done == {id(item): row} and pending == [edited]
+        assert json.loads(path.read_text(encoding="utf-8").splitlines()[0])["identifier"] == "happy"
+    return True
+
+
+def run_evaluator(tmpdir, server):
+    argv = [
+        "gemini_quality_evaluator.py",
+        "--input-csv", str(tmpdir / "complete_translations.csv"),
+        "--output-csv", str(tmpdir / "results.csv"),
+        "--target-cols", "de",
+        "--model", "model-a",
+        "--fallback-model", "model-b",
+    ]
+    saved = (sys.argv, os.environ.get("GEMINI_API_BASE"), os.environ.get("GEMINI_API_KEY"))
+    sys.argv = argv
+    os.environ["GEMINI_API_BASE"] = server.url
+    os.environ["GEMINI_API_KEY"] = "test-key"
+    try:
+        return evaluator.main()
+    finally:
+        sys.argv = saved[0]
+        for name, value in (("GEMINI_API_BASE", saved[1]), ("GEMINI_API_KEY", saved[2])):
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def test_main_resumes_from_ledger() -> bool:
+    with tempfile.TemporaryDirectory() as tmp:
+        tmpdir = Path(tmp)
+        write_csv(tmpdir / "complete_translations.csv", ROWS)
+        ledger_path = evaluator.default_ledger_path(tmpdir / "results.csv")
+
+        with FakeGeminiServer(failures=(), reject="BOOM") as server:
+            try:
+                run_evaluator(tmpdir, server)
+                raise AssertionError("the rejected batch must fail the run")
+            except evaluator.gj.GeminiHTTPError:
+                pass
+        assert not (tmpdir / "results.csv").exists()
+        assert len(evaluator.EvaluationLedger(ledger_path, "model-a")) == 4
+
+        with FakeGeminiServer(failures=()) as server:
+            assert run_evaluator(tmpdir, server) == 0
+            assert server.requests == 1, server.requests
+        rows = read_csv(tmpdir / "results.csv")
+        assert [row["identifier"] for row in rows] == [r[0] for r in ROWS]
+
+        edited = list(ROWS)
+        edited[2] = ("next", "general", "next", "WRONG weiter")
+        write_csv(tmpdir / "complete_translations.csv", edited)
+        with FakeGeminiServer(failures=()) as server:
+            assert run_evaluator(tmpdir, server) == 0
+            assert server.requests == 1 and server.batch_sizes == [1], server.batch_sizes
+        rows = {row["identifier"]: row for row in read_csv(tmpdir / "results.csv")}
+        assert rows["next"]["human_review"] == "yes" and rows["great_job"]["human_review"] == "no"
+    return True
+
+
+def test_run_gemini_all_uses_ledger() -> bool:
+    calls = []
+
+    def fake_single(item, api_key, model, fallback_model):
+        calls.append(item.identifier)
+        return {"score": 4, "errors": [], "notes": model}
+
+    def fake_batch(items, api_key, model, fallback_model):
+        return [fake_single(item, api_key, model, fallback_model) for item in items]
+
+    # run_gemini_all imports the evaluator as a top-level module
+    gqe = run_gemini_all.gqe
+    saved = (gqe.evaluate_single, gqe.evaluate_object_batch, sys.argv, os.environ.get("GEMINI_API_KEY"))
+    gqe.evaluate_single, gqe.evaluate_object_batch = fake_single, fake_batch
+    os.environ["GEMINI_API_KEY"] = "test-key"
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmpdir = Path(tmp)
+            write_csv(tmpdir / "complete_translations.csv", ROWS)
+            out = tmpdir / "results.csv"
+            # Output of a run from before the ledger existed, including another language and a retired item
+            old = [
+                {"identifier": "happy", "language": "de", "score": "5", "notes": "old run"},
+                {"identifier": "happy", "language": "fr-CA", "score": "3", "notes": "other language"},
+                {"identifier": "retired", "language": "de", "score": "4", "notes": "not in input"},
+            ]
+            run_gemini_all.flush(out, old)
+            argv = ["run_gemini_all.py", "--input-csv", str(tmpdir / "complete_translations.csv"),
+                    "--output-csv", str(out), "--target-cols", "de", "--workers", "2"]
+            sys.argv = argv
+
+            assert run_gemini_all.main() == 0
+            assert sorted(calls) == sorted(r[0] for r in ROWS[1:]), calls
+            rows = read_csv(out)
+            assert [(row["identifier"], row["language"]) for row in rows] == (
+                [("happy", "de"), ("happy", "fr-CA"), ("retired", "de")] + [(r[0], "de") for r in ROWS[1:]]
+            )
+            assert rows[0]["notes"] == "old run"
+
+            calls.clear()
+            assert run_gemini_all.main() == 0 and calls == []
+
+            # A --limit smoke run keeps every row outside the limit
+            sys.argv = argv + ["--limit", "1"]
+            assert run_gemini_all.main() == 0 and calls == []
+            assert read_csv(out) == rows
+    finally:
+        gqe.evaluate_single, gqe.evaluate_object_batch, sys.argv = saved[:3]
+        if saved[3] is None:
+            os.environ.pop("GEMINI_API_KEY", None)
+        else:
+            os.environ["GEMINI_API_KEY"] = saved[3]
+    return True
+
+
+def main() -> int:
+    try:
+        test_ledger_keys_and_reload()
+        test_main_resumes_from_ledger()
+        test_run_gemini_all_uses_ledger()
+    except AssertionError as exc:
+        print(f"FAIL: {exc}")
+        return 1
+    except Exception as exc:
+        print(f"ERROR: {exc}")
+        return 1
+    print("PASS: Gemini evaluation ledger tests")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Tests for the concurrent Gemini judge stage (translation_grading/gemini_judge.py).
+
+A local fake Gemini server answers ``generateContent`` over HTTP/1.1
+keep-alive. It rejects the first request with 429 (Retry-After) and the
+second with 503, so we can check retries, connection reuse, the worker cap
+and that a second run is served entirely from the response cache.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from translation_grading import gemini_judge as gj
+from translation_grading import pipeline
+
+
+class FakeGeminiServer:
+    """Threaded HTTP/1.1 server returning a judgement per prompt."""
+
+    def __init__(self, failures=(429, 503), latency: float = 0.05):
+        self.failures = list(failures)
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.connections = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                payload = json.loads(self.rfile.read(length))
+                prompt = payload["contents"][0]["parts"][0]["text"]
+                with server.lock:
+                    server.requests += 1
+                    server.connections.add(self.client_address)
+                    status = server.failures.pop(0) if server.failures else 200
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                time.sleep(server.latency)
+                with server.lock:
+                    server.in_flight -= 1
+                if status != 200:
+                    body = b'{"error": "try again"}'
+                    self.send_response(status)
+                    self.send_header("Retry-After", "0.1")
+                else:
+                    score = 40 if "WRONG" in prompt else 95
+                    judged = {"final_score": score, "severity": "major" if score < 75 else "none"}
+                    body = json.dumps({"candidates": [{"content": {"parts": [{"text": json.dumps(judged)}]}}]}).encode()
+                    self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/v1beta"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def make_rows(count: int):
+    return [
+        pipeline.RowTranslation(
+            item_id=f"item-{i}",
+            row_index=i + 2,
+            source_text=f"Sentence number {i}.",
+            target_lang="de",
+            target_text="WRONG" if i == 0 else f"Satz Nummer {i}.",
+        )
+        for i in range(count)
+    ]
+
+
+def make_args(cache_dir: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        run_llm_judge=True,
+        gemini_api_key_env="FAKE_GEMINI_KEY",
+        gemini_model="gemini-test",
+        gemini_threshold=75.0,
+        llm_prompt_mode="generic",
+        llm_only_flagged=False,
+        llm_max_calls=0,
+        llm_workers=3,
+        llm_rate_per_minute=0,
+        llm_max_retries=3,
+        llm_cache_dir=cache_dir,
+    )
+
+
+def test_concurrent_judging_with_retries_and_keep_alive() -> bool:
+    os.environ["FAKE_GEMINI_KEY"] = "test-key"
+    with tempfile.TemporaryDirectory() as tmpdir, FakeGeminiServer() as server:
+        os.environ["GEMINI_API_BASE"] = server.url
+        try:
+            rows = make_rows(12)
+            pipeline.run_llm_judge_stage(rows, make_args(tmpdir))
+        finally:
+            os.environ.pop("GEMINI_API_BASE", None)
+
+        assert all("llm_final" in r.scores for r in rows), [r.notes for r in rows]
+        assert rows[0].needs_review and "llm_severity:major" in rows[0].review_reasons
+        assert not any(r.needs_review for r in rows[1:])
+        assert server.requests == 14, server.requests  # 12 rows + 429 + 503 retries
+        assert server.max_in_flight <= 3, server.max_in_flight
+        assert len(server.connections) <= 4, f"expected keep-alive reuse, got {len(server.connections)} connections"
+    return True
+
+
+def test_second_run_is_served_from_cache() -> bool:
+    os.environ["FAKE_GEMINI_KEY"] = "test-key"
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with FakeGeminiServer(failures=()) as server:
+            os.environ["GEMINI_API_BASE"] = server.url
+            try:
+                pipeline.run_llm_judge_stage(make_rows(5), make_args(tmpdir))
+                first_requests = server.requests
+                rows = make_rows(6)  # one new row
+                pipeline.run_llm_judge_stage(rows, make_args(tmpdir))
+            finally:
+                os.environ.pop("GEMINI_API_BASE", None)
+        assert first_requests == 5
+        assert server.requests == 6, server.requests
+        assert rows[0].scores["llm_final"] == 40
+
+        # A torn last line from an interrupted run is ignored on load
+        with open(os.path.join(tmpdir, "responses.jsonl"), "a", encoding="utf-8") as handle:
+            handle.write('{"key": "partial')
+        assert len(gj.ResponseCache(tmpdir)) == 6
+    return True
+
+
+def test_non_retryable_errors_are_reported_per_row() -> bool:
+    with FakeGeminiServer(failures=(400,)) as server:
+        client = gj.GeminiClient("k", api_base=server.url, max_retries=2, backoff=0.01)
+        results = gj.judge_prompts(["a", "b"], "gemini-test", client, max_workers=1)
+    assert isinstance(results[0], gj.GeminiHTTPError) and results[0].status == 400
+    assert results[1]["final_score"] == 95
+    assert server.requests == 2
+    return True
+
+
+def main() -> int:
+    try:
+        test_concurrent_judging_with_retries_and_keep_alive()
+        test_second_run_is_served_from_cache()
+        test_non_retryable_errors_are_reported_per_row()
+    except AssertionError as exc:
+        print(f"FAIL: {exc}")
+        return 1
+    except Exception as exc:
+        print(f"ERROR: {exc}")
+        return 1
+    print("PASS: Gemini judge tests")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
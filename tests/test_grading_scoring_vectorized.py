@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Equivalence tests and benchmark for the vectorized grading scores
+(translation_grading/embedding_baseline.py).
+
+The reference functions below are the per-row loops the consistency and
+baseline-outlier stages used before; the grouped matrix versions must match
+them numerically.
+
+Benchmark at scale:
+    python tests/test_grading_scoring_vectorized.py --rows 100000 --langs 20
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from translation_grading import embedding_baseline as eb
+
+TOLERANCE = 1e-5
+
+
+def reference_consistency(target_emb, source_emb, item_ids):
+    per_item = {}
+    for idx, item_id in enumerate(item_ids):
+        per_item.setdefault(item_id, []).append(idx)
+    scores = np.zeros(len(item_ids))
+    fallback = np.zeros(len(item_ids), dtype=bool)
+    for indices in per_item.values():
+        for idx in indices:
+            others = [target_emb[j] for j in indices if j != idx]
+            if others:
+                scores[idx] = eb.cosine(target_emb[idx], np.mean(np.array(others), axis=0))
+            else:
+                scores[idx] = eb.cosine(target_emb[idx], source_emb[idx])
+                fallback[idx] = True
+    return scores, fallback
+
+
+def reference_baseline(cand_emb, cand_item, cand_lang, base_emb, base_item, base_lang):
+    by_item = eb.build_index(base_item)
+    by_item_lang = eb.build_index([f"{i}|{l}" for i, l in zip(base_item, base_lang)])
+    by_lang = eb.build_index(base_lang)
+    out = {name: np.full(len(cand_emb), np.nan) for name in ("item_centroid", "item_lang_max", "lang_centroid")}
+    for idx, vec in enumerate(cand_emb):
+        item_idx = by_item.get(cand_item[idx], [])
+        item_lang_idx = by_item_lang.get(f"{cand_item[idx]}|{cand_lang[idx]}", [])
+        lang_idx = by_lang.get(cand_lang[idx], [])
+        if item_idx:
+            out["item_centroid"][idx] = eb.cosine(vec, np.mean(base_emb[item_idx], axis=0))
+        if item_lang_idx:
+            out["item_lang_max"][idx] = max(eb.cosine(vec, base_emb[j]) for j in item_lang_idx)
+        if lang_idx:
+            out["lang_centroid"][idx] = eb.cosine(vec, np.mean(base_emb[lang_idx], axis=0))
+    return out
+
+
+def make_rows(n_rows, n_langs, dim, seed):
+    rng = np.random.default_rng(seed)
+    langs = [f"l{j}" for j in range(n_langs)]
+    n_items = max(1, n_rows // n_langs)
+    item_ids = [f"item-{i % n_items}" for i in range(n_rows)]
+    target_langs = [langs[i // n_items % n_langs] for i in range(n_rows)]
+    emb = rng.normal(size=(n_rows, dim)).astype(np.float32)
+    emb /= np.linalg.norm(emb, axis=1, keepdims=True)
+    return emb, item_ids, target_langs
+
+
+def test_consistency_matches_reference() -> bool:
+    rng = np.random.default_rng(1)
+    target_emb = rng.normal(size=(60, 16)).astype(np.float32)
+    source_emb = rng.normal(size=(60, 16)).astype(np.float32)
+    target_emb[3] = 0.0  # zero vectors score 0 like eb.cosine
+    item_ids = [f"item-{i % 25}" for i in range(50)] + [f"solo-{i}" for i in range(10)]
+
+    expected, expected_fallback = reference_consistency(target_emb, source_emb, item_ids)
+    scores, fallback = eb.leave_one_out_cosine(target_emb, item_ids, source_emb)
+    assert np.array_equal(fallback, expected_fallback), "fallback basis differs"
+    assert fallback.sum() == 10
+    assert np.allclose(scores, expected, atol=TOLERANCE), np.abs(scores - expected).max()
+    return True
+
+
+def test_baseline_matches_reference() -> bool:
+    base_emb, base_item, base_lang = make_rows(300, 5, 24, seed=2)
+    cand_emb, cand_item, cand_lang = make_rows(120, 6, 24, seed=3)  # l5 is unknown to the baseline
+    cand_item[0] = "brand-new-item"
+
+    expected = reference_baseline(cand_emb, cand_item, cand_lang, base_emb, base_item, base_lang)
+    actual = eb.baseline_similarities(cand_emb, cand_item, cand_lang, base_emb, base_item, base_lang)
+    for name, values in expected.items():
+        assert np.array_equal(np.isnan(values), np.isnan(actual[name])), f"{name}: missing groups differ"
+        assert np.allclose(actual[name], values, atol=TOLERANCE, equal_nan=True), name
+    assert np.isnan(actual["item_centroid"][0]) and np.isnan(actual["item_lang_max"][0])
+    assert eb.optional_score(actual["item_centroid"][0]) is None
+    return True
+
+
+def benchmark(n_rows, n_langs, dim, skip_reference=False) -> bool:
+    emb, item_ids, langs = make_rows(n_rows, n_langs, dim, seed=4)
+    source_emb, _, _ = make_rows(n_rows, n_langs, dim, seed=5)
+    cand_emb, _, _ = make_rows(n_rows, n_langs, dim, seed=6)
+    print(f"📊 {n_rows} rows, {n_langs} languages, dim {dim}")
+
+    start = time.perf_counter()
+    scores, _ = eb.leave_one_out_cosine(emb, item_ids, source_emb)
+    sims = eb.baseline_similarities(cand_emb, item_ids, langs, emb, item_ids, langs)
+    vectorized = time.perf_counter() - start
+    print(f"   ⚡ vectorized: {vectorized:.2f}s")
+    if skip_reference:
+        return True
+
+    start = time.perf_counter()
+    ref_scores, _ = reference_consistency(emb, source_emb, item_ids)
+    ref_sims = reference_baseline(cand_emb, item_ids, langs, emb, item_ids, langs)
+    reference = time.perf_counter() - start
+    print(f"   🐢 per-row loops: {reference:.2f}s ({reference / max(vectorized, 1e-9):.0f}x slower)")
+
+    max_diff = float(np.abs(scores - ref_scores).max())
+    for name, values in ref_sims.items():
+        max_diff = max(max_diff, float(np.nanmax(np.abs(sims[name] - values))))
+    print(f"   🔍 max abs difference: {max_diff:.2e}")
+    return max_diff <= TOLERANCE
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Vectorized grading score tests / benchmark")
+    parser.add_argument("--rows", type=int, default=0, help="Also benchmark with this many rows")
+    parser.add_argument("--langs", type=int, default=20)
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--skip-reference", action="store_true", help="Only time the vectorized path")
+    args = parser.parse_args()
+    try:
+        test_consistency_matches_reference()
+        test_baseline_matches_reference()
+        if args.rows and not benchmark(args.rows, args.langs, args.dim, args.skip_reference):
+            print("FAIL: vectorized scores differ from the reference loops")
+            return 1
+    except AssertionError as exc:
+        print(f"FAIL: {exc}")
+        return 1
+    except Exception as exc:
+        print(f"ERROR: {exc}")
+        return 1
+    print("PASS: vectorized grading score tests")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Tests for the single-open ID3 tag session API in utilities/utilities.py
+(ID3TagSession, update_id3_tags_bulk) and its use in
+itembank_by_task_regen_report.seed_from_audio_directory.
+
+Copies of tests/test_audio_with_metadata.mp3 are patched in a temp directory.
+"""
+
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mutagen.id3 import ID3
+from mutagen.mp3 import MP3
+
+from utilities import utilities as u
+from utilities import itembank_by_task_regen_report as regen
+
+SAMPLE_MP3 = Path(__file__).resolve().parent / "test_audio_with_metadata.mp3"
+
+
+def reference_read(file_path):
+    """The previous read_id3_tags body (two TXXX walks)."""
+    audio_file = MP3(file_path, ID3=ID3)
+    tags = {}
+    if audio_file.tags:
+        for field, frame_id in [('title', 'TIT2'), ('artist', 'TPE1'), ('album', 'TALB'), ('date', 'TDRC'), ('genre', 'TCON')]:
+            tags[field] = str(audio_file.tags.get(frame_id, [''])[0]) if audio_file.tags.get(frame_id) else ''
+        comment_frames = audio_file.tags.getall('COMM')
+        tags['comment'] = str(comment_frames[0].text[0]) if comment_frames else ''
+        copyright_frames = audio_file.tags.getall('TCOP')
+        if copyright_frames:
+            tags['copyright'] = str(copyright_frames[0].text[0]) if copyright_frames[0].text else ''
+        else:
+            for frame in audio_file.tags.getall('TXXX'):
+                if frame.desc and frame.desc.upper() == 'COPYRIGHT' and frame.text:
+                    tags['copyright'] = str(frame.text[0])
+                    break
+            else:
+                tags['copyright'] = ''
+        for frame in audio_file.tags.getall('TXXX'):
+            if frame.desc and frame.text:
+                tags[frame.desc] = str(frame.text[0])
+    return tags
+
+
+def copy_sample(directory, name):
+    path = os.path.join(directory, name)
+    shutil.copy2(SAMPLE_MP3, path)
+    return path
+
+
+def freeze_mtime(path):
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    return os.stat(path).st_mtime_ns
+
+
+def test_session_reads_like_read_id3_tags_and_saves_only_on_change() -> bool:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = copy_sample(tmpdir, "clip.mp3")
+        assert u.write_id3_tags(path, {"title": "item-1", "copyright": "CC BY", "text": "Hallo", "task": ""})
+        assert u.read_id3_tags(path) == reference_read(path)
+
+        before = freeze_mtime(path)
+        with u.ID3TagSession(path) as session:
+            assert session.get("text") == "Hallo" and session.get("title") == "item-1"
+            assert session.get("task") == ""
+            assert not session.set("text", "Hallo")
+        assert os.stat(path).st_mtime_ns == before, "unchanged session must not save"
+
+        # Rewriting identical tags is a no-op on disk too
+        assert u.write_id3_tags(path, {"title": "item-1", "text": "Hallo"})
+        assert os.stat(path).st_mtime_ns == before
+
+        with u.ID3TagSession(path) as session:
+            assert session.set("task", "vocab")
+            assert session.remove("research_notes")
+            assert not session.remove("does_not_exist")
+        tags = u.read_id3_tags(path)
+        assert tags["task"] == "vocab" and "research_notes" not in tags
+        assert tags == reference_read(path)
+
+        # An exception inside the block leaves the file untouched
+        before = freeze_mtime(path)
+        try:
+            with u.ID3TagSession(path) as session:
+                session.set("task", "math")
+                raise ValueError("abort")
+        except ValueError:
+            pass
+        assert os.stat(path).st_mtime_ns == before and u.read_id3_tags(path)["task"] == "vocab"
+    return True
+
+
+def test_bulk_update_counts_changed_and_unchanged() -> bool:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for i in range(6):
+            copy_sample(tmpdir, f"item_{i}.mp3")
+        u.write_id3_tags(os.path.join(tmpdir, "item_0.mp3"), {"task": "vocab"})
+        with open(os.path.join(tmpdir, "broken.mp3"), "wb") as handle:
+            handle.write(b"not an mp3")
+
+        def add_task(session):
+            if not session.get("task"):
+                session.set("task", "vocab")
+            return session.get("lang_code")
+
+        stats = u.update_id3_tags_bulk(tmpdir, add_task, max_workers=4)
+        assert (stats["changed"], stats["unchanged"], stats["failed"]) == (5, 1, 1), stats
+        assert list(stats["results"]) == sorted(stats["results"])
+        assert stats["results"][os.path.join(tmpdir, "item_3.mp3")]["value"] == reference_read(SAMPLE_MP3)["lang_code"]
+
+        again = u.update_id3_tags_bulk(sorted(Path(tmpdir).glob("item_*.mp3")), add_task, max_workers=4)
+        assert (again["changed"], again["unchanged"], again["failed"]) == (0, 6, 0), again
+
+        # A single file path is one file, not an iterable of characters
+        single_path = os.path.join(tmpdir, "item_2.mp3")
+        for single in (single_path, Path(single_path)):
+            one = u.update_id3_tags_bulk(single, add_task)
+            assert list(one["results"]) == [single_path], one
+            assert (one["unchanged"], one["failed"]) == (1, 0), one
+    return True
+
+
+def test_seed_backfills_task_in_one_pass() -> bool:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        lang_dir = Path(tmpdir) / "de"
+        lang_dir.mkdir()
+        for item_id in ["apple", "bread", "cheese"]:
+            path = copy_sample(lang_dir, f"{item_id}.mp3")
+            u.write_id3_tags(path, {"text": f"{item_id} text"})
+        u.write_id3_tags(str(lang_dir / "cheese.mp3"), {"task": "already"})
+
+        conn = sqlite3.connect(":memory:")
+        regen.ensure_db(conn)
+        stats = regen.seed_from_audio_directory(
+            conn,
+            audio_base_dir=Path(tmpdir),
+            lang_code="de",
+            run_id=1,
+            item_task_map={"apple": "vocab", "bread": "vocab", "cheese": "vocab"},
+            backfill_task_tag=True,
+            id3_workers=2,
+        )
+        assert stats["scanned"] == 3 and stats["seeded"] == 3, stats
+        assert stats["task_backfilled"] == 2 and stats["task_backfill_failed"] == 0, stats
+        assert u.read_id3_tags(str(lang_dir / "apple.mp3"))["task"] == "vocab"
+        assert u.read_id3_tags(str(lang_dir / "cheese.mp3"))["task"] == "already"
+        rows = dict(conn.execute("SELECT item_id, task FROM items_current"))
+        assert rows == {"apple": "vocab", "bread": "vocab", "cheese": "already"}, rows
+        conn.close()
+    return True
+
+
+def main() -> int:
+    try:
+        test_session_reads_like_read_id3_tags_and_saves_only_on_change()
+        test_bulk_update_counts_changed_and_unchanged()
+        test_seed_backfills_task_in_one_pass()
+    except AssertionError as exc:
+        print(f"FAIL: {exc}")
+        return 1
+    except Exception as exc:
+        print(f"ERROR: {exc}")
+        return 1
+    print("PASS: ID3 tag session tests")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Tests for the SQLite-backed master cache (utilities/master_store.py)."""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utilities.master_store import MasterStore
+
+
+def write_master_csv(path: Path) -> None:
+    pd.DataFrame(
+        {
+            "item_id": ["intro", "next", "great-job"],
+            "labels": ["general", "general", "survey"],
+            "de-DE": ["Willkommen", "", ""],
+            "es-CO": ["", "", ""],
+        }
+    ).to_csv(path, index=False)
+
+
+def test_import_upsert_and_export_roundtrip() -> bool:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        csv_path = Path(tmpdir) / "translation_master.csv"
+        db_path = Path(tmpdir) / "master.sqlite"
+        write_master_csv(csv_path)
+
+        store = MasterStore(str(csv_path), str(db_path))
+        assert store.columns() == ["item_id", "labels", "de-DE", "es-CO"]
+        assert store.get_column("de-DE")["intro"]["text"] == "Willkommen"
+
+        store.upsert("next", "de-DE", "Weiter", voice="Julia", service="ElevenLabs", model_id="eleven_v3")
+        store.upsert("new-item", "fr-CA", "Bravo")
+        assert store.ensure_items(["intro", "another"]) == 1
+
+        cell = store.get_column("de-DE")["next"]
+        assert cell == {"text": "Weiter", "voice": "Julia", "service": "ElevenLabs", "model_id": "eleven_v3"}
+
+        store.export_csv()
+        exported = pd.read_csv(csv_path, dtype=str, keep_default_na=False)
+        assert list(exported.columns) == ["item_id", "labels", "de-DE", "es-CO", "fr-CA"]
+        assert list(exported["item_id"]) == ["intro", "next", "great-job", "new-item", "another"]
+        assert exported.loc[exported["item_id"] == "next", "de-DE"].item() == "Weiter"
+        assert exported.loc[exported["item_id"] == "great-job", "labels"].item() == "survey"
+
+        store.clear_column("de-DE")
+        assert store.get_column("de-DE") == {}
+        store.close()
+    return True
+
+
+def test_progress_survives_without_export_and_external_edits_reimport() -> bool:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        csv_path = Path(tmpdir) / "translation_master.csv"
+        db_path = Path(tmpdir) / "master.sqlite"
+        write_master_csv(csv_path)
+
+        store = MasterStore(str(csv_path), str(db_path))
+        store.export_csv()
+        store.upsert("next", "es-CO", "Siguiente")
+        store.close()  # simulate a run that stops before exporting
+
+        reopened = MasterStore(str(csv_path), str(db_path))
+        assert reopened.get_column("es-CO")["next"]["text"] == "Siguiente"
+        reopened.close()
+
+        # Someone rewrites the CSV afterwards (e.g. rebuild_master.py)
+        time.sleep(0.05)
+        pd.DataFrame({"item_id": ["only"], "de-DE": ["Nur"]}).to_csv(csv_path, index=False)
+        future = time.time() + 5
+        os.utime(csv_path, (future, future))
+
+        reimported = MasterStore(str(csv_path), str(db_path))
+        assert reimported.columns()[:2] == ["item_id", "de-DE"]
+        assert reimported.get_column("de-DE") == {
+            "only": {"text": "Nur", "voice": None, "service": None, "model_id": None}
+        }
+        reimported.close()
+    return True
+
+
+def main() -> int:
+    try:
+        test_import_upsert_and_export_roundtrip()
+        test_progress_survives_without_export_and_external_edits_reimport()
+    except AssertionError as exc:
+        print(f"FAIL: {exc}")
+        return 1
+    except Exception as exc:
+        print(f"ERROR: {exc}")
+        return 1
+    print("PASS: master store tests")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Tests for batched cross-lingual meaning similarity
+(validate_audio/metrics.py + ValidationSession).
+
+A stand-in sentence-transformer (numpy only) records every encode call so we
+can check batch sizes, that each distinct text is encoded once, and that
+expected-text embeddings come from the on-disk cache on a rerun.
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from validate_audio import metrics, validator
+from validate_audio.transcript_cache import TextEmbeddingCache
+
+
+class FakeSentenceModel:
+    def __init__(self, dim: int = 8):
+        self.dim = dim
+        self.calls = []
+
+    def vector(self, text):
+        return np.random.default_rng(sum(map(ord, text)) + len(text)).normal(size=self.dim).astype(np.float32)
+
+    def encode(self, texts, batch_size=32, convert_to_numpy=True, normalize_embeddings=True, show_progress_bar=False):
+        self.calls.append((list(texts), batch_size))
+        vecs = np.stack([self.vector(t) for t in texts])
+        return vecs / np.linalg.norm(vecs, axis=1, keepdims=True)
+
+
+def reference_cosine(model, a, b):
+    u, v = model.vector(a), model.vector(b)
+    return float(np.dot(u, v) / (np.linalg.norm(u) * np.linalg.norm(v)))
+
+
+def test_batch_scores_and_expected_cache() -> bool:
+    pairs = [("the cat", "el gato"), ("the dog", "el perro"), ("the cat", "la gata"), ("", "")]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = TextEmbeddingCache(os.path.join(tmpdir, "emb.sqlite"))
+        model = FakeSentenceModel()
+        scores = metrics.crosslingual_meaning_similarity_batch(
+            pairs, model_name="fake", batch_size=16, embedding_cache=cache, model=model
+        )
+        for (a, b), score in zip(pairs, scores):
+            assert abs(score - reference_cosine(model, a, b)) < 1e-5, (a, b, score)
+        # One call for the three distinct expected texts, one for the four transcripts
+        assert [sorted(texts) for texts, _ in model.calls] == [sorted(["the cat", "the dog", ""]),
+                                                               sorted(["el gato", "el perro", "la gata", ""])]
+        assert all(size == 16 for _, size in model.calls)
+
+        # A rerun only encodes transcripts; expected texts come from the cache
+        rerun = FakeSentenceModel()
+        again = metrics.crosslingual_meaning_similarity_batch(
+            pairs, model_name="fake", batch_size=16, embedding_cache=cache, model=rerun
+        )
+        assert len(rerun.calls) == 1 and "the cat" not in rerun.calls[0][0]
+        assert np.allclose(again, scores, atol=1e-6)
+
+        # A different model name does not reuse the vectors
+        other = FakeSentenceModel()
+        metrics.crosslingual_meaning_similarity_batch(pairs[:1], model_name="other", embedding_cache=cache, model=other)
+        assert other.calls[0][0] == ["the cat"]
+        cache.close()
+    return True
+
+
+def test_session_scores_meaning_in_blocks() -> bool:
+    batches = []
+
+    def scorer(pairs):
+        batches.append(len(pairs))
+        return [float(len(e)) for e, _ in pairs]
+
+    class FailingTranscriber:
+        def transcribe(self, audio_file_path, language=None, audio=None):
+            if audio_file_path.endswith("boom"):
+                raise RuntimeError("simulated crash")
+            return {"text": "ok", "language": language}
+
+    def make_session():
+        return validator.ValidationSession(
+            include_quality=False,
+            transcriber=FailingTranscriber(),
+            audio_loader=lambda path, include_quality: {"asr": None},
+            meaning_scorer=scorer,
+            meaning_batch_size=4,
+        )
+
+    paths = [f"clip_{i}" for i in range(10)]
+    expected = ["x" * (i + 1) for i in range(10)]
+    results = validator.validate_many(paths, expected_texts=expected, session=make_session())
+    assert batches == [4, 4, 2], batches
+    assert [r["meaning_similarity"] for r in results] == [float(i + 1) for i in range(10)]
+
+    # Files finished before a failure are still scored and yielded
+    batches.clear()
+    seen = []
+    try:
+        for result in make_session().iter_validate(paths[:6] + ["boom"], expected_texts=expected):
+            seen.append(result)
+        raise AssertionError("expected the simulated crash")
+    except RuntimeError:
+        pass
+    assert len(seen) == 6 and batches == [4, 2], (len(seen), batches)
+    assert seen[5]["meaning_similarity"] == 6.0
+    return True
+
+
+def main() -> int:
+    try:
+        test_batch_scores_and_expected_cache()
+        test_session_scores_meaning_in_blocks()
+    except AssertionError as exc:
+        print(f"FAIL: {exc}")
+        return 1
+    except Exception as exc:
+        print(f"ERROR: {exc}")
+        return 1
+    print("PASS: batched meaning similarity tests")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
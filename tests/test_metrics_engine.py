@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Equivalence tests and micro-benchmark for the bulk text-metrics engine
+(validate_audio/metrics.py).
+
+The reference functions below are the per-call code paths the metrics used
+before (regexes compiled on every call, a Python Levenshtein table per pair,
+set-based word overlap); the engine must give the same numbers.
+
+Benchmark at scale:
+    python tests/test_metrics_engine.py --pairs 20000
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+from difflib import SequenceMatcher
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from validate_audio import metrics
+
+WORDS = [
+    "the", "cat", "sat", "on", "mat", "Mika's", "medium-sized", "omelette", "Straße",
+    "phone", "quick", "box", "cinema", "gentle", "belle", "classe", "pomme", "hello,", "world!",
+]
+
+
+def reference_preprocess(text):
+    text = text.lower()
+    text = re.sub(r"(\w)'s\b", r"\1s", text)
+    text = re.sub(r"(\w)'(\w)", r"\1\2", text)
+    text = re.sub(r'(\w)-(\w)', r'\1 \2', text)
+    text = re.sub(r'[,;:!?]+', ' ', text)
+    text = re.sub(r'\.+', '.', text)
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip()
+
+
+def reference_phonetic(word):
+    normalized = re.sub(r'[\s\-]', '', word.lower())
+    for pattern, replacement in [('ä', 'a'), ('ö', 'o'), ('ü', 'u'), ('ß', 'ss'),
+                                 ('tte', 'tt'), ('tt', 't'), ('lle', 'll'), ('ll', 'l'),
+                                 ('sse', 'ss'), ('ss', 's'), ('nne', 'nn'), ('nn', 'n'),
+                                 ('mme', 'mm'), ('mm', 'm')]:
+        normalized = re.sub(pattern, replacement, normalized)
+    for pattern, replacement in {r'ph': 'f', r'ck': 'k', r'qu': 'kw', r'x': 'ks',
+                                 r'c([ei])': r's\1', r'g([ei])': r'j\1'}.items():
+        normalized = re.sub(pattern, replacement, normalized)
+    return normalized
+
+
+def reference_wer(reference, hypothesis):
+    ref, hyp = reference.split(), hypothesis.split()
+    if not ref:
+        return None
+    prev = list(range(len(hyp) + 1))
+    for i, r_word in enumerate(ref, 1):
+        cur = [i] + [0] * len(hyp)
+        for j, h_word in enumerate(hyp, 1):
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (r_word != h_word))
+        prev = cur
+    return prev[-1] / len(ref)
+
+
+def reference_basic(expected, transcribed):
+    orig = reference_preprocess((expected or "").strip())
+    trans = reference_preprocess((transcribed or "").strip())
+    orig_words, trans_words = set(orig.split()), set(trans.split())
+    union = orig_words | trans_words
+    return {
+        "similarity_ratio": SequenceMatcher(None, orig, trans).ratio(),
+        "word_error_rate": reference_wer(orig, trans),
+        "word_overlap": len(orig_words & trans_words) / len(union) if union else 0,
+        "words_matched": len(orig_words & trans_words),
+        "total_unique_words": len(union),
+        "original_cleaned": orig,
+        "transcribed_cleaned": trans,
+    }
+
+
+def make_pairs(count, seed=0):
+    rng = random.Random(seed)
+    pairs = [("", ""), ("", "extra words"), ("just words", ""), ("Hello, world!", "hello world")]
+    while len(pairs) < count:
+        expected = [rng.choice(WORDS) for _ in range(rng.randint(1, 14))]
+        heard = list(expected)
+        for _ in range(rng.randint(0, 4)):
+            op = rng.random()
+            if op < 0.3 and heard:
+                heard.pop(rng.randrange(len(heard)))
+            elif op < 0.6:
+                heard.insert(rng.randrange(len(heard) + 1), rng.choice(WORDS))
+            elif heard:
+                heard[rng.randrange(len(heard))] = rng.choice(WORDS)
+        pairs.append((" ".join(expected), " ".join(heard)))
+    return pairs[:count]
+
+
+def test_preprocessing_and_phonetics_unchanged() -> bool:
+    for expected, transcribed in make_pairs(300, seed=1):
+        for text in (expected, transcribed):
+            assert metrics.preprocess_text_for_comparison(text) == reference_preprocess(text), text
+    for word in ["omelette", "straße", "phonecheck", "quixotic", "cinema", "gentle", "bonne-pomme", "Ärger"]:
+        assert metrics._phonetic_key(word) == reference_phonetic(word), word
+    return True
+
+
+def test_word_error_rates_match_levenshtein() -> bool:
+    pairs = make_pairs(500, seed=2)
+    refs = [reference_preprocess(e) for e, _ in pairs]
+    hyps = [reference_preprocess(t) for _, t in pairs]
+    rates = metrics.word_error_rates(refs, hyps)
+    for rate, ref, hyp in zip(rates, refs, hyps):
+        want = reference_wer(ref, hyp)
+        if want is None:
+            assert np.isnan(rate), (ref, hyp)
+        else:
+            assert abs(rate - want) < 1e-12, (ref, hyp, rate, want)
+    assert len(metrics.word_error_rates([], [])) == 0
+    return True
+
+
+def test_engine_matches_per_call_metrics() -> bool:
+    pairs = make_pairs(200, seed=3)
+    engine = metrics.MetricsEngine()
+    basic = engine.basic_many(pairs)
+    try:
+        import jiwer  # type: ignore  # noqa: F401
+        has_jiwer = True
+    except Exception:
+        has_jiwer = False
+    for (expected, transcribed), got in zip(pairs, basic):
+        want = reference_basic(expected, transcribed)
+        if not has_jiwer:
+            want["word_error_rate"] = None
+        assert got == want, (expected, transcribed, got, want)
+
+    combined = engine.score_many(pairs[:20], language="en")
+    for (expected, transcribed), result in zip(pairs[:20], combined):
+        assert result["basic_metrics"] == metrics.compute_basic_metrics(expected, transcribed)
+        assert result["comprehensive_metrics"] == metrics.comprehensive_text_similarity(expected, transcribed)
+        assert result["elevenlabs_validation"] == metrics.validate_elevenlabs_audio(expected, transcribed, "en")
+    return True
+
+
+def benchmark(n_pairs) -> bool:
+    pairs = make_pairs(n_pairs, seed=4)
+    print(f"📊 {n_pairs} (expected, transcribed) pairs")
+
+    start = time.perf_counter()
+    basic = metrics.MetricsEngine().basic_many(pairs)
+    engine_time = time.perf_counter() - start
+    print(f"   ⚡ engine basic metrics: {engine_time:.2f}s")
+
+    start = time.perf_counter()
+    reference = [reference_basic(e, t) for e, t in pairs]
+    reference_time = time.perf_counter() - start
+    print(f"   🐢 per-pair reference: {reference_time:.2f}s ({reference_time / max(engine_time, 1e-9):.1f}x slower)")
+
+    refs = [r["original_cleaned"] for r in reference]
+    hyps = [r["transcribed_cleaned"] for r in reference]
+    start = time.perf_counter()
+    rates = metrics.word_error_rates(refs, hyps)
+    print(f"   ⚡ bulk WER alone: {time.perf_counter() - start:.2f}s")
+
+    mismatches = 0
+    for got, want, rate in zip(basic, reference, rates):
+        want_wer = want["word_error_rate"]
+        if got["word_overlap"] != want["word_overlap"] or got["original_cleaned"] != want["original_cleaned"]:
+            mismatches += 1
+        elif (want_wer is None) != bool(np.isnan(rate)) or (want_wer is not None and abs(rate - want_wer) > 1e-12):
+            mismatches += 1
+    print(f"   🔍 mismatching pairs: {mismatches}")
+    return mismatches == 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Text metrics engine tests / benchmark")
+    parser.add_argument("--pairs", type=int, default=0, help="Also benchmark with this many pairs")
+    args = parser.parse_args()
+    try:
+        test_preprocessing_and_phonetics_unchanged()
+        test_word_error_rates_match_levenshtein()
+        test_engine_matches_per_call_metrics()
+        if args.pairs and not benchmark(args.pairs):
+            print("FAIL: engine metrics differ from the per-pair reference")
+            return 1
+    except AssertionError as exc:
+        print(f"FAIL: {exc}")
+        return 1
+    except Exception as exc:
+        print(f"ERROR: {exc}")
+        return 1
+    print("PASS: text metrics engine tests")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Tests for multi-language generation in generate_speech.py (language selection and dispatch)."""
+
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import generate_speech
+
+LANGUAGES = {
+    "German": {"lang_code": "de-DE", "service": "ElevenLabs"},
+    "Spanish (Colombia)": {"lang_code": "es-CO", "service": "ElevenLabs"},
+    "French (Canada)": {"lang_code": "fr-CA", "service": "PlayHt"},
+}
+
+
+def test_resolve_languages() -> bool:
+    resolve = generate_speech._resolve_languages
+    assert resolve("German", LANGUAGES) == ["German"]
+    assert resolve("german, es-co,fr_CA,German", LANGUAGES) == ["German", "Spanish (Colombia)", "French (Canada)"]
+    assert resolve(["fr-CA", "Klingon"], LANGUAGES) == ["French (Canada)", "Klingon"]
+    assert resolve("all", LANGUAGES) == list(LANGUAGES)
+    return True
+
+
+def test_languages_dispatch_concurrently() -> bool:
+    running = []
+    peak = [0]
+    lock = threading.Lock()
+
+    def fake_run_language(job, **kwargs):
+        with lock:
+            running.append(job["language"])
+            peak[0] = max(peak[0], len(running))
+        time.sleep(0.1)
+        with lock:
+            running.remove(job["language"])
+        if job["language"] == "French (Canada)":
+            raise RuntimeError("provider down")
+        return {"Processed": 1, "Errors": 0, "NoTask": 0}
+
+    original = generate_speech._run_language
+    generate_speech._run_language = fake_run_language
+    try:
+        jobs = [{"language": name, "lang_code": cfg["lang_code"], "service": cfg["service"]}
+                for name, cfg in LANGUAGES.items()]
+        results, failed = generate_speech._dispatch_languages(jobs, master_file_path=None, audio_base_dir="audio_files")
+        # A single language fails the same way as one of several
+        single, single_failed = generate_speech._dispatch_languages(jobs[2:], master_file_path=None, audio_base_dir="audio_files")
+    finally:
+        generate_speech._run_language = original
+
+    assert peak[0] == 3, peak[0]
+    assert results["German"]["Processed"] == 1
+    assert results["French (Canada)"] is None  # one failing language doesn't sink the others
+    assert failed == ["French (Canada)"], failed
+    assert single == {"French (Canada)": None} and single_failed == ["French (Canada)"]
+    return True
+
+
+def test_failed_languages_exit_non_zero() -> bool:
+    import run_generate_speech
+
+    def fake_main(language, force_regenerate=False):
+        raise generate_speech.LanguageGenerationError(["French (Canada)"])
+
+    saved = (generate_speech.main, run_generate_speech.conf.get_languages, sys.argv)
+    generate_speech.main = fake_main
+    run_generate_speech.conf.get_languages = lambda: LANGUAGES
+    sys.argv = ["run_generate_speech.py", "--languages", "German,fr-CA", "--yes"]
+    try:
+        run_generate_speech.main()
+        raise AssertionError("a failed language must exit non-zero")
+    except SystemExit as exc:
+        assert exc.code == 1, exc.code
+    finally:
+        generate_speech.main, run_generate_speech.conf.get_languages, sys.argv = saved
+    return True
+
+
+def test_ctrl_c_stops_every_language() -> bool:
+    """Ctrl-C during a two-language run stops both languages' remaining rows."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        log_path = os.path.join(tmpdir, "rows.txt")
+        script = f"""
+import os, signal, sys, threading, time
+sys.path.insert(0, {os.path.dirname(os.path.dirname(os.path.abspath(__file__)))!r})
+import generate_speech
+from utilities import tts_engine
+
+lock = threading.Lock()
+done = []
+
+def fake_run_language(job, **kwargs):
+    def process_row(index, row):
+        time.sleep(0.05)
+        with lock:
+            done.append(row["item_id"])
+            with open({log_path!r}, "a", encoding="utf-8") as handle:
+                handle.write(row["item_id"] + "\\n")
+            if len(done) == 4:
+                os.kill(os.getpid(), signal.SIGINT)
+        return "Success"
+    rows = [(i, {{"item_id": job["lang_code"] + "-" + str(i)}}) for i in range(40)]
+    return tts_engine.run_rows(rows, process_row, total=40, max_workers=2, label=job["lang_code"])
+
+generate_speech._run_language = fake_run_language
+jobs = [{{"language": "German", "lang_code": "de-DE", "service": "ElevenLabs"}},
+        {{"language": "French (Canada)", "lang_code": "fr-CA", "service": "PlayHt"}}]
+generate_speech._dispatch_languages(jobs, master_file_path=None, audio_base_dir="audio_files")
+print("dispatch returned")
+"""
+        proc = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, timeout=60)
+        assert proc.returncode == 0, proc.stdout + proc.stderr
+        assert "Process interrupted by user; stopping all languages" in proc.stdout, proc.stdout
+        assert "dispatch returned" not in proc.stdout
+        processed = open(log_path, encoding="utf-8").read().split()
+        # Only rows already in flight when Ctrl-C arrived may finish (2 workers x 2 queued per language)
+        assert 4 <= len(processed) <= 12, processed
+        assert proc.stdout.count("Process interrupted by user at item") == 2, proc.stdout
+    return True
+
+
+def main() -> int:
+    try:
+        test_resolve_languages()
+        test_languages_dispatch_concurrently()
+        test_failed_languages_exit_non_zero()
+        test_ctrl_c_stops_every_language()
+    except AssertionError as exc:
+        print(f"FAIL: {exc}")
+        return 1
+    except Exception as exc:
+        print(f"ERROR: {exc}")
+        return 1
+    print("PASS: multi-language generation tests")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Tests and micro-benchmark for the bulk SQLite ingestion path of
+utilities/itembank_by_task_regen_report.py (ItemBankWriter, open_db/close_db).
+
+The writer must leave items_current / item_versions / items_staged with the
+same content as the per-row upsert_item / append_item_version /
+upsert_staged_item calls (timestamps aside), skip unchanged rows on a rerun,
+and the XLIFF import in main() must produce the same change reasons as before.
+
+Benchmark at scale:
+    python tests/test_regen_bulk_ingest.py --rows 200000
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utilities import itembank_by_task_regen_report as regen
+
+CURRENT_COLUMNS = "item_id, lang, task, source_text, target_text, text_hash, voice, service, source_file, run_id"
+VERSION_COLUMNS = "item_id, lang, task, target_text, text_hash, voice, service, source_file, run_id, change_type"
+STAGED_COLUMNS = "item_id, lang, task, source_text, target_text, text_hash, approved, target_state, source_file, run_id"
+
+
+def make_rows(count, langs=("de", "es-CO", "fr-CA"), edit=None):
+    rows = []
+    for i in range(count):
+        lang = langs[i % len(langs)]
+        text = f"{lang} translation {i}"
+        if edit is not None and i % edit == 0:
+            text += " (edited)"
+        rows.append({
+            "item_id": f"item-{i // len(langs)}",
+            "lang": lang,
+            "task": f"task-{i % 7}",
+            "source_text": f"source {i // len(langs)}",
+            "target_text": text,
+            "text_hash": regen._sha256(text),
+            "voice": "Clara",
+            "service": "ElevenLabs",
+            "source_file": f"task-{i % 7}-{lang}.xliff",
+        })
+    return rows
+
+
+def new_db(path=":memory:"):
+    conn = regen.open_db(path) if path != ":memory:" else sqlite3.connect(path)
+    regen.ensure_db(conn)
+    return conn
+
+
+def per_row_import(conn, rows, run_id, staged=True):
+    for row in rows:
+        regen.upsert_item(conn, run_id=run_id, **row)
+        regen.append_item_version(conn, run_id=run_id, change_type="TEXT_CHANGED", **row)
+        if staged:
+            regen.upsert_staged_item(conn, run_id=run_id, approved=True, target_state="final", **staged_fields(row))
+    conn.commit()
+
+
+def bulk_import(conn, rows, run_id, staged=True):
+    writer = regen.ItemBankWriter(conn)
+    for row in rows:
+        if writer.upsert_item(run_id=run_id, **row):
+            writer.append_item_version(run_id=run_id, change_type="TEXT_CHANGED", **row)
+        if staged:
+            writer.upsert_staged_item(run_id=run_id, approved=True, target_state="final", **staged_fields(row))
+    return writer.flush()
+
+
+def staged_fields(row):
+    return {k: v for k, v in row.items() if k not in {"voice", "service"}}
+
+
+def table(conn, name, columns, order):
+    return conn.execute(f"SELECT {columns} FROM {name} ORDER BY {order}").fetchall()
+
+
+def test_bulk_writer_matches_per_row_writes() -> bool:
+    rows = make_rows(300)
+    reference, bulk = new_db(), new_db()
+    per_row_import(reference, rows, run_id=1)
+    stats = bulk_import(bulk, rows, run_id=1)
+    assert stats["items_written"] == stats["versions_written"] == stats["staged_written"] == 300, stats
+
+    for name, columns, order in [
+        ("items_current", CURRENT_COLUMNS, "item_id, lang, task"),
+        ("item_versions", VERSION_COLUMNS, "version_id"),
+        ("items_staged", STAGED_COLUMNS, "item_id, lang, task"),
+    ]:
+        assert table(bulk, name, columns, order) == table(reference, name, columns, order), name
+    # One run, one timestamp
+    assert bulk.execute("SELECT COUNT(DISTINCT updated_at) FROM items_current").fetchone()[0] == 1
+    reference.close()
+    bulk.close()
+    return True
+
+
+def test_rerun_writes_only_changed_rows() -> bool:
+    conn = new_db()
+    bulk_import(conn, make_rows(90), run_id=1)
+    before = table(conn, "items_current", CURRENT_COLUMNS, "item_id, lang, task")
+
+    stats = bulk_import(conn, make_rows(90), run_id=2)
+    assert (stats["items_written"], stats["items_unchanged"], stats["staged_written"]) == (0, 90, 0), stats
+    assert table(conn, "items_current", CURRENT_COLUMNS, "item_id, lang, task") == before
+
+    stats = bulk_import(conn, make_rows(90, edit=10), run_id=3)
+    assert (stats["items_written"], stats["versions_written"], stats["staged_written"]) == (9, 9, 9), stats
+    assert conn.execute("SELECT COUNT(*) FROM items_current WHERE run_id = 3").fetchone()[0] == 9
+    assert conn.execute("SELECT COUNT(*) FROM item_versions").fetchone()[0] == 99
+    conn.close()
+    return True
+
+
+def write_xliff(path, units):
+    body = "".join(
+        f'<trans-unit id="{item_id}" resname="{item_id}"><source>{source}</source>'
+        f'<target state="final">{target}</target></trans-unit>'
+        for item_id, source, target in units
+    )
+    path.write_text(
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<xliff version="1.2" xmlns="urn:oasis:names:tc:xliff:document:1.2">'
+        f'<file original="x" source-language="en" target-language="de"><body>{body}</body></file></xliff>',
+        encoding="utf-8",
+    )
+
+
+def run_main(tmpdir, extra=()):
+    argv = [
+        "itembank_by_task_regen_report.py",
+        "--project-id", "1",
+        "--skip-download",
+        "--langs", "de", "fr",
+        "--output-dir", str(tmpdir / "xliff"),
+        "--report-dir", str(tmpdir / "reports"),
+        "--db-path", str(tmpdir / "itembank.sqlite"),
+        "--skip-audio-check",
+        "--voice-config-source", "local",
+        "--no-partner-json-export",
+        *extra,
+    ]
+    saved = (sys.argv, regen.get_crowdin_token, regen.list_project_files)
+    sys.argv = argv
+    regen.get_crowdin_token = lambda: "token"
+    regen.list_project_files = lambda project_id, headers: [{"data": {"id": 1, "path": "/itembank_by_task/vocab.xliff"}}]
+    try:
+        assert regen.main() == 0
+    finally:
+        sys.argv, regen.get_crowdin_token, regen.list_project_files = saved
+
+
+def test_main_xliff_import_is_incremental() -> bool:
+    with tempfile.TemporaryDirectory() as tmp:
+        tmpdir = Path(tmp)
+        (tmpdir / "xliff").mkdir()
+        units = [(f"item_{i}", f"word {i}", f"Wort {i}") for i in range(20)]
+        write_xliff(tmpdir / "xliff" / "vocab-de.xliff", units)
+        write_xliff(tmpdir / "xliff" / "vocab-fr.xliff", [(i, s, t.replace("Wort", "mot")) for i, s, t in units])
+
+        run_main(tmpdir, ["--import-staged"])
+        conn = sqlite3.connect(tmpdir / "itembank.sqlite")
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete", "DB must be a single file after close"
+        assert not (tmpdir / "itembank.sqlite-wal").exists()
+        assert conn.execute("SELECT COUNT(*) FROM items_current").fetchone()[0] == 40
+        assert conn.execute("SELECT COUNT(*) FROM items_staged").fetchone()[0] == 40
+        assert conn.execute("SELECT change_type, COUNT(*) FROM item_versions GROUP BY change_type").fetchall() == [("NEW_ITEM", 40)]
+        conn.close()
+
+        run_main(tmpdir)
+        units[3] = ("item_3", "word 3", "Wort drei")
+        write_xliff(tmpdir / "xliff" / "vocab-de.xliff", units)
+        run_main(tmpdir)
+        conn = sqlite3.connect(tmpdir / "itembank.sqlite")
+        versions = conn.execute("SELECT item_id, lang, change_type, run_id FROM item_versions WHERE change_type != 'NEW_ITEM'").fetchall()
+        assert versions == [("item_3", regen.normalize_crowdin_lang_code("de"), "TEXT_CHANGED", 3)], versions
+        assert conn.execute("SELECT COUNT(*) FROM items_current WHERE run_id > 1").fetchone()[0] == 1
+        conn.close()
+    return True
+
+
+def benchmark(n_rows) -> bool:
+    rows = make_rows(n_rows, langs=("de", "es-CO", "fr-CA", "nl", "en-US", "pt-BR", "it"))
+    print(f"📊 {n_rows} item rows")
+    with tempfile.TemporaryDirectory() as tmp:
+        reference = new_db(os.path.join(tmp, "per_row.sqlite"))
+        start = time.perf_counter()
+        per_row_import(reference, rows, run_id=1, staged=False)
+        per_row_time = time.perf_counter() - start
+        print(f"   🐢 per-row upserts: {per_row_time:.2f}s")
+
+        bulk = new_db(os.path.join(tmp, "bulk.sqlite"))
+        start = time.perf_counter()
+        bulk_import(bulk, rows, run_id=1, staged=False)
+        bulk_time = time.perf_counter() - start
+        print(f"   ⚡ bulk writer: {bulk_time:.2f}s ({per_row_time / max(bulk_time, 1e-9):.1f}x faster)")
+
+        start = time.perf_counter()
+        bulk_import(bulk, rows, run_id=2, staged=False)
+        print(f"   ⚡ unchanged rerun: {time.perf_counter() - start:.2f}s")
+
+        same = table(bulk, "items_current", CURRENT_COLUMNS, "item_id, lang, task") == \
+            table(reference, "items_current", CURRENT_COLUMNS, "item_id, lang, task")
+        print(f"   🔍 identical items_current: {same}")
+        regen.close_db(reference)
+        regen.close_db(bulk)
+    return same
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Itembank bulk ingestion tests / benchmark")
+    parser.add_argument("--rows", type=int, default=0, help="Also benchmark with this many item rows")
+    args = parser.parse_args()
+    try:
+        test_bulk_writer_matches_per_row_writes()
+        test_rerun_writes_only_changed_rows()
+        test_main_xliff_import_is_incremental()
+        if args.rows and not benchmark(args.rows):
+            print("FAIL: bulk writer output differs from per-row writes")
+            return 1
+    except AssertionError as exc:
+        print(f"FAIL: {exc}")
+        return 1
+    except Exception as exc:
+        print(f"ERROR: {exc}")
+        return 1
+    print("PASS: itembank bulk ingestion tests")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
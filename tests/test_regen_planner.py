@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""Tests for the vectorized regeneration planner (utilities/regen_planner.py)."""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utilities import gcs_uploader, regen_planner
+from utilities.master_store import MasterStore
+
+
+def build_fixture(tmpdir: str):
+    translations = pd.DataFrame(
+        {
+            "item_id": ["fresh", "gone", "edited", "revoiced", "ok", "legacy", "stub", "blank", "untracked"],
+            "labels": ["general"] * 9,
+            "de-DE": [
+                "Hallo", "Weiter", "Neuer Text", "Gut gemacht", "Fertig <br>  jetzt",
+                "Alt", "NO APPROVED TRANSLATION", "", "Ohne Eintrag",
+            ],
+        }
+    )
+    audio_dir = Path(tmpdir) / "audio_files" / "de-DE"
+    audio_dir.mkdir(parents=True)
+    for item_id in ["edited", "revoiced", "ok", "legacy", "untracked"]:
+        (audio_dir / f"{item_id}.mp3").write_bytes(b"ID3")
+
+    store = MasterStore(str(Path(tmpdir) / "translation_master.csv"), str(Path(tmpdir) / "master.sqlite"))
+    store.upsert("gone", "de-DE", "Weiter", voice="Julia", service="ElevenLabs", model_id="eleven_v3")
+    store.upsert("edited", "de-DE", "Alter Text", voice="Julia", service="ElevenLabs", model_id="eleven_v3")
+    store.upsert("revoiced", "de-DE", "Gut gemacht", voice="Otto", service="ElevenLabs", model_id="eleven_v3")
+    store.upsert("ok", "de-DE", "Fertig jetzt", voice="Julia", service="ElevenLabs", model_id="eleven_v3")
+    store.upsert("legacy", "de-DE", "Alt")  # imported from an old CSV: no voice info
+    return translations, store
+
+
+def test_plan_statuses() -> bool:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        translations, store = build_fixture(tmpdir)
+        plan = regen_planner.build_plan(
+            translations, "de-DE", "Julia", "ElevenLabs", model_id="eleven_v3",
+            audio_base_dir=str(Path(tmpdir) / "audio_files"), master=store,
+        )
+        statuses = dict(zip(plan["item_id"], plan["status"]))
+        assert statuses == {
+            "fresh": "new",
+            "gone": "missing-file",
+            "edited": "changed-text",
+            "revoiced": "voice-changed",
+            "ok": "up-to-date",
+            "legacy": "unverified",
+            "stub": "placeholder",
+            "blank": "no-translation",
+            "untracked": "unverified",
+        }, statuses
+        to_generate = plan[regen_planner.needs_generation(plan)]
+        assert list(to_generate["item_id"]) == ["fresh", "gone", "edited", "revoiced"]
+        summary = regen_planner.summarize_plan(plan, "de-DE")
+        assert summary["chars_to_generate"] == len("Hallo") + len("Weiter") + len("Neuer Text") + len("Gut gemacht")
+
+        # A different model id invalidates every clip the store knows about
+        plan = regen_planner.build_plan(
+            translations, "de-DE", "Julia", "ElevenLabs", model_id="eleven_multilingual_v2",
+            audio_base_dir=str(Path(tmpdir) / "audio_files"), master=store,
+        )
+        assert dict(zip(plan["item_id"], plan["status"]))["ok"] == "voice-changed"
+        store.close()
+    return True
+
+
+def test_force_and_no_master() -> bool:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        translations, store = build_fixture(tmpdir)
+        audio_base_dir = str(Path(tmpdir) / "audio_files")
+        plan = regen_planner.build_plan(
+            translations, "de-DE", "Julia", "ElevenLabs", audio_base_dir=audio_base_dir, master=store, force=True,
+        )
+        statuses = dict(zip(plan["item_id"], plan["status"]))
+        assert statuses["ok"] == "forced" and statuses["fresh"] == "new"
+        assert statuses["stub"] == "placeholder" and statuses["blank"] == "no-translation"
+
+        # Without a master cache, existing files can only be verified via ID3
+        plan = regen_planner.build_plan(translations, "de-DE", "Julia", "ElevenLabs", audio_base_dir=audio_base_dir)
+        statuses = dict(zip(plan["item_id"], plan["status"]))
+        assert statuses["ok"] == "unverified" and statuses["gone"] == "new"
+        store.close()
+    return True
+
+
+class FakeBlob:
+    def __init__(self, name):
+        self.name = name
+
+
+class FakeListingClient:
+    """Storage client stand-in that only answers prefix listings."""
+
+    def __init__(self, names):
+        self.names = names
+        self.listings = []
+
+    def list_blobs(self, bucket_name, prefix=""):
+        self.listings.append((bucket_name, prefix))
+        return [FakeBlob(name) for name in self.names if name.startswith(prefix)]
+
+
+def test_gcs_inventory_plan() -> bool:
+    import generate_speech
+
+    client = FakeListingClient([
+        "audio/de-DE/edited.mp3", "audio/de-DE/revoiced.mp3", "audio/de-DE/ok.mp3",
+        "audio/de-DE/legacy.mp3", "audio/de-DE/untracked.mp3",
+        "audio/de-DE/old/ok.mp3", "audio/de-DE/notes.txt", "audio/fr-CA/gone.mp3",
+    ])
+    saved = (gcs_uploader.GCS_AVAILABLE, gcs_uploader._client, gcs_uploader._client_initialized,
+             os.environ.get("ASSETS_DRAFT_BUCKET"))
+    gcs_uploader.GCS_AVAILABLE, gcs_uploader._client, gcs_uploader._client_initialized = True, client, True
+    os.environ["ASSETS_DRAFT_BUCKET"] = "test-draft"
+    try:
+        assert regen_planner.gcs_inventory("de-DE") == {
+            "edited.mp3", "revoiced.mp3", "ok.mp3", "legacy.mp3", "untracked.mp3"}
+        assert client.listings == [("test-draft", "audio/de-DE/")]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            translations, store = build_fixture(tmpdir)
+            local_plan = regen_planner.build_plan(
+                translations, "de-DE", "Julia", "ElevenLabs", model_id="eleven_v3",
+                audio_base_dir=str(Path(tmpdir) / "audio_files"), master=store,
+            )
+            # --audio-inventory gcs plans from the bucket listing, with no local audio at all
+            job = generate_speech._plan_language(
+                "German", {"lang_code": "de-DE", "service": "ElevenLabs", "voice": "Julia"},
+                translations, store, None, str(Path(tmpdir) / "no_audio_here"),
+                model_id="eleven_v3", plan_only=True, audio_inventory="gcs",
+            )
+            assert list(job["plan"]["status"]) == list(local_plan["status"])
+            assert job["summary"] == regen_planner.summarize_plan(local_plan, "de-DE")
+            store.close()
+
+        gcs_uploader._client = None
+        try:
+            regen_planner.gcs_inventory("de-DE")
+            raise AssertionError("a missing GCS client must fail instead of planning against an empty inventory")
+        except RuntimeError:
+            pass
+    finally:
+        gcs_uploader.GCS_AVAILABLE, gcs_uploader._client, gcs_uploader._client_initialized = saved[:3]
+        if saved[3] is None:
+            os.environ.pop("ASSETS_DRAFT_BUCKET", None)
+        else:
+            os.environ["ASSETS_DRAFT_BUCKET"] = saved[3]
+    return True
+
+
+def main() -> int:
+    try:
+        test_plan_statuses()
+        test_force_and_no_master()
+        test_gcs_inventory_plan()
+    except AssertionError as exc:
+        print(f"FAIL: {exc}")
+        return 1
+    except Exception as exc:
+        print(f"ERROR: {exc}")
+        return 1
+    print("PASS: regen planner tests")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
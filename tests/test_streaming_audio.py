@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Tests for streaming synthesized audio to disk (stream_audio_to_temp / save_audio in utilities/utilities.py)."""
+
+import hashlib
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utilities import audio_cache
+from utilities.utilities import StreamedAudio, save_audio, stream_audio_to_temp
+
+CHUNKS = [b"ID3", b"chunk-one-", b"", b"chunk-two"]
+
+
+def test_stream_hashes_and_renames_atomically() -> bool:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        final_path = os.path.join(tmpdir, "audio_files", "de-DE", "intro.mp3")
+        streamed = stream_audio_to_temp(iter(CHUNKS), final_path)
+
+        assert isinstance(streamed, StreamedAudio)
+        assert streamed.sha256 == hashlib.sha256(b"".join(CHUNKS)).hexdigest()
+        assert streamed.size == len(b"".join(CHUNKS))
+        assert os.path.dirname(streamed.temp_path) == os.path.dirname(final_path)
+        assert os.path.basename(streamed.temp_path).startswith(".") and streamed.temp_path.endswith(".part")
+        assert not os.path.exists(final_path)
+
+        # Cache copies the file without loading it; save_audio renames it into place
+        cache = audio_cache.AudioCache(os.path.join(tmpdir, "cache"))
+        cache.put_file("k" * 64, streamed.temp_path)
+        row = {"item_id": "intro", "labels": "general", "de-DE": "Willkommen"}
+        assert save_audio(row, "de-DE", "ElevenLabs", streamed, os.path.join(tmpdir, "audio_files")) == "Success"
+
+        assert os.listdir(os.path.dirname(final_path)) == ["intro.mp3"]
+        with open(final_path, "rb") as handle:
+            assert handle.read().startswith(b"".join(CHUNKS))
+        assert cache.get("k" * 64) == b"".join(CHUNKS)
+    return True
+
+
+def test_interrupted_stream_leaves_no_file() -> bool:
+    def broken_stream():
+        yield b"ID3partial"
+        raise ConnectionError("connection reset")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        final_path = os.path.join(tmpdir, "de-DE", "intro.mp3")
+        try:
+            stream_audio_to_temp(broken_stream(), final_path)
+        except ConnectionError:
+            pass
+        else:
+            raise AssertionError("expected the stream error to propagate")
+        assert os.listdir(os.path.dirname(final_path)) == []
+
+        try:
+            stream_audio_to_temp(iter([]), final_path)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("expected an empty stream to be rejected")
+        assert os.listdir(os.path.dirname(final_path)) == []
+    return True
+
+
+def main() -> int:
+    try:
+        test_stream_hashes_and_renames_atomically()
+        test_interrupted_stream_leaves_no_file()
+    except AssertionError as exc:
+        print(f"FAIL: {exc}")
+        return 1
+    except Exception as exc:
+        print(f"ERROR: {exc}")
+        return 1
+    print("PASS: streaming audio tests")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental re-validation with the transcript store
+(validate_audio/transcript_cache.py + ValidationSession).
+
+Stand-in transcriber, decoder and quality scorer count how often they run;
+clip files are small byte blobs in a temp directory.
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from validate_audio import validator
+from validate_audio.transcript_cache import TranscriptCache, file_md5
+
+
+class CountingTranscriber:
+    def __init__(self):
+        self.calls = 0
+
+    def transcribe(self, audio_file_path, language=None, audio=None):
+        self.calls += 1
+        with open(audio_file_path, "rb") as handle:
+            return {"text": handle.read().decode("utf-8"), "language": language or "en", "confidence": None}
+
+
+def make_session(cache, model_size="base"):
+    stats = {"decoded": [], "quality": 0}
+
+    def loader(path, include_quality):
+        stats["decoded"].append((os.path.basename(path), include_quality))
+        return {"asr": None, "clap": [0.0], "clap_sr": 48000} if include_quality else {"asr": None}
+
+    def batch_scorer(audios, sample_rate):
+        stats["quality"] += len(audios)
+        return [{"quality_score": 0.7, "noise_score": 0.2, "quality_confidence": 0.5} for _ in audios]
+
+    session = validator.ValidationSession(
+        language="en",
+        model_size=model_size,
+        transcriber=CountingTranscriber(),
+        audio_loader=loader,
+        quality_batch_scorer=batch_scorer,
+        transcript_cache=cache,
+    )
+    return session, stats
+
+
+def write_clips(root, texts):
+    paths = []
+    for i, text in enumerate(texts):
+        path = os.path.join(root, f"clip_{i}.mp3")
+        with open(path, "wb") as handle:
+            handle.write(text.encode("utf-8"))
+        paths.append(path)
+    return paths
+
+
+def test_unchanged_clips_skip_asr_and_quality() -> bool:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        texts = [f"hello number {i}" for i in range(5)]
+        paths = write_clips(tmpdir, texts)
+        cache = TranscriptCache(os.path.join(tmpdir, "transcripts.sqlite"))
+
+        first, first_stats = make_session(cache)
+        first_results = validator.validate_many(paths, expected_texts=texts, session=first)
+        assert (first.cache_hits, first.transcribed) == (0, 5)
+        assert first_stats["quality"] == 5
+
+        # Partial regen: one clip gets new bytes
+        with open(paths[2], "wb") as handle:
+            handle.write(b"hello number two")
+
+        second, second_stats = make_session(cache)
+        results = validator.validate_many(paths, expected_texts=texts, session=second)
+        assert (second.cache_hits, second.transcribed) == (4, 1)
+        assert second.transcriber.calls == 1
+        assert second_stats["decoded"] == [("clip_2.mp3", True)], second_stats["decoded"]
+        assert second_stats["quality"] == 1
+        assert results[0]["transcribed_text"] == first_results[0]["transcribed_text"]
+        assert results[0]["quality"] == first_results[0]["quality"]
+        assert results[2]["transcribed_text"] == "hello number two"
+        # Text metrics are still recomputed against the (possibly new) expected text
+        assert results[2]["basic_metrics"] != first_results[2]["basic_metrics"]
+    return True
+
+
+def test_cache_key_includes_model_and_language() -> bool:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        paths = write_clips(tmpdir, ["guten tag"])
+        cache = TranscriptCache(os.path.join(tmpdir, "transcripts.sqlite"))
+        base, _ = make_session(cache)
+        base.validate(paths[0], expected_text="guten tag")
+
+        small, _ = make_session(cache, model_size="small")
+        small.validate(paths[0], expected_text="guten tag")
+        assert small.transcribed == 1
+
+        md5 = file_md5(paths[0])
+        assert cache.get_transcript(md5, "whisper", "base", "en")["text"] == "guten tag"
+        assert cache.get_transcript(md5, "whisper", "base", "de") is None
+        assert cache.get_transcript(md5, "whisper", "large", "en") is None
+        cache.close()
+    return True
+
+
+def main() -> int:
+    try:
+        test_unchanged_clips_skip_asr_and_quality()
+        test_cache_key_includes_model_and_language()
+    except AssertionError as exc:
+        print(f"FAIL: {exc}")
+        return 1
+    except Exception as exc:
+        print(f"ERROR: {exc}")
+        return 1
+    print("PASS: transcript cache tests")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Tests for the concurrent TTS generation engine (utilities/tts_engine.py).
+
+A local fake TTS server stands in for ElevenLabs/PlayHT: it answers the
+first request with HTTP 429 (Retry-After) and records how many requests were
+in flight at once, so we can check the concurrency cap, 429 handling and the
+Processed/Errors/NoTask stats without any network access.
+"""
+
+import os
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utilities import tts_engine
+
+
+class FakeTTSServer:
+    """Tiny threaded HTTP server that returns fake MP3 bytes."""
+
+    def __init__(self, rate_limited_requests: int = 1, latency: float = 0.05):
+        self.rate_limited_requests = rate_limited_requests
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = 0
+        self.rejected = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                self.rfile.read(length)
+                with server.lock:
+                    server.requests += 1
+                    if server.rejected < server.rate_limited_requests:
+                        server.rejected += 1
+                        self.send_response(429)
+                        self.send_header("Retry-After", "0.2")
+                        self.end_headers()
+                        return
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                time.sleep(server.latency)
+                with server.lock:
+                    server.in_flight -= 1
+                body = b"ID3fake-mp3-bytes"
+                self.send_response(200)
+                self.send_header("Content-Type", "audio/mpeg")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/tts"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def fake_synthesize(url: str, text: str) -> bytes:
+    request = urllib.request.Request(url, data=text.encode("utf-8"), method="POST")
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.read()
+    except urllib.error.HTTPError as exc:
+        if exc.code == 429:
+            raise tts_engine.RateLimitedError(
+                "fake 429", retry_after=tts_engine.parse_retry_after(exc.headers.get("Retry-After"))
+            )
+        raise
+
+
+def test_run_rows_against_fake_server() -> bool:
+    rows = [(i, {"item_id": f"item-{i}", "labels": "task" if i % 5 else None}) for i in range(20)]
+    limiter = tts_engine.ProviderLimiter("FakeTTS", max_concurrency=3, rate_per_minute=6000)
+    outputs = {}
+    outputs_lock = threading.Lock()
+
+    with FakeTTSServer(rate_limited_requests=1) as server:
+
+        def process_row(index, row):
+            if not row["labels"]:
+                return "NoTask"
+            audio = limiter.call(lambda: fake_synthesize(server.url, row["item_id"]))
+            with outputs_lock:
+                outputs[row["item_id"]] = audio
+            return "Success"
+
+        stats = tts_engine.run_rows(iter(rows), process_row, total=len(rows), max_workers=6, label="fake")
+
+    assert stats == {"Errors": 0, "Processed": 16, "NoTask": 4}, stats
+    assert len(outputs) == 16
+    assert server.rejected == 1, "fake server should have rate limited exactly one request"
+    assert limiter.rate_limited == 1, "limiter should record the 429"
+    assert server.max_in_flight <= 3, f"concurrency cap exceeded: {server.max_in_flight}"
+    return True
+
+
+def test_errors_and_unexpected_results_are_counted() -> bool:
+    def process_row(index, row):
+        if index == 0:
+            raise RuntimeError("boom")
+        if index == 1:
+            return "Error"
+        if index == 2:
+            return None
+        return "Success"
+
+    rows = [(i, {"item_id": f"item-{i}"}) for i in range(5)]
+    stats = tts_engine.run_rows(rows, process_row, total=len(rows), max_workers=2)
+    assert stats == {"Errors": 3, "Processed": 2, "NoTask": 0}, stats
+    return True
+
+
+def test_token_bucket_spacing() -> bool:
+    bucket = tts_engine.TokenBucket(rate_per_minute=600, capacity=1)  # 10/s
+    start = time.monotonic()
+    for _ in range(4):
+        bucket.acquire()
+    elapsed = time.monotonic() - start
+    assert elapsed >= 0.25, f"bucket handed out tokens too quickly ({elapsed:.3f}s)"
+    return True
+
+
+def main() -> int:
+    try:
+        test_run_rows_against_fake_server()
+        test_errors_and_unexpected_results_are_counted()
+        test_token_bucket_spacing()
+    except AssertionError as exc:
+        print(f"FAIL: {exc}")
+        return 1
+    except Exception as exc:
+        print(f"ERROR: {exc}")
+        return 1
+    print("PASS: TTS engine tests")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Tests for streaming output and --resume in validate_audio/cli.py.
+
+A stand-in transcriber is registered in the validator's transcriber cache so
+the CLI runs without Whisper; it can be told to crash partway through a run.
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from validate_audio import cli, validator
+
+
+class FlakyTranscriber:
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.calls = []
+
+    def transcribe(self, audio_file_path, language=None, audio=None):
+        self.calls.append(os.path.basename(audio_file_path))
+        if self.fail_on and audio_file_path.endswith(self.fail_on):
+            raise RuntimeError("simulated crash")
+        return {"text": "hallo welt", "language": language, "confidence": None}
+
+
+def install(transcriber):
+    validator._TRANSCRIBERS[("whisper", "base", None)] = transcriber
+
+
+def make_clips(root, count):
+    for i in range(count):
+        with open(os.path.join(root, f"clip_{i}.mp3"), "wb") as handle:
+            handle.write(b"ID3")
+    return [os.path.join(root, f"clip_{i}.mp3") for i in range(count)]
+
+
+def base_args(clips, output):
+    return clips + ["--language", "de", "--expected", "hallo welt", "--no-quality", "--output", output]
+
+
+def test_crash_then_resume_json_output() -> bool:
+    try:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            clips = make_clips(tmpdir, 5)
+            output = os.path.join(tmpdir, "results.json")
+            partial = os.path.join(tmpdir, "results.partial.jsonl")
+
+            install(FlakyTranscriber(fail_on="clip_3.mp3"))
+            try:
+                cli.main(base_args(clips, output))
+                raise AssertionError("expected the simulated crash")
+            except RuntimeError:
+                pass
+            with open(partial, encoding="utf-8") as handle:
+                assert len(handle.readlines()) == 3
+            assert not os.path.exists(output)
+
+            resumed = FlakyTranscriber()
+            install(resumed)
+            assert cli.main(base_args(clips, output) + ["--resume"]) == 0
+            assert resumed.calls == ["clip_3.mp3", "clip_4.mp3"], resumed.calls
+            with open(output, encoding="utf-8") as handle:
+                results = json.load(handle)
+            assert [os.path.basename(r["audio_path"]) for r in results] == [f"clip_{i}.mp3" for i in range(5)]
+            assert not os.path.exists(partial)
+    finally:
+        validator._TRANSCRIBERS.clear()
+    return True
+
+
+def test_resume_jsonl_output_with_torn_last_line() -> bool:
+    try:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            clips = make_clips(tmpdir, 4)
+            output = os.path.join(tmpdir, "results.jsonl")
+            install(FlakyTranscriber())
+            assert cli.main(base_args(clips[:2], output)) == 0
+            with open(output, "a", encoding="utf-8") as handle:
+                handle.write('{"audio_path": "' + clips[2])  # interrupted mid-write
+
+            resumed = FlakyTranscriber()
+            install(resumed)
+            assert cli.main(base_args(clips, output) + ["--resume"]) == 0
+            assert resumed.calls == ["clip_2.mp3", "clip_3.mp3"], resumed.calls
+            with open(output, encoding="utf-8") as handle:
+                lines = [json.loads(line) for line in handle]
+            assert [os.path.basename(r["audio_path"]) for r in lines] == [f"clip_{i}.mp3" for i in range(4)]
+    finally:
+        validator._TRANSCRIBERS.clear()
+    return True
+
+
+def main() -> int:
+    try:
+        test_crash_then_resume_json_output()
+        test_resume_jsonl_output_with_torn_last_line()
+    except AssertionError as exc:
+        print(f"FAIL: {exc}")
+        return 1
+    except Exception as exc:
+        print(f"ERROR: {exc}")
+        return 1
+    print("PASS: validate_audio resume tests")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Tests for the model-reusing batch validator (validate_audio/validator.py).
+
+Stand-in transcriber, decoder and quality scorer replace Whisper, librosa and
+CLAP so the test runs without model downloads; each records how often it is
+used so we can check that models load once, every file is decoded once and
+the decoded samples are shared between ASR and quality scoring.
+"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from validate_audio import validator
+
+
+class FakeTranscriber:
+    loads = 0
+
+    def __init__(self, latency: float = 0.0):
+        FakeTranscriber.loads += 1
+        self.latency = latency
+        self.seen = []
+
+    def transcribe(self, audio_file_path, language=None, audio=None):
+        time.sleep(self.latency)
+        self.seen.append(audio)
+        return {"text": audio["text"] if audio else "", "language": language, "confidence": None}
+
+
+class FakeLoader:
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = []
+        self.threads = set()
+        self.lock = threading.Lock()
+
+    def __call__(self, path, include_quality):
+        time.sleep(self.latency)
+        with self.lock:
+            self.calls.append(path)
+            self.threads.add(threading.current_thread().name)
+        samples = {"text": os.path.basename(path).replace(".mp3", "").replace("_", " ")}
+        return {"asr": samples, "clap": samples, "clap_sr": 48000} if include_quality else {"asr": samples}
+
+
+def test_models_load_once_and_audio_is_decoded_once() -> bool:
+    FakeTranscriber.loads = 0
+    loader = FakeLoader()
+    quality_inputs = []
+
+    def fake_quality(path, audio_data=None, sample_rate=48000):
+        quality_inputs.append(audio_data)
+        return {"quality_score": 0.9, "noise_score": 0.1, "quality_confidence": 0.8}
+
+    paths = [f"clips/hello_world_{i}.mp3" for i in range(12)]
+    session = validator.ValidationSession(
+        language="en",
+        transcriber=FakeTranscriber(),
+        audio_loader=loader,
+        quality_scorer=fake_quality,
+    )
+    results = validator.validate_many(paths, expected_texts=[f"hello world {i}" for i in range(12)], session=session)
+
+    assert FakeTranscriber.loads == 1
+    assert sorted(loader.calls) == sorted(paths) and len(loader.calls) == len(paths)
+    assert [r["audio_path"] for r in results] == [os.path.join("clips", f"hello_world_{i}.mp3") for i in range(12)]
+    assert all(r["transcribed_text"] == f"hello world {i}" for i, r in enumerate(results))
+    # CLAP saw exactly the samples Whisper saw
+    assert all(q is a for q, a in zip(quality_inputs, session.transcriber.seen))
+    assert results[0]["quality"]["quality_score"] == 0.9
+    assert results[0]["elevenlabs_validation"]["similarity_score"] == 1.0
+    return True
+
+
+def test_decoding_overlaps_with_inference() -> bool:
+    loader = FakeLoader(latency=0.04)
+    session = validator.ValidationSession(
+        include_quality=False,
+        transcriber=FakeTranscriber(latency=0.04),
+        audio_loader=loader,
+        quality_scorer=None,
+        decode_workers=2,
+    )
+    paths = [f"clips/item_{i}.mp3" for i in range(15)]
+    start = time.perf_counter()
+    results = list(session.iter_validate(paths, expected_texts=["item"] * len(paths)))
+    elapsed = time.perf_counter() - start
+    serial = 15 * 0.08
+    assert len(results) == 15 and results[3]["quality"] is None
+    assert elapsed < serial * 0.8, f"pipelined run took {elapsed:.2f}s, serial estimate {serial:.2f}s"
+    assert all(not name.startswith("MainThread") for name in loader.threads)
+    return True
+
+
+def test_decode_failures_fall_back_to_the_file_path() -> bool:
+    def broken_loader(path, include_quality):
+        raise RuntimeError("no decoder")
+
+    transcriber = FakeTranscriber()
+    session = validator.ValidationSession(include_quality=False, transcriber=transcriber, audio_loader=broken_loader)
+    result = session.validate("clips/item.mp3", expected_text="item")
+    assert transcriber.seen == [None]  # transcriber reads the file itself
+    assert result["expected_text"] == "item"
+    return True
+
+
+def main() -> int:
+    try:
+        test_models_load_once_and_audio_is_decoded_once()
+        test_decoding_overlaps_with_inference()
+        test_decode_failures_fall_back_to_the_file_path()
+    except AssertionError as exc:
+        print(f"FAIL: {exc}")
+        return 1
+    except Exception as exc:
+        print(f"ERROR: {exc}")
+        return 1
+    print("PASS: validation session tests")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
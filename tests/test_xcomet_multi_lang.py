@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Tests for the single-process multi-language mode of
+xcomet/run_all_and_export_excel.py (run_languages_in_process,
+run_xcomet.run_api_multi).
+
+A deterministic stand-in for the COMET model replaces run_xcomet's model
+loader; the per-language subprocess path runs run_xcomet.main in-process so
+both modes can be compared file by file and sheet by sheet.
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+from openpyxl import load_workbook
+
+from xcomet import run_all_and_export_excel as run_all
+from xcomet import run_xcomet as rx
+
+LANGS = ["de", "fr-CA", "es-CO"]
+
+
+class FakeComet:
+    """Scores each segment from its lengths; records every predict call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def predict(self, data, batch_size=8, progress_bar=True, accelerator="cpu", devices=1):
+        self.calls.append([len(d["src"]) + len(d["mt"]) for d in data])
+        scores = [((len(d["mt"]) * 7 + len(d["src"]) * 3) % 100) / 100.0 for d in data]
+        return {"scores": scores, "system_score": sum(scores) / len(scores)}
+
+
+def write_csv(path):
+    rows = []
+    for i in range(15):
+        rows.append({
+            "item_id": f"item_{i}",
+            "en": "word " * (i % 5 + 1) + str(i),
+            "de": "Wort " * (i % 7 + 1) + str(i),
+            "fr-CA": "mot " * (i % 3 + 1) + str(i),
+            "es-CO": "palabra " * (i % 4 + 1) + str(i),
+        })
+    pd.DataFrame(rows).to_csv(path, index=False)
+
+
+def workbook_values(path):
+    wb = load_workbook(path)
+    return {name: [[cell.value for cell in row] for row in wb[name].iter_rows()] for name in wb.sheetnames}
+
+
+def run_main(csv_path, out_dir, extra=()):
+    saved = sys.argv
+    sys.argv = ["run_all_and_export_excel.py", "--csv", str(csv_path), "--langs", ",".join(LANGS),
+                "--out_dir", str(out_dir), "--excel", str(out_dir / "scores.xlsx"), "--no_cache", *extra]
+    try:
+        run_all.main()
+    finally:
+        sys.argv = saved
+
+
+def test_single_process_matches_per_language_runs() -> bool:
+    models = []
+
+    def fake_load(model):
+        models.append(FakeComet())
+        return models[-1]
+
+    def in_process_check_call(cmd):
+        saved = sys.argv
+        sys.argv = cmd[1:]
+        try:
+            rx.main()
+        finally:
+            sys.argv = saved
+
+    saved = (rx.load_comet_model, rx.resolve_model, run_all.subprocess.check_call)
+    rx.load_comet_model = fake_load
+    rx.resolve_model = lambda model, has_ref, allow_qe_fallback: "Unbabel/wmt22-cometkiwi-da"
+    run_all.subprocess.check_call = in_process_check_call
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmpdir = Path(tmp)
+            csv_path = tmpdir / "item_bank.csv"
+            write_csv(csv_path)
+
+            run_main(csv_path, tmpdir / "per_lang", ["--subprocess_per_lang"])
+            assert len(models) == 3 and all(len(m.calls) == 1 for m in models)
+
+            models.clear()
+            run_main(csv_path, tmpdir / "single")
+            assert len(models) == 1 and len(models[0].calls) == 1, "model must be loaded and called once"
+            lengths = models[0].calls[0]
+            assert len(lengths) == 45 and lengths == sorted(lengths, reverse=True)
+
+            for lang in LANGS:
+                for name in ["scores.json", "segment_scores.csv", "segment_scores.md", "report.md", "hyp.txt"]:
+                    a = (tmpdir / "per_lang" / lang / name).read_text(encoding="utf-8")
+                    b = (tmpdir / "single" / lang / name).read_text(encoding="utf-8")
+                    assert a == b, f"{lang}/{name} differs"
+            assert workbook_values(tmpdir / "per_lang" / "scores.xlsx") == workbook_values(tmpdir / "single" / "scores.xlsx")
+            assert load_workbook(tmpdir / "single" / "scores.xlsx").sheetnames == ["Summary"] + LANGS
+    finally:
+        rx.load_comet_model, rx.resolve_model, run_all.subprocess.check_call = saved
+    return True
+
+
+def test_run_api_multi_splits_metadata() -> bool:
+    class SpanComet(FakeComet):
+        def predict(self, data, **kwargs):
+            out = super().predict(data, **kwargs)
+            out["metadata"] = {"error_spans": [[d["mt"]] for d in data], "model": "fake"}
+            return out
+
+    inputs = {
+        "de": rx.Inputs(src=["a", "bbbbbb"], hyp=["x", "yyyyyyyy"], ref=None, item_ids=["1", "2"]),
+        "nl": rx.Inputs(src=["cccc"], hyp=["zzz"], ref=None, item_ids=["1"]),
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        out = {lang: Path(tmp) / f"{lang}.json" for lang in inputs}
+        rx.run_api_multi("fake", inputs, out, spans=True, comet_model=SpanComet())
+        de = json.loads(out["de"].read_text(encoding="utf-8"))
+        assert [s["mt"] for s in de["segments"]] == ["x", "yyyyyyyy"]
+        assert de["metadata"] == {"error_spans": [["x"], ["yyyyyyyy"]], "model": "fake"}
+        assert abs(de["system_score"] - sum(s["score"] for s in de["segments"]) / 2) < 1e-12
+    return True
+
+
+def main() -> int:
+    try:
+        test_single_process_matches_per_language_runs()
+        test_run_api_multi_splits_metadata()
+    except AssertionError as exc:
+        print(f"FAIL: {exc}")
+        return 1
+    except Exception as exc:
+        print(f"ERROR: {exc}")
+        return 1
+    print("PASS: XCOMET multi-language tests")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Tests for the concurrent Crowdin XLIFF downloader
+(utilities/crowdin_xliff_manager.download_xliff_files) and the streaming
+XLIFF parser (utilities/itembank_by_task_regen_report.iter_xliff_units).
+
+A local HTTP server stands in for the Crowdin build/download endpoints: it
+hands out ETags, answers 304 to a matching If-None-Match and records how many
+requests were in flight at once.
+
+Benchmark the parser at scale:
+    python tests/test_xliff_sync.py --units 200000
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utilities import crowdin_xliff_manager as cxm
+from utilities import itembank_by_task_regen_report as regen
+
+
+def reference_parse(path, approved_only=False):
+    """The previous parse_xliff_file body (whole tree via ET.parse)."""
+    rows = []
+    for tu in ET.parse(path).getroot().iter():
+        if regen._local_tag(tu.tag) != "trans-unit":
+            continue
+        item_id = tu.attrib.get("resname") or tu.attrib.get("id") or ""
+        if not item_id:
+            continue
+        approved_attr = str(tu.attrib.get("approved", "")).strip().lower()
+        source_el = target_el = None
+        for child in list(tu):
+            tag = regen._local_tag(child.tag)
+            if tag == "source":
+                source_el = child
+            elif tag == "target":
+                target_el = child
+        target_state = str((target_el.attrib.get("state") if target_el is not None else "") or "").strip().lower()
+        is_approved = approved_attr in {"yes", "true", "1"} or target_state in {"final", "signed-off", "approved"}
+        if approved_only and not is_approved:
+            continue
+        rows.append({
+            "item_id": item_id,
+            "source_text": regen._extract_text(source_el),
+            "target_text": regen._extract_text(target_el),
+            "approved": "1" if is_approved else "0",
+            "target_state": target_state,
+        })
+    return rows
+
+
+def write_xliff(path, count):
+    units = []
+    for i in range(count):
+        state = ["final", "translated", "needs-translation", ""][i % 4]
+        target = "" if i % 9 == 0 else f'<target state="{state}">Wort <g id="1">{i}</g> fertig</target>'
+        approved = ' approved="yes"' if i % 5 == 0 else ""
+        resname = "" if i % 50 == 49 else f' resname="item_{i}"'
+        units.append(f'<trans-unit id="{i}"{resname}{approved}><source>word {i}</source>{target}</trans-unit>')
+    groups = "".join(f"<group>{''.join(units[i:i + 100])}</group>" for i in range(0, len(units), 100))
+    Path(path).write_text(
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<xliff version="1.2" xmlns="urn:oasis:names:tc:xliff:document:1.2">'
+        f'<file original="vocab" source-language="en" target-language="de"><body>{groups}</body></file></xliff>',
+        encoding="utf-8",
+    )
+
+
+def test_streaming_parser_matches_tree_parser() -> bool:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "vocab-de.xliff")
+        write_xliff(path, 500)
+        for approved_only in (False, True):
+            assert regen.parse_xliff_file(Path(path), approved_only=approved_only) == reference_parse(path, approved_only)
+        assert next(regen.iter_xliff_units(Path(path)))["item_id"] == "item_0"
+
+        Path(path).write_text("<xliff><file><body><trans-unit id='1'>", encoding="utf-8")
+        try:
+            list(regen.iter_xliff_units(Path(path)))
+            raise AssertionError("truncated XLIFF must fail")
+        except RuntimeError:
+            pass
+    return True
+
+
+class FakeCrowdin:
+    """Build endpoint + file host; content per (file_id, lang) can be edited between runs."""
+
+    def __init__(self):
+        self.content = {}
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.builds = 0
+        self.downloads = 0
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, body=b"", content_type="application/json"):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                file_id = self.path.rstrip("/").rsplit("/", 1)[-1]
+                payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                lang = payload["targetLanguageId"]
+                with fake.lock:
+                    fake.builds += 1
+                    fake.in_flight += 1
+                    fake.max_in_flight = max(fake.max_in_flight, fake.in_flight)
+                time.sleep(0.05)
+                with fake.lock:
+                    fake.in_flight -= 1
+                    etag = f"etag-{hash(fake.content[(file_id, lang)]) & 0xffffff}"
+                if self.headers.get("If-None-Match") == etag:
+                    self._send(304)
+                    return
+                url = f"http://127.0.0.1:{fake.server.server_port}/dl/{file_id}/{lang}"
+                self._send(200, json.dumps({"data": {"url": url, "etag": etag}}).encode())
+
+            def do_GET(self):
+                _, _, file_id, lang = self.path.split("/")
+                with fake.lock:
+                    fake.downloads += 1
+                self._send(200, fake.content[(file_id, lang)].encode(), "application/xml")
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def test_concurrent_download_skips_unchanged() -> bool:
+    langs = ["de", "fr", "es-CO", "nl", "it", "pt-BR"]
+    saved_base = cxm.API_BASE
+    with tempfile.TemporaryDirectory() as tmpdir, FakeCrowdin() as crowdin:
+        cxm.API_BASE = f"http://127.0.0.1:{crowdin.server.server_port}"
+        try:
+            jobs = []
+            for file_id in ("11", "12"):
+                for lang in langs:
+                    crowdin.content[(file_id, lang)] = f'<xliff><file target-language="{lang}"><body/></file></xliff>'
+                    jobs.append({"file_id": file_id, "language_id": lang, "revision_id": "3",
+                                 "output_path": os.path.join(tmpdir, f"task{file_id}-{lang}.xliff")})
+            manifest = os.path.join(tmpdir, "manifest.json")
+
+            first = cxm.download_xliff_files("1", {}, jobs, max_workers=6, manifest_path=manifest)
+            assert len(first["downloaded"]) == 12 and not first["failed"], first
+            assert 1 < crowdin.max_in_flight <= 6, crowdin.max_in_flight
+            assert Path(jobs[0]["output_path"]).read_text().startswith("<xliff")
+
+            crowdin.content[("12", "nl")] = crowdin.content[("12", "nl")].replace("<body/>", "<body></body>")
+            os.remove(jobs[1]["output_path"])
+            jobs[2] = dict(jobs[2], revision_id="4")
+            crowdin.downloads = 0
+            second = cxm.download_xliff_files("1", {}, jobs, max_workers=6, manifest_path=manifest)
+            changed = sorted([jobs[1]["output_path"], jobs[2]["output_path"], os.path.join(tmpdir, "task12-nl.xliff")])
+            assert second["downloaded"] == changed and len(second["not_modified"]) == 9, second
+            assert crowdin.downloads == 3
+
+            forced = cxm.download_xliff_files("1", {}, jobs, max_workers=6, manifest_path=manifest, force=True)
+            assert len(forced["downloaded"]) == 12
+            assert not cxm.download_xliff_files("1", {}, jobs, manifest_path=manifest)["downloaded"]
+        finally:
+            cxm.API_BASE = saved_base
+    return True
+
+
+def benchmark(n_units) -> bool:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "big.xliff")
+        write_xliff(path, n_units)
+        print(f"📊 {n_units} trans-units ({os.path.getsize(path) / 1e6:.1f} MB)")
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        reference = reference_parse(path)
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"   🐢 ET.parse: {elapsed:.2f}s, peak {peak / 1e6:.1f} MB")
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        count = 0
+        same = True
+        for row, want in zip(regen.iter_xliff_units(Path(path)), reference):
+            count += 1
+            same = same and row == want
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"   ⚡ iterparse stream: {elapsed:.2f}s, peak {peak / 1e6:.1f} MB (rows held by the reference not counted)")
+        same = same and count == len(reference)
+        print(f"   🔍 identical rows: {same}")
+    return same
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="XLIFF download/parse tests / benchmark")
+    parser.add_argument("--units", type=int, default=0, help="Also benchmark parsing this many trans-units")
+    args = parser.parse_args()
+    try:
+        test_streaming_parser_matches_tree_parser()
+        test_concurrent_download_skips_unchanged()
+        if args.units and not benchmark(args.units):
+            print("FAIL: streaming parser rows differ from ET.parse")
+            return 1
+    except AssertionError as exc:
+        print(f"FAIL: {exc}")
+        return 1
+    except Exception as exc:
+        print(f"ERROR: {exc}")
+        return 1
+    print("PASS: XLIFF download/parse tests")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Persistent segment-level COMET score cache.
+
+Only a few strings change between Crowdin syncs, but the COMET stage of the
+grading pipeline and ``xcomet/run_xcomet.py`` used to re-score every
+(source, translation) pair. Scores are now stored in a SQLite table keyed by
+``(model, source hash, translation hash, reference hash)``; a run only sends
+new or edited segments through the model, and a fully cached run never
+loads it.
+
+Typical use:
+
+    cache = CometScoreCache(DEFAULT_CACHE_PATH, "Unbabel/wmt22-cometkiwi-da")
+    scores, from_cache, stats = score_samples(samples, predict_scores, cache)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_CACHE_PATH = "translation_grading/output/.comet-score-cache.sqlite"
+
+
+def text_hash(text: Optional[str]) -> str:
+    """SHA-256 of a segment field; a missing field (e.g. no reference) hashes to ``""``."""
+    if text is None:
+        return ""
+    return hashlib.sha256(str(text).encode("utf-8")).hexdigest()
+
+
+def segment_key(sample: dict) -> Tuple[str, str, str]:
+    return text_hash(sample.get("src", "")), text_hash(sample.get("mt", "")), text_hash(sample.get("ref"))
+
+
+class CometScoreCache:
+    """SQLite table of segment scores for one COMET model; safe to share between threads."""
+
+    def __init__(self, path: str | Path, model_name: str):
+        self.path = Path(path).expanduser()
+        self.model_name = model_name
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS comet_scores (
+                model TEXT NOT NULL,
+                src_hash TEXT NOT NULL,
+                mt_hash TEXT NOT NULL,
+                ref_hash TEXT NOT NULL,
+                score REAL NOT NULL,
+                scored_at REAL NOT NULL,
+                PRIMARY KEY (model, src_hash, mt_hash, ref_hash)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM comet_scores WHERE model = ?", (self.model_name,)).fetchone()[0])
+
+    def get(self, keys: Sequence[Tuple[str, str, str]]) -> Dict[Tuple[str, str, str], float]:
+        """Return the cached score for every key that has one."""
+        found: Dict[Tuple[str, str, str], float] = {}
+        unique = list(dict.fromkeys(keys))
+        with self._lock:
+            # One indexed lookup per distinct key, in chunks to stay under SQLite's variable limit
+            for start in range(0, len(unique), 300):
+                chunk = unique[start:start + 300]
+                clause = " OR ".join(["(src_hash = ? AND mt_hash = ? AND ref_hash = ?)"] * len(chunk))
+                params: List[str] = [self.model_name]
+                for key in chunk:
+                    params.extend(key)
+                for src_hash, mt_hash, ref_hash, score in self._conn.execute(
+                    f"SELECT src_hash, mt_hash, ref_hash, score FROM comet_scores WHERE model = ? AND ({clause})",
+                    params,
+                ):
+                    found[(src_hash, mt_hash, ref_hash)] = float(score)
+        return found
+
+    def put(self, scores: Dict[Tuple[str, str, str], float]) -> None:
+        now = time.time()
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO comet_scores VALUES (?, ?, ?, ?, ?, ?)",
+                    [(self.model_name, *key, float(score), now) for key, score in scores.items()],
+                )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def score_samples(
+    samples: Sequence[dict],
+    predict_scores: Callable[[List[dict]], Sequence[float]],
+    cache: Optional[CometScoreCache] = None,
+) -> Tuple[List[float], List[bool], Dict[str, object]]:
+    """
+    Score COMET samples (``{"src", "mt"[, "ref"]}``), sending only uncached ones to the model.
+
+    Identical segments are scored once. ``predict_scores`` is not called at
+    all when every segment is cached, so it can load the model lazily.
+
+    Args:
+        samples: Segments to score
+        predict_scores: Returns one score per sample it is given, in order
+        cache: Score cache for the model (None = score everything)
+
+    Returns:
+        tuple: (score per sample, whether each score came from the cache, stats with
+        ``segments``, ``cached``, ``scored`` (distinct segments sent to the model) and ``cache_path``)
+
+    Raises:
+        ValueError: If ``predict_scores`` returns the wrong number of scores
+    """
+    keys = [segment_key(sample) for sample in samples]
+    known = cache.get(keys) if cache is not None else {}
+    from_cache = [key in known for key in keys]
+    todo: Dict[Tuple[str, str, str], dict] = {}
+    for key, sample in zip(keys, samples):
+        if key not in known and key not in todo:
+            todo[key] = sample
+    if todo:
+        fresh = list(predict_scores(list(todo.values())))
+        if len(fresh) != len(todo):
+            raise ValueError(f"COMET returned {len(fresh)} scores for {len(todo)} segments")
+        new_scores = {key: float(score) for key, score in zip(todo, fresh)}
+        if cache is not None:
+            cache.put(new_scores)
+        known.update(new_scores)
+    stats = {
+        "segments": len(samples),
+        "cached": sum(from_cache),
+        "scored": len(todo),
+        "cache_path": str(cache.path) if cache is not None else "",
+    }
+    return [known[key] for key in keys], from_cache, stats
@@ -176,6 +176,147 @@ def build_index(values: Sequence[str]) -> Dict[str, List[int]]:
     return idx
 
 
+# Vectorized scoring -------------------------------------------------------
+#
+# The per-row loops (list comprehension + np.mean per row, eb.cosine per
+# neighbor) are replaced by grouped matrix operations. Work is done in row
+# chunks so 100k x 768 float32 inputs never need more than a few extra
+# chunk-sized temporaries.
+
+SCORING_CHUNK_ROWS = 8192
+
+
+def group_codes(keys: Sequence[str], vocabulary: Dict[str, int] | None = None) -> tuple[np.ndarray, Dict[str, int]]:
+    """Map keys to dense integer group ids; with ``vocabulary``, unknown keys get -1."""
+    if vocabulary is None:
+        vocabulary = {}
+        codes = np.fromiter((vocabulary.setdefault(str(k), len(vocabulary)) for k in keys), dtype=np.int64, count=len(keys))
+    else:
+        codes = np.fromiter((vocabulary.get(str(k), -1) for k in keys), dtype=np.int64, count=len(keys))
+    return codes, vocabulary
+
+
+def grouped_sums(emb: np.ndarray, codes: np.ndarray, n_groups: int) -> tuple[np.ndarray, np.ndarray]:
+    """Per-group vector sums (segment sums) and row counts."""
+    counts = np.bincount(codes, minlength=n_groups)
+    sums = np.zeros((n_groups, emb.shape[1]), dtype=np.float32)
+    # Sort rows by group once, then sum each contiguous run. This beats both
+    # np.add.at and np.add.reduceat(axis=0) on (100k, 768) float32 inputs.
+    ordered = emb[np.argsort(codes, kind="stable")]
+    start = 0
+    for group, end in enumerate(np.cumsum(counts).tolist()):
+        if end > start:
+            sums[group] = ordered[start:end].sum(axis=0)
+        start = end
+    return sums, counts
+
+
+def rowwise_cosine(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Cosine of matching rows of ``a`` and ``b``; 0 where either row is zero (like :func:`cosine`)."""
+    out = np.empty(len(a), dtype=np.float64)
+    for start in range(0, len(a), SCORING_CHUNK_ROWS):
+        sl = slice(start, start + SCORING_CHUNK_ROWS)
+        num = np.einsum("ij,ij->i", a[sl], b[sl])
+        denom = np.linalg.norm(a[sl], axis=1) * np.linalg.norm(b[sl], axis=1)
+        out[sl] = np.divide(num, denom, out=np.zeros(len(num), dtype=np.float64), where=denom != 0)
+    return out
+
+
+def leave_one_out_cosine(emb: np.ndarray, group_keys: Sequence[str], fallback: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Cosine of each row to the centroid of the *other* rows in its group.
+
+    The leave-one-out centroid is ``(group_sum - row) / (count - 1)``; the
+    scale doesn't change the cosine, so only the sums are needed. Rows alone
+    in their group are compared with the matching ``fallback`` row instead.
+
+    Returns:
+        (scores, used_fallback) arrays, one entry per row
+    """
+    emb = np.asarray(emb, dtype=np.float32)
+    codes, vocab = group_codes(group_keys)
+    sums, counts = grouped_sums(emb, codes, len(vocab))
+    scores = np.empty(len(emb), dtype=np.float64)
+    for start in range(0, len(emb), SCORING_CHUNK_ROWS):
+        sl = slice(start, start + SCORING_CHUNK_ROWS)
+        scores[sl] = rowwise_cosine(emb[sl], sums[codes[sl]] - emb[sl])
+    used_fallback = counts[codes] <= 1
+    if used_fallback.any():
+        scores[used_fallback] = rowwise_cosine(emb[used_fallback], np.asarray(fallback, dtype=np.float32)[used_fallback])
+    return scores, used_fallback
+
+
+def optional_score(value: float) -> float | None:
+    return None if np.isnan(value) else float(value)
+
+
+def _unit_rows(mat: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(mat, axis=1, keepdims=True)
+    return mat / np.where(norms == 0, 1.0, norms)
+
+
+def baseline_similarities(
+    cand_emb: np.ndarray,
+    cand_item: Sequence[str],
+    cand_lang: Sequence[str],
+    base_emb: np.ndarray,
+    base_item: Sequence[str],
+    base_lang: Sequence[str],
+) -> Dict[str, np.ndarray]:
+    """
+    Baseline outlier similarities for every candidate row at once.
+
+    Returns float arrays (NaN where the baseline has no matching rows):
+    ``item_centroid`` (vs the item's baseline centroid), ``item_lang_max``
+    (best match among the same item+language baseline rows) and
+    ``lang_centroid`` (vs the language's baseline centroid).
+    """
+    cand_emb = np.asarray(cand_emb, dtype=np.float32)
+    base_emb = np.asarray(base_emb, dtype=np.float32)
+    n = len(cand_emb)
+    out: Dict[str, np.ndarray] = {}
+
+    # Centroid similarities: one grouped sum over the baseline, one row-wise cosine
+    for name, base_keys, cand_keys in (
+        ("item_centroid", base_item, cand_item),
+        ("lang_centroid", base_lang, cand_lang),
+    ):
+        base_codes, vocab = group_codes(base_keys)
+        sums, _counts = grouped_sums(base_emb, base_codes, len(vocab))
+        codes, _ = group_codes(cand_keys, vocab)
+        sims = np.full(n, np.nan)
+        hit = codes >= 0
+        if hit.any():
+            sims[hit] = rowwise_cosine(cand_emb[hit], sums[codes[hit]])
+        out[name] = sims
+
+    # Item+language max: expand (candidate, neighbor) pairs and reduce per candidate
+    base_keys = [f"{i}|{l}" for i, l in zip(base_item, base_lang)]
+    base_codes, vocab = group_codes(base_keys)
+    codes, _ = group_codes([f"{i}|{l}" for i, l in zip(cand_item, cand_lang)], vocab)
+    order = np.argsort(base_codes, kind="stable")
+    counts = np.bincount(base_codes, minlength=len(vocab))
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1])) if len(vocab) else np.zeros(0, dtype=np.int64)
+
+    sims = np.full(n, np.nan)
+    hit_rows = np.flatnonzero(codes >= 0)
+    if len(hit_rows):
+        per_row = counts[codes[hit_rows]]
+        pair_row = np.repeat(hit_rows, per_row)
+        first = np.cumsum(per_row) - per_row
+        offsets = np.arange(len(pair_row)) - np.repeat(first, per_row)
+        pair_base = order[np.repeat(starts[codes[hit_rows]], per_row) + offsets]
+        pair_sims = np.empty(len(pair_row), dtype=np.float64)
+        cand_unit = _unit_rows(cand_emb)
+        base_unit = _unit_rows(base_emb)
+        for start in range(0, len(pair_row), SCORING_CHUNK_ROWS):
+            sl = slice(start, start + SCORING_CHUNK_ROWS)
+            pair_sims[sl] = np.einsum("ij,ij->i", cand_unit[pair_row[sl]], base_unit[pair_base[sl]])
+        sims[hit_rows] = np.maximum.reduceat(pair_sims, first)
+    out["item_lang_max"] = sims
+    return out
+
+
 def cmd_build(args: argparse.Namespace) -> int:
     csv_path = Path(args.input_csv).expanduser()
     pairs = load_pairs_from_csv(
@@ -231,33 +372,21 @@ def cmd_detect(args: argparse.Namespace) -> int:
         prefix="passage",
     )
 
-    by_item = build_index(baseline_item_id)
-    by_item_lang = build_index([f"{iid}|{lang}" for iid, lang in zip(baseline_item_id, baseline_target_lang)])
-    by_lang = build_index(baseline_target_lang)
+    sims = baseline_similarities(
+        cand_emb,
+        [p.item_id for p in pairs],
+        [p.target_lang for p in pairs],
+        baseline_emb,
+        baseline_item_id,
+        baseline_target_lang,
+    )
 
     out_rows: List[dict] = []
     flagged = 0
     for i, pair in enumerate(pairs):
-        vec = cand_emb[i]
-        key_item = pair.item_id
-        key_item_lang = f"{pair.item_id}|{pair.target_lang}"
-        same_item_idx = by_item.get(key_item, [])
-        same_item_lang_idx = by_item_lang.get(key_item_lang, [])
-        same_lang_idx = by_lang.get(pair.target_lang, [])
-
-        same_item_centroid_sim = None
-        same_item_lang_max_sim = None
-        lang_centroid_sim = None
-
-        if same_item_idx:
-            centroid = np.mean(baseline_emb[same_item_idx], axis=0)
-            same_item_centroid_sim = cosine(vec, centroid)
-        if same_item_lang_idx:
-            sims = [cosine(vec, baseline_emb[j]) for j in same_item_lang_idx]
-            same_item_lang_max_sim = max(sims) if sims else None
-        if same_lang_idx:
-            lang_centroid = np.mean(baseline_emb[same_lang_idx], axis=0)
-            lang_centroid_sim = cosine(vec, lang_centroid)
+        same_item_centroid_sim = optional_score(sims["item_centroid"][i])
+        same_item_lang_max_sim = optional_score(sims["item_lang_max"][i])
+        lang_centroid_sim = optional_score(sims["lang_centroid"][i])
 
         reasons: List[str] = []
         if (
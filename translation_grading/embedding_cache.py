@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Persistent sentence-embedding cache for translation grading.
+
+Most strings are unchanged between grading runs, but the consistency and
+embedding-baseline stages used to load a SentenceTransformer each and
+re-encode every string. Vectors are now stored per model under
+``<cache-dir>/<model-slug>/``:
+
+- ``vectors.f32``: float32 matrix, one row per cached string (memory-mapped)
+- ``index.json``: model name, dimension and the row of every
+  ``<prefix>|<embedding_baseline.text_hash>`` key
+
+``Embedder.encode`` returns rows for cached strings straight from the
+memory map and only runs the model (loaded lazily, once) for new or edited
+strings, appending them to the cache.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+try:
+    from translation_grading import embedding_baseline as eb
+except ModuleNotFoundError:
+    import embedding_baseline as eb
+
+
+DEFAULT_CACHE_DIR = "translation_grading/output/.embedding-cache"
+
+
+def model_slug(model_name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._-]+", "__", str(model_name or "model")).strip("_") or "model"
+
+
+def effective_prefix(model_name: str, prefix: str) -> str:
+    # Only e5 models see the prefix; for the rest "query" and "passage" inputs
+    # are identical, so they share cache entries.
+    return prefix if "e5" in str(model_name or "").lower() else ""
+
+
+class EmbeddingCache:
+    """Append-only float32 matrix plus key index for one embedding model."""
+
+    def __init__(self, cache_dir: str | Path, model_name: str):
+        self.model_name = model_name
+        self.root = Path(cache_dir).expanduser() / model_slug(model_name)
+        self.vectors_path = self.root / "vectors.f32"
+        self.index_path = self.root / "index.json"
+        self.dim: Optional[int] = None
+        self.keys: List[str] = []
+        self.rows: Dict[str, int] = {}
+        self._matrix: Optional[np.ndarray] = None
+        self._load()
+
+    def _load(self) -> None:
+        if not self.index_path.exists():
+            return
+        try:
+            meta = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            print(f"[embedding-cache] ignoring unreadable index {self.index_path}: {exc}")
+            return
+        if meta.get("model_name") != self.model_name or not meta.get("dim"):
+            return
+        self.dim = int(meta["dim"])
+        self.keys = list(meta.get("keys", []))
+        expected_bytes = len(self.keys) * self.dim * 4
+        actual_bytes = self.vectors_path.stat().st_size if self.vectors_path.exists() else 0
+        if actual_bytes < expected_bytes:
+            print(f"[embedding-cache] vectors file shorter than index; starting fresh: {self.root}")
+            self.dim, self.keys = None, []
+            return
+        if actual_bytes > expected_bytes:
+            # Rows appended by a run that died before rewriting the index
+            with self.vectors_path.open("r+b") as handle:
+                handle.truncate(expected_bytes)
+        self.rows = {key: i for i, key in enumerate(self.keys)}
+
+    def _matrix_view(self) -> np.ndarray:
+        if self._matrix is None or len(self._matrix) != len(self.keys):
+            self._matrix = np.memmap(self.vectors_path, dtype=np.float32, mode="r", shape=(len(self.keys), self.dim))
+        return self._matrix
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def get(self, keys: Sequence[str]) -> tuple[np.ndarray, List[int]]:
+        """Return ``(matrix, missing positions)``; rows for missing keys are zero."""
+        dim = self.dim or 0
+        out = np.zeros((len(keys), dim), dtype=np.float32)
+        positions = [self.rows.get(key, -1) for key in keys]
+        missing = [i for i, pos in enumerate(positions) if pos < 0]
+        hit_positions = [i for i, pos in enumerate(positions) if pos >= 0]
+        if hit_positions:
+            out[hit_positions] = self._matrix_view()[[positions[i] for i in hit_positions]]
+        return out, missing
+
+    def add(self, keys: Sequence[str], vectors: np.ndarray) -> None:
+        """Append new rows, then rewrite the index atomically."""
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        if not len(keys):
+            return
+        if self.dim is None:
+            self.dim = int(vectors.shape[1])
+        elif vectors.shape[1] != self.dim:
+            raise ValueError(f"Embedding dim {vectors.shape[1]} does not match cache dim {self.dim}")
+        new = [(key, vec) for key, vec in zip(keys, vectors) if key not in self.rows]
+        if not new:
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._matrix = None  # drop the memmap before growing the file
+        with self.vectors_path.open("ab") as handle:
+            handle.write(np.stack([vec for _key, vec in new]).tobytes())
+            handle.flush()
+            os.fsync(handle.fileno())
+        for key, _vec in new:
+            self.rows[key] = len(self.keys)
+            self.keys.append(key)
+        payload = {"model_name": self.model_name, "dim": self.dim, "keys": self.keys}
+        tmp_path = self.index_path.with_suffix(".json.part")
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp_path, self.index_path)
+
+
+class Embedder:
+    """Encodes texts through an :class:`EmbeddingCache`, loading the model only on a miss."""
+
+    def __init__(
+        self,
+        model_name: str,
+        device: str = "auto",
+        batch_size: int = 128,
+        cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+        model_loader: Optional[Callable[[str, str], object]] = None,
+    ):
+        self.model_name = model_name
+        self.device = device
+        self.batch_size = batch_size
+        self.cache = EmbeddingCache(cache_dir, model_name) if cache_dir else None
+        self._model_loader = model_loader or eb.load_model
+        self._model = None
+        self._memo: Dict[str, np.ndarray] = {}  # used when the disk cache is disabled
+        self.hits = 0
+        self.encoded = 0
+
+    @property
+    def model(self):
+        if self._model is None:
+            self._model = self._model_loader(self.model_name, self.device)
+        return self._model
+
+    def encode(self, texts: Sequence[str], prefix: str) -> np.ndarray:
+        """Return L2-normalized float32 embeddings for ``texts`` (one row each)."""
+        prefix = effective_prefix(self.model_name, prefix)
+        keys = [f"{prefix}|{eb.text_hash(text)}" for text in texts]
+        if self.cache is not None:
+            out, missing = self.cache.get(keys)
+        else:
+            missing = [i for i, key in enumerate(keys) if key not in self._memo]
+            out = None
+
+        # Encode each distinct missing string once
+        todo: Dict[str, int] = {}
+        for i in missing:
+            todo.setdefault(keys[i], i)
+        if todo:
+            fresh = eb.encode_texts(
+                self.model,
+                self.model_name,
+                [texts[i] for i in todo.values()],
+                batch_size=self.batch_size,
+                prefix=prefix or "passage",
+            )
+            if self.cache is not None:
+                self.cache.add(list(todo.keys()), fresh)
+            else:
+                self._memo.update(zip(todo.keys(), fresh))
+        self.encoded += len(todo)
+        self.hits += len(keys) - len(missing)
+
+        if self.cache is not None:
+            if missing:
+                out, _ = self.cache.get(keys)
+            return np.asarray(out, dtype=np.float32)
+        return np.asarray([self._memo[key] for key in keys], dtype=np.float32).reshape(len(keys), -1)
+
+
+_EMBEDDERS: Dict[tuple, Embedder] = {}
+
+
+def get_embedder(model_name: str, device: str = "auto", batch_size: int = 128,
+                 cache_dir: Optional[str] = DEFAULT_CACHE_DIR) -> Embedder:
+    """Return the process-wide embedder for these settings so stages share one model load."""
+    key = (model_name, device, batch_size, str(cache_dir or ""))
+    if key not in _EMBEDDERS:
+        _EMBEDDERS[key] = Embedder(model_name, device=device, batch_size=batch_size, cache_dir=cache_dir)
+    return _EMBEDDERS[key]
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+Concurrent, rate-limited Gemini judge with a persistent response cache.
+
+The pipeline's LLM judge stage used to call Gemini one row at a time, opening
+a fresh ``urllib`` connection per request and keeping nothing on disk, so an
+interrupted run lost every judgement. This module provides:
+
+- ``GeminiClient``: one keep-alive HTTPS connection per worker thread,
+  retries for 429/5xx and dropped connections with jittered exponential
+  back-off (``Retry-After`` is honored and pauses every worker)
+- ``RateLimiter``: spaces request starts to a requests-per-minute budget;
+  ``AdaptiveRateLimiter`` also widens the spacing on 429/503 and narrows it
+  again as requests succeed
+- ``ResponseCache``: append-only JSONL keyed by sha256(model, prompt); each
+  judgement is written as soon as it arrives, so resumed or repeated runs
+  only pay for prompts that were never answered
+- ``judge_prompts``: fans prompts out over a thread pool, de-duplicating
+  identical prompts and serving cached ones without a request
+
+Set ``GEMINI_API_BASE`` to point the client at a different endpoint (e.g. a
+local fake server in tests).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import http.client
+import json
+import os
+import random
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+DEFAULT_API_BASE = "https://generativelanguage.googleapis.com/v1beta"
+DEFAULT_CACHE_DIR = "translation_grading/output/.gemini-judge-cache"
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class GeminiHTTPError(RuntimeError):
+    """Non-2xx answer from the Gemini API."""
+
+    def __init__(self, status: int, body: str, retry_after: Optional[float] = None):
+        super().__init__(f"HTTP {status}: {body[:300]}")
+        self.status = status
+        self.body = body
+        self.retry_after = retry_after
+
+
+def prompt_key(model: str, prompt: str) -> str:
+    return hashlib.sha256(f"{model}\n{prompt}".encode("utf-8")).hexdigest()
+
+
+def parse_json_response(text: str) -> dict:
+    """Parse the JSON object Gemini returned as response text."""
+    text = str(text or "").strip()
+    if not text:
+        raise RuntimeError("Gemini returned empty response.")
+    return json.loads(text)
+
+
+class RateLimiter:
+    """Spaces request starts ``60 / rate_per_minute`` seconds apart across threads."""
+
+    def __init__(self, rate_per_minute: float = 0):
+        self.interval = 60.0 / rate_per_minute if rate_per_minute and rate_per_minute > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+    def pause(self, seconds: float) -> None:
+        """Push every subsequent request back by at least ``seconds``."""
+        with self._lock:
+            self._next = max(self._next, time.monotonic() + max(0.0, seconds))
+
+    def on_success(self) -> None:
+        """Called by the client after a 2xx answer."""
+
+    def on_throttle(self) -> None:
+        """Called by the client after a 429/503 answer."""
+
+
+class AdaptiveRateLimiter(RateLimiter):
+    """
+    Rate limiter that slows down when the API pushes back.
+
+    Each 429/503 doubles the spacing between request starts (from at least
+    ``min_backoff_interval`` up to ``max_interval`` seconds); each success
+    shrinks it by ``recovery`` until it is back at the configured rate
+    (``rate_per_minute``, 0 = unlimited).
+    """
+
+    def __init__(
+        self,
+        rate_per_minute: float = 0,
+        max_interval: float = 30.0,
+        min_backoff_interval: float = 0.25,
+        recovery: float = 0.9,
+    ):
+        super().__init__(rate_per_minute)
+        self.base_interval = self.interval
+        self.max_interval = max_interval
+        self.min_backoff_interval = min_backoff_interval
+        self.recovery = recovery
+        self.throttles = 0
+
+    def on_success(self) -> None:
+        with self._lock:
+            if self.interval > self.base_interval:
+                shrunk = self.interval * self.recovery
+                self.interval = self.base_interval if shrunk < max(self.base_interval, self.min_backoff_interval) else shrunk
+
+    def on_throttle(self) -> None:
+        with self._lock:
+            self.throttles += 1
+            self.interval = min(self.max_interval, max(self.interval * 2, self.min_backoff_interval))
+
+
+class GeminiClient:
+    """Thread-safe Gemini ``generateContent`` client with keep-alive and retries."""
+
+    def __init__(
+        self,
+        api_key: str,
+        api_base: Optional[str] = None,
+        timeout: float = 90,
+        max_retries: int = 4,
+        backoff: float = 1.0,
+        limiter: Optional[RateLimiter] = None,
+    ):
+        self.api_key = api_key
+        self.api_base = (api_base or os.environ.get("GEMINI_API_BASE") or DEFAULT_API_BASE).rstrip("/")
+        parts = urllib.parse.urlsplit(self.api_base)
+        self._scheme = parts.scheme or "https"
+        self._netloc = parts.netloc
+        self._base_path = parts.path.rstrip("/")
+        self.timeout = timeout
+        self.max_retries = max(0, int(max_retries))
+        self.backoff = backoff
+        self.limiter = limiter or RateLimiter(0)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.retries = 0
+        self.connections = 0
+
+    def _connection(self) -> http.client.HTTPConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            cls = http.client.HTTPSConnection if self._scheme == "https" else http.client.HTTPConnection
+            conn = cls(self._netloc, timeout=self.timeout)
+            self._local.conn = conn
+            with self._lock:
+                self.connections += 1
+        return conn
+
+    def _drop_connection(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _post(self, path: str, body: bytes) -> dict:
+        self.limiter.acquire()
+        with self._lock:
+            self.requests += 1
+        conn = self._connection()
+        try:
+            conn.request("POST", path, body=body, headers={"Content-Type": "application/json", "Connection": "keep-alive"})
+            resp = conn.getresponse()
+            payload = resp.read().decode("utf-8", errors="replace")
+        except (http.client.HTTPException, OSError):
+            self._drop_connection()
+            raise
+        if resp.getheader("Connection", "").lower() == "close":
+            self._drop_connection()
+        if resp.status in (429, 503):
+            self.limiter.on_throttle()
+        elif resp.status < 300:
+            self.limiter.on_success()
+        if resp.status >= 300:
+            retry_after = resp.getheader("Retry-After")
+            try:
+                retry_seconds = float(retry_after) if retry_after is not None else None
+            except ValueError:
+                retry_seconds = None
+            raise GeminiHTTPError(resp.status, payload, retry_seconds)
+        return json.loads(payload)
+
+    def _sleep_before_retry(self, attempt: int, retry_after: Optional[float]) -> None:
+        # Equal jitter: half the exponential delay is fixed, half random
+        delay = self.backoff * (2 ** attempt)
+        delay = delay / 2 + random.uniform(0, delay / 2)
+        if retry_after is not None:
+            self.limiter.pause(retry_after)
+            delay = max(delay, retry_after)
+        with self._lock:
+            self.retries += 1
+        time.sleep(delay)
+
+    def generate_text(
+        self,
+        model: str,
+        prompt: str,
+        generation_config: Optional[dict] = None,
+        extra_parts: Optional[Sequence[dict]] = None,
+    ) -> str:
+        """Return the first candidate's text for ``prompt`` (plus e.g. image parts), retrying transient failures."""
+        path = f"{self._base_path}/models/{model}:generateContent?key={urllib.parse.quote(self.api_key)}"
+        payload = {
+            "contents": [{"parts": [{"text": prompt}, *(extra_parts or [])]}],
+            "generationConfig": generation_config or {"temperature": 0, "responseMimeType": "application/json"},
+        }
+        body = json.dumps(payload).encode("utf-8")
+        attempt = 0
+        while True:
+            try:
+                parsed = self._post(path, body)
+                break
+            except GeminiHTTPError as exc:
+                if exc.status not in RETRY_STATUSES or attempt >= self.max_retries:
+                    raise
+                self._sleep_before_retry(attempt, exc.retry_after)
+            except (http.client.HTTPException, OSError):
+                if attempt >= self.max_retries:
+                    raise
+                self._sleep_before_retry(attempt, None)
+            attempt += 1
+        return parsed.get("candidates", [{}])[0].get("content", {}).get("parts", [{}])[0].get("text", "").strip()
+
+    def judge(self, model: str, prompt: str) -> dict:
+        return parse_json_response(self.generate_text(model, prompt))
+
+
+class ResponseCache:
+    """Append-only JSONL of judged prompts keyed by :func:`prompt_key`."""
+
+    def __init__(self, cache_dir: str | Path):
+        self.path = Path(cache_dir).expanduser() / "responses.jsonl"
+        self.entries: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        with self.path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # partial line from an interrupted run
+                if isinstance(record, dict) and "key" in record:
+                    self.entries[record["key"]] = record.get("response")
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: str) -> Optional[dict]:
+        return self.entries.get(key)
+
+    def put(self, key: str, model: str, response: dict) -> None:
+        line = json.dumps({"key": key, "model": model, "response": response}, ensure_ascii=False)
+        with self._lock:
+            self.entries[key] = response
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as handle:
+                handle.write(line + "\n")
+                handle.flush()
+
+
+def judge_prompts(
+    prompts: Sequence[str],
+    model: str,
+    client: GeminiClient,
+    cache: Optional[ResponseCache] = None,
+    max_workers: int = 4,
+    max_calls: int = 0,
+    on_result: Optional[Callable[[int, object], None]] = None,
+) -> List[object]:
+    """
+    Judge every prompt, returning a dict (or the raised exception) per prompt.
+
+    Cached prompts cost nothing; identical prompts share one request. With
+    ``max_calls > 0`` at most that many uncached prompts are sent and the
+    rest come back as ``None``.
+
+    Args:
+        prompts: Prompt text per row
+        model: Gemini model name (part of the cache key)
+        client: Shared client (connections, retries, rate limit)
+        cache: Optional on-disk response cache
+        max_workers: Concurrent requests
+        max_calls: Cap on uncached requests (0 = unlimited)
+        on_result: Called as ``on_result(index, result)`` for each request as it finishes
+
+    Returns:
+        One entry per prompt: dict, Exception or None (skipped by ``max_calls``)
+    """
+    results: List[object] = [None] * len(prompts)
+    pending: Dict[str, List[int]] = {}
+    for idx, prompt in enumerate(prompts):
+        key = prompt_key(model, prompt)
+        cached = cache.get(key) if cache is not None else None
+        if cached is not None:
+            results[idx] = cached
+        else:
+            pending.setdefault(key, []).append(idx)
+
+    todo = list(pending.items())
+    if max_calls > 0:
+        todo = todo[:max_calls]
+    if not todo:
+        return results
+
+    def work(key: str, idx: int) -> dict:
+        judged = client.judge(model, prompts[idx])
+        if cache is not None:
+            cache.put(key, model, judged)
+        return judged
+
+    with ThreadPoolExecutor(max_workers=max(1, int(max_workers))) as pool:
+        futures = {pool.submit(work, key, indices[0]): indices for key, indices in todo}
+        for future in as_completed(futures):
+            try:
+                outcome: object = future.result()
+            except Exception as exc:
+                outcome = exc
+            for idx in futures[future]:
+                results[idx] = outcome
+            if on_result is not None:
+                on_result(futures[future][0], outcome)
+    return results
@@ -12,13 +12,20 @@ import mimetypes
 import os
 import re
 import statistics
+import threading
 import time
 import urllib.error
 import urllib.parse
 import urllib.request
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, List, Sequence, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    from translation_grading import gemini_judge as gj
+except ModuleNotFoundError:
+    import gemini_judge as gj
 
 
 SOURCE_LANG = "English"
@@ -26,6 +33,17 @@ DEFAULT_TARGET_LANGS = ["es-CO", "de", "fr-CA", "nl"]
 DEFAULT_MODEL = "gemini-2.5-flash"
 FALLBACK_MODEL = "gemini-flash-latest"
 BATCH_SIZE = 20
+# Rough input-token budget for the numbered items of one batched request
+# (the shared system prompt and instructions are not counted).
+BATCH_TOKEN_BUDGET = 2000
+DEFAULT_WORKERS = 4
+GENERATION_CONFIG = {
+    "temperature": 0,
+    "responseMimeType": "application/json",
+    # Disable "thinking" on 2.5+ flash models: ~3-5x faster and cheaper
+    # for this short structured-judgement task (ignored by older models).
+    "thinkingConfig": {"thinkingBudget": 0},
+}
 CROWDIN_API_BASE = "https://api.crowdin.com/api/v2"
 DEFAULT_CROWDIN_PROJECT_ID = "756721"
 DEFAULT_SCREENSHOT_TASK_LABELS = [
@@ -292,7 +310,20 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--model", default=DEFAULT_MODEL)
     parser.add_argument("--fallback-model", default=FALLBACK_MODEL)
     parser.add_argument("--limit", type=int, default=0, help="Limit evaluated source rows, for smoke runs.")
-    parser.add_argument("--sleep-seconds", type=float, default=0.0, help="Optional delay between Gemini calls.")
+    parser.add_argument("--sleep-seconds", type=float, default=0.0, help="Optional minimum spacing between Gemini calls.")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Concurrent Gemini requests.")
+    parser.add_argument(
+        "--batch-token-budget",
+        type=int,
+        default=BATCH_TOKEN_BUDGET,
+        help=f"Approximate item tokens per batched request (at most {BATCH_SIZE} items).",
+    )
+    parser.add_argument(
+        "--ledger-path",
+        default="",
+        help="JSONL ledger of finished evaluations (default: <output-csv stem>.ledger.jsonl next to the output).",
+    )
+    parser.add_argument("--no-ledger", action="store_true", help="Judge every item again and do not record a ledger.")
     parser.add_argument("--use-crowdin-screenshots", action="store_true", help="Attach tagged Crowdin screenshots for visual-context tasks.")
     parser.add_argument("--crowdin-project-id", default=DEFAULT_CROWDIN_PROJECT_ID)
     parser.add_argument("--crowdin-api-key-env", default="CROWDIN_API_TOKEN")
@@ -303,6 +334,12 @@ def parse_args() -> argparse.Namespace:
         help="Comma-separated task labels eligible for screenshot attachment.",
     )
     parser.add_argument("--max-screenshots-per-item", type=int, default=1)
+    parser.add_argument(
+        "--screenshot-index-max-age",
+        type=float,
+        default=3600,
+        help="Seconds to reuse the local Crowdin screenshot index without revalidating it (0 = always revalidate).",
+    )
     return parser.parse_args()
 
 
@@ -477,6 +514,97 @@ def build_batch_object_prompt(items: Sequence[EvaluationItem], *, json_only: boo
     )
 
 
+def batch_group_key(item: EvaluationItem) -> Tuple[str, str, str, str]:
+    """Items sharing this key can be judged in one request (same instructions and context)."""
+    return (
+        item.target_lang,
+        item.template_key,
+        construct_context_for(item.labels, item.template_key),
+        survey_audience_for(item.identifier, item.labels),
+    )
+
+
+def numbered_item_lines(idx: int, item: EvaluationItem) -> List[str]:
+    return [
+        f"{idx}. Source text: \"{item.source}\"",
+        f"   Translation: \"{item.hypothesis}\"",
+    ]
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // 4 + 1
+
+
+def build_batch_prompt(items: Sequence[EvaluationItem], *, json_only: bool = False) -> str:
+    """Batched prompt for items sharing :func:`batch_group_key`; OBJECT_NAMING keeps its dedicated prompt."""
+    if not items:
+        raise ValueError("Cannot build an empty batch prompt.")
+    first = items[0]
+    if first.template_key == "OBJECT_NAMING":
+        return build_batch_object_prompt(items, json_only=json_only)
+    instructions = TEMPLATES[first.template_key].format(
+        source_lang=SOURCE_LANG,
+        target_lang=first.target_lang,
+        source="",
+        hypothesis="",
+        survey_audience=survey_audience_for(first.identifier, first.labels),
+    )
+    # Drop the single-item source/translation lines; the items are listed below
+    instructions = "\n".join(
+        line for line in instructions.splitlines() if not line.startswith(("Source text:", "Translation:"))
+    ).strip()
+    construct_context = construct_context_for(first.labels, first.template_key)
+    construct_block = f"{construct_context}\n\n" if construct_context else ""
+    numbered = []
+    for idx, item in enumerate(items, start=1):
+        numbered.extend(numbered_item_lines(idx, item))
+    suffix = "\nOutput ONLY valid JSON, no other text." if json_only else ""
+    return (
+        f"{SYSTEM_PROMPT}\n\n"
+        f"{construct_block}"
+        f"{instructions}\n\n"
+        "Evaluate each numbered item below independently using the criteria above.\n\n"
+        + "\n".join(numbered)
+        + "\n\nReturn JSON as: {\"items\": [{\"index\": 1, \"score\": <1-5>, "
+        "\"errors\": [{\"severity\": \"minor|major|critical\", \"description\": \"...\"}], "
+        "\"notes\": \"...\"}]}."
+        + suffix
+    )
+
+
+def plan_batches(
+    items: Sequence[EvaluationItem],
+    *,
+    token_budget: int = BATCH_TOKEN_BUDGET,
+    max_items: int = BATCH_SIZE,
+) -> List[List[EvaluationItem]]:
+    """
+    Pack items into requests: items with the same :func:`batch_group_key` are
+    batched greedily up to ``token_budget`` estimated tokens and ``max_items``
+    each; items with screenshots are sent on their own.
+    """
+    groups: Dict[Tuple[str, str, str, str], List[EvaluationItem]] = {}
+    batches: List[List[EvaluationItem]] = []
+    for item in items:
+        if item.screenshots:
+            batches.append([item])
+        else:
+            groups.setdefault(batch_group_key(item), []).append(item)
+    for key in sorted(groups):
+        current: List[EvaluationItem] = []
+        used = 0
+        for item in groups[key]:
+            cost = estimate_tokens("\n".join(numbered_item_lines(len(current) + 1, item)))
+            if current and (used + cost > token_budget or len(current) >= max_items):
+                batches.append(current)
+                current, used = [], 0
+            current.append(item)
+            used += cost
+        if current:
+            batches.append(current)
+    return batches
+
+
 def extract_json_text(raw: str) -> str:
     text = str(raw or "").strip()
     if text.startswith("```"):
@@ -580,6 +708,8 @@ def call_gemini_text(prompt: str, model: str, api_key: str, image_paths: Sequenc
 
 
 def should_fallback(exc: Exception) -> bool:
+    if isinstance(exc, gj.GeminiHTTPError):
+        return exc.status in {400, 404, 429, 503}
     if not isinstance(exc, urllib.error.HTTPError):
         return False
     return exc.code in {400, 404, 429, 503}
@@ -667,57 +797,246 @@ def get_crowdin_token(api_key_env: str) -> str:
     raise RuntimeError(f"Crowdin token not found. Set {api_key_env}, CROWDIN_TOKEN, or create ~/.crowdin_api_token.")
 
 
-def fetch_crowdin_json(path: str, token: str, params: Dict[str, object] | None = None) -> dict:
+def fetch_crowdin_page(
+    path: str,
+    token: str,
+    params: Dict[str, object] | None = None,
+    etag: str = "",
+) -> Tuple[dict | None, str]:
+    """
+    GET a Crowdin API path, revalidating with ``If-None-Match`` when an ETag is known.
+
+    Returns:
+        tuple: (payload, etag); payload is None when Crowdin answers 304 Not Modified
+    """
     query = ""
     if params:
         query = "?" + urllib.parse.urlencode({k: str(v) for k, v in params.items()})
-    req = urllib.request.Request(
-        f"{CROWDIN_API_BASE}{path}{query}",
-        headers={"Authorization": f"Bearer {token}"},
-    )
+    headers = {"Authorization": f"Bearer {token}"}
+    if etag:
+        headers["If-None-Match"] = etag
+    req = urllib.request.Request(f"{CROWDIN_API_BASE}{path}{query}", headers=headers)
     try:
         with urllib.request.urlopen(req, timeout=60) as resp:
-            return json.loads(resp.read().decode("utf-8"))
+            return json.loads(resp.read().decode("utf-8")), resp.headers.get("ETag", "") or ""
     except urllib.error.HTTPError as exc:
+        if exc.code == 304 and etag:
+            return None, etag
         details = exc.read().decode("utf-8", errors="ignore")
         raise RuntimeError(f"Crowdin HTTP {exc.code} for {path}: {details}") from exc
 
 
-def iter_crowdin_pages(path: str, token: str, *, limit: int = 500) -> Iterable[dict]:
-    offset = 0
-    while True:
-        payload = fetch_crowdin_json(path, token, {"limit": limit, "offset": offset})
-        items = payload.get("data", [])
-        for item in items:
-            yield item.get("data", item)
-        if len(items) < limit:
-            break
-        offset += limit
-
-
 def crowdin_identifier_for(item: EvaluationItem) -> str:
     return str(item.identifier or "").split("::", 1)[-1]
 
 
-def safe_cache_name(screenshot_id: int, name: str, url: str) -> str:
+def screenshot_suffix(name: str) -> str:
     suffix = Path(str(name or "")).suffix.lower() or ".png"
-    if suffix not in {".png", ".jpg", ".jpeg", ".webp"}:
-        suffix = ".png"
-    digest = hashlib.sha1(url.encode("utf-8")).hexdigest()[:10]
-    stem = re.sub(r"[^A-Za-z0-9._-]+", "_", Path(str(name or f'screenshot-{screenshot_id}')).stem).strip("_")
-    return f"{screenshot_id}_{stem}_{digest}{suffix}"
+    return suffix if suffix in {".png", ".jpg", ".jpeg", ".webp"} else ".png"
 
 
 def download_screenshot(url: str, cache_dir: Path, screenshot_id: int, name: str) -> Path:
+    """Download one screenshot into the content-addressed cache (``<sha256>.<ext>``) and return its path."""
     cache_dir.mkdir(parents=True, exist_ok=True)
-    out_path = cache_dir / safe_cache_name(screenshot_id, name, url)
-    if out_path.exists() and out_path.stat().st_size > 0:
-        return out_path
     with urllib.request.urlopen(url, timeout=90) as resp:
-        out_path.write_bytes(resp.read())
+        data = resp.read()
+    out_path = cache_dir / f"{hashlib.sha256(data).hexdigest()[:32]}{screenshot_suffix(name)}"
+    if not (out_path.exists() and out_path.stat().st_size == len(data)):
+        tmp = out_path.with_name(f"{out_path.name}.{screenshot_id}.tmp")
+        tmp.write_bytes(data)
+        tmp.replace(out_path)
     return out_path
 
 
+def _compact_string(data: dict) -> dict:
+    return {"id": int(data.get("id") or 0), "identifier": str(data.get("identifier") or "")}
+
+
+def _compact_screenshot(data: dict) -> dict:
+    return {
+        "id": int(data.get("id") or 0),
+        "name": str(data.get("name") or ""),
+        "url": str(data.get("url") or "").strip(),
+        "updated_at": str(data.get("updatedAt") or ""),
+        "tags": [
+            {"stringId": tag.get("stringId"), "position": tag.get("position")}
+            for tag in data.get("tags") or []
+        ],
+    }
+
+
+class CrowdinScreenshotIndex:
+    """
+    Local index of a project's Crowdin strings and screenshots plus the cached image files.
+
+    The index (``screenshot_index.json`` in the cache directory) keeps each
+    listing page with its ETag, so a refresh re-downloads only pages Crowdin
+    reports as changed, and maps screenshot ids to content-addressed files so
+    an unchanged screenshot (same ``updatedAt``) is never downloaded again.
+    Within ``max_age`` seconds of the last refresh the listings are not
+    requested at all.
+    """
+
+    INDEX_NAME = "screenshot_index.json"
+
+    def __init__(self, cache_dir: Path, project_id: str, token: str, *, max_age: float = 0, workers: int = 8, page_limit: int = 500):
+        self.cache_dir = Path(cache_dir)
+        self.project_id = str(project_id)
+        self.token = token
+        self.max_age = max_age
+        self.workers = max(1, int(workers))
+        self.page_limit = page_limit
+        self.path = self.cache_dir / self.INDEX_NAME
+        self.data = {"project_id": self.project_id, "refreshed_at": 0.0, "pages": {}, "files": {}}
+        self.refreshed = False
+        self.stats = {"pages_fetched": 0, "pages_not_modified": 0, "downloaded": 0, "reused": 0, "failed": 0}
+        if self.path.exists():
+            try:
+                loaded = json.loads(self.path.read_text(encoding="utf-8"))
+            except ValueError:
+                loaded = {}
+            if isinstance(loaded, dict) and str(loaded.get("project_id")) == self.project_id:
+                self.data.update(loaded)
+
+    def save(self) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(self.data, ensure_ascii=False), encoding="utf-8")
+        tmp.replace(self.path)
+
+    def _refresh_listing(self, kind: str, compact: Callable[[dict], dict]) -> Tuple[Dict[str, dict], Dict[str, int]]:
+        old_pages = self.data["pages"]
+        pages: Dict[str, dict] = {}
+        counts = {"fetched": 0, "not_modified": 0}
+        offset = 0
+        while True:
+            key = f"{kind}:{offset}"
+            cached = old_pages.get(key)
+            payload, etag = fetch_crowdin_page(
+                f"/projects/{self.project_id}/{kind}",
+                self.token,
+                {"limit": self.page_limit, "offset": offset},
+                etag=(cached or {}).get("etag", ""),
+            )
+            if payload is None:
+                pages[key] = cached
+                counts["not_modified"] += 1
+            else:
+                raw = payload.get("data", [])
+                pages[key] = {"etag": etag, "count": len(raw), "items": [compact(entry.get("data", entry)) for entry in raw]}
+                counts["fetched"] += 1
+            if pages[key]["count"] < self.page_limit:
+                return pages, counts
+            offset += self.page_limit
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Revalidate the string and screenshot listings (both in parallel).
+
+        Args:
+            force: Revalidate even if the index is younger than ``max_age``
+
+        Returns:
+            bool: True if Crowdin was asked, False if the index was fresh enough
+        """
+        if not force and self.data["pages"] and time.time() - float(self.data.get("refreshed_at") or 0) < self.max_age:
+            return False
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            strings = pool.submit(self._refresh_listing, "strings", _compact_string)
+            screenshots = pool.submit(self._refresh_listing, "screenshots", _compact_screenshot)
+            pages = {**strings.result()[0], **screenshots.result()[0]}
+            for _, counts in (strings.result(), screenshots.result()):
+                self.stats["pages_fetched"] += counts["fetched"]
+                self.stats["pages_not_modified"] += counts["not_modified"]
+        self.data["pages"] = pages
+        self.data["refreshed_at"] = time.time()
+        self.refreshed = True
+        self.save()
+        return True
+
+    def _listing(self, kind: str) -> Iterable[dict]:
+        pages = self.data["pages"]
+        for key in sorted((key for key in pages if key.startswith(f"{kind}:")), key=lambda key: int(key.split(":", 1)[1])):
+            yield from pages[key]["items"]
+
+    def screenshots_by_identifier(self, identifiers: Iterable[str]) -> Tuple[Dict[str, List[dict]], int]:
+        """
+        Map string identifiers to the screenshots tagged with them.
+
+        Returns:
+            tuple: ({identifier: [screenshot dicts]}, number of identifiers found among the project strings)
+        """
+        wanted = set(identifiers)
+        identifier_by_string_id: Dict[int, str] = {}
+        for string in self._listing("strings"):
+            if string["identifier"] in wanted:
+                identifier_by_string_id[string["id"]] = string["identifier"]
+        by_identifier: Dict[str, List[dict]] = {identifier: [] for identifier in wanted}
+        for shot in self._listing("screenshots"):
+            if not shot["id"] or not shot["url"]:
+                continue
+            seen_in_screenshot = set()
+            for tag in shot["tags"]:
+                identifier = identifier_by_string_id.get(tag.get("stringId"))
+                if not identifier or identifier in seen_in_screenshot:
+                    continue
+                seen_in_screenshot.add(identifier)
+                by_identifier[identifier].append(
+                    {
+                        "screenshot_id": shot["id"],
+                        "name": shot["name"] or f"screenshot-{shot['id']}",
+                        "url": shot["url"],
+                        "updated_at": shot["updated_at"],
+                        "position": tag.get("position"),
+                    }
+                )
+        return by_identifier, len(set(identifier_by_string_id.values()))
+
+    def cached_file(self, shot: dict) -> Path | None:
+        entry = self.data["files"].get(str(shot["screenshot_id"]))
+        if not entry or entry.get("updated_at") != shot["updated_at"]:
+            return None
+        path = self.cache_dir / entry["file"]
+        return path if path.exists() and path.stat().st_size > 0 else None
+
+    def fetch(self, shots: Sequence[dict]) -> Dict[int, Path]:
+        """
+        Return a local file per screenshot, downloading missing or updated ones concurrently.
+
+        Screenshots that fail to download are left out (and counted in ``stats["failed"]``).
+        """
+        paths: Dict[int, Path] = {}
+        missing: Dict[int, dict] = {}
+        for shot in shots:
+            screenshot_id = int(shot["screenshot_id"])
+            if screenshot_id in paths or screenshot_id in missing:
+                continue
+            cached = self.cached_file(shot)
+            if cached is not None:
+                paths[screenshot_id] = cached
+                self.stats["reused"] += 1
+            else:
+                missing[screenshot_id] = shot
+        if missing:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                futures = {
+                    pool.submit(download_screenshot, shot["url"], self.cache_dir, screenshot_id, shot["name"]): shot
+                    for screenshot_id, shot in missing.items()
+                }
+                for future, shot in futures.items():
+                    try:
+                        path = future.result()
+                    except Exception as exc:
+                        self.stats["failed"] += 1
+                        print(f"[screenshots] download failed for {shot['screenshot_id']} ({shot['name']}): {exc}")
+                        continue
+                    paths[int(shot["screenshot_id"])] = path
+                    self.data["files"][str(shot["screenshot_id"])] = {"updated_at": shot["updated_at"], "file": path.name}
+                    self.stats["downloaded"] += 1
+            self.save()
+        return paths
+
+
 def attach_crowdin_screenshots(
     items: Sequence[EvaluationItem],
     *,
@@ -726,6 +1045,8 @@ def attach_crowdin_screenshots(
     cache_dir: Path,
     eligible_labels: Sequence[str],
     max_screenshots_per_item: int = 1,
+    index_max_age: float = 0,
+    workers: int = 8,
 ) -> Dict[str, int]:
     eligible = {normalize_label(label) for label in eligible_labels if normalize_label(label)}
     wanted_items = [item for item in items if normalize_label(item.labels) in eligible]
@@ -733,66 +1054,50 @@ def attach_crowdin_screenshots(
     if not wanted_identifiers:
         return {"eligible_items": 0, "items_with_screenshots": 0, "screenshots_downloaded": 0}
 
-    token = get_crowdin_token(api_key_env)
-    strings_by_identifier: Dict[str, List[int]] = {identifier: [] for identifier in wanted_identifiers}
-    for string_data in iter_crowdin_pages(f"/projects/{project_id}/strings", token):
-        identifier = str(string_data.get("identifier") or "")
-        if identifier in strings_by_identifier:
-            strings_by_identifier[identifier].append(int(string_data["id"]))
-    identifier_by_string_id = {
-        string_id: identifier
-        for identifier, string_ids in strings_by_identifier.items()
-        for string_id in string_ids
-    }
+    index = CrowdinScreenshotIndex(cache_dir, project_id, get_crowdin_token(api_key_env), max_age=index_max_age, workers=workers)
+    index.refresh()
+    screenshots_by_identifier, matched_identifiers = index.screenshots_by_identifier(wanted_identifiers)
 
-    screenshots_by_identifier: Dict[str, List[dict]] = {identifier: [] for identifier in wanted_identifiers}
-    for screenshot in iter_crowdin_pages(f"/projects/{project_id}/screenshots", token):
-        screenshot_id = int(screenshot.get("id") or 0)
-        url = str(screenshot.get("url") or "").strip()
-        name = str(screenshot.get("name") or f"screenshot-{screenshot_id}")
-        if not screenshot_id or not url:
-            continue
-        seen_in_screenshot = set()
-        for tag in screenshot.get("tags") or []:
-            identifier = identifier_by_string_id.get(tag.get("stringId"))
-            if not identifier or identifier in seen_in_screenshot:
-                continue
-            seen_in_screenshot.add(identifier)
-            screenshots_by_identifier[identifier].append(
-                {
-                    "screenshot_id": screenshot_id,
-                    "name": name,
-                    "url": url,
-                    "position": tag.get("position"),
-                }
-            )
+    chosen: Dict[int, List[dict]] = {}
+    for item in wanted_items:
+        identifier = crowdin_identifier_for(item)
+        candidates = sorted(
+            screenshots_by_identifier.get(identifier, []),
+            key=lambda shot: (identifier.lower() not in str(shot["name"]).lower(), int(shot["screenshot_id"])),
+        )
+        chosen[id(item)] = candidates[: max(0, max_screenshots_per_item)]
+    wanted_shots = [shot for shots in chosen.values() for shot in shots]
+    paths = index.fetch(wanted_shots)
+    if len(paths) < len({shot["screenshot_id"] for shot in wanted_shots}) and not index.refreshed:
+        # Signed image URLs from an index reused within max_age may have expired
+        index.refresh(force=True)
+        screenshots_by_identifier, matched_identifiers = index.screenshots_by_identifier(wanted_identifiers)
+        fresh = {shot["screenshot_id"]: shot for shots in screenshots_by_identifier.values() for shot in shots}
+        paths.update(index.fetch([fresh[shot["screenshot_id"]] for shot in wanted_shots if shot["screenshot_id"] in fresh]))
 
-    screenshots_downloaded = 0
     items_with_screenshots = 0
     for item in wanted_items:
-        identifier = crowdin_identifier_for(item)
-        candidates = screenshots_by_identifier.get(identifier, [])
-        candidates.sort(key=lambda shot: (crowdin_identifier_for(item).lower() not in str(shot["name"]).lower(), int(shot["screenshot_id"])))
-        attachments: List[ScreenshotAttachment] = []
-        for shot in candidates[: max(0, max_screenshots_per_item)]:
-            path = download_screenshot(str(shot["url"]), cache_dir, int(shot["screenshot_id"]), str(shot["name"]))
-            screenshots_downloaded += 1
-            attachments.append(
-                ScreenshotAttachment(
-                    path=path,
-                    screenshot_id=int(shot["screenshot_id"]),
-                    name=str(shot["name"]),
-                    position=shot.get("position"),
-                )
+        item.screenshots = [
+            ScreenshotAttachment(
+                path=paths[int(shot["screenshot_id"])],
+                screenshot_id=int(shot["screenshot_id"]),
+                name=str(shot["name"]),
+                position=shot.get("position"),
             )
-        item.screenshots = attachments
-        if attachments:
+            for shot in chosen[id(item)]
+            if int(shot["screenshot_id"]) in paths
+        ]
+        if item.screenshots:
             items_with_screenshots += 1
     return {
         "eligible_items": len(wanted_items),
         "items_with_screenshots": items_with_screenshots,
-        "screenshots_downloaded": screenshots_downloaded,
-        "matched_identifiers": sum(1 for ids in strings_by_identifier.values() if ids),
+        "screenshots_downloaded": index.stats["downloaded"],
+        "screenshots_reused": index.stats["reused"],
+        "screenshot_download_failures": index.stats["failed"],
+        "pages_fetched": index.stats["pages_fetched"],
+        "pages_not_modified": index.stats["pages_not_modified"],
+        "matched_identifiers": matched_identifiers,
     }
 
 
@@ -823,35 +1128,217 @@ def write_results(path: Path, rows: Sequence[dict]) -> None:
         writer.writerows(rows)
 
 
-def chunks(items: Sequence[EvaluationItem], size: int) -> Iterable[Sequence[EvaluationItem]]:
-    for start in range(0, len(items), size):
-        yield items[start : start + size]
+def ledger_key(item: EvaluationItem, model: str) -> str:
+    """Ledger key: identifier, language, template, translation text hash and model."""
+    target_hash = hashlib.sha256(item.hypothesis.encode("utf-8")).hexdigest()
+    return "|".join([item.identifier, item.target_lang, item.template_key, target_hash, model])
 
 
-def evaluate_items(items: Sequence[EvaluationItem], api_key: str, model: str, fallback_model: str, sleep_seconds: float) -> List[dict]:
-    results: List[dict] = []
-    object_items = [item for item in items if item.template_key == "OBJECT_NAMING" and not item.screenshots]
-    object_ids = {id(item) for item in object_items}
+def default_ledger_path(output_csv: Path) -> Path:
+    return output_csv.with_name(f"{output_csv.stem}.ledger.jsonl")
 
-    object_items_by_group: Dict[Tuple[str, str], List[EvaluationItem]] = {}
-    for item in object_items:
-        object_items_by_group.setdefault((item.target_lang, construct_context_for(item.labels, item.template_key)), []).append(item)
 
-    for group in sorted(object_items_by_group):
-        for batch in chunks(object_items_by_group[group], BATCH_SIZE):
-            evaluations = evaluate_object_batch(batch, api_key, model, fallback_model)
-            results.extend(result_row(item, evaluation) for item, evaluation in zip(batch, evaluations))
-            if sleep_seconds:
-                time.sleep(sleep_seconds)
+class EvaluationLedger:
+    """
+    Append-only JSONL of finished evaluations keyed by :func:`ledger_key`.
 
-    for item in items:
-        if id(item) in object_ids:
-            continue
-        evaluation = evaluate_single(item, api_key, model, fallback_model)
-        results.append(result_row(item, evaluation))
-        if sleep_seconds:
-            time.sleep(sleep_seconds)
-    return results
+    Each result is appended and flushed as soon as it arrives, so an
+    interrupted run keeps everything already judged. Because the key includes
+    a hash of the translation, an edited translation misses the ledger and is
+    judged again; the older line is kept but no longer matched.
+    """
+
+    def __init__(self, path: str | Path, model: str):
+        self.path = Path(path).expanduser()
+        self.model = model
+        self.entries: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        with self.path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # partial line from an interrupted run
+                if isinstance(record, dict) and "key" in record and isinstance(record.get("row"), dict):
+                    self.entries[record["key"]] = record["row"]
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, item: EvaluationItem) -> Optional[dict]:
+        return self.entries.get(ledger_key(item, self.model))
+
+    def split(self, items: Sequence[EvaluationItem]) -> Tuple[Dict[int, dict], List[EvaluationItem]]:
+        """Return ({id(item): ledger row} for finished items, items still to judge)."""
+        done: Dict[int, dict] = {}
+        pending: List[EvaluationItem] = []
+        for item in items:
+            row = self.get(item)
+            if row is None:
+                pending.append(item)
+            else:
+                done[id(item)] = row
+        return done, pending
+
+    def record(self, item: EvaluationItem, row: dict) -> None:
+        key = ledger_key(item, self.model)
+        line = json.dumps(
+            {
+                "key": key,
+                "identifier": item.identifier,
+                "language": item.target_lang,
+                "template": item.template_key,
+                "model": self.model,
+                "row": row,
+            },
+            ensure_ascii=False,
+        )
+        with self._lock:
+            self.entries[key] = row
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as handle:
+                handle.write(line + "\n")
+                handle.flush()
+
+
+def chunks(items: Sequence[EvaluationItem], size: int) -> Iterable[Sequence[EvaluationItem]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+class ConcurrentEvaluator:
+    """
+    Batched, concurrent Gemini evaluation.
+
+    Every template type is batched (see :func:`plan_batches`) and batches run
+    on a thread pool over one keep-alive :class:`gemini_judge.GeminiClient`,
+    paced by an :class:`gemini_judge.AdaptiveRateLimiter` that backs off on
+    429/503. A batch whose answer cannot be parsed or has the wrong number of
+    items is split in half and retried; single items get one JSON-only retry.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = DEFAULT_MODEL,
+        fallback_model: str = FALLBACK_MODEL,
+        *,
+        workers: int = DEFAULT_WORKERS,
+        token_budget: int = BATCH_TOKEN_BUDGET,
+        max_batch_items: int = BATCH_SIZE,
+        requests_per_minute: float = 0,
+        client: Optional[gj.GeminiClient] = None,
+    ):
+        self.model = model
+        self.fallback_model = fallback_model
+        self.workers = max(1, int(workers))
+        self.token_budget = token_budget
+        self.max_batch_items = max(1, int(max_batch_items))
+        self.client = client or gj.GeminiClient(api_key, limiter=gj.AdaptiveRateLimiter(requests_per_minute))
+        self.stats = {"requests": 0, "batches": 0, "splits": 0}
+        self._stats_lock = threading.Lock()
+
+    def _count(self, key: str) -> None:
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def call(self, prompt: str, image_paths: Sequence[Path] = ()) -> str:
+        parts = [image_part(path) for path in image_paths]
+        self._count("requests")
+        try:
+            return self.client.generate_text(self.model, prompt, GENERATION_CONFIG, parts)
+        except Exception as exc:
+            if self.fallback_model and self.fallback_model != self.model and should_fallback(exc):
+                return self.client.generate_text(self.fallback_model, prompt, GENERATION_CONFIG, parts)
+            raise
+
+    def evaluate_one(self, item: EvaluationItem) -> dict:
+        image_paths = [attachment.path for attachment in item.screenshots]
+        raw = self.call(build_prompt(item), image_paths)
+        try:
+            return parse_evaluation(raw)
+        except Exception:
+            return parse_evaluation(self.call(build_prompt(item, json_only=True), image_paths))
+
+    def evaluate_batch(self, batch: Sequence[EvaluationItem]) -> List[dict]:
+        if len(batch) == 1:
+            return [self.evaluate_one(batch[0])]
+        raw = self.call(build_batch_prompt(batch))
+        try:
+            return parse_batch_evaluations(raw, len(batch))
+        except Exception:
+            self._count("splits")
+            mid = len(batch) // 2
+            return self.evaluate_batch(batch[:mid]) + self.evaluate_batch(batch[mid:])
+
+    def evaluate(
+        self,
+        items: Sequence[EvaluationItem],
+        on_result: Optional[Callable[[EvaluationItem, dict], None]] = None,
+    ) -> List[dict]:
+        """
+        Judge all items and return their result rows in input order.
+
+        Args:
+            items: Items to judge
+            on_result: Called as ``on_result(item, row)`` as each batch finishes
+
+        Returns:
+            list: One :func:`result_row` per item
+
+        Raises:
+            Exception: The first failed request (after retries and fallback); queued batches are cancelled
+        """
+        batches = plan_batches(items, token_budget=self.token_budget, max_items=self.max_batch_items)
+        self.stats["batches"] += len(batches)
+        rows_by_item: Dict[int, dict] = {}
+
+        def run(batch: Sequence[EvaluationItem]) -> None:
+            for item, evaluation in zip(batch, self.evaluate_batch(batch)):
+                row = result_row(item, evaluation)
+                rows_by_item[id(item)] = row
+                if on_result is not None:
+                    on_result(item, row)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = [pool.submit(run, batch) for batch in batches]
+            _, pending = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in pending:
+                future.cancel()
+            for future in futures:
+                if future.done() and not future.cancelled() and future.exception() is not None:
+                    raise future.exception()
+        return [rows_by_item[id(item)] for item in items]
+
+
+def evaluate_items(
+    items: Sequence[EvaluationItem],
+    api_key: str,
+    model: str,
+    fallback_model: str,
+    sleep_seconds: float,
+    *,
+    workers: int = DEFAULT_WORKERS,
+    token_budget: int = BATCH_TOKEN_BUDGET,
+    client: Optional[gj.GeminiClient] = None,
+    on_result: Optional[Callable[[EvaluationItem, dict], None]] = None,
+) -> List[dict]:
+    """Evaluate items with :class:`ConcurrentEvaluator`; ``sleep_seconds`` caps the request rate (0 = adaptive only)."""
+    evaluator = ConcurrentEvaluator(
+        api_key,
+        model,
+        fallback_model,
+        workers=workers,
+        token_budget=token_budget,
+        requests_per_minute=60.0 / sleep_seconds if sleep_seconds and sleep_seconds > 0 else 0,
+        client=client,
+    )
+    return evaluator.evaluate(items, on_result=on_result)
 
 
 def mean_score(rows: Sequence[dict]) -> float:
@@ -883,23 +1370,45 @@ def main() -> int:
         raise RuntimeError(f"{args.api_key_env} is not set.")
 
     items = load_items(Path(args.input_csv), args.source_col, csv_list(args.target_cols), args.limit)
-    if args.use_crowdin_screenshots:
+    ledger = None
+    done: Dict[int, dict] = {}
+    pending = items
+    if not args.no_ledger:
+        ledger = EvaluationLedger(args.ledger_path or default_ledger_path(Path(args.output_csv)), args.model)
+        done, pending = ledger.split(items)
+        print(f"[ledger] {ledger.path}: reusing={len(done)} pending={len(pending)}")
+    if args.use_crowdin_screenshots and pending:
         screenshot_stats = attach_crowdin_screenshots(
-            items,
+            pending,
             project_id=args.crowdin_project_id,
             api_key_env=args.crowdin_api_key_env,
             cache_dir=Path(args.screenshot_cache_dir),
             eligible_labels=csv_list(args.screenshot_task_labels),
             max_screenshots_per_item=args.max_screenshots_per_item,
+            index_max_age=args.screenshot_index_max_age,
         )
         print(
             "[screenshots] "
             f"eligible={screenshot_stats['eligible_items']} "
             f"with_screenshots={screenshot_stats['items_with_screenshots']} "
             f"matched_identifiers={screenshot_stats.get('matched_identifiers', 0)} "
-            f"downloaded={screenshot_stats['screenshots_downloaded']}"
+            f"downloaded={screenshot_stats['screenshots_downloaded']} "
+            f"reused={screenshot_stats.get('screenshots_reused', 0)} "
+            f"pages_fetched={screenshot_stats.get('pages_fetched', 0)} "
+            f"pages_not_modified={screenshot_stats.get('pages_not_modified', 0)}"
         )
-    rows = evaluate_items(items, api_key, args.model, args.fallback_model, args.sleep_seconds)
+    new_rows = evaluate_items(
+        pending,
+        api_key,
+        args.model,
+        args.fallback_model,
+        args.sleep_seconds,
+        workers=args.workers,
+        token_budget=args.batch_token_budget,
+        on_result=ledger.record if ledger is not None else None,
+    )
+    done.update((id(item), row) for item, row in zip(pending, new_rows))
+    rows = [done[id(item)] for item in items]
     write_results(Path(args.output_csv), rows)
     print(f"Wrote {len(rows)} evaluations to {args.output_csv}")
     print_summary(rows)
@@ -33,9 +33,15 @@ from typing import Dict, Iterable, List, Sequence, Tuple
 
 import numpy as np
 try:
+    from translation_grading import comet_cache as cc
     from translation_grading import embedding_baseline as eb
+    from translation_grading import embedding_cache as ec
+    from translation_grading import gemini_judge as gj
 except ModuleNotFoundError:
+    import comet_cache as cc
     import embedding_baseline as eb
+    import embedding_cache as ec
+    import gemini_judge as gj
 
 
 CROWDIN_API_BASE = "https://api.crowdin.com/api/v2"
@@ -100,11 +106,21 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--embedding-device", default="auto", choices=["auto", "cpu", "cuda"])
     parser.add_argument("--embedding-batch-size", type=int, default=128)
     parser.add_argument("--consistency-threshold", type=float, default=0.78)
+    parser.add_argument(
+        "--embedding-cache-dir",
+        default=ec.DEFAULT_CACHE_DIR,
+        help="Persistent embedding cache; only new/edited strings are encoded (empty string disables).",
+    )
 
     parser.add_argument("--run-comet", action="store_true")
     parser.add_argument("--comet-model", default="Unbabel/wmt22-cometkiwi-da")
     parser.add_argument("--comet-batch-size", type=int, default=32)
     parser.add_argument("--comet-threshold", type=float, default=0.62)
+    parser.add_argument(
+        "--comet-cache-path",
+        default=cc.DEFAULT_CACHE_PATH,
+        help="Persistent COMET segment score cache; only new/edited pairs are scored (empty string disables).",
+    )
 
     parser.add_argument("--run-llm-judge", action="store_true")
     parser.add_argument("--gemini-api-key-env", default="GEMINI_API_KEY")
@@ -123,6 +139,14 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument("--llm-only-flagged", action="store_true")
     parser.add_argument("--llm-max-calls", type=int, default=0)
+    parser.add_argument("--llm-workers", type=int, default=4, help="Concurrent Gemini judge requests.")
+    parser.add_argument("--llm-rate-per-minute", type=float, default=60.0, help="Gemini request budget (0 = unlimited).")
+    parser.add_argument("--llm-max-retries", type=int, default=4, help="Retries per request for 429/5xx/connection errors.")
+    parser.add_argument(
+        "--llm-cache-dir",
+        default=gj.DEFAULT_CACHE_DIR,
+        help="On-disk Gemini response cache keyed by model + prompt hash (empty string disables).",
+    )
 
     parser.add_argument("--output-csv", default="translation_grading/output/translation-grading-report.csv")
     parser.add_argument("--summary-json", default="translation_grading/output/translation-grading-summary.json")
@@ -415,62 +439,79 @@ def cosine(u: np.ndarray, v: np.ndarray) -> float:
     return 0.0 if denom == 0 else float(np.dot(u, v) / denom)
 
 
+def get_embedder(args: argparse.Namespace) -> ec.Embedder:
+    """Shared cached embedder: one model load and one encode per string across stages."""
+    return ec.get_embedder(
+        args.embedding_model,
+        device=args.embedding_device,
+        batch_size=args.embedding_batch_size,
+        cache_dir=getattr(args, "embedding_cache_dir", ec.DEFAULT_CACHE_DIR) or None,
+    )
+
+
 def run_consistency_stage(rows: List[RowTranslation], args: argparse.Namespace) -> None:
+    if not rows:
+        return
+    embedder = get_embedder(args)
     try:
-        from sentence_transformers import SentenceTransformer
-    except Exception as exc:
+        target_emb = embedder.encode([r.target_text for r in rows], "passage")
+        source_emb = embedder.encode([r.source_text for r in rows], "query")
+    except ImportError as exc:
         print(f"[consistency] skipped: sentence-transformers unavailable ({exc})")
         return
-    if not rows:
-        return
-    device = None if args.embedding_device == "auto" else args.embedding_device
-    model = SentenceTransformer(args.embedding_model, device=device)
-    target_inputs = maybe_prefix_e5(args.embedding_model, [r.target_text for r in rows], "passage")
-    source_inputs = maybe_prefix_e5(args.embedding_model, [r.source_text for r in rows], "query")
-    target_emb = model.encode(target_inputs, batch_size=args.embedding_batch_size, convert_to_numpy=True, normalize_embeddings=True, show_progress_bar=True)
-    source_emb = model.encode(source_inputs, batch_size=args.embedding_batch_size, convert_to_numpy=True, normalize_embeddings=True, show_progress_bar=True)
-    per_item: Dict[str, List[int]] = {}
-    for idx, row in enumerate(rows):
-        per_item.setdefault(row.item_id, []).append(idx)
-    for indices in per_item.values():
-        for idx in indices:
-            row = rows[idx]
-            others = [target_emb[j] for j in indices if j != idx]
-            if others:
-                score = cosine(target_emb[idx], np.mean(np.array(others), axis=0))
-                basis = "target-centroid"
-            else:
-                score = cosine(target_emb[idx], source_emb[idx])
-                basis = "source-fallback"
-            row.scores["consistency"] = score
-            row.metadata["consistency_basis"] = basis
-            if score < args.consistency_threshold:
-                row.needs_review = True
-                row.review_reasons.append(f"consistency<{args.consistency_threshold:.2f}")
+    print(f"[embeddings] {embedder.hits} cached, {embedder.encoded} encoded")
+    # Leave-one-out item centroids from per-item segment sums; items with a
+    # single translation fall back to target-vs-source similarity
+    scores, used_fallback = eb.leave_one_out_cosine(target_emb, [r.item_id for r in rows], source_emb)
+    for row, score, fallback in zip(rows, scores.tolist(), used_fallback.tolist()):
+        row.scores["consistency"] = score
+        row.metadata["consistency_basis"] = "source-fallback" if fallback else "target-centroid"
+        if score < args.consistency_threshold:
+            row.needs_review = True
+            row.review_reasons.append(f"consistency<{args.consistency_threshold:.2f}")
 
 
-def run_comet_stage(rows: List[RowTranslation], args: argparse.Namespace) -> None:
-    if not args.run_comet or not rows:
-        return
+def load_comet_model(model_name: str):
     try:
         from comet import download_model, load_from_checkpoint
     except Exception as exc:
-        print(f"[comet] skipped: unbabel-comet unavailable ({exc})")
+        raise ImportError(exc) from exc
+    return load_from_checkpoint(download_model(model_name))
+
+
+def run_comet_stage(rows: List[RowTranslation], args: argparse.Namespace) -> None:
+    if not args.run_comet or not rows:
         return
-    model_path = download_model(args.comet_model)
-    model = load_from_checkpoint(model_path)
+    cache_path = getattr(args, "comet_cache_path", "")
+    cache = cc.CometScoreCache(cache_path, args.comet_model) if cache_path else None
+
+    def predict_scores(samples: List[dict]) -> List[float]:
+        # Only reached when some pair is not cached
+        model = load_comet_model(args.comet_model)
+        try:
+            pred = model.predict(samples, batch_size=args.comet_batch_size, progress_bar=True)
+        except TypeError:
+            pred = model.predict(samples, batch_size=args.comet_batch_size, gpus=0, progress_bar=True)
+        return list(pred.get("scores") or [])
+
     samples = [{"src": r.source_text, "mt": r.target_text} for r in rows]
     try:
-        pred = model.predict(samples, batch_size=args.comet_batch_size, progress_bar=True)
-    except TypeError:
-        pred = model.predict(samples, batch_size=args.comet_batch_size, gpus=0, progress_bar=True)
-    scores = list(pred.get("scores") or [])
-    if len(scores) != len(rows):
+        scores, from_cache, stats = cc.score_samples(samples, predict_scores, cache)
+    except ImportError as exc:
+        print(f"[comet] skipped: unbabel-comet unavailable ({exc})")
+        return
+    except ValueError:
         print("[comet] skipped: prediction count did not match row count")
         return
-    for row, score in zip(rows, scores):
+    finally:
+        if cache is not None:
+            cache.close()
+    if cache is not None:
+        print(f"[comet] {stats['segments']} pairs: {stats['cached']} cached, {stats['scored']} scored")
+    for row, score, cached in zip(rows, scores, from_cache):
         score_f = float(score)
         row.scores["comet"] = score_f
+        row.metadata["comet_cached"] = cached
         if score_f < args.comet_threshold:
             row.needs_review = True
             row.review_reasons.append(f"comet<{args.comet_threshold:.2f}")
@@ -519,15 +560,7 @@ def build_llm_prompt(row: RowTranslation, args: argparse.Namespace) -> str:
 
 
 def call_gemini(prompt: str, model: str, api_key: str) -> dict:
-    url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={api_key}"
-    payload = {"contents": [{"parts": [{"text": prompt}]}], "generationConfig": {"temperature": 0, "responseMimeType": "application/json"}}
-    req = urllib.request.Request(url, data=json.dumps(payload).encode("utf-8"), headers={"Content-Type": "application/json"}, method="POST")
-    with urllib.request.urlopen(req, timeout=90) as resp:
-        parsed = json.loads(resp.read().decode("utf-8"))
-    text = parsed.get("candidates", [{}])[0].get("content", {}).get("parts", [{}])[0].get("text", "").strip()
-    if not text:
-        raise RuntimeError("Gemini returned empty response.")
-    return json.loads(text)
+    return gj.GeminiClient(api_key).judge(model, prompt)
 
 
 def run_llm_judge_stage(rows: List[RowTranslation], args: argparse.Namespace) -> None:
@@ -537,18 +570,48 @@ def run_llm_judge_stage(rows: List[RowTranslation], args: argparse.Namespace) ->
     if not api_key:
         print(f"[llm] skipped: {args.gemini_api_key_env} is not set")
         return
-    calls = 0
-    for row in rows:
-        if args.llm_only_flagged and not row.needs_review:
+    selected = [row for row in rows if not (args.llm_only_flagged and not row.needs_review)]
+    if not selected:
+        return
+    prompts = [build_llm_prompt(row, args) for row in selected]
+
+    # Judgements are appended to the cache as they arrive, so a resumed run
+    # only pays for prompts that were never answered
+    cache_dir = getattr(args, "llm_cache_dir", gj.DEFAULT_CACHE_DIR)
+    cache = gj.ResponseCache(cache_dir) if cache_dir else None
+    cached = 0
+    if cache is not None:
+        cached = sum(1 for prompt in prompts if cache.get(gj.prompt_key(args.gemini_model, prompt)) is not None)
+    client = gj.GeminiClient(
+        api_key,
+        max_retries=getattr(args, "llm_max_retries", 4),
+        limiter=gj.RateLimiter(getattr(args, "llm_rate_per_minute", 60.0)),
+    )
+    done = {"count": 0}
+
+    def progress(_idx: int, _outcome: object) -> None:
+        done["count"] += 1
+        if done["count"] % 25 == 0:
+            print(f"[llm] {done['count']} requests finished")
+
+    results = gj.judge_prompts(
+        prompts,
+        args.gemini_model,
+        client,
+        cache=cache,
+        max_workers=getattr(args, "llm_workers", 4),
+        max_calls=args.llm_max_calls,
+        on_result=progress,
+    )
+
+    errors = 0
+    for row, judged in zip(selected, results):
+        if judged is None:
             continue
-        if args.llm_max_calls > 0 and calls >= args.llm_max_calls:
-            break
-        try:
-            judged = call_gemini(build_llm_prompt(row, args), args.gemini_model, api_key)
-        except Exception as exc:
-            row.notes.append(f"llm_error:{exc}")
+        if isinstance(judged, Exception):
+            row.notes.append(f"llm_error:{judged}")
+            errors += 1
             continue
-        calls += 1
         row.metadata["llm"] = judged
         score = float(judged.get("final_score", 0.0) or 0.0)
         severity = str(judged.get("severity", "none")).strip().lower().replace("_", "-")
@@ -559,6 +622,10 @@ def run_llm_judge_stage(rows: List[RowTranslation], args: argparse.Namespace) ->
         if severity in {"critical", "major"}:
             row.needs_review = True
             row.review_reasons.append(f"llm_severity:{severity}")
+    print(
+        f"[llm] {len(selected)} rows: {cached} cached, {client.requests - client.retries} requests "
+        f"({client.retries} retries, {client.connections} connections), {errors} errors"
+    )
 
 
 def run_embedding_baseline_stage(rows: List[RowTranslation], args: argparse.Namespace) -> None:
@@ -568,14 +635,8 @@ def run_embedding_baseline_stage(rows: List[RowTranslation], args: argparse.Name
     if not baseline_path:
         return
 
-    model = eb.load_model(args.embedding_model, args.embedding_device)
-    embeddings = eb.encode_texts(
-        model=model,
-        model_name=args.embedding_model,
-        texts=[r.target_text for r in rows],
-        batch_size=args.embedding_batch_size,
-        prefix="passage",
-    )
+    # Target vectors are usually already cached by the consistency stage
+    embeddings = get_embedder(args).encode([r.target_text for r in rows], "passage")
 
     if args.build_embedding_baseline:
         baseline_pairs = [
@@ -600,28 +661,25 @@ def run_embedding_baseline_stage(rows: List[RowTranslation], args: argparse.Name
     base_emb = baseline["embeddings"]
     base_item_id = baseline["item_id"].astype(str)
     base_lang = baseline["target_lang"].astype(str)
-    by_item = eb.build_index(base_item_id)
-    by_item_lang = eb.build_index([f"{iid}|{lang}" for iid, lang in zip(base_item_id, base_lang)])
-    by_lang = eb.build_index(base_lang)
+    sims = eb.baseline_similarities(
+        embeddings,
+        [r.item_id for r in rows],
+        [r.target_lang for r in rows],
+        base_emb,
+        base_item_id,
+        base_lang,
+    )
 
     flagged = 0
     for idx, row in enumerate(rows):
-        vec = embeddings[idx]
-        item_idx = by_item.get(row.item_id, [])
-        item_lang_idx = by_item_lang.get(f"{row.item_id}|{row.target_lang}", [])
-        lang_idx = by_lang.get(row.target_lang, [])
-
-        sim_item_centroid = None
-        sim_item_lang_max = None
-        sim_lang_centroid = None
-        if item_idx:
-            sim_item_centroid = eb.cosine(vec, np.mean(base_emb[item_idx], axis=0))
+        sim_item_centroid = eb.optional_score(sims["item_centroid"][idx])
+        sim_item_lang_max = eb.optional_score(sims["item_lang_max"][idx])
+        sim_lang_centroid = eb.optional_score(sims["lang_centroid"][idx])
+        if sim_item_centroid is not None:
             row.scores["baseline_item_centroid"] = sim_item_centroid
-        if item_lang_idx:
-            sim_item_lang_max = max(eb.cosine(vec, base_emb[j]) for j in item_lang_idx)
+        if sim_item_lang_max is not None:
             row.scores["baseline_item_lang_max"] = sim_item_lang_max
-        if lang_idx:
-            sim_lang_centroid = eb.cosine(vec, np.mean(base_emb[lang_idx], axis=0))
+        if sim_lang_centroid is not None:
             row.scores["baseline_lang_centroid"] = sim_lang_centroid
 
         reasons: List[str] = []
@@ -666,6 +724,12 @@ def metric_summary(values: Sequence[float]) -> Dict[str, object]:
     }
 
 
+def comet_cache_summary(rows: List[RowTranslation]) -> Dict[str, int]:
+    scored = [r for r in rows if "comet" in r.scores]
+    cached = sum(1 for r in scored if r.metadata.get("comet_cached"))
+    return {"segments": len(scored), "cached": cached, "scored": len(scored) - cached}
+
+
 def summarize(rows: List[RowTranslation]) -> Dict[str, object]:
     flagged = [r for r in rows if r.needs_review]
     by_language: Dict[str, Dict[str, int]] = {}
@@ -680,6 +744,7 @@ def summarize(rows: List[RowTranslation]) -> Dict[str, object]:
         "flag_rate": round((len(flagged) / len(rows)) if rows else 0.0, 4),
         "consistency": metric_summary([r.scores["consistency"] for r in rows if "consistency" in r.scores]),
         "comet": metric_summary([r.scores["comet"] for r in rows if "comet" in r.scores]),
+        "comet_cache": comet_cache_summary(rows),
         "llm_final": metric_summary([r.scores["llm_final"] for r in rows if "llm_final" in r.scores]),
         "baseline_item_centroid": metric_summary([r.scores["baseline_item_centroid"] for r in rows if "baseline_item_centroid" in r.scores]),
         "baseline_item_lang_max": metric_summary([r.scores["baseline_item_lang_max"] for r in rows if "baseline_item_lang_max" in r.scores]),
@@ -786,10 +851,14 @@ def write_markdown_report(rows: List[RowTranslation], out_path: Path) -> None:
         "",
         f"- Total pairs: **{len(rows)}**",
         f"- Flagged pairs: **{len(flagged)}** ({(100 * len(flagged) / max(1, len(rows))):.2f}%)",
-        "",
-        "## Flag Reasons",
-        "",
     ]
+    comet_cache = comet_cache_summary(rows)
+    if comet_cache["segments"]:
+        lines.append(
+            f"- COMET scores reused from cache: **{comet_cache['cached']}** / {comet_cache['segments']}"
+            f" ({comet_cache['scored']} scored this run)"
+        )
+    lines.extend(["", "## Flag Reasons", ""])
     if reason_counts:
         lines.extend([f"- `{reason}`: **{count}**" for reason, count in reason_counts.most_common()])
     else:
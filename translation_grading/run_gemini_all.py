@@ -3,9 +3,12 @@
 
 Wraps ``gemini_quality_evaluator`` to add the robustness a full multi-thousand
 pair run needs:
-  * resume   - skips ``(identifier, language)`` pairs already in the output CSV
-  * flushing - rewrites the output CSV every ``--flush-every`` results so a crash
-               or interruption never loses completed work
+  * resume   - every result is appended to a JSONL ledger as it arrives, keyed
+               by identifier, language, template, translation hash and model;
+               a restart skips finished keys and re-judges edited translations
+  * flushing - rewrites the output CSV every ``--flush-every`` results; rows
+               of an earlier run that this run does not re-judge (other
+               languages, items outside ``--limit``) are kept
   * resilient - a per-item Gemini failure is recorded and skipped, never aborts
 
 Usage (from repo root, with GEMINI_API_KEY in the environment):
@@ -66,6 +69,19 @@ def load_done(path: Path) -> Tuple[List[dict], Set[Tuple[str, str]]]:
     return rows, done
 
 
+def seed_ledger_from_csv(ledger: gqe.EvaluationLedger, items: Sequence[gqe.EvaluationItem], path: Path) -> int:
+    """Carry results of a pre-ledger run (output CSV only) into an empty ledger, assuming unchanged text."""
+    rows, _ = load_done(path)
+    by_pair = {(str(row.get("identifier", "")), str(row.get("language", ""))): row for row in rows}
+    seeded = 0
+    for it in items:
+        row = by_pair.get((it.identifier, it.target_lang))
+        if row is not None and ledger.get(it) is None:
+            ledger.record(it, {field: row.get(field, "") for field in FIELDS})
+            seeded += 1
+    return seeded
+
+
 def flush(path: Path, rows: Sequence[dict]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp = path.with_suffix(path.suffix + ".tmp")
@@ -88,6 +104,8 @@ def main() -> int:
     p.add_argument("--limit", type=int, default=0)
     p.add_argument("--workers", type=int, default=8, help="Concurrent Gemini requests.")
     p.add_argument("--flush-every", type=int, default=25)
+    p.add_argument("--ledger-path", default="",
+                   help="JSONL ledger of finished evaluations (default: <output stem>.ledger.jsonl).")
     args = p.parse_args()
 
     api_key = os.environ.get(args.api_key_env, "").strip()
@@ -95,13 +113,24 @@ def main() -> int:
         raise SystemExit(f"{args.api_key_env} is not set.")
 
     out_path = Path(args.output_csv)
-    results, done = load_done(out_path)
-
+    previous, _ = load_done(out_path)
     items = gqe.load_items(Path(args.input_csv), args.source_col,
                            gqe.csv_list(args.target_cols), args.limit)
-    pending = [it for it in items if (it.identifier, it.target_lang) not in done]
+    ledger = gqe.EvaluationLedger(args.ledger_path or gqe.default_ledger_path(out_path), args.model)
+    if not len(ledger) and out_path.exists():
+        print(f"[gemini-all] seeded ledger with {seed_ledger_from_csv(ledger, items, out_path)} rows "
+              f"from {out_path}", flush=True)
+    done, pending = ledger.split(items)
     print(f"[gemini-all] total={len(items)} done={len(done)} pending={len(pending)} "
-          f"model={args.model}", flush=True)
+          f"model={args.model} ledger={ledger.path}", flush=True)
+
+    def ordered_results() -> List[dict]:
+        # Earlier output rows stay in place (replaced by this run's result when
+        # there is one); results for new pairs follow in input order
+        fresh = {(it.identifier, it.target_lang): done[id(it)] for it in items if id(it) in done}
+        rows = [fresh.pop((str(row.get("identifier", "")), str(row.get("language", ""))), row)
+                for row in previous]
+        return rows + list(fresh.values())
 
     # Batch OBJECT_NAMING (vocab) pairs; single-call everything else.
     object_items = [it for it in pending
@@ -118,13 +147,13 @@ def main() -> int:
     single_items = [it for it in pending if id(it) not in object_ids]
     batches = [batch for group in sorted(groups) for batch in gqe.chunks(groups[group], gqe.BATCH_SIZE)]
 
-    def run_batch(batch: Sequence[gqe.EvaluationItem]) -> List[dict]:
+    def run_batch(batch: Sequence[gqe.EvaluationItem]) -> List[Tuple[gqe.EvaluationItem, dict]]:
         evals = with_retry(gqe.evaluate_object_batch, batch, api_key, args.model, args.fallback_model)
-        return [gqe.result_row(it, ev) for it, ev in zip(batch, evals)]
+        return [(it, gqe.result_row(it, ev)) for it, ev in zip(batch, evals)]
 
-    def run_single(it: gqe.EvaluationItem) -> List[dict]:
+    def run_single(it: gqe.EvaluationItem) -> List[Tuple[gqe.EvaluationItem, dict]]:
         ev = with_retry(gqe.evaluate_single, it, api_key, args.model, args.fallback_model)
-        return [gqe.result_row(it, ev)]
+        return [(it, gqe.result_row(it, ev))]
 
     with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
         futures = {}
@@ -136,7 +165,9 @@ def main() -> int:
         for fut in as_completed(futures):
             kind, n, payload = futures[fut]
             try:
-                results.extend(fut.result())
+                for it, row in fut.result():
+                    ledger.record(it, row)
+                    done[id(it)] = row
             except Exception as exc:  # noqa: BLE001 - record and continue
                 failures += n
                 label = (payload[0].identifier if kind == "batch" and payload
@@ -144,10 +175,11 @@ def main() -> int:
                 print(f"[gemini-all] {kind} failed ({label}, n={n}): {exc}", flush=True)
             processed += n
             if processed % args.flush_every < n:
-                flush(out_path, results)
+                flush(out_path, ordered_results())
             if processed % 100 < n or processed >= total:
                 print(f"[gemini-all] {processed}/{total} failures={failures}", flush=True)
 
+    results = ordered_results()
     flush(out_path, results)
     print(f"[gemini-all] DONE wrote {len(results)} rows to {out_path} "
           f"(processed={processed}, failures={failures})", flush=True)
@@ -0,0 +1,172 @@
+"""
+Content-addressed cache of synthesized audio.
+
+Identical strings are shared across tasks and locales (e.g. "Great job!" in
+several surveys), and the regen diff is keyed by item, so the same clip used
+to be synthesized and paid for repeatedly. The cache is keyed by a hash of
+the normalized text plus voice_id, model_id and output format and stores the
+provider's MP3 bytes (before ID3 tagging) under ``tmp/tts_audio_cache/``.
+
+Entries are evicted least-recently-used once the cache grows past its size
+budget. Settings (environment):
+
+- ``TTS_AUDIO_CACHE``: set to ``0`` to disable the cache
+- ``TTS_AUDIO_CACHE_DIR``: cache directory (default ``tmp/tts_audio_cache``)
+- ``TTS_AUDIO_CACHE_MAX_MB``: size budget in MB (default 2048)
+"""
+
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Optional
+
+DEFAULT_CACHE_DIR = "tmp/tts_audio_cache"
+DEFAULT_MAX_MB = 2048
+
+_cache_singleton: Optional["AudioCache"] = None
+_singleton_lock = threading.Lock()
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for cache keys: NFC, collapsed whitespace, stripped."""
+    normalized = unicodedata.normalize("NFC", str(text or ""))
+    return re.sub(r"\s+", " ", normalized).strip()
+
+
+def cache_key(text: str, voice_id: str, model_id: str, output_format: str) -> str:
+    """Return the sha256 content address for one synthesis request."""
+    parts = [normalize_text(text), str(voice_id or ""), str(model_id or ""), str(output_format or "")]
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+class AudioCache:
+    """Size-bounded LRU cache of MP3 bytes on disk, safe to share across threads."""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = int(max_bytes)
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, int]" = OrderedDict()  # key -> size, oldest first
+        self._total_bytes = 0
+        self._counters: Dict[str, Dict[str, int]] = {}
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._load_index()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.mp3")
+
+    def _load_index(self) -> None:
+        found = []
+        for root, _dirs, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith(".mp3"):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(root, name))
+                except OSError:
+                    continue
+                found.append((stat.st_mtime, name[:-4], stat.st_size))
+        for _mtime, key, size in sorted(found):
+            self._entries[key] = size
+            self._total_bytes += size
+
+    def _count(self, tag: Optional[str], field: str) -> None:
+        for name in {"_total", tag or "_total"}:
+            bucket = self._counters.setdefault(name, {"hits": 0, "misses": 0})
+            bucket[field] += 1
+
+    def get(self, key: str, tag: Optional[str] = None) -> Optional[bytes]:
+        """Return cached bytes for ``key`` (marking it recently used) or None."""
+        path = self._path(key)
+        with self._lock:
+            if key not in self._entries:
+                self._count(tag, "misses")
+                return None
+            try:
+                with open(path, "rb") as handle:
+                    data = handle.read()
+                os.utime(path, None)
+            except OSError:
+                self._total_bytes -= self._entries.pop(key, 0)
+                self._count(tag, "misses")
+                return None
+            self._entries.move_to_end(key)
+            self._count(tag, "hits")
+            return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store ``data`` under ``key`` atomically, then evict past the size budget."""
+        if not data:
+            return
+        self._store(key, lambda handle: handle.write(data))
+
+    def put_file(self, key: str, source_path: str) -> None:
+        """Copy an already-written audio file into the cache without loading it into memory."""
+        if not os.path.exists(source_path) or os.path.getsize(source_path) == 0:
+            return
+
+        def _copy(handle):
+            with open(source_path, "rb") as source:
+                shutil.copyfileobj(source, handle)
+
+        self._store(key, _copy)
+
+    def _store(self, key: str, write) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                write(handle)
+            size = os.path.getsize(tmp_path)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️  Warning: Could not write audio cache entry {key[:12]}: {e}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return
+        with self._lock:
+            self._total_bytes -= self._entries.pop(key, 0)
+            self._entries[key] = size
+            self._total_bytes += size
+            self._evict()
+
+    def _evict(self) -> None:
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            old_key, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            try:
+                os.remove(self._path(old_key))
+            except OSError:
+                pass
+
+    def stats(self, tag: Optional[str] = None) -> Dict[str, int]:
+        """Return hit/miss counters for ``tag`` (or the whole process)."""
+        with self._lock:
+            counters = dict(self._counters.get(tag or "_total", {"hits": 0, "misses": 0}))
+            counters["entries"] = len(self._entries)
+            counters["bytes"] = self._total_bytes
+        return counters
+
+
+def get_cache() -> Optional[AudioCache]:
+    """Return the process-wide cache, or None when TTS_AUDIO_CACHE=0."""
+    global _cache_singleton
+    if os.environ.get("TTS_AUDIO_CACHE", "1").strip().lower() in {"0", "false", "no", "off"}:
+        return None
+    with _singleton_lock:
+        if _cache_singleton is None:
+            cache_dir = os.environ.get("TTS_AUDIO_CACHE_DIR", DEFAULT_CACHE_DIR)
+            try:
+                max_mb = float(os.environ.get("TTS_AUDIO_CACHE_MAX_MB", DEFAULT_MAX_MB))
+            except ValueError:
+                max_mb = DEFAULT_MAX_MB
+            _cache_singleton = AudioCache(cache_dir, int(max_mb * 1024 * 1024))
+        return _cache_singleton
@@ -0,0 +1,265 @@
+"""
+Persistent ID3 metadata catalog for the local audio tree.
+
+Counting, seeding, regeneration checks and the backfill scripts all used to
+glob ``audio_files/<lang>/*.mp3`` and parse every file's ID3 tags again. The
+catalog keeps one SQLite row per MP3 (path, mtime, size, content MD5 and the
+parsed tags) under ``tmp/audio_catalog.sqlite``. ``refresh`` only stats
+files and re-reads the ones whose mtime or size changed; lookups for a
+single file stat it and re-read it only when it is stale.
+
+Typical use:
+
+    catalog = AudioCatalog()
+    catalog.refresh("audio_files")
+    catalog.count("de")
+    catalog.custom_fields("audio_files/de/apple.mp3")
+
+Settings (environment):
+
+- ``AUDIO_CATALOG_PATH``: SQLite file (default ``tmp/audio_catalog.sqlite``)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from utilities.utilities import ID3TagSession
+
+DEFAULT_CATALOG_PATH = "tmp/audio_catalog.sqlite"
+
+
+def _file_md5(path: str, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.md5()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _lang_and_layout(path: str) -> Tuple[str, bool]:
+    """Language folder of a clip: ``<lang>/<file>`` or legacy ``<task>/<lang>/shared/<file>``."""
+    parts = Path(path).parts
+    if len(parts) >= 3 and parts[-2] == "shared":
+        return parts[-3], True
+    return (parts[-2] if len(parts) >= 2 else ""), False
+
+
+def _read_file(path: str, stat: os.stat_result) -> Dict[str, Any]:
+    """Hash and parse one MP3; a file mutagen cannot read is recorded without tags."""
+    row: Dict[str, Any] = {"path": path, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+    try:
+        row["md5"] = _file_md5(path)
+    except OSError as e:
+        row["error"] = str(e)
+        return row
+    try:
+        session = ID3TagSession(path)
+        row["tags"] = session.read()
+        row["custom"] = session.custom_fields()
+        row["has_tags"] = session.frames is not None
+    except Exception as e:
+        row.update({"tags": {}, "custom": {}, "has_tags": False, "error": str(e)})
+    return row
+
+
+class AudioCatalog:
+    """SQLite-backed ID3 metadata catalog, refreshed incrementally; safe to share between threads."""
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path or os.environ.get("AUDIO_CATALOG_PATH") or DEFAULT_CATALOG_PATH
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS audio_files (
+                path TEXT PRIMARY KEY,
+                lang TEXT NOT NULL,
+                legacy_layout INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                md5 TEXT,
+                has_tags INTEGER NOT NULL,
+                tags TEXT NOT NULL,
+                custom TEXT NOT NULL,
+                scanned_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_audio_files_lang ON audio_files(lang)")
+        self._conn.commit()
+
+    @staticmethod
+    def _key(path: str) -> str:
+        return os.path.abspath(path)
+
+    def _store(self, rows: Iterable[Dict[str, Any]]) -> None:
+        now = time.time()
+        values = []
+        for row in rows:
+            lang, legacy = _lang_and_layout(row["path"])
+            values.append((
+                row["path"], lang, int(legacy), row["mtime_ns"], row["size"], row.get("md5"),
+                int(bool(row.get("has_tags"))), json.dumps(row.get("tags") or {}, ensure_ascii=False),
+                json.dumps(row.get("custom") or {}, ensure_ascii=False), now,
+            ))
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO audio_files VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", values)
+            self._conn.commit()
+
+    @staticmethod
+    def _row_dict(row: Tuple) -> Dict[str, Any]:
+        return {
+            "path": row[0],
+            "lang": row[1],
+            "legacy_layout": bool(row[2]),
+            "mtime_ns": row[3],
+            "size": row[4],
+            "md5": row[5],
+            "has_tags": bool(row[6]),
+            "tags": json.loads(row[7]),
+            "custom": json.loads(row[8]),
+        }
+
+    def refresh(self, directory: str = "audio_files", recursive: bool = True, workers: int = 8) -> Dict[str, int]:
+        """
+        Bring the catalog up to date for the MP3 files under a directory.
+
+        Every file is stat-ed; only new files and files whose mtime or size
+        changed are hashed and parsed (in a thread pool). Rows for files that
+        disappeared are removed.
+
+        Args:
+            directory: Root to scan
+            recursive: Also scan subdirectories
+            workers: Threads for reading changed files
+
+        Returns:
+            dict: ``scanned``, ``added``, ``updated``, ``unchanged``, ``removed`` and ``failed`` counts
+        """
+        root = self._key(directory)
+        stats = {"scanned": 0, "added": 0, "updated": 0, "unchanged": 0, "removed": 0, "failed": 0}
+        with self._lock:
+            known = {
+                path: (mtime_ns, size)
+                for path, mtime_ns, size in self._conn.execute(
+                    "SELECT path, mtime_ns, size FROM audio_files WHERE substr(path, 1, ?) = ?",
+                    (len(root) + 1, root + os.sep),
+                )
+            }
+        if not recursive:
+            known = {path: v for path, v in known.items() if os.path.dirname(path) == root}
+
+        todo: List[Tuple[str, os.stat_result]] = []
+        seen = set()
+        if os.path.isdir(root):
+            mp3_paths = Path(root).rglob("*.mp3") if recursive else Path(root).glob("*.mp3")
+            for mp3 in mp3_paths:
+                path = str(mp3)
+                try:
+                    stat = mp3.stat()
+                except OSError:
+                    continue
+                stats["scanned"] += 1
+                seen.add(path)
+                previous = known.get(path)
+                if previous == (stat.st_mtime_ns, stat.st_size):
+                    stats["unchanged"] += 1
+                    continue
+                stats["updated" if previous else "added"] += 1
+                todo.append((path, stat))
+
+        if todo:
+            with ThreadPoolExecutor(max_workers=max(1, int(workers))) as pool:
+                rows = list(pool.map(lambda item: _read_file(*item), todo))
+            stats["failed"] = sum(1 for row in rows if row.get("error"))
+            self._store([row for row in rows if "md5" in row])
+
+        removed = [path for path in known if path not in seen]
+        if removed:
+            with self._lock:
+                self._conn.executemany("DELETE FROM audio_files WHERE path = ?", [(path,) for path in removed])
+                self._conn.commit()
+        stats["removed"] = len(removed)
+        return stats
+
+    def entry(self, path: str) -> Optional[Dict[str, Any]]:
+        """
+        Catalog row for one file, re-read first if the file changed since it was cataloged.
+
+        Returns:
+            dict or None: Row with ``tags`` / ``custom`` dicts, or None if the file does not exist
+        """
+        key = self._key(path)
+        try:
+            stat = os.stat(key)
+        except OSError:
+            return None
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM audio_files WHERE path = ?", (key,)).fetchone()
+        if row is not None and (row[3], row[4]) == (stat.st_mtime_ns, stat.st_size):
+            return self._row_dict(row)
+        fresh = _read_file(key, stat)
+        if "md5" not in fresh:
+            return None
+        self._store([fresh])
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM audio_files WHERE path = ?", (key,)).fetchone()
+        return self._row_dict(row)
+
+    def tags(self, path: str) -> Dict[str, Any]:
+        """Same dict as ``read_id3_tags`` (empty if the file is missing or unreadable)."""
+        row = self.entry(path)
+        return row["tags"] if row else {}
+
+    def custom_fields(self, path: str) -> Optional[Dict[str, Any]]:
+        """Same dict as ``read_audio_metadata``: TXXX fields, or None if the file has no tag."""
+        row = self.entry(path)
+        if row is None or not row["has_tags"]:
+            return None
+        return row["custom"]
+
+    def entries(self, directory: Optional[str] = None, lang: Optional[str] = None, recursive: bool = True) -> List[Dict[str, Any]]:
+        """Cataloged rows (as of the last refresh), sorted by path, optionally under a directory and/or for a language."""
+        query = "SELECT * FROM audio_files WHERE 1 = 1"
+        params: List[Any] = []
+        if directory is not None:
+            root = self._key(directory)
+            query += " AND substr(path, 1, ?) = ?"
+            params += [len(root) + 1, root + os.sep]
+        if lang is not None:
+            query += " AND lang = ?"
+            params.append(lang)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY path", params).fetchall()
+        result = [self._row_dict(row) for row in rows]
+        if directory is not None and not recursive:
+            result = [row for row in result if os.path.dirname(row["path"]) == self._key(directory)]
+        return result
+
+    def count(self, lang: str, legacy_layout: Optional[bool] = None, directory: Optional[str] = None) -> int:
+        """Number of cataloged clips for a language, optionally only one directory layout and/or root."""
+        query = "SELECT COUNT(*) FROM audio_files WHERE lang = ?"
+        params: List[Any] = [lang]
+        if directory is not None:
+            root = self._key(directory)
+            query += " AND substr(path, 1, ?) = ?"
+            params += [len(root) + 1, root + os.sep]
+        if legacy_layout is not None:
+            query += " AND legacy_layout = ?"
+            params.append(int(legacy_layout))
+        with self._lock:
+            return int(self._conn.execute(query, params).fetchone()[0])
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -21,16 +21,21 @@ except ImportError:
     print("Warning: ID3 utilities not available. Audio validation will be limited.")
 
 
-def read_audio_metadata(audio_file_path: str) -> Optional[Dict[str, Any]]:
+def read_audio_metadata(audio_file_path: str, catalog=None) -> Optional[Dict[str, Any]]:
     """
     Read metadata from an audio file's ID3 tags.
     
     Args:
         audio_file_path (str): Path to the audio file
+        catalog (AudioCatalog, optional): Look the file up in the metadata catalog
+            (utilities.audio_catalog) instead of parsing it; stale entries are re-read
         
     Returns:
         Dict containing metadata or None if not available
     """
+    if catalog is not None:
+        return catalog.custom_fields(audio_file_path)
+
     if not ID3_AVAILABLE or not os.path.exists(audio_file_path):
         return None
     
@@ -77,7 +82,8 @@ def needs_regeneration(
     current_service: str,
     current_lang_code: str,
     force_id: bool = False,
-    current_model_id: Optional[str] = None
+    current_model_id: Optional[str] = None,
+    catalog=None,
 ) -> Tuple[bool, str]:
     """
     Check if an audio file needs regeneration based on text or voice changes.
@@ -90,6 +96,7 @@ def needs_regeneration(
         current_lang_code (str): Current language code
         force_id (bool): If True, regenerate files without ID3 tags. If False, skip them.
         current_model_id (Optional[str]): Expected model ID, when model-specific validation is needed.
+        catalog (AudioCatalog, optional): Read the stored tags from the metadata catalog.
         
     Returns:
         Tuple of (needs_regeneration: bool, reason: str)
@@ -97,7 +104,7 @@ def needs_regeneration(
     if not os.path.exists(audio_file_path):
         return True, "Audio file does not exist"
     
-    metadata = read_audio_metadata(audio_file_path)
+    metadata = read_audio_metadata(audio_file_path, catalog=catalog)
     if not metadata:
         if force_id:
             return True, "Cannot read audio metadata (missing ID3 tags) - forcing regeneration"
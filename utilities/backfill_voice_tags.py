@@ -21,6 +21,7 @@ PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.append(str(PROJECT_ROOT))
 
+from utilities.audio_catalog import DEFAULT_CATALOG_PATH, AudioCatalog  # noqa: E402
 from utilities.utilities import audio_tags, read_id3_tags, write_id3_tags  # noqa: E402
 
 try:
@@ -84,7 +85,9 @@ def merge_tags(existing: Dict[str, str | None] | None, title: str, config: Langu
     return merged
 
 
-def discover_local_files(config: LanguageConfig, explicit_files: Iterable[str] | None = None) -> List[str]:
+def discover_local_files(
+    config: LanguageConfig, explicit_files: Iterable[str] | None = None, catalog: AudioCatalog | None = None
+) -> List[str]:
     base_path = pathlib.Path(config.base_dir)
     if explicit_files:
         return sorted(set(f.replace("\\", "/") for f in explicit_files))
@@ -94,6 +97,14 @@ def discover_local_files(config: LanguageConfig, explicit_files: Iterable[str] |
         return []
 
     candidates: List[str] = []
+    if catalog is not None:
+        # Only files added or changed since the last refresh are parsed
+        catalog.refresh(str(base_path))
+        for entry in catalog.entries(str(base_path)):
+            if is_missing_voice(entry["tags"]):
+                candidates.append(pathlib.Path(os.path.relpath(entry["path"], os.path.abspath(base_path))).as_posix())
+        return sorted(candidates)
+
     for mp3_path in base_path.rglob("*.mp3"):
         tags = read_id3_tags(str(mp3_path))
         if is_missing_voice(tags):
@@ -214,6 +225,13 @@ def parse_args() -> argparse.Namespace:
         nargs="+",
         help="Explicit relative file paths (relative to the language base directory). Applies to all specified languages.",
     )
+    parser.add_argument(
+        "--catalog",
+        nargs="?",
+        const=DEFAULT_CATALOG_PATH,
+        default=None,
+        help=f"Find candidates through the incremental ID3 metadata catalog (default path: {DEFAULT_CATALOG_PATH})",
+    )
     return parser.parse_args()
 
 
@@ -230,9 +248,10 @@ def main() -> None:
         print("No valid languages selected. Exiting.")
         return
 
+    catalog = AudioCatalog(args.catalog) if args.catalog else None
     for lang in languages:
         config = LANGUAGE_CONFIG[lang]
-        files = discover_local_files(config, explicit_files=args.files)
+        files = discover_local_files(config, explicit_files=args.files, catalog=catalog)
         print(f"\n===== {lang} =====")
         print(f"Found {len(files)} candidate files to update.")
 
@@ -27,12 +27,16 @@ import argparse
 import json
 import os
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import xml.etree.ElementTree as ET
 from copy import deepcopy
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 API_BASE = os.environ.get("CROWDIN_API_BASE", "https://api.crowdin.com/api/v2").rstrip("/")
 
@@ -127,24 +131,48 @@ def upload_xliff_file(project_id: str, headers: Dict[str, str], file_path: str,
         print(f"⚠️  File exists, skipping: {crowdin_path}")
         return existing_file
 
-def download_xliff_file(project_id: str, headers: Dict[str, str], file_id: str,
-                       language_id: str, output_path: str, *, format: str | None = "xliff") -> bool:
-    """Download a translated XLIFF file from Crowdin.
-
-    Note: Some projects with non-XLIFF sources require an explicit format parameter.
+def make_session(max_workers: int = 8) -> requests.Session:
+    """requests.Session with a connection pool sized for max_workers and retries on 429/5xx."""
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=1.0,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=None,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def _fetch_xliff_file(project_id: str, headers: Dict[str, str], file_id: str,
+                      language_id: str, output_path: str, *, format: str | None = "xliff",
+                      etag: Optional[str] = None, session: Optional[requests.Session] = None) -> Tuple[str, Optional[str]]:
+    """Build and download one file/language; with an ETag, Crowdin answers 304 if nothing changed.
+
+    Returns:
+        tuple: (status, etag) where status is "downloaded", "not_modified" or "failed"
     """
+    http = session or requests
     
     # Build request (POST) to obtain a downloadable URL for this file/language
     build_url = f"{API_BASE}/projects/{project_id}/translations/builds/files/{file_id}"
     payload = {"targetLanguageId": language_id}
     if format:
         payload["format"] = format
+    build_headers = dict(headers)
+    if etag:
+        build_headers["If-None-Match"] = etag
     
     try:
         def post_build(req_payload: Dict[str, str]) -> requests.Response:
-            return requests.post(build_url, headers=headers, json=req_payload, timeout=30)
+            return http.post(build_url, headers=build_headers, json=req_payload, timeout=30)
 
         build_resp = post_build(payload)
+        if build_resp.status_code == 304:
+            print(f"⏭️  Unchanged: {output_path}")
+            return "not_modified", etag
         if build_resp.status_code == 400 and "format" in payload:
             try:
                 err = build_resp.json()
@@ -158,6 +186,9 @@ def download_xliff_file(project_id: str, headers: Dict[str, str], file_id: str,
             if format_error:
                 payload.pop("format", None)
                 build_resp = post_build(payload)
+                if build_resp.status_code == 304:
+                    print(f"⏭️  Unchanged: {output_path}")
+                    return "not_modified", etag
 
         if not build_resp.ok:
             try:
@@ -167,15 +198,15 @@ def download_xliff_file(project_id: str, headers: Dict[str, str], file_id: str,
             except Exception:
                 print(f"❌ API request failed: {build_resp.status_code} {build_resp.reason} for url: {build_url}")
                 print(f"   Response: {build_resp.text[:200]}")
-            return False
+            return "failed", None
 
         build_data = build_resp.json().get("data", {})
         download_url = build_data.get("url")
         if not download_url:
             print(f"❌ No download URL for file {file_id} lang {language_id}")
-            return False
+            return "failed", None
         # Download the file bytes
-        bin_resp = requests.get(download_url, timeout=60)
+        bin_resp = http.get(download_url, timeout=60)
         bin_resp.raise_for_status()
         # Optionally normalize content before saving
         content = bin_resp.content
@@ -186,15 +217,88 @@ def download_xliff_file(project_id: str, headers: Dict[str, str], file_id: str,
             pass
 
         # Save to file
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
         with open(output_path, 'wb') as f:
             f.write(content)
         print(f"✅ Downloaded: {output_path}")
-        return True
+        return "downloaded", build_data.get("etag")
         
     except Exception as e:
         print(f"❌ Failed to download {output_path}: {e}")
-        return False
+        return "failed", None
+
+def download_xliff_file(project_id: str, headers: Dict[str, str], file_id: str,
+                       language_id: str, output_path: str, *, format: str | None = "xliff",
+                       session: Optional[requests.Session] = None) -> bool:
+    """Download a translated XLIFF file from Crowdin.
+
+    Note: Some projects with non-XLIFF sources require an explicit format parameter.
+    """
+    status, _etag = _fetch_xliff_file(project_id, headers, file_id, language_id, output_path,
+                                      format=format, session=session)
+    return status == "downloaded"
+
+def download_xliff_files(project_id: str, headers: Dict[str, str], jobs: List[Dict[str, str]], *,
+                         max_workers: int = 8, manifest_path: Optional[str] = None,
+                         force: bool = False, format: str | None = "xliff") -> Dict[str, List[str]]:
+    """Download many file/language XLIFFs concurrently over one pooled session.
+
+    With a manifest (JSON of the last ETag and file revision per file/language),
+    files whose local copy exists and whose ETag Crowdin still reports as
+    current are skipped (HTTP 304); a changed file revision forces a download.
+
+    Args:
+        project_id: Crowdin project ID
+        headers: Auth headers
+        jobs: Dicts with ``file_id``, ``language_id``, ``output_path`` and optional ``revision_id``
+        max_workers: Concurrent requests (Crowdin allows 20 per account)
+        manifest_path: Where to keep ETags between runs (None = always download)
+        force: Download everything but still record the new ETags
+        format: Export format passed to the build request
+
+    Returns:
+        dict: ``downloaded``, ``not_modified`` and ``failed`` lists of output paths
+    """
+    manifest: Dict[str, Dict[str, str]] = {}
+    if manifest_path and os.path.exists(manifest_path):
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except Exception as e:
+            print(f"⚠️  Ignoring unreadable download manifest {manifest_path}: {e}")
+    lock = threading.Lock()
+    results: Dict[str, List[str]] = {"downloaded": [], "not_modified": [], "failed": []}
+    workers = max(1, int(max_workers))
+    session = make_session(workers)
+
+    def run(job: Dict[str, str]) -> None:
+        key = f"{job['file_id']}:{job['language_id']}"
+        revision = str(job.get("revision_id") or "")
+        previous = manifest.get(key, {})
+        etag = None
+        if not force and os.path.exists(job["output_path"]) and previous.get("revision_id", "") == revision:
+            etag = previous.get("etag")
+        status, new_etag = _fetch_xliff_file(project_id, headers, job["file_id"], job["language_id"],
+                                             job["output_path"], format=format, etag=etag, session=session)
+        with lock:
+            results[status].append(job["output_path"])
+            if status != "failed" and new_etag:
+                manifest[key] = {"etag": new_etag, "revision_id": revision, "path": job["output_path"]}
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(run, jobs))
+    finally:
+        session.close()
+        if manifest_path:
+            os.makedirs(os.path.dirname(manifest_path) or ".", exist_ok=True)
+            tmp_path = f"{manifest_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, manifest_path)
+    for paths in results.values():
+        paths.sort()
+    return results
 
 def upload_xliff_directory(project_id: str, headers: Dict[str, str], source_dir: str, 
                           crowdin_base_path: str = "/translations/") -> Dict[str, str]:
@@ -226,7 +330,8 @@ def upload_xliff_directory(project_id: str, headers: Dict[str, str], source_dir:
     return uploaded_files
 
 def download_xliff_translations(project_id: str, headers: Dict[str, str], output_dir: str,
-                               file_pattern: str = "*", languages: Optional[List[str]] = None) -> Dict[str, List[str]]:
+                               file_pattern: str = "*", languages: Optional[List[str]] = None,
+                               max_workers: int = 8) -> Dict[str, List[str]]:
     """Download all translated XLIFF files from Crowdin."""
     
     # Get project files and languages (if not provided)
@@ -249,25 +354,24 @@ def download_xliff_translations(project_id: str, headers: Dict[str, str], output
     print(f"Downloading translations for {len(matched_files)} files in {len(languages)} languages (as XLIFF)")
     
     downloaded_files = {}
+    jobs = []
+    output_names = {}
     
     for file_info in matched_files:
-        file_id = file_info["id"]
         file_name = os.path.basename(file_info["path"])
         base_name = os.path.splitext(file_name)[0]
         
-        file_downloads = []
-        
         for lang_id in languages:
             
             # Create output filename: <source_base>-<langId>.xliff
             output_filename = f"{base_name}-{lang_id}.xliff"
             output_path = os.path.join(output_dir, output_filename)
-            
-            if download_xliff_file(project_id, headers, file_id, lang_id, output_path, format="xliff"):
-                file_downloads.append(output_path)
-        
-        if file_downloads:
-            downloaded_files[file_name] = file_downloads
+            jobs.append({"file_id": file_info["id"], "language_id": lang_id, "output_path": output_path})
+            output_names[output_path] = file_name
+    
+    results = download_xliff_files(project_id, headers, jobs, max_workers=max_workers, format="xliff")
+    for output_path in results["downloaded"]:
+        downloaded_files.setdefault(output_names[output_path], []).append(output_path)
     
     return downloaded_files
 
@@ -0,0 +1,165 @@
+"""
+Process-wide GCS uploader for generated audio.
+
+``save_audio`` used to build a brand-new ``storage.Client`` (re-parsing
+``GOOGLE_APPLICATION_CREDENTIALS_JSON``) for every clip, then upload and
+``blob.patch()`` metadata in two round-trips. This module keeps one
+authenticated client for the whole process, sends object metadata with the
+upload request itself, and drains uploads on a background thread pool so
+synthesis never waits on network writes.
+
+Call :func:`flush` at the end of a run to wait for pending uploads and get
+the per-file failures back.
+
+Settings (environment):
+
+- ``GOOGLE_APPLICATION_CREDENTIALS_JSON`` / ``GCP_SERVICE_ACCOUNT_JSON``:
+  service-account JSON (falls back to application default credentials)
+- ``GCS_UPLOAD_WORKERS``: parallel uploads (default 8)
+"""
+
+import atexit
+import json
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from google.cloud import storage
+    from google.oauth2 import service_account
+    GCS_AVAILABLE = True
+except ImportError:
+    GCS_AVAILABLE = False
+
+DEFAULT_UPLOAD_WORKERS = 8
+
+_client = None
+_client_initialized = False
+_client_lock = threading.Lock()
+
+_executor: Optional[ThreadPoolExecutor] = None
+_pending: List[Tuple[Optional[str], str, Future]] = []
+_pending_lock = threading.Lock()
+
+
+def get_storage_client():
+    """
+    Return the shared ``storage.Client``, creating it once per process.
+
+    Returns None when google-cloud-storage is missing or no credentials work;
+    that outcome is cached too so we don't retry credential parsing per clip.
+    """
+    global _client, _client_initialized
+    if not GCS_AVAILABLE:
+        return None
+    with _client_lock:
+        if _client_initialized:
+            return _client
+        _client_initialized = True
+        credentials_json = (
+            os.environ.get('GOOGLE_APPLICATION_CREDENTIALS_JSON')
+            or os.environ.get('GCP_SERVICE_ACCOUNT_JSON')
+        )
+        if credentials_json:
+            try:
+                credentials_dict = json.loads(credentials_json)
+                credentials = service_account.Credentials.from_service_account_info(credentials_dict)
+                _client = storage.Client(credentials=credentials, project=credentials_dict.get('project_id'))
+                return _client
+            except Exception as e:
+                print(f"Warning: Could not parse GCS credentials: {e}")
+        # Fall back to default credentials
+        try:
+            _client = storage.Client()
+        except Exception:
+            _client = None
+        return _client
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _pending_lock:
+        if _executor is None:
+            try:
+                workers = int(os.environ.get('GCS_UPLOAD_WORKERS', DEFAULT_UPLOAD_WORKERS))
+            except ValueError:
+                workers = DEFAULT_UPLOAD_WORKERS
+            _executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='gcs-upload')
+        return _executor
+
+
+def _upload(client, file_path: str, bucket_name: str, gcs_path: str,
+            metadata: Optional[Dict[str, str]], content_type: str) -> str:
+    blob = client.bucket(bucket_name).blob(gcs_path)
+    if metadata:
+        # Sent with the upload request; no separate blob.patch() round-trip.
+        blob.metadata = {key: str(value) for key, value in metadata.items()}
+    blob.upload_from_filename(file_path, content_type=content_type)
+    print(f"✅ Uploaded to GCS: gs://{bucket_name}/{gcs_path}")
+    return gcs_path
+
+
+def enqueue_upload(
+    file_path: str,
+    bucket_name: str,
+    gcs_path: str,
+    metadata: Optional[Dict[str, str]] = None,
+    content_type: str = 'audio/mpeg',
+    tag: Optional[str] = None,
+) -> bool:
+    """
+    Queue ``file_path`` for upload to ``gs://bucket_name/gcs_path``.
+
+    Args:
+        file_path (str): Local file to upload (must stay in place until flushed)
+        bucket_name (str): Target bucket
+        gcs_path (str): Object name inside the bucket
+        metadata (dict, optional): Custom object metadata set in the same request
+        content_type (str): MIME type for the object
+        tag (str, optional): Group label (e.g. lang_code) so :func:`flush` can
+            wait for one run's uploads only
+
+    Returns:
+        bool: True if queued, False when no GCS client is available
+    """
+    client = get_storage_client()
+    if client is None:
+        return False
+    future = _get_executor().submit(_upload, client, file_path, bucket_name, gcs_path, metadata, content_type)
+    with _pending_lock:
+        _pending.append((tag, f"gs://{bucket_name}/{gcs_path}", future))
+    return True
+
+
+def flush(tag: Optional[str] = None) -> List[Tuple[str, str]]:
+    """
+    Wait for queued uploads and report failures.
+
+    Args:
+        tag (str, optional): Only wait for uploads queued with this tag;
+            None waits for everything
+
+    Returns:
+        list: ``(gcs_uri, error message)`` for every failed upload
+    """
+    with _pending_lock:
+        selected = [entry for entry in _pending if tag is None or entry[0] == tag]
+        _pending[:] = [entry for entry in _pending if not (tag is None or entry[0] == tag)]
+
+    failures = []
+    for _tag, uri, future in selected:
+        try:
+            future.result()
+        except Exception as e:
+            failures.append((uri, str(e)))
+
+    if selected:
+        print(f"☁️  GCS uploads finished: {len(selected) - len(failures)} ok, {len(failures)} failed")
+    for uri, error in failures:
+        print(f"⚠️  Warning: Failed to upload {uri}: {error}. File saved locally.")
+    return failures
+
+
+# Make sure nothing queued is silently dropped when a caller forgets to flush.
+atexit.register(flush)
@@ -25,7 +25,7 @@ import tempfile
 import urllib.request
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 import xml.etree.ElementTree as ET
 
 # Ensure repo root is on sys.path so `utilities` resolves to package.
@@ -37,11 +37,14 @@ from utilities.crowdin_xliff_manager import (
     get_crowdin_token,
     list_project_files,
     list_project_languages,
-    download_xliff_file,
+    download_xliff_files,
 )
 import utilities.config as conf
-from utilities.audio_validation import read_audio_metadata
-from utilities.utilities import read_id3_tags, write_id3_tags
+from utilities.audio_catalog import DEFAULT_CATALOG_PATH, AudioCatalog
+from utilities.utilities import update_id3_tags_bulk
+
+# ETags of the last Crowdin builds, kept next to the downloaded XLIFFs.
+DOWNLOAD_MANIFEST_NAME = ".crowdin_download_manifest.json"
 
 def _load_env() -> None:
     try:
@@ -250,46 +253,74 @@ def _local_tag(tag: str) -> str:
     return tag.split("}", 1)[1] if "}" in tag else tag
 
 
-def _iter_trans_units(root: ET.Element) -> Iterable[ET.Element]:
-    for elem in root.iter():
-        if _local_tag(elem.tag) == "trans-unit":
-            yield elem
+def _xliff_unit_row(tu: ET.Element, *, approved_only: bool) -> Optional[Dict[str, str]]:
+    item_id = tu.attrib.get("resname") or tu.attrib.get("id") or ""
+    if not item_id:
+        return None
+    approved_attr = str(tu.attrib.get("approved", "")).strip().lower()
+    source_el = None
+    target_el = None
+    for child in list(tu):
+        tag = _local_tag(child.tag)
+        if tag == "source":
+            source_el = child
+        elif tag == "target":
+            target_el = child
+    target_state = str((target_el.attrib.get("state") if target_el is not None else "") or "").strip().lower()
+    is_approved = approved_attr in {"yes", "true", "1"} or target_state in {"final", "signed-off", "approved"}
+    if approved_only and not is_approved:
+        return None
+    return {
+        "item_id": item_id,
+        "source_text": _extract_text(source_el),
+        "target_text": _extract_text(target_el),
+        "approved": "1" if is_approved else "0",
+        "target_state": target_state,
+    }
 
 
-def parse_xliff_file(path: Path, *, approved_only: bool = False) -> List[Dict[str, str]]:
+def iter_xliff_units(path: Path, *, approved_only: bool = False) -> Iterator[Dict[str, str]]:
+    """Stream ``trans-unit`` rows from an XLIFF with ``iterparse``.
+
+    Each unit is dropped from the tree once its row is yielded, so memory
+    stays flat regardless of file size. Rows are the same as ``parse_xliff_file``.
+    """
+    parents: List[ET.Element] = []
     try:
-        root = ET.parse(path).getroot()
-    except Exception as exc:
+        for event, elem in ET.iterparse(str(path), events=("start", "end")):
+            if event == "start":
+                parents.append(elem)
+                continue
+            parents.pop()
+            if _local_tag(elem.tag) != "trans-unit":
+                continue
+            row = _xliff_unit_row(elem, approved_only=approved_only)
+            if parents:
+                parents[-1].remove(elem)
+            if row is not None:
+                yield row
+    except (ET.ParseError, OSError) as exc:
         raise RuntimeError(f"Failed to parse XLIFF: {path}") from exc
 
-    rows: List[Dict[str, str]] = []
-    for tu in _iter_trans_units(root):
-        item_id = tu.attrib.get("resname") or tu.attrib.get("id") or ""
-        if not item_id:
-            continue
-        approved_attr = str(tu.attrib.get("approved", "")).strip().lower()
-        source_el = None
-        target_el = None
-        for child in list(tu):
-            tag = _local_tag(child.tag)
-            if tag == "source":
-                source_el = child
-            elif tag == "target":
-                target_el = child
-        target_state = str((target_el.attrib.get("state") if target_el is not None else "") or "").strip().lower()
-        is_approved = approved_attr in {"yes", "true", "1"} or target_state in {"final", "signed-off", "approved"}
-        if approved_only and not is_approved:
-            continue
-        rows.append(
-            {
-                "item_id": item_id,
-                "source_text": _extract_text(source_el),
-                "target_text": _extract_text(target_el),
-                "approved": "1" if is_approved else "0",
-                "target_state": target_state,
-            }
-        )
-    return rows
+
+def parse_xliff_file(path: Path, *, approved_only: bool = False) -> List[Dict[str, str]]:
+    return list(iter_xliff_units(path, approved_only=approved_only))
+
+
+def open_db(db_path: Path) -> sqlite3.Connection:
+    """Open the item-bank SQLite DB in WAL mode with pragmas tuned for bulk imports."""
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")
+    return conn
+
+
+def close_db(conn: sqlite3.Connection) -> None:
+    """Checkpoint the WAL back into the main file and close, so the DB can be copied or uploaded as one file."""
+    conn.execute("PRAGMA journal_mode=DELETE")
+    conn.close()
 
 
 def ensure_db(conn: sqlite3.Connection) -> None:
@@ -456,7 +487,13 @@ def seed_from_translation_master(
     conn: sqlite3.Connection,
     master_path: Path,
     run_id: int,
+    writer: Optional[ItemBankWriter] = None,
 ) -> int:
+    """Seed ``task='*'`` baseline rows from translation_master.csv.
+
+    Rows are queued on ``writer`` (one is created and flushed here if not
+    given); rows already identical in items_current are not rewritten.
+    """
     if not master_path.exists():
         print(f"⚠️  translation_master.csv not found at {master_path}. Skipping baseline seed.")
         return 0
@@ -475,6 +512,9 @@ def seed_from_translation_master(
     ignore_cols = {"item_id", "labels", "context", "isHidden"}
     lang_cols = [c for c in df.columns if c not in ignore_cols]
 
+    own_writer = writer is None
+    if own_writer:
+        writer = ItemBankWriter(conn)
     seeded = 0
     for _, row in df.iterrows():
         item_id = str(row["item_id"])
@@ -485,35 +525,36 @@ def seed_from_translation_master(
             text = str(text_val).strip()
             if not text:
                 continue
-            upsert_item(
-                conn,
-                item_id=item_id,
-                lang=lang,
-                task="*",
-                source_text="",
-                target_text=text,
-                text_hash=_sha256(text),
-                voice="",
-                service="",
-                source_file="translation_master.csv",
-                run_id=run_id,
-            )
-            append_item_version(
-                conn,
+            text_hash = _sha256(text)
+            changed = writer.upsert_item(
                 item_id=item_id,
                 lang=lang,
                 task="*",
                 source_text="",
                 target_text=text,
-                text_hash=_sha256(text),
+                text_hash=text_hash,
                 voice="",
                 service="",
                 source_file="translation_master.csv",
                 run_id=run_id,
-                change_type="BASELINE_SEED",
             )
+            if changed:
+                writer.append_item_version(
+                    item_id=item_id,
+                    lang=lang,
+                    task="*",
+                    source_text="",
+                    target_text=text,
+                    text_hash=text_hash,
+                    voice="",
+                    service="",
+                    source_file="translation_master.csv",
+                    run_id=run_id,
+                    change_type="BASELINE_SEED",
+                )
             seeded += 1
-    conn.commit()
+    if own_writer:
+        writer.flush()
     return seeded
 
 
@@ -536,6 +577,46 @@ def write_run(
     return int(cur.lastrowid)
 
 
+_UPSERT_CURRENT_SQL = """
+    INSERT INTO items_current (item_id, lang, task, source_text, target_text, text_hash, voice, service, source_file, run_id, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(item_id, lang, task)
+    DO UPDATE SET
+        source_text=excluded.source_text,
+        target_text=excluded.target_text,
+        text_hash=excluded.text_hash,
+        voice=excluded.voice,
+        service=excluded.service,
+        source_file=excluded.source_file,
+        run_id=excluded.run_id,
+        updated_at=excluded.updated_at
+"""
+
+_INSERT_VERSION_SQL = """
+    INSERT INTO item_versions (
+        item_id, lang, task, source_text, target_text, text_hash,
+        voice, service, source_file, run_id, change_type, created_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_UPSERT_STAGED_SQL = """
+    INSERT INTO items_staged (
+        item_id, lang, task, source_text, target_text, text_hash,
+        approved, target_state, source_file, run_id, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(item_id, lang, task)
+    DO UPDATE SET
+        source_text=excluded.source_text,
+        target_text=excluded.target_text,
+        text_hash=excluded.text_hash,
+        approved=excluded.approved,
+        target_state=excluded.target_state,
+        source_file=excluded.source_file,
+        run_id=excluded.run_id,
+        updated_at=excluded.updated_at
+"""
+
+
 def upsert_item(
     conn: sqlite3.Connection,
     *,
@@ -551,20 +632,7 @@ def upsert_item(
     run_id: int,
 ) -> None:
     conn.execute(
-        """
-        INSERT INTO items_current (item_id, lang, task, source_text, target_text, text_hash, voice, service, source_file, run_id, updated_at)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ON CONFLICT(item_id, lang, task)
-        DO UPDATE SET
-            source_text=excluded.source_text,
-            target_text=excluded.target_text,
-            text_hash=excluded.text_hash,
-            voice=excluded.voice,
-            service=excluded.service,
-            source_file=excluded.source_file,
-            run_id=excluded.run_id,
-            updated_at=excluded.updated_at
-        """,
+        _UPSERT_CURRENT_SQL,
         (
             item_id,
             lang,
@@ -598,12 +666,7 @@ def append_item_version(
 ) -> None:
     cur = conn.cursor()
     cur.execute(
-        """
-        INSERT INTO item_versions (
-            item_id, lang, task, source_text, target_text, text_hash,
-            voice, service, source_file, run_id, change_type, created_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
+        _INSERT_VERSION_SQL,
         (
             item_id,
             lang,
@@ -741,22 +804,7 @@ def upsert_staged_item(
     run_id: int,
 ) -> None:
     conn.execute(
-        """
-        INSERT INTO items_staged (
-            item_id, lang, task, source_text, target_text, text_hash,
-            approved, target_state, source_file, run_id, updated_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ON CONFLICT(item_id, lang, task)
-        DO UPDATE SET
-            source_text=excluded.source_text,
-            target_text=excluded.target_text,
-            text_hash=excluded.text_hash,
-            approved=excluded.approved,
-            target_state=excluded.target_state,
-            source_file=excluded.source_file,
-            run_id=excluded.run_id,
-            updated_at=excluded.updated_at
-        """,
+        _UPSERT_STAGED_SQL,
         (
             item_id,
             lang,
@@ -773,6 +821,143 @@ def upsert_staged_item(
     )
 
 
+class ItemBankWriter:
+    """
+    Buffered writer for items_current, item_versions and items_staged.
+
+    The current/staged tables are snapshotted once; ``upsert_item`` and
+    ``upsert_staged_item`` diff each row against the snapshot in memory and
+    only queue rows whose content changed. ``flush`` writes everything queued
+    with ``executemany`` in a single transaction, stamped with one timestamp.
+
+    Typical use:
+
+        writer = ItemBankWriter(conn)
+        if writer.upsert_item(item_id=..., lang=..., task=..., ...):
+            writer.append_item_version(..., change_type="TEXT_CHANGED")
+        writer.flush()
+    """
+
+    _CURRENT_FIELDS = ("source_text", "target_text", "text_hash", "voice", "service", "source_file")
+    _STAGED_FIELDS = ("source_text", "target_text", "text_hash", "approved", "target_state", "source_file")
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+        self._current = self._snapshot("items_current", self._CURRENT_FIELDS)
+        self._staged: Optional[Dict[Tuple[str, str, str], Tuple]] = None
+        self._current_rows: Dict[Tuple[str, str, str], Tuple] = {}
+        self._version_rows: List[Tuple] = []
+        self._staged_rows: Dict[Tuple[str, str, str], Tuple] = {}
+        self.stats = {
+            "items_written": 0,
+            "items_unchanged": 0,
+            "versions_written": 0,
+            "staged_written": 0,
+            "staged_unchanged": 0,
+        }
+
+    def _snapshot(self, table: str, fields: Tuple[str, ...]) -> Dict[Tuple[str, str, str], Tuple]:
+        columns = ", ".join(f"COALESCE({f}, '')" for f in fields)
+        return {
+            (r[0], r[1], r[2]): tuple(r[3:])
+            for r in self.conn.execute(f"SELECT item_id, lang, task, {columns} FROM {table}")
+        }
+
+    @staticmethod
+    def _content(*values) -> Tuple:
+        return tuple("" if v is None else v for v in values)
+
+    def upsert_item(
+        self,
+        *,
+        item_id: str,
+        lang: str,
+        task: str,
+        source_text: str,
+        target_text: str,
+        text_hash: str,
+        voice: str,
+        service: str,
+        source_file: str,
+        run_id: int,
+    ) -> bool:
+        """Queue an items_current upsert; returns False (nothing queued) if the row is unchanged."""
+        key = (item_id, lang, task)
+        content = self._content(source_text, target_text, text_hash, voice, service, source_file)
+        if self._current.get(key) == content:
+            self.stats["items_unchanged"] += 1
+            return False
+        self._current[key] = content
+        self._current_rows[key] = (item_id, lang, task, source_text, target_text, text_hash, voice, service, source_file, run_id)
+        return True
+
+    def append_item_version(
+        self,
+        *,
+        item_id: str,
+        lang: str,
+        task: str,
+        source_text: str,
+        target_text: str,
+        text_hash: str,
+        voice: str,
+        service: str,
+        source_file: str,
+        run_id: int,
+        change_type: str,
+    ) -> None:
+        self._version_rows.append(
+            (item_id, lang, task, source_text, target_text, text_hash, voice, service, source_file, run_id, change_type)
+        )
+
+    def upsert_staged_item(
+        self,
+        *,
+        item_id: str,
+        lang: str,
+        task: str,
+        source_text: str,
+        target_text: str,
+        text_hash: str,
+        approved: bool,
+        target_state: str,
+        source_file: str,
+        run_id: int,
+    ) -> bool:
+        """Queue an items_staged upsert; returns False (nothing queued) if the row is unchanged."""
+        if self._staged is None:
+            self._staged = self._snapshot("items_staged", self._STAGED_FIELDS)
+        key = (item_id, lang, task)
+        approved_int = 1 if approved else 0
+        content = self._content(source_text, target_text, text_hash, approved_int, target_state, source_file)
+        if self._staged.get(key) == content:
+            self.stats["staged_unchanged"] += 1
+            return False
+        self._staged[key] = content
+        self._staged_rows[key] = (
+            item_id, lang, task, source_text, target_text, text_hash, approved_int, target_state, source_file, run_id
+        )
+        return True
+
+    def flush(self) -> Dict[str, int]:
+        """Write all queued rows in one transaction; returns the running write/skip counts."""
+        if not (self._current_rows or self._version_rows or self._staged_rows):
+            return self.stats
+        now = datetime.now(timezone.utc).isoformat()
+        with self.conn:
+            # Primary-key order keeps the B-tree inserts local
+            self.conn.executemany(_UPSERT_CURRENT_SQL, [self._current_rows[k] + (now,) for k in sorted(self._current_rows)])
+            self.conn.executemany(_INSERT_VERSION_SQL, [row + (now,) for row in self._version_rows])
+            self.conn.executemany(_UPSERT_STAGED_SQL, [self._staged_rows[k] + (now,) for k in sorted(self._staged_rows)])
+        self.stats["items_written"] += len(self._current_rows)
+        self.stats["versions_written"] += len(self._version_rows)
+        self.stats["staged_written"] += len(self._staged_rows)
+        self._current_rows.clear()
+        self._version_rows.clear()
+        self._staged_rows.clear()
+        return self.stats
+
+
 def compare_staged_vs_current(conn: sqlite3.Connection) -> Dict[str, int]:
     rows = conn.execute(
         """
@@ -815,6 +1000,7 @@ def promote_staged_to_current(
     approved_only: bool = False,
     require_audio_ready: bool = False,
     audio_base_dir: str = "audio_files",
+    audio_catalog=None,
     audio_history_enabled: bool = True,
     audio_history_bucket: str = "levante-assets-history",
     audio_history_prefix: str = "audio",
@@ -882,6 +1068,7 @@ def promote_staged_to_current(
                 service,
                 lang,
                 False,
+                catalog=audio_catalog,
             )
             if needs_regen:
                 stats["skipped_audio_not_ready"] += 1
@@ -1081,7 +1268,17 @@ def seed_from_audio_directory(
     run_id: int,
     item_task_map: Optional[Dict[str, str]] = None,
     backfill_task_tag: bool = False,
+    id3_workers: int = 8,
+    catalog=None,
+    writer: Optional[ItemBankWriter] = None,
 ) -> Dict[str, int]:
+    """Seed items from the ID3 tags of ``<audio_base_dir>/<lang_code>/*.mp3``.
+
+    With an :class:`~utilities.audio_catalog.AudioCatalog` (and no tag
+    backfill), the directory is refreshed in the catalog and only new or
+    changed files are parsed. Rows are queued on ``writer`` (one is created
+    and flushed here if not given); unchanged rows are not rewritten.
+    """
     audio_dir = audio_base_dir / lang_code
     stats = {
         "scanned": 0,
@@ -1094,10 +1291,40 @@ def seed_from_audio_directory(
     if not audio_dir.exists():
         return stats
 
-    for mp3 in sorted(audio_dir.glob("*.mp3")):
+    def scan(session) -> Dict[str, object]:
+        # Each file is opened once; the task tag is patched in the same session.
+        # Only TXXX frames are used, as read_audio_metadata did.
+        meta = session.custom_fields()
+        backfill = None
+        if backfill_task_tag and meta and str(meta.get("text") or "").strip():
+            item_id = str(meta.get("title") or Path(session.file_path).stem).strip()
+            mapped_task = (item_task_map or {}).get(item_id, "")
+            if mapped_task and not str(meta.get("task") or "").strip():
+                session.set("task", mapped_task)
+                backfill = mapped_task
+        return {"meta": meta, "backfill": backfill}
+
+    if catalog is not None and not backfill_task_tag:
+        catalog.refresh(str(audio_dir), recursive=False, workers=id3_workers)
+        scanned = {
+            entry["path"]: {"value": {"meta": entry["custom"] if entry["has_tags"] else None}, "error": None}
+            for entry in catalog.entries(str(audio_dir), recursive=False)
+        }
+    else:
+        scanned = update_id3_tags_bulk(audio_dir, scan, max_workers=id3_workers)["results"]
+        if catalog is not None:
+            catalog.refresh(str(audio_dir), recursive=False, workers=id3_workers)
+    own_writer = writer is None
+    if own_writer:
+        writer = ItemBankWriter(conn)
+    for mp3_path, outcome in scanned.items():
+        mp3 = Path(mp3_path)
         stats["scanned"] += 1
-        meta = read_audio_metadata(str(mp3))
+        scan_result = outcome["value"] or {}
+        meta = scan_result.get("meta")
         if not meta:
+            if outcome["error"] is not None:
+                print(f"Warning: Could not read metadata from {mp3}: {outcome['error']}")
             stats["missing_metadata"] += 1
             continue
 
@@ -1117,30 +1344,15 @@ def seed_from_audio_directory(
         if not target_text:
             stats["missing_text"] += 1
             continue
-        if backfill_task_tag and mapped_task and not str(meta.get("task") or "").strip():
-            tags = read_id3_tags(str(mp3))
-            tags["task"] = mapped_task
-            if write_id3_tags(str(mp3), tags):
+        if scan_result.get("backfill"):
+            if outcome["error"] is None:
                 stats["task_backfilled"] += 1
             else:
+                print(f"Error writing ID3 tags to {mp3}: {outcome['error']}")
                 stats["task_backfill_failed"] += 1
 
         text_hash = _sha256(target_text)
-        upsert_item(
-            conn,
-            item_id=item_id,
-            lang=stored_lang,
-            task=task,
-            source_text="",
-            target_text=target_text,
-            text_hash=text_hash,
-            voice=voice,
-            service=service,
-            source_file=mp3.name,
-            run_id=run_id,
-        )
-        append_item_version(
-            conn,
+        changed = writer.upsert_item(
             item_id=item_id,
             lang=stored_lang,
             task=task,
@@ -1151,10 +1363,24 @@ def seed_from_audio_directory(
             service=service,
             source_file=mp3.name,
             run_id=run_id,
-            change_type="AUDIO_BASELINE_SEED",
         )
+        if changed:
+            writer.append_item_version(
+                item_id=item_id,
+                lang=stored_lang,
+                task=task,
+                source_text="",
+                target_text=target_text,
+                text_hash=text_hash,
+                voice=voice,
+                service=service,
+                source_file=mp3.name,
+                run_id=run_id,
+                change_type="AUDIO_BASELINE_SEED",
+            )
         stats["seeded"] += 1
-    conn.commit()
+    if own_writer:
+        writer.flush()
     return stats
 
 
@@ -1172,6 +1398,12 @@ def main() -> int:
     parser.add_argument("--report-dir", default="tmp/itembank_by_task_reports")
     parser.add_argument("--audio-base-dir", default="audio_files")
     parser.add_argument("--skip-download", action="store_true")
+    parser.add_argument("--download-workers", type=int, default=8, help="Concurrent Crowdin XLIFF downloads.")
+    parser.add_argument(
+        "--force-download",
+        action="store_true",
+        help=f"Download every XLIFF even if its Crowdin ETag in {DOWNLOAD_MANIFEST_NAME} is unchanged.",
+    )
     parser.add_argument("--skip-audio-check", action="store_true")
     parser.add_argument("--no-update-db", action="store_true")
     parser.add_argument("--baseline-from", choices=["none", "master"], default="none")
@@ -1185,6 +1417,14 @@ def main() -> int:
     parser.add_argument("--audio-seed-only", action="store_true", help="Only seed DB from local audio metadata; skip Crowdin download/parse.")
     parser.add_argument("--task-map-csv", default=conf.item_bank_translations, help="CSV path used to map item_id -> task (labels) during audio seeding.")
     parser.add_argument("--backfill-task-tag", action="store_true", help="When audio metadata lacks task, write ID3 task tag using --task-map-csv.")
+    parser.add_argument("--id3-workers", type=int, default=8, help="Threads for reading/backfilling audio ID3 tags.")
+    parser.add_argument(
+        "--audio-catalog",
+        nargs="?",
+        const=DEFAULT_CATALOG_PATH,
+        default=None,
+        help=f"Read audio ID3 metadata through the incremental SQLite catalog (default path: {DEFAULT_CATALOG_PATH}).",
+    )
     parser.add_argument("--import-staged", action="store_true", help="Import parsed XLIFF rows into items_staged.")
     parser.add_argument("--staged-only", action="store_true", help="Only import/compare staged rows; do not update items_current.")
     parser.add_argument("--approved-only", action="store_true", help="Only include approved/final XLIFF units.")
@@ -1230,6 +1470,7 @@ def main() -> int:
     args = parser.parse_args()
     _load_env()
     _strip_env_vars(["CROWDIN_API_TOKEN", "CROWDIN_PROJECT_ID", "CROWDIN_LEVANTE_PID"])
+    audio_catalog = AudioCatalog(args.audio_catalog) if args.audio_catalog else None
     if args.staged_only and not args.import_staged:
         print("❌ --staged-only requires --import-staged.")
         return 1
@@ -1278,14 +1519,33 @@ def main() -> int:
             return 1
 
         if not args.skip_download:
+            jobs = []
             for file_info in matched:
-                file_id = file_info["id"]
                 base_name = os.path.splitext(os.path.basename(file_info["path"]))[0]
                 for lang in langs:
-                    out_path = output_dir / f"{base_name}-{lang}.xliff"
-                    ok = download_xliff_file(args.project_id, headers, file_id, lang, str(out_path), format="xliff")
-                    if not ok:
-                        print(f"⚠️  Failed download: {file_info['path']} ({lang})")
+                    jobs.append(
+                        {
+                            "file_id": file_info["id"],
+                            "language_id": lang,
+                            "output_path": str(output_dir / f"{base_name}-{lang}.xliff"),
+                            "revision_id": str(file_info.get("revisionId") or ""),
+                        }
+                    )
+            downloads = download_xliff_files(
+                args.project_id,
+                headers,
+                jobs,
+                max_workers=args.download_workers,
+                manifest_path=str(output_dir / DOWNLOAD_MANIFEST_NAME),
+                force=args.force_download,
+                format="xliff",
+            )
+            for out_path in downloads["failed"]:
+                print(f"⚠️  Failed download: {out_path}")
+            print(
+                f"📥 XLIFF downloads: downloaded={len(downloads['downloaded'])}, "
+                f"unchanged={len(downloads['not_modified'])}, failed={len(downloads['failed'])}"
+            )
     elif args.audio_seed_only:
         langs = [lang.strip() for lang in args.seed_audio_lang if lang.strip()]
         if not langs:
@@ -1304,7 +1564,7 @@ def main() -> int:
             return 1
         gcs_generation = _gcs_pull_db(gcs_client, args.gcs_bucket, args.gcs_path, Path(args.db_path))
 
-    conn = sqlite3.connect(db_path)
+    conn = open_db(db_path)
     ensure_db(conn)
     drop_legacy_tables(conn)
     if args.reset_db:
@@ -1334,6 +1594,7 @@ def main() -> int:
         os.close(tmp_fd)
         tmp_db_path = Path(tmp_path_str)
         try:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
             shutil.copy2(db_path, tmp_db_path)
             tmp_conn = sqlite3.connect(tmp_db_path)
             tmp_run_id = write_run(
@@ -1386,12 +1647,13 @@ def main() -> int:
             approved_only=args.promote_approved_only,
             require_audio_ready=True,
             audio_base_dir=args.audio_base_dir,
+            audio_catalog=audio_catalog,
             audio_history_enabled=not args.no_audio_history,
             audio_history_bucket=args.audio_history_bucket,
             audio_history_prefix=args.audio_history_prefix,
         )
         conn.commit()
-        conn.close()
+        close_db(conn)
 
         if args.gcs_sync:
             try:
@@ -1409,8 +1671,9 @@ def main() -> int:
         return 0
 
     run_id = write_run(conn, args.project_id or "audio-seed", prefix or "audio-seed/", langs)
+    item_writer = ItemBankWriter(conn)
     if args.baseline_from == "master":
-        seeded = seed_from_translation_master(conn, Path(args.master_path), run_id)
+        seeded = seed_from_translation_master(conn, Path(args.master_path), run_id, writer=item_writer)
         print(f"Seeded baseline rows from translation_master.csv: {seeded}")
     if args.seed_audio_lang:
         if args.no_update_db:
@@ -1427,6 +1690,9 @@ def main() -> int:
                     run_id=run_id,
                     item_task_map=item_task_map,
                     backfill_task_tag=args.backfill_task_tag,
+                    id3_workers=args.id3_workers,
+                    catalog=audio_catalog,
+                    writer=item_writer,
                 )
                 print(
                     f"Seeded audio metadata for {audio_lang}: "
@@ -1434,8 +1700,9 @@ def main() -> int:
                     f"missing_metadata={stats['missing_metadata']}, missing_text={stats['missing_text']}, "
                     f"task_backfilled={stats['task_backfilled']}, task_backfill_failed={stats['task_backfill_failed']}"
                 )
+    item_writer.flush()
     if args.audio_seed_only:
-        conn.close()
+        close_db(conn)
         print("✅ Audio metadata seeding complete.")
         print(f"SQLite: {db_path}")
         return 0
@@ -1464,11 +1731,9 @@ def main() -> int:
             continue
         lang = normalize_crowdin_lang_code(raw_lang)
 
-        rows = parse_xliff_file(xliff_path, approved_only=args.approved_only)
-        if args.verbose:
-            print(f"Parsed {len(rows)} items from {xliff_path.name}")
-
-        for row in rows:
+        parsed = 0
+        for row in iter_xliff_units(xliff_path, approved_only=args.approved_only):
+            parsed += 1
             item_id = row["item_id"]
             target_text = row["target_text"]
             source_text = row["source_text"]
@@ -1477,8 +1742,7 @@ def main() -> int:
             target_state = row.get("target_state", "")
             approved = row.get("approved", "0") == "1"
             if args.import_staged and not args.no_update_db:
-                upsert_staged_item(
-                    conn,
+                item_writer.upsert_staged_item(
                     item_id=item_id,
                     lang=lang,
                     task=task,
@@ -1534,8 +1798,7 @@ def main() -> int:
 
             if not args.no_update_db and not args.staged_only:
                 change_types = [r for r in reasons if r in {"NEW_ITEM", "TEXT_CHANGED", "VOICE_CHANGED", "SERVICE_CHANGED"}]
-                upsert_item(
-                    conn,
+                item_writer.upsert_item(
                     item_id=item_id,
                     lang=lang,
                     task=task,
@@ -1555,8 +1818,7 @@ def main() -> int:
                     "task": task,
                 }
                 for change_type in change_types:
-                    append_item_version(
-                        conn,
+                    item_writer.append_item_version(
                         item_id=item_id,
                         lang=lang,
                         task=task,
@@ -1569,6 +1831,16 @@ def main() -> int:
                         run_id=run_id,
                         change_type=change_type,
                     )
+        if args.verbose:
+            print(f"Parsed {parsed} items from {xliff_path.name}")
+
+    if not args.no_update_db:
+        write_stats = item_writer.flush()
+        print(
+            f"💾 SQLite writes: items_current={write_stats['items_written']} "
+            f"(unchanged={write_stats['items_unchanged']}), item_versions={write_stats['versions_written']}, "
+            f"items_staged={write_stats['staged_written']} (unchanged={write_stats['staged_unchanged']})"
+        )
 
     if args.import_staged:
         staged_stats = compare_staged_vs_current(conn)
@@ -1578,7 +1850,7 @@ def main() -> int:
 
     if not args.no_update_db:
         conn.commit()
-    conn.close()
+    close_db(conn)
 
     if args.gcs_sync:
         try:
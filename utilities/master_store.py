@@ -0,0 +1,334 @@
+"""
+Indexed store for the generation master cache (translation_master.csv).
+
+Every successful clip used to run an ``np.where`` over the whole master frame
+and then rewrite the full ``translation_master.csv``, which made a language
+regen O(n^2) in rows. The master cache now lives in a SQLite database with
+one row per (item_id, column) cell, so recording a clip is a single-row
+upsert committed in WAL mode. The CSV is still produced - as an export at the
+end of a run - because the dashboard and other tools read it.
+
+For generated language columns the store also records the voice, service and
+model_id used, which lets the regen planner spot voice/model changes without
+opening the MP3s.
+
+If the CSV is modified by something else (e.g. ``rebuild_master.py``) after
+the last export and after the last write to the store, it is re-imported the
+next time the store is opened.
+"""
+
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+DEFAULT_DB_PATH = "tmp/translation_master.sqlite"
+
+_stores: Dict[str, "MasterStore"] = {}
+_stores_lock = threading.Lock()
+
+
+def ensure_db(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS master_columns (
+            name TEXT PRIMARY KEY,
+            position INTEGER NOT NULL
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS master_rows (
+            item_id TEXT PRIMARY KEY,
+            position INTEGER NOT NULL
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS master_cells (
+            item_id TEXT NOT NULL,
+            column_name TEXT NOT NULL,
+            value TEXT,
+            voice TEXT,
+            service TEXT,
+            model_id TEXT,
+            updated_at REAL NOT NULL,
+            PRIMARY KEY (item_id, column_name)
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS master_meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        )
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_master_cells_column ON master_cells(column_name)")
+    conn.commit()
+
+
+def _clean(value) -> Optional[str]:
+    if value is None:
+        return None
+    try:
+        if pd.isna(value):
+            return None
+    except (TypeError, ValueError):
+        pass
+    text = str(value)
+    return text if text != "" else None
+
+
+class MasterStore:
+    """SQLite-backed master cache with a CSV compatibility export."""
+
+    def __init__(self, csv_path: str = "translation_master.csv", db_path: str = DEFAULT_DB_PATH):
+        self.csv_path = csv_path
+        self.db_path = db_path
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        # FULL keeps every committed clip durable across power loss, not just crashes.
+        self.conn.execute("PRAGMA synchronous=FULL")
+        ensure_db(self.conn)
+        self._sync_from_csv_if_newer()
+
+    # -- metadata helpers -------------------------------------------------
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM master_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self.conn.execute(
+            "INSERT INTO master_meta(key, value) VALUES(?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+    def _sync_from_csv_if_newer(self) -> None:
+        if not os.path.exists(self.csv_path):
+            return
+        csv_mtime = os.path.getmtime(self.csv_path)
+        exported_mtime = self._get_meta("csv_mtime")
+        last_write = self.conn.execute("SELECT MAX(updated_at) FROM master_cells").fetchone()[0] or 0.0
+        has_rows = self.conn.execute("SELECT 1 FROM master_rows LIMIT 1").fetchone() is not None
+        if has_rows and exported_mtime is not None and float(exported_mtime) == csv_mtime:
+            return
+        if has_rows and csv_mtime <= last_write:
+            # Store holds newer progress (e.g. a run crashed before exporting).
+            return
+        print(f"Importing master cache from {self.csv_path} into {self.db_path}")
+        try:
+            from utilities.robust_csv_parser import parse_csv_robust
+            frame = pd.DataFrame(parse_csv_robust(self.csv_path))
+        except Exception:
+            frame = pd.read_csv(self.csv_path, dtype=str, keep_default_na=False)
+        self.replace_from_dataframe(frame)
+        with self._lock:
+            self._set_meta("csv_mtime", repr(csv_mtime))
+            self.conn.commit()
+
+    # -- bulk operations --------------------------------------------------
+
+    def is_empty(self) -> bool:
+        with self._lock:
+            return self.conn.execute("SELECT 1 FROM master_rows LIMIT 1").fetchone() is None
+
+    def replace_from_dataframe(self, frame: pd.DataFrame) -> None:
+        """Replace the whole store with ``frame`` (wide CSV layout, item_id first)."""
+        if "item_id" not in frame.columns:
+            raise ValueError("Master data must have an 'item_id' column")
+        columns = [str(c) for c in frame.columns if str(c) != "item_id" and not str(c).startswith("Unnamed")]
+        now = time.time()
+        item_ids = frame["item_id"].astype(str).tolist()
+        cells: List[Tuple] = []
+        for column in columns:
+            values = frame[column].tolist()
+            for item_id, value in zip(item_ids, values):
+                cleaned = _clean(value)
+                if cleaned is not None:
+                    cells.append((item_id, column, cleaned, now))
+        with self._lock:
+            with self.conn:
+                self.conn.execute("DELETE FROM master_cells")
+                self.conn.execute("DELETE FROM master_rows")
+                self.conn.execute("DELETE FROM master_columns")
+                self.conn.executemany(
+                    "INSERT INTO master_columns(name, position) VALUES(?, ?)",
+                    [(name, pos) for pos, name in enumerate(["item_id"] + columns)],
+                )
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO master_rows(item_id, position) VALUES(?, ?)",
+                    [(item_id, pos) for pos, item_id in enumerate(item_ids)],
+                )
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO master_cells(item_id, column_name, value, updated_at) VALUES(?, ?, ?, ?)",
+                    cells,
+                )
+
+    def columns(self) -> List[str]:
+        with self._lock:
+            return [r[0] for r in self.conn.execute("SELECT name FROM master_columns ORDER BY position")]
+
+    def ensure_columns(self, names: Iterable[str]) -> List[str]:
+        """Add any missing columns (appended in order); return the ones added."""
+        with self._lock:
+            existing = set(self.columns())
+            added = [name for name in names if name not in existing]
+            if added:
+                start = self.conn.execute("SELECT COALESCE(MAX(position), -1) + 1 FROM master_columns").fetchone()[0]
+                with self.conn:
+                    self.conn.executemany(
+                        "INSERT INTO master_columns(name, position) VALUES(?, ?)",
+                        [(name, start + i) for i, name in enumerate(added)],
+                    )
+            return added
+
+    def ensure_items(self, item_ids: Iterable) -> int:
+        """Track any item_ids not yet in the store (blank rows); return how many were added."""
+        with self._lock:
+            before = self.conn.total_changes
+            start = self.conn.execute("SELECT COALESCE(MAX(position), -1) + 1 FROM master_rows").fetchone()[0]
+            unique_ids = list(dict.fromkeys(str(i) for i in item_ids))
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO master_rows(item_id, position) VALUES(?, ?)",
+                    [(item_id, start + i) for i, item_id in enumerate(unique_ids)],
+                )
+            return self.conn.total_changes - before
+
+    def rename_columns(self, mapping: Dict[str, str]) -> None:
+        """Rename columns whose target name does not already exist."""
+        with self._lock:
+            existing = set(self.columns())
+            with self.conn:
+                for old, new in mapping.items():
+                    if old in existing and new not in existing:
+                        self.conn.execute("UPDATE master_columns SET name = ? WHERE name = ?", (new, old))
+                        self.conn.execute("UPDATE master_cells SET column_name = ? WHERE column_name = ?", (new, old))
+                        existing.discard(old)
+                        existing.add(new)
+
+    def clear_column(self, column: str) -> None:
+        """Forget every cached value for ``column`` (used by --force)."""
+        with self._lock:
+            self.ensure_columns([column])
+            with self.conn:
+                self.conn.execute("DELETE FROM master_cells WHERE column_name = ?", (column,))
+
+    # -- single-row operations --------------------------------------------
+
+    def upsert(
+        self,
+        item_id: str,
+        column: str,
+        value: str,
+        voice: Optional[str] = None,
+        service: Optional[str] = None,
+        model_id: Optional[str] = None,
+    ) -> None:
+        """Record the generated text for one (item_id, column) and commit."""
+        with self._lock:
+            self.ensure_columns([column])
+            self.ensure_items([item_id])
+            with self.conn:
+                self.conn.execute(
+                    """
+                    INSERT INTO master_cells(item_id, column_name, value, voice, service, model_id, updated_at)
+                    VALUES(?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(item_id, column_name) DO UPDATE SET
+                        value = excluded.value,
+                        voice = excluded.voice,
+                        service = excluded.service,
+                        model_id = excluded.model_id,
+                        updated_at = excluded.updated_at
+                    """,
+                    (str(item_id), column, _clean(value), voice or None, service or None, model_id or None, time.time()),
+                )
+
+    def get_column(self, column: str) -> Dict[str, Dict[str, Optional[str]]]:
+        """Return ``{item_id: {'text', 'voice', 'service', 'model_id'}}`` for one column."""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT item_id, value, voice, service, model_id FROM master_cells WHERE column_name = ?",
+                (column,),
+            ).fetchall()
+        return {
+            item_id: {"text": value, "voice": voice, "service": service, "model_id": model_id}
+            for item_id, value, voice, service, model_id in rows
+        }
+
+    # -- CSV compatibility ------------------------------------------------
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Pivot the store back into the wide translation_master.csv layout."""
+        with self._lock:
+            columns = self.columns() or ["item_id"]
+            item_ids = [r[0] for r in self.conn.execute("SELECT item_id FROM master_rows ORDER BY position")]
+            cells = self.conn.execute("SELECT item_id, column_name, value FROM master_cells").fetchall()
+        frame = pd.DataFrame({"item_id": item_ids}, columns=columns, dtype=object)
+        if cells:
+            long_frame = pd.DataFrame(cells, columns=["item_id", "column_name", "value"])
+            wide = long_frame.pivot(index="item_id", columns="column_name", values="value")
+            positions = {item_id: pos for pos, item_id in enumerate(item_ids)}
+            wide = wide[wide.index.isin(positions.keys())]
+            row_idx = [positions[i] for i in wide.index]
+            for column in wide.columns:
+                if column in frame.columns and column != "item_id":
+                    frame.loc[row_idx, column] = wide[column].values
+        return frame
+
+    def export_csv(self, path: Optional[str] = None) -> str:
+        """Atomically write the CSV export the dashboard reads; return its path."""
+        target = path or self.csv_path
+        # Held for the whole export so concurrent languages can't replace a
+        # newer snapshot with an older one.
+        with self._lock:
+            frame = self.to_dataframe()
+            directory = os.path.dirname(os.path.abspath(target))
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".csv.part")
+            os.close(fd)
+            try:
+                frame.to_csv(tmp_path, index=False, encoding="utf-8", errors="replace")
+                os.replace(tmp_path, target)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            if target == self.csv_path:
+                self._set_meta("csv_mtime", repr(os.path.getmtime(target)))
+                self.conn.commit()
+        return target
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
+
+def get_store(csv_path: str = "translation_master.csv", db_path: Optional[str] = None) -> MasterStore:
+    """
+    Return the shared :class:`MasterStore` for ``csv_path`` in this process.
+
+    The database defaults to ``tmp/translation_master.sqlite`` for the default
+    CSV and to ``<csv_path>.sqlite`` for any other CSV, so test fixtures never
+    share state with the real cache.
+    """
+    if db_path is None:
+        db_path = DEFAULT_DB_PATH if csv_path == "translation_master.csv" else f"{csv_path}.sqlite"
+    key = os.path.abspath(db_path)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = MasterStore(csv_path, db_path)
+            _stores[key] = store
+        return store
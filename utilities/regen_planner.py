@@ -0,0 +1,228 @@
+"""
+Vectorized planner that decides which items need audio (re)generation.
+
+``generate_audio`` used to walk ``translationData.iterrows()`` and open every
+MP3 to compare its ID3 tags. The planner instead joins, in one pass:
+
+- the translation data (current text per item for one locale),
+- the master cache (``utilities.master_store``: last generated text, voice,
+  service and model per item), and
+- the audio inventory (one directory listing, or one GCS prefix listing
+  with ``generate_speech.py --audio-inventory gcs``),
+
+and returns a typed plan with one row per item. Statuses:
+
+- ``new``            no audio file and never generated
+- ``missing-file``   generated before, but the file is gone
+- ``changed-text``   the translation changed since the clip was generated
+- ``voice-changed``  voice, service or model differs from the clip's
+- ``placeholder``    placeholder text (e.g. NO APPROVED TRANSLATION); skipped
+- ``no-translation`` no text for this exact locale; skipped
+- ``unverified``     file exists but the master cache can't vouch for it;
+                     the caller falls back to the ID3 check for these rows
+- ``up-to-date``     nothing to do
+- ``forced``         existing clip regenerated because of ``--force``
+
+Only ``unverified`` rows ever touch the MP3s, so a plan for the full item
+bank (``generate_speech.py <Language> --plan-only``) takes well under a
+second once translations are loaded.
+"""
+
+import os
+from typing import Iterable, Optional, Set
+
+import numpy as np
+import pandas as pd
+
+import utilities.utilities as u
+
+REGENERATE_STATUSES = ("new", "missing-file", "changed-text", "voice-changed", "forced")
+SKIPPED_STATUSES = ("placeholder", "no-translation")
+PLAN_STATUSES = REGENERATE_STATUSES + SKIPPED_STATUSES + ("unverified", "up-to-date")
+
+PLAN_COLUMNS = ["item_id", "labels", "text", "audio_path", "status", "reason", "chars"]
+
+
+def _first_column(frame: pd.DataFrame, name: str) -> Optional[pd.Series]:
+    # Duplicate column labels (from upstream merges) return a DataFrame; keep the first.
+    if name not in frame.columns:
+        return None
+    value = frame[name]
+    if isinstance(value, pd.DataFrame):
+        value = value.iloc[:, 0]
+    return value
+
+
+def normalize_text_series(series: pd.Series) -> pd.Series:
+    """
+    Vectorized version of the whitespace normalization in
+    ``audio_validation.needs_regeneration``: <br>/<p> become spaces and runs of
+    whitespace collapse, so layout-only edits never trigger a regen.
+    """
+    text = series.fillna("").astype(str)
+    text = text.str.replace(r"<\s*/?\s*(?:br|p)\s*/?\s*>", " ", regex=True, case=False)
+    return text.str.replace(r"\s+", " ", regex=True).str.strip()
+
+
+def local_inventory(audio_base_dir: str, lang_code: str) -> Set[str]:
+    """Return the set of ``<item_id>.mp3`` names on disk for one locale."""
+    folder = os.path.join(audio_base_dir, lang_code)
+    try:
+        with os.scandir(folder) as entries:
+            return {entry.name for entry in entries if entry.name.endswith(".mp3") and entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
+
+def gcs_inventory(lang_code: str, bucket_name: Optional[str] = None) -> Set[str]:
+    """Return the set of ``<item_id>.mp3`` names under ``audio/<lang_code>/`` in the draft bucket."""
+    from utilities import gcs_uploader
+
+    client = gcs_uploader.get_storage_client()
+    if client is None:
+        raise RuntimeError("GCS client unavailable; cannot list the audio inventory")
+    bucket_name = bucket_name or os.environ.get("ASSETS_DRAFT_BUCKET", "levante-assets-draft")
+    prefix = f"audio/{lang_code}/"
+    return {
+        blob.name[len(prefix):]
+        for blob in client.list_blobs(bucket_name, prefix=prefix)
+        if blob.name.endswith(".mp3") and "/" not in blob.name[len(prefix):]
+    }
+
+
+def build_plan(
+    translation_data: pd.DataFrame,
+    lang_code: str,
+    voice: str,
+    service: str,
+    model_id: Optional[str] = None,
+    audio_base_dir: str = "audio_files",
+    master=None,
+    inventory: Optional[Iterable[str]] = None,
+    force: bool = False,
+) -> pd.DataFrame:
+    """
+    Build the regeneration plan for one locale.
+
+    Args:
+        translation_data (pd.DataFrame): Item rows with item_id, labels and a column per locale
+        lang_code (str): Locale column to plan for (exact match only)
+        voice (str): Configured display voice for the locale
+        service (str): Configured TTS service ('ElevenLabs' or 'PlayHt')
+        model_id (str, optional): Expected model; only compared when given
+        audio_base_dir (str): Root of the local audio tree
+        master (MasterStore, optional): Master cache; without it every existing file is 'unverified'
+        inventory (iterable, optional): ``<item_id>.mp3`` names that exist; defaults to the local folder
+        force (bool): Regenerate every valid row regardless of state
+
+    Returns:
+        pd.DataFrame: One row per item with columns :data:`PLAN_COLUMNS`
+    """
+    item_ids = _first_column(translation_data, "item_id")
+    if item_ids is None:
+        raise ValueError("Translation data must have an 'item_id' column")
+    plan = pd.DataFrame({"item_id": item_ids.astype(str).values})
+    labels = _first_column(translation_data, "labels")
+    plan["labels"] = labels.values if labels is not None else "general"
+    texts = _first_column(translation_data, lang_code)
+    plan["text"] = texts.values if texts is not None else None
+    plan["audio_path"] = [os.path.join(audio_base_dir, lang_code, f"{item_id}.mp3") for item_id in plan["item_id"]]
+
+    names = set(inventory) if inventory is not None else local_inventory(audio_base_dir, lang_code)
+    file_exists = (plan["item_id"] + ".mp3").isin(names)
+
+    # Join the master cache for this locale (text + voice/service/model per item)
+    master_cols = ["master_text", "master_voice", "master_service", "master_model_id"]
+    if master is not None:
+        master_column = u.resolve_master_column(master.columns(), lang_code)
+        cells = master.get_column(master_column)
+        master_frame = pd.DataFrame.from_dict(cells, orient="index")
+        if master_frame.empty:
+            master_frame = pd.DataFrame(columns=["text", "voice", "service", "model_id"])
+        master_frame.columns = [f"master_{c}" for c in master_frame.columns]
+        plan = plan.merge(master_frame, how="left", left_on="item_id", right_index=True)
+    for column in master_cols:
+        if column not in plan.columns:
+            plan[column] = None
+
+    raw_text = plan["text"]
+    missing_text = raw_text.isna() | (raw_text.astype(str).str.strip() == "")
+    placeholder = ~missing_text & raw_text.map(u.is_placeholder_translation).astype(bool)
+    has_master = plan["master_text"].notna() & (plan["master_text"].astype(str).str.strip() != "")
+    text_changed = normalize_text_series(plan["master_text"]) != normalize_text_series(raw_text)
+    has_voice_info = plan["master_voice"].notna() & plan["master_service"].notna()
+    voice_changed = (plan["master_voice"] != voice) | (plan["master_service"] != service)
+    if model_id is not None:
+        voice_changed |= plan["master_model_id"].notna() & (plan["master_model_id"] != str(model_id))
+
+    conditions = [
+        missing_text,
+        placeholder,
+        ~file_exists & ~has_master,
+        ~file_exists & has_master,
+        file_exists & ~has_master,
+        file_exists & text_changed,
+        file_exists & ~has_voice_info,
+        file_exists & voice_changed,
+    ]
+    choices = [
+        "no-translation",
+        "placeholder",
+        "new",
+        "missing-file",
+        "unverified",
+        "changed-text",
+        "unverified",
+        "voice-changed",
+    ]
+    plan["status"] = np.select(conditions, choices, default="up-to-date")
+
+    reasons = {
+        "no-translation": f"No translation for exact locale {lang_code}",
+        "placeholder": "Placeholder translation",
+        "new": "Audio file does not exist",
+        "missing-file": "Audio file missing (generated before)",
+        "unverified": "Not in master cache; needs ID3 check",
+        "changed-text": "Text changed since last generation",
+        "voice-changed": "Voice/service/model changed since last generation",
+        "up-to-date": "Audio file is up to date",
+    }
+    plan["reason"] = plan["status"].map(reasons)
+    if force:
+        forced = ~plan["status"].isin(SKIPPED_STATUSES + ("new",))
+        plan.loc[forced, "status"] = "forced"
+        plan.loc[forced, "reason"] = "Forced regeneration"
+
+    plan["chars"] = np.where(missing_text, 0, raw_text.fillna("").astype(str).str.len())
+    return plan[PLAN_COLUMNS]
+
+
+def needs_generation(plan: pd.DataFrame) -> pd.Series:
+    """Boolean mask of plan rows that must be (re)generated without further checks."""
+    return plan["status"].isin(REGENERATE_STATUSES)
+
+
+def summarize_plan(plan: pd.DataFrame, lang_code: str, elapsed: Optional[float] = None) -> dict:
+    """Print status counts and the estimated character cost; return them as a dict."""
+    counts = {status: int(n) for status, n in plan["status"].value_counts().items()}
+    to_generate = plan[needs_generation(plan)]
+    unverified = plan[plan["status"] == "unverified"]
+    summary = {
+        "lang_code": lang_code,
+        "counts": counts,
+        "to_generate": int(len(to_generate)),
+        "chars_to_generate": int(to_generate["chars"].sum()),
+        "unverified": int(len(unverified)),
+        "chars_unverified": int(unverified["chars"].sum()),
+    }
+    timing = f" in {elapsed * 1000:.0f} ms" if elapsed is not None else ""
+    print(f"\n🗺️  Regen plan for {lang_code} ({len(plan)} items{timing}):")
+    for status in PLAN_STATUSES:
+        if counts.get(status):
+            print(f"   {status:<15} {counts[status]}")
+    print(f"   Items to generate: {summary['to_generate']} "
+          f"(~{summary['chars_to_generate']:,} characters)")
+    if summary["unverified"]:
+        print(f"   Unverified (ID3 check at generation time): {summary['unverified']} "
+              f"(up to ~{summary['chars_unverified']:,} more characters)")
+    return summary
@@ -0,0 +1,313 @@
+"""
+Bounded-concurrency generation engine for TTS runs.
+
+ElevenLabs and PlayHT used to walk ``inputData.iterrows()`` one row at a time,
+so a full-language regen was bound by one HTTP round-trip per clip. This
+module dispatches per-row work over a thread pool while keeping each
+provider inside its own limits:
+
+- a per-provider concurrency cap (how many requests may be in flight), and
+- a per-provider token bucket (requests per minute) that also honors
+  ``Retry-After`` from HTTP 429 responses by pausing every worker.
+
+Limiters are process-wide singletons keyed by provider name, so several
+generation runs in the same process share one budget per provider.
+
+Resumability is unchanged: rows that finish are written (and tagged) as they
+complete, and an interrupted run can be re-started with the same command,
+which skips files that are already up to date.
+"""
+
+import os
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+# Defaults per provider. Override with environment variables, e.g.
+# ELEVENLABS_MAX_CONCURRENCY=8 or PLAYHT_RATE_PER_MINUTE=20.
+PROVIDER_LIMITS = {
+    "ElevenLabs": {"max_concurrency": 4, "rate_per_minute": 120},
+    "PlayHt": {"max_concurrency": 2, "rate_per_minute": 10},
+}
+DEFAULT_LIMITS = {"max_concurrency": 2, "rate_per_minute": 30}
+
+RESULT_KEYS = {"Success": "Processed", "Error": "Errors", "NoTask": "NoTask"}
+
+_LIMITERS: Dict[str, "ProviderLimiter"] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+# Set by a caller that runs several run_rows() calls on worker threads (e.g.
+# the multi-language dispatcher in generate_speech.py) when the user presses
+# Ctrl-C; KeyboardInterrupt only reaches the main thread, so each run checks
+# this before submitting or waiting on a row and stops as if interrupted.
+STOP_REQUESTED = threading.Event()
+
+
+class RateLimitedError(Exception):
+    """Raised by a provider call when the service answered HTTP 429."""
+
+    def __init__(self, message: str = "Rate limited", retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value: Any, default: float = 1.0) -> float:
+    """Parse a ``Retry-After`` header value (seconds); fall back to ``default``."""
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return default
+
+
+def retry_after_from_exception(exc: BaseException) -> Optional[float]:
+    """
+    Return the back-off delay when ``exc`` represents an HTTP 429, else None.
+
+    Works for :class:`RateLimitedError` and for SDK errors that expose
+    ``status_code`` / ``headers`` (e.g. ``elevenlabs.core.ApiError``).
+    """
+    if isinstance(exc, RateLimitedError):
+        return exc.retry_after if exc.retry_after is not None else 1.0
+    if getattr(exc, "status_code", None) == 429:
+        headers = getattr(exc, "headers", None) or {}
+        return parse_retry_after(headers.get("retry-after") or headers.get("Retry-After"))
+    return None
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at ``rate_per_minute``."""
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate_per_second = max(float(rate_per_minute), 0.001) / 60.0
+        self.capacity = float(capacity if capacity is not None else max(1.0, min(rate_per_minute, 10)))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate_per_second)
+        self._updated = now
+
+    def acquire(self) -> None:
+        """Block until one token is available (and no 429 pause is active)."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    wait_seconds = self._paused_until - now
+                else:
+                    self._refill(now)
+                    if self._tokens >= 1.0:
+                        self._tokens -= 1.0
+                        return
+                    wait_seconds = (1.0 - self._tokens) / self.rate_per_second
+            time.sleep(min(wait_seconds, 1.0))
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for ``seconds`` and drain the bucket."""
+        with self._lock:
+            now = time.monotonic()
+            self._paused_until = max(self._paused_until, now + max(0.0, seconds))
+            self._tokens = 0.0
+            self._updated = max(now, self._paused_until)
+
+
+class ProviderLimiter:
+    """Concurrency cap plus token bucket for one TTS provider."""
+
+    def __init__(self, name: str, max_concurrency: int, rate_per_minute: float):
+        self.name = name
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.rate_per_minute = float(rate_per_minute)
+        self.bucket = TokenBucket(rate_per_minute)
+        self._semaphore = threading.BoundedSemaphore(self.max_concurrency)
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.rate_limited = 0
+
+    @contextmanager
+    def slot(self):
+        """Hold one request slot for the duration of a provider call."""
+        self._semaphore.acquire()
+        try:
+            self.bucket.acquire()
+            with self._lock:
+                self.in_flight += 1
+            try:
+                yield self
+            finally:
+                with self._lock:
+                    self.in_flight -= 1
+        finally:
+            self._semaphore.release()
+
+    def backoff(self, retry_after: Optional[float]) -> float:
+        """Record a 429 from the provider and pause all workers."""
+        delay = retry_after if retry_after is not None else 1.0
+        with self._lock:
+            self.rate_limited += 1
+        print(f"🕒 {self.name} rate limit hit (429); pausing requests for {delay:.1f}s")
+        self.bucket.pause(delay)
+        return delay
+
+    def call(self, func: Callable[[], Any], max_retries: int = 5) -> Any:
+        """
+        Run ``func`` inside a slot, retrying when the provider answers 429.
+
+        Non-429 errors propagate so the caller's own retry policy applies.
+        """
+        for attempt in range(max_retries):
+            try:
+                with self.slot():
+                    return func()
+            except Exception as exc:
+                retry_after = retry_after_from_exception(exc)
+                if retry_after is None or attempt == max_retries - 1:
+                    raise
+                self.backoff(retry_after)
+        return None
+
+
+def _env_override(provider: str, key: str) -> Optional[float]:
+    env_name = f"{provider.upper()}_{key.upper()}"
+    raw = os.environ.get(env_name)
+    if not raw:
+        return None
+    try:
+        return float(raw)
+    except ValueError:
+        print(f"⚠️  Ignoring non-numeric {env_name}={raw!r}")
+        return None
+
+
+def get_limiter(
+    provider: str,
+    max_concurrency: Optional[int] = None,
+    rate_per_minute: Optional[float] = None,
+) -> ProviderLimiter:
+    """
+    Return the process-wide limiter for ``provider``, creating it on first use.
+
+    Explicit arguments win over environment overrides, which win over
+    :data:`PROVIDER_LIMITS`. Later calls with explicit values re-create the
+    limiter so a CLI flag always takes effect.
+    """
+    defaults = PROVIDER_LIMITS.get(provider, DEFAULT_LIMITS)
+    with _LIMITERS_LOCK:
+        existing = _LIMITERS.get(provider)
+        if existing is not None and max_concurrency is None and rate_per_minute is None:
+            return existing
+        concurrency = max_concurrency or _env_override(provider, "max_concurrency") or defaults["max_concurrency"]
+        rate = rate_per_minute or _env_override(provider, "rate_per_minute") or defaults["rate_per_minute"]
+        if (
+            existing is not None
+            and existing.max_concurrency == int(concurrency)
+            and existing.rate_per_minute == float(rate)
+        ):
+            return existing
+        limiter = ProviderLimiter(provider, int(concurrency), float(rate))
+        _LIMITERS[provider] = limiter
+        return limiter
+
+
+def run_rows(
+    rows: Iterable[Tuple[Any, Any]],
+    process_row: Callable[[Any, Any], str],
+    total: int,
+    max_workers: int,
+    label: str = "",
+) -> Dict[str, int]:
+    """
+    Process ``(index, row)`` pairs concurrently and tally the results.
+
+    Args:
+        rows: Iterable of ``(index, row)`` pairs, e.g. ``inputData.iterrows()``
+        process_row: Callable returning 'Success', 'Error' or 'NoTask'
+        total: Number of rows (for progress output)
+        max_workers: Upper bound on rows in flight at once
+        label: Optional prefix for progress lines (e.g. the lang_code)
+
+    Returns:
+        dict: ``{'Errors': n, 'Processed': n, 'NoTask': n}``
+    """
+    stats = {"Errors": 0, "Processed": 0, "NoTask": 0}
+    prefix = f"[{label}] " if label else ""
+    max_workers = max(1, int(max_workers))
+    done_count = 0
+
+    def _record(item_id: Any, outcome: Any) -> None:
+        nonlocal done_count
+        done_count += 1
+        key = RESULT_KEYS.get(outcome) if isinstance(outcome, str) else None
+        if key is None:
+            print(f"⚠️ Unexpected result from processRow for '{item_id}': {outcome} - counting as error")
+            key = "Errors"
+        stats[key] += 1
+        pct = done_count / total * 100 if total else 100.0
+        print(f"📊 {prefix}Progress: {done_count}/{total} ({pct:.1f}%) - finished '{item_id}'")
+        if done_count % 10 == 0:
+            print(
+                f"📈 {prefix}Running totals: ✅ {stats['Processed']} processed, "
+                f"❌ {stats['Errors']} errors, ⏭️  {stats['NoTask']} skipped"
+            )
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"tts-{label or 'worker'}")
+    pending = {}
+    try:
+        # Keep at most 2x max_workers rows queued so huge inputs stay lazy.
+        for index, row in rows:
+            if STOP_REQUESTED.is_set():
+                raise KeyboardInterrupt
+            item_id = _row_item_id(row)
+            pending[executor.submit(process_row, index, row)] = item_id
+            if len(pending) >= max_workers * 2:
+                finished = _wait_for_rows(pending)
+                for future in finished:
+                    item_id = pending.pop(future)
+                    _record(item_id, _outcome(future, item_id))
+        while pending:
+            finished = _wait_for_rows(pending)
+            for future in finished:
+                item_id = pending.pop(future)
+                _record(item_id, _outcome(future, item_id))
+    except KeyboardInterrupt:
+        executor.shutdown(wait=False, cancel_futures=True)
+        print(f"\n🛑 {prefix}Process interrupted by user at item {done_count}/{total}")
+        print(
+            f"📊 Final stats: ✅ {stats['Processed']} processed, ❌ {stats['Errors']} errors, "
+            f"⏭️  {stats['NoTask']} skipped"
+        )
+        print("💡 You can resume by running the same command again - it will skip already generated files.")
+        sys.exit(0)
+    executor.shutdown(wait=True)
+    return stats
+
+
+def _wait_for_rows(pending: Dict[Any, str]):
+    """Wait for at least one row to finish; raise KeyboardInterrupt once STOP_REQUESTED is set."""
+    while True:
+        if STOP_REQUESTED.is_set():
+            raise KeyboardInterrupt
+        finished, _ = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+        if finished:
+            return finished
+
+
+def _row_item_id(row: Any) -> str:
+    try:
+        return str(row["item_id"])
+    except Exception:
+        return "?"
+
+
+def _outcome(future, item_id: str) -> str:
+    try:
+        return future.result()
+    except Exception as exc:
+        print(f"❌ Unexpected error processing '{item_id}': {exc}")
+        return "Error"
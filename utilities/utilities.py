@@ -1,26 +1,28 @@
 # wrapper so trying to create a directory that exists doesn't fail
+import hashlib
 import os
 import textwrap
 import subprocess
 import pandas as pd
 import re
 import tempfile
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import playsound
 import tkinter as tk
 from tkinter import font as tkfont
 from utilities import config as conf
+from utilities import gcs_uploader
+from utilities.master_store import MasterStore
 from PlayHt import playHt_utilities
 from ELabs import elevenlabs_utilities
 import numpy as np
 
-# GCS imports for uploading to levante-assets-draft bucket
-try:
-    from google.cloud import storage
-    from google.oauth2 import service_account
-    GCS_AVAILABLE = True
-except ImportError:
-    GCS_AVAILABLE = False
+# GCS uploads to the levante-assets-draft bucket go through utilities/gcs_uploader.py
+GCS_AVAILABLE = gcs_uploader.GCS_AVAILABLE
+if not GCS_AVAILABLE:
     print("Warning: google-cloud-storage not available. GCS upload will be skipped.")
 
 # Add mutagen for ID3v2 tag handling
@@ -69,6 +71,10 @@ STANDARD_ID3_FIELDS = {'title', 'artist', 'album', 'date', 'genre', 'comment', '
 
 # Avoid re-uploading the same CSV repeatedly during a single generation run.
 _DRAFT_CSV_SYNCED_BUCKETS = set()
+_CSV_SYNC_LOCK = threading.Lock()
+# save_audio runs on tts_engine worker threads; serialize master-cache writes.
+_MASTER_LOCK = threading.Lock()
+_STATS_LOCK = threading.Lock()
 _PLACEHOLDER_TRANSLATIONS = {
     "NO APPROVED TRANSLATION",
 }
@@ -126,11 +132,85 @@ def audio_file_path(task_name, item_name, audio_base_dir, lang_code):
     full_file_path = os.path.join(full_file_folder, item_name + ".mp3")
     return full_file_path
 
+class StreamedAudio:
+    """
+    Synthesized audio already written to a temp file beside its destination.
+
+    Produced by :func:`stream_audio_to_temp`; ``save_audio`` tags the temp
+    file and renames it into place, so a clip is never held in memory and an
+    interrupted download never leaves a partial MP3 in the audio tree.
+    """
+
+    def __init__(self, temp_path, sha256, size):
+        self.temp_path = temp_path
+        self.sha256 = sha256
+        self.size = size
+        self.status_code = 200
+
+    @property
+    def content(self):
+        with open(self.temp_path, "rb") as handle:
+            return handle.read()
+
+    def discard(self):
+        """Remove the temp file if it was never moved into place."""
+        try:
+            os.unlink(self.temp_path)
+        except OSError:
+            pass
+
+def stream_audio_to_temp(chunks, final_path):
+    """
+    Write audio chunks to a hidden temp file in ``final_path``'s folder.
+
+    Args:
+        chunks: Iterable of bytes (e.g. the ElevenLabs SDK generator), bytes,
+                or a response object with ``.content``
+        final_path (str): Where the finished MP3 will live
+
+    Returns:
+        StreamedAudio: temp file path plus the sha256 and size of the audio
+    """
+    if hasattr(chunks, 'content'):
+        chunks = [chunks.content]
+    elif isinstance(chunks, (bytes, bytearray)):
+        chunks = [chunks]
+
+    folder = os.path.dirname(os.path.abspath(final_path))
+    os.makedirs(folder, exist_ok=True)
+    # Hidden ".part" name: never mistaken for a finished clip by inventory scans.
+    # os.open (not mkstemp) so the renamed MP3 keeps normal umask permissions.
+    temp_path = os.path.join(folder, f".{os.path.basename(final_path)}.{uuid.uuid4().hex[:8]}.part")
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            for chunk in chunks:
+                if not chunk:
+                    continue
+                handle.write(chunk)
+                digest.update(chunk)
+                size += len(chunk)
+        if size == 0:
+            raise ValueError(f"Empty audio stream for {final_path}")
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+    return StreamedAudio(temp_path, digest.hexdigest(), size)
+
 def wrap_text(text, width=40):
     return "\n".join(textwrap.wrap(text, width=width))
 
-def count_audio_files(lang_code):
-    """Count audio files for a given language code, checking both old and new directory formats"""
+def count_audio_files(lang_code, catalog=None):
+    """Count audio files for a given language code, checking both old and new directory formats
+
+    With an AudioCatalog (utilities.audio_catalog) refreshed over audio_files/,
+    the counts come from the catalog instead of globbing the tree.
+    """
     import glob
     
     # Map simplified codes to old codes for backward compatibility
@@ -142,6 +222,13 @@ def count_audio_files(lang_code):
         conf.LANGUAGE_CODES['Dutch']: 'nl-NL'
     }
     
+    old_lang_code = old_lang_codes.get(lang_code, lang_code)
+    if catalog is not None:
+        total_count = catalog.count(lang_code, directory='audio_files')
+        if old_lang_code != lang_code:
+            total_count += catalog.count(old_lang_code, legacy_layout=True, directory='audio_files')
+        return str(total_count)
+
     total_count = 0
     
     # Check new simplified directory structure: audio_files/<lang_code>/*.mp3
@@ -155,7 +242,6 @@ def count_audio_files(lang_code):
     total_count += len(old_files)
     
     # Also check with old language codes for extra backward compatibility
-    old_lang_code = old_lang_codes.get(lang_code, lang_code)
     if old_lang_code != lang_code:  # Only check if there's a different old format
         old_pattern_with_old_code = f'audio_files/*/{old_lang_code}/shared/*.mp3'
         old_files_with_old_code = glob.glob(old_pattern_with_old_code)
@@ -176,43 +262,44 @@ def play_audio_from_text(service, language, voice, text ):
         #print("NOT IMPLEMENTED")
 
 def store_stats(lang_code, errors, notask, voice):
-
-    stats_file_path = 'stats.csv'
-    # first initialize our statistics data
-    if os.path.exists(stats_file_path):
-        statsData = pd.read_csv(stats_file_path)
-    else:
-        # create a new dataframe
-        statsData = pd.DataFrame(columns=['Language', 'Errors', 'No Task', 'Voice'])
-        new_rows = [
-            ['English', 0, 0 ,''],
-            ['Spanish', 0, 0, ''],
-            ['German', 0, 0, ''],
-            ['French', 0, 0, ''],
-            ['Dutch', 0, 0, '']
-        ]
+    # Languages may finish concurrently in a multi-language run
+    with _STATS_LOCK:
+        stats_file_path = 'stats.csv'
+        # first initialize our statistics data
+        if os.path.exists(stats_file_path):
+            statsData = pd.read_csv(stats_file_path)
+        else:
+            # create a new dataframe
+            statsData = pd.DataFrame(columns=['Language', 'Errors', 'No Task', 'Voice'])
+            new_rows = [
+                ['English', 0, 0 ,''],
+                ['Spanish', 0, 0, ''],
+                ['German', 0, 0, ''],
+                ['French', 0, 0, ''],
+                ['Dutch', 0, 0, '']
+            ]
     
-        for row in new_rows:
-            statsData.loc[len(statsData)] = row
+            for row in new_rows:
+                statsData.loc[len(statsData)] = row
         
-    if lang_code == conf.LANGUAGE_CODES['English']:
-        language = 'English'
-    elif lang_code == conf.LANGUAGE_CODES['Spanish']:
-        language = 'Spanish'
-    elif lang_code == conf.LANGUAGE_CODES['German']:
-        language = 'German'
-    elif lang_code == conf.LANGUAGE_CODES['French']:
-        language = 'French'
-    elif lang_code == conf.LANGUAGE_CODES['Dutch']:
-        language = 'Dutch'
-    else:
-        return()
+        if lang_code == conf.LANGUAGE_CODES['English']:
+            language = 'English'
+        elif lang_code == conf.LANGUAGE_CODES['Spanish']:
+            language = 'Spanish'
+        elif lang_code == conf.LANGUAGE_CODES['German']:
+            language = 'German'
+        elif lang_code == conf.LANGUAGE_CODES['French']:
+            language = 'French'
+        elif lang_code == conf.LANGUAGE_CODES['Dutch']:
+            language = 'Dutch'
+        else:
+            return()
             
-    # now that we have a DataFrame with rows modify our stats
-    # Correct way to update values
-    statsData.loc[statsData['Language'] == language, ['Errors', 'No Task', 'Voice']] = [errors, notask, voice]
+        # now that we have a DataFrame with rows modify our stats
+        # Correct way to update values
+        statsData.loc[statsData['Language'] == language, ['Errors', 'No Task', 'Voice']] = [errors, notask, voice]
 
-    statsData.to_csv(stats_file_path, index=False)
+        statsData.to_csv(stats_file_path, index=False)
 
 def get_stats():
     if not os.path.exists(conf.stats_file_path):
@@ -297,6 +384,171 @@ def show_ssml_tips(self):
 
         
 
+# Standard fields -> ID3 frame classes (comment and copyright are handled separately)
+_STANDARD_TEXT_FRAMES = {
+    'title': 'TIT2',
+    'artist': 'TPE1',
+    'album': 'TALB',
+    'date': 'TDRC',
+    'genre': 'TCON',
+}
+
+
+class ID3TagSession:
+    """
+    Open an MP3 once, read and patch its ID3v2 frames, and save only if something changed.
+
+    Use as a context manager; the file is saved on a clean exit when a patch
+    actually changed a frame:
+
+        with ID3TagSession(path) as session:
+            if not session.get('task'):
+                session.set('task', 'vocab')
+
+    Args:
+        file_path (str): Path to the MP3 file
+
+    Raises:
+        RuntimeError: If mutagen is not available
+        FileNotFoundError: If the file does not exist
+    """
+
+    def __init__(self, file_path):
+        if not MUTAGEN_AVAILABLE:
+            raise RuntimeError("mutagen not available. Cannot read ID3 tags.")
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File {file_path} does not exist.")
+        self.file_path = str(file_path)
+        self._audio = MP3(self.file_path, ID3=ID3)
+        self.changed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.save()
+        return False
+
+    @property
+    def frames(self):
+        """The underlying mutagen ID3 object (None if the file has no tag)."""
+        return self._audio.tags
+
+    def custom_fields(self):
+        """
+        Return the custom TXXX fields as a dict (description -> first value).
+        """
+        fields = {}
+        if self._audio.tags is None:
+            return fields
+        for frame in self._audio.tags.getall('TXXX'):
+            if frame.desc and frame.text:
+                fields[frame.desc] = str(frame.text[0])
+        return fields
+
+    def read(self):
+        """
+        Return the same dict as read_id3_tags, walking the TXXX frames once.
+        """
+        id3 = self._audio.tags
+        tags = {}
+        if not id3:
+            return tags
+        for field, frame_id in _STANDARD_TEXT_FRAMES.items():
+            tags[field] = str(id3.get(frame_id, [''])[0]) if id3.get(frame_id) else ''
+
+        comment_frames = id3.getall('COMM')
+        tags['comment'] = str(comment_frames[0].text[0]) if comment_frames else ''
+
+        custom = self.custom_fields()
+        # Copyright: TCOP frame, or fallback to TXXX COPYRIGHT
+        copyright_frames = id3.getall('TCOP')
+        if copyright_frames:
+            tags['copyright'] = str(copyright_frames[0].text[0]) if copyright_frames[0].text else ''
+        else:
+            tags['copyright'] = next((value for desc, value in custom.items() if desc.upper() == 'COPYRIGHT'), '')
+
+        tags.update(custom)
+        return tags
+
+    def get(self, field, default=''):
+        """
+        Return one field ('title', 'comment', a TXXX description, ...) or default.
+        """
+        value = self.read().get(field) if field in STANDARD_ID3_FIELDS else self.custom_fields().get(field)
+        return value if value not in (None, '') else default
+
+    def _frame_for(self, field, value):
+        text = str(value)
+        if field in _STANDARD_TEXT_FRAMES:
+            frame_cls = {'TIT2': TIT2, 'TPE1': TPE1, 'TALB': TALB, 'TDRC': TDRC, 'TCON': TCON}[_STANDARD_TEXT_FRAMES[field]]
+            return frame_cls(encoding=3, text=text)
+        if field == 'comment':
+            return COMM(encoding=3, lang='eng', desc='', text=text)
+        if field == 'copyright':
+            if TCOP_AVAILABLE:
+                return TCOP(encoding=3, text=text)
+            # Fall back to custom TXXX frame if TCOP not available
+            return TXXX(encoding=3, desc='COPYRIGHT', text=text)
+        return TXXX(encoding=3, desc=field, text=text)
+
+    def set(self, field, value):
+        """
+        Set one field; returns True if the stored value changed.
+        """
+        if self._audio.tags is None:
+            self._audio.add_tags()
+        frame = self._frame_for(field, value)
+        existing = self._audio.tags.get(frame.HashKey)
+        if existing is not None and [str(t) for t in existing.text] == [str(t) for t in frame.text]:
+            return False
+        self._audio.tags.add(frame)
+        self.changed = True
+        return True
+
+    def remove(self, field):
+        """
+        Delete one field; returns True if it was present.
+        """
+        if self._audio.tags is None:
+            return False
+        key = self._frame_for(field, '').HashKey
+        if key not in self._audio.tags:
+            return False
+        del self._audio.tags[key]
+        self.changed = True
+        return True
+
+    def update(self, tags):
+        """
+        Apply a tag dict with write_id3_tags semantics (empty values are skipped).
+
+        Returns:
+            int: Number of fields whose stored value changed
+        """
+        changed = 0
+        for field, value in tags.items():
+            if value:
+                changed += self.set(field, value)
+        return changed
+
+    def save(self, force=False):
+        """
+        Write the tags back to disk if anything changed (or force is set).
+
+        Returns:
+            bool: True if the file was written
+        """
+        if not (self.changed or force):
+            return False
+        if self._audio.tags is None:
+            self._audio.add_tags()
+        self._audio.save()
+        self.changed = False
+        return True
+
+
 def read_id3_tags(file_path):
     """
     Read ID3v2 tags from an MP3 file, including custom fields.
@@ -316,45 +568,7 @@ def read_id3_tags(file_path):
         return {}
     
     try:
-        audio_file = MP3(file_path, ID3=ID3)
-        tags = {}
-        
-        # Read standard ID3v2 tags
-        if audio_file.tags:
-            tags['title'] = str(audio_file.tags.get('TIT2', [''])[0]) if audio_file.tags.get('TIT2') else ''
-            tags['artist'] = str(audio_file.tags.get('TPE1', [''])[0]) if audio_file.tags.get('TPE1') else ''
-            tags['album'] = str(audio_file.tags.get('TALB', [''])[0]) if audio_file.tags.get('TALB') else ''
-            tags['date'] = str(audio_file.tags.get('TDRC', [''])[0]) if audio_file.tags.get('TDRC') else ''
-            tags['genre'] = str(audio_file.tags.get('TCON', [''])[0]) if audio_file.tags.get('TCON') else ''
-            
-            # Read comment (if any)
-            comment_frames = audio_file.tags.getall('COMM')
-            tags['comment'] = str(comment_frames[0].text[0]) if comment_frames else ''
-            
-            # Read copyright (TCOP frame or fallback to TXXX COPYRIGHT)
-            copyright_frames = audio_file.tags.getall('TCOP')
-            if copyright_frames:
-                tags['copyright'] = str(copyright_frames[0].text[0]) if copyright_frames[0].text else ''
-            else:
-                # Try to find COPYRIGHT in TXXX frames as fallback
-                txxx_frames = audio_file.tags.getall('TXXX')
-                for frame in txxx_frames:
-                    if frame.desc and frame.desc.upper() == 'COPYRIGHT' and frame.text:
-                        tags['copyright'] = str(frame.text[0]) if frame.text else ''
-                        break
-                else:
-                    tags['copyright'] = ''
-            
-            # Read custom fields (TXXX frames)
-            txxx_frames = audio_file.tags.getall('TXXX')
-            for frame in txxx_frames:
-                if frame.desc and frame.text:
-                    # Use the description as the field name
-                    custom_field_name = frame.desc
-                    custom_field_value = str(frame.text[0]) if frame.text else ''
-                    tags[custom_field_name] = custom_field_value
-        
-        return tags
+        return ID3TagSession(file_path).read()
         
     except Exception as e:
         print(f"Error reading ID3 tags from {file_path}: {e}")
@@ -371,7 +585,7 @@ def write_id3_tags(file_path, tags):
                     Any fields beyond standard ID3v2 fields will be stored as custom TXXX frames
         
     Returns:
-        bool: True if successful, False otherwise
+        bool: True if successful (including when every tag already had that value), False otherwise
     """
     if not MUTAGEN_AVAILABLE:
         print("Warning: mutagen not available. Cannot write ID3 tags.")
@@ -386,40 +600,10 @@ def write_id3_tags(file_path, tags):
         return False
     
     try:
-        audio_file = MP3(file_path, ID3=ID3)
-        
-        # Create ID3 tag if it doesn't exist
-        if audio_file.tags is None:
-            audio_file.add_tags()
-        
-        # Write standard ID3v2 tags
-        if tags.get('title'):
-            audio_file.tags.add(TIT2(encoding=3, text=tags['title']))
-        if tags.get('artist'):
-            audio_file.tags.add(TPE1(encoding=3, text=tags['artist']))
-        if tags.get('album'):
-            audio_file.tags.add(TALB(encoding=3, text=tags['album']))
-        if tags.get('date'):
-            audio_file.tags.add(TDRC(encoding=3, text=tags['date']))
-        if tags.get('genre'):
-            audio_file.tags.add(TCON(encoding=3, text=tags['genre']))
-        if tags.get('comment'):
-            audio_file.tags.add(COMM(encoding=3, lang='eng', desc='', text=tags['comment']))
-        if tags.get('copyright'):
-            if TCOP_AVAILABLE:
-                audio_file.tags.add(TCOP(encoding=3, text=tags['copyright']))
-            else:
-                # Fall back to custom TXXX frame if TCOP not available
-                audio_file.tags.add(TXXX(encoding=3, desc='COPYRIGHT', text=tags['copyright']))
-        
-        # Write custom fields as TXXX frames
-        for field_name, field_value in tags.items():
-            if field_name not in STANDARD_ID3_FIELDS and field_value:
-                # Store custom fields as user-defined text frames (TXXX)
-                audio_file.tags.add(TXXX(encoding=3, desc=field_name, text=str(field_value)))
-        
-        # Save the tags
-        audio_file.save()
+        session = ID3TagSession(file_path)
+        session.update(tags)
+        # Files without any ID3 tag still get one, as before
+        session.save(force=session.frames is None)
         return True
         
     except Exception as e:
@@ -427,6 +611,54 @@ def write_id3_tags(file_path, tags):
         return False
 
 
+def update_id3_tags_bulk(paths, update, max_workers=8):
+    """
+    Run an ID3 read/patch callback over many MP3 files with a thread pool.
+
+    Each file is opened once; ``update(session)`` may read and patch frames
+    and the file is saved only if a frame changed. Tag parsing and saving are
+    file I/O, so a few threads overlap it well.
+
+    Args:
+        paths (str | Path | iterable): Directory (its ``*.mp3`` files), one MP3 path, or MP3 paths
+        update (callable): Called with an ID3TagSession; its return value is kept
+        max_workers (int): Number of worker threads
+
+    Returns:
+        dict: ``changed``, ``unchanged`` and ``failed`` counts, plus ``results``
+              mapping each path (in sorted order) to
+              ``{"value": ..., "changed": bool, "error": str or None}``
+    """
+    if isinstance(paths, (str, Path)):
+        paths = Path(paths).glob('*.mp3') if Path(paths).is_dir() else [paths]
+    paths = sorted(str(p) for p in paths)
+
+    def run_one(path):
+        value = None
+        try:
+            session = ID3TagSession(path)
+            value = update(session)
+            changed = session.changed
+            session.save()
+            return {"value": value, "changed": changed, "error": None}
+        except Exception as e:
+            # value is kept when only the save failed
+            return {"value": value, "changed": False, "error": str(e)}
+
+    with ThreadPoolExecutor(max_workers=max(1, int(max_workers))) as pool:
+        outcomes = list(pool.map(run_one, paths))
+
+    stats = {"changed": 0, "unchanged": 0, "failed": 0, "results": dict(zip(paths, outcomes))}
+    for outcome in outcomes:
+        if outcome["error"] is not None:
+            stats["failed"] += 1
+        elif outcome["changed"]:
+            stats["changed"] += 1
+        else:
+            stats["unchanged"] += 1
+    return stats
+
+
 def save_audio(
     ourRow,
     lang_code,
@@ -438,11 +670,12 @@ def save_audio(
     voice_id="",
     model_id=""
 ):
-    def _upload_itembank_csv_if_needed(storage_client, bucket_name):
+    def _upload_itembank_csv_if_needed(bucket_name, tag):
         # Upload translation_text/item_bank_translations.csv once per bucket/run
         # to keep draft bucket audio context aligned with the generated clips.
-        if bucket_name in _DRAFT_CSV_SYNCED_BUCKETS:
-            return
+        with _CSV_SYNC_LOCK:
+            if bucket_name in _DRAFT_CSV_SYNCED_BUCKETS:
+                return
 
         # Prefer explicit runtime CSV source (draft-bucket runtime export) when available.
         # Fall back to the canonical local CSV path for legacy flows.
@@ -462,10 +695,15 @@ def save_audio(
             print(f"⚠️  Warning: item bank CSV not found at {csv_path}; skipping draft CSV upload.")
             return
 
-        csv_blob = storage_client.bucket(bucket_name).blob("audio/item_bank_translations.csv")
-        csv_blob.upload_from_filename(str(csv_path), content_type="text/csv")
-        _DRAFT_CSV_SYNCED_BUCKETS.add(bucket_name)
-        print(f"✅ Uploaded to GCS: gs://{bucket_name}/audio/item_bank_translations.csv (source: {csv_path})")
+        with _CSV_SYNC_LOCK:
+            # Only mark the bucket synced once the upload is actually queued
+            if bucket_name in _DRAFT_CSV_SYNCED_BUCKETS:
+                return
+            if not gcs_uploader.enqueue_upload(str(csv_path), bucket_name, "audio/item_bank_translations.csv",
+                                               content_type="text/csv", tag=tag):
+                return
+            _DRAFT_CSV_SYNCED_BUCKETS.add(bucket_name)
+        print(f"Queued item bank CSV for gs://{bucket_name}/audio/item_bank_translations.csv (source: {csv_path})")
 
     def _resolve_text_from_row(row, target_lang_code):
         if target_lang_code in row:
@@ -475,154 +713,158 @@ def save_audio(
         return ""
 
     file_path = audio_file_path(ourRow["labels"], ourRow["item_id"], audio_base_dir, lang_code)
-    
-    with open(file_path, "wb") as file:
-        file.write(audioData.content)
 
-    # Add ID3v2 tags to the saved MP3 file
+    # Tags are written to a temp file that is renamed into place afterwards, so
+    # readers only ever see complete, tagged clips.
+    if not isinstance(audioData, StreamedAudio):
+        audioData = stream_audio_to_temp(audioData.content, file_path)
+    temp_path = audioData.temp_path
+
     try:
-        # Create a copy of the default audio_tags template
-        tags = audio_tags.copy()
+        # Add ID3v2 tags to the saved MP3 file
+        try:
+            # Create a copy of the default audio_tags template
+            tags = audio_tags.copy()
         
-        # Populate the tags with metadata from the row data
-        tags['title'] = f"{ourRow['item_id']}"  # Use item_id as title
-        tags['artist'] = f"Levante Framework - {service}"  # Service used
-        tags['album'] = f"{ourRow['labels']}"  # Task name as album
-        tags['date'] = str(pd.Timestamp.now().year)  # Current year
-        tags['genre'] = "Speech Synthesis"
+            # Populate the tags with metadata from the row data
+            tags['title'] = f"{ourRow['item_id']}"  # Use item_id as title
+            tags['artist'] = f"Levante Framework - {service}"  # Service used
+            tags['album'] = f"{ourRow['labels']}"  # Task name as album
+            tags['date'] = str(pd.Timestamp.now().year)  # Current year
+            tags['genre'] = "Speech Synthesis"
         
-        # Add our custom tags
-        tags['created'] = str(pd.Timestamp.now())  # Full timestamp when file was created
-        tags['lang_code'] = lang_code
-        tags['service'] = service
-        tags['voice'] = voice
-        tags['voice_id'] = str(voice_id) if voice_id else ""
-        tags['voiceId'] = str(voice_id) if voice_id else ""
-        tags['model_id'] = str(model_id) if model_id else ""
-        tags['task'] = str(ourRow.get('labels', ''))  # Explicit task field for downstream SQLite/reporting
-        text_value = _resolve_text_from_row(ourRow, lang_code)
-        tags['text'] = text_value
-        tags['original_translation_text'] = text_value
-        tags['comment'] = f"Levante Project - {service} - {voice} - {lang_code}"
-
-
-        # Write ID3 tags using the tags dictionary
-        write_id3_tags(file_path=file_path, tags=tags)
+            # Add our custom tags
+            tags['created'] = str(pd.Timestamp.now())  # Full timestamp when file was created
+            tags['lang_code'] = lang_code
+            tags['service'] = service
+            tags['voice'] = voice
+            tags['voice_id'] = str(voice_id) if voice_id else ""
+            tags['voiceId'] = str(voice_id) if voice_id else ""
+            tags['model_id'] = str(model_id) if model_id else ""
+            tags['task'] = str(ourRow.get('labels', ''))  # Explicit task field for downstream SQLite/reporting
+            text_value = _resolve_text_from_row(ourRow, lang_code)
+            tags['text'] = text_value
+            tags['original_translation_text'] = text_value
+            tags['comment'] = f"Levante Project - {service} - {voice} - {lang_code}"
+            tags['audio_sha256'] = audioData.sha256  # Hash of the provider audio, before tagging
+
+
+            # Write ID3 tags using the tags dictionary
+            write_id3_tags(file_path=temp_path, tags=tags)
         
-    except Exception as e:
-        print(f"Warning: Could not add ID3 tags to {file_path}: {e}")
+        except Exception as e:
+            print(f"Warning: Could not add ID3 tags to {file_path}: {e}")
 
-    if masterData is not None:
-        # Handle column format mismatch - masterData might have old column names
-        # Map simplified codes to old codes for backward compatibility
-        old_lang_codes = {
-            conf.LANGUAGE_CODES['English']: 'en-US',
-            'es': 'es-CO',
-            conf.LANGUAGE_CODES['German']: 'de-DE',
-            'fr': 'fr-CA',
-            conf.LANGUAGE_CODES['Dutch']: 'nl-NL'
-        }
-
-        # Determine which column name to use in masterData
-        master_lang_col = lang_code
-        if lang_code not in masterData.columns:
-            # Try the old format
-            old_lang_code = old_lang_codes.get(lang_code, lang_code)
-            if old_lang_code in masterData.columns:
-                master_lang_col = old_lang_code
-            else:
-                # Add the new column if neither exists
-                masterData[lang_code] = None
-                master_lang_col = lang_code
+        os.replace(temp_path, file_path)
+    except BaseException:
+        # Never leave the temp file behind (including on Ctrl-C)
+        audioData.discard()
+        raise
 
+    if masterData is not None:
         # Update our "cache" of successful transcriptions
-        text_for_master = _resolve_text_from_row(ourRow, lang_code)
-
-        masterData[master_lang_col] = \
-            np.where(masterData["item_id"] == ourRow["item_id"], \
-            text_for_master, masterData[master_lang_col])
-
-    # Upload to GCS levante-assets-draft bucket
+        update_master(
+            masterData,
+            ourRow["item_id"],
+            lang_code,
+            _resolve_text_from_row(ourRow, lang_code),
+            service=service,
+            voice=voice,
+            model_id=model_id,
+        )
+
+    # Upload to GCS levante-assets-draft bucket (queued; drained by gcs_uploader.flush())
     if GCS_AVAILABLE:
         try:
-            # Initialize GCS client
-            # Try to get credentials from environment variable (same as web dashboard)
-            import json
-            import os as os_module
-            
-            storage_client = None
-            credentials_json = os_module.environ.get('GOOGLE_APPLICATION_CREDENTIALS_JSON') or os_module.environ.get('GCP_SERVICE_ACCOUNT_JSON')
-            
-            if credentials_json:
-                try:
-                    credentials_dict = json.loads(credentials_json)
-                    credentials = service_account.Credentials.from_service_account_info(credentials_dict)
-                    storage_client = storage.Client(credentials=credentials, project=credentials_dict.get('project_id'))
-                except Exception as e:
-                    print(f"Warning: Could not parse GCS credentials: {e}")
-                    # Fall back to default credentials
-                    try:
-                        storage_client = storage.Client()
-                    except Exception:
-                        storage_client = None
-            else:
-                # Try default credentials
-                try:
-                    storage_client = storage.Client()
-                except Exception:
-                    storage_client = None
-            
-            if storage_client:
-                # Bucket name from environment or default
-                bucket_name = os_module.environ.get('ASSETS_DRAFT_BUCKET', 'levante-assets-draft')
-                bucket = storage_client.bucket(bucket_name)
-                
-                # GCS path: audio/{lang_code}/{item_id}.mp3
-                gcs_path = f"audio/{lang_code}/{ourRow['item_id']}.mp3"
-                blob = bucket.blob(gcs_path)
-                
-                # Upload the file (with ID3 tags already written)
-                blob.upload_from_filename(file_path, content_type='audio/mpeg')
-                
-                # Set metadata to match ID3 tags
-                metadata = {
-                    'service': service,
-                    'voice': voice,
-                    'voice_id': str(voice_id) if voice_id else '',
-                    'voiceId': str(voice_id) if voice_id else '',
-                    'model_id': str(model_id) if model_id else '',
-                    'lang_code': lang_code,
-                    'item_id': ourRow['item_id'],
-                    'task': ourRow.get('labels', ''),
-                }
-                
-                # Add text if available
-                text_value = _resolve_text_from_row(ourRow, lang_code)
-                
-                if text_value:
-                    metadata['text'] = text_value[:500]  # Limit length for metadata
-                
-                blob.metadata = metadata
-                blob.patch()
-                
-                print(f"✅ Uploaded to GCS: gs://{bucket_name}/{gcs_path}")
-
+            # Bucket name from environment or default
+            bucket_name = os.environ.get('ASSETS_DRAFT_BUCKET', 'levante-assets-draft')
+
+            # GCS path: audio/{lang_code}/{item_id}.mp3
+            gcs_path = f"audio/{lang_code}/{ourRow['item_id']}.mp3"
+
+            # Set metadata to match ID3 tags
+            metadata = {
+                'service': service,
+                'voice': voice,
+                'voice_id': str(voice_id) if voice_id else '',
+                'voiceId': str(voice_id) if voice_id else '',
+                'model_id': str(model_id) if model_id else '',
+                'lang_code': lang_code,
+                'item_id': ourRow['item_id'],
+                'task': ourRow.get('labels', ''),
+            }
+
+            # Add text if available
+            text_value = _resolve_text_from_row(ourRow, lang_code)
+
+            if text_value:
+                metadata['text'] = text_value[:500]  # Limit length for metadata
+
+            # Upload the file (with ID3 tags already written) on the shared client
+            if gcs_uploader.enqueue_upload(file_path, bucket_name, gcs_path, metadata,
+                                           content_type='audio/mpeg', tag=lang_code):
                 # Also publish the current item bank CSV into the draft audio folder.
-                _upload_itembank_csv_if_needed(storage_client, bucket_name)
+                _upload_itembank_csv_if_needed(bucket_name, lang_code)
             else:
                 print(f"⚠️  Warning: Could not initialize GCS client. Skipping upload to levante-assets-draft.")
         except Exception as e:
-            print(f"⚠️  Warning: Failed to upload to GCS: {e}. File saved locally.")
+            print(f"⚠️  Warning: Failed to queue GCS upload: {e}. File saved locally.")
     else:
         print(f"⚠️  Warning: GCS not available. File saved locally only.")
 
-    if masterData is not None:
-        # write as we go, so erroring out doesn't lose progress
-        # Translated, so we can save it to a master sheet
-        masterData.to_csv("translation_master.csv", index=False)
     # finished with the if statement        
     return 'Success'    
 
+
+def resolve_master_column(columns, lang_code):
+    """
+    Return the master-cache column that holds ``lang_code``.
+
+    Older master files used different locale codes; when ``lang_code`` has no
+    column of its own but its legacy equivalent does, that column is used.
+    """
+    # Handle column format mismatch - masterData might have old column names
+    # Map simplified codes to old codes for backward compatibility
+    old_lang_codes = {
+        conf.LANGUAGE_CODES['English']: 'en-US',
+        'es': 'es-CO',
+        conf.LANGUAGE_CODES['German']: 'de-DE',
+        'fr': 'fr-CA',
+        conf.LANGUAGE_CODES['Dutch']: 'nl-NL'
+    }
+    if lang_code not in columns:
+        # Try the old format
+        old_lang_code = old_lang_codes.get(lang_code, lang_code)
+        if old_lang_code in columns:
+            return old_lang_code
+    return lang_code
+
+def update_master(masterData, item_id, lang_code, text, service="", voice="", model_id=""):
+    """
+    Record a generated clip in the master cache.
+
+    ``masterData`` is either a ``MasterStore`` (single-row upsert; the CSV is
+    exported at the end of the run) or a legacy DataFrame (updated in place
+    and written to translation_master.csv straight away).
+    """
+    with _MASTER_LOCK:
+        columns = masterData.columns() if isinstance(masterData, MasterStore) else masterData.columns
+        master_lang_col = resolve_master_column(columns, lang_code)
+
+        if isinstance(masterData, MasterStore):
+            masterData.upsert(item_id, master_lang_col, text, voice=voice, service=service, model_id=model_id)
+            return
+
+        if master_lang_col not in masterData.columns:
+            # Add the new column if neither exists
+            masterData[master_lang_col] = None
+        masterData[master_lang_col] = \
+            np.where(masterData["item_id"] == item_id, \
+            text, masterData[master_lang_col])
+
+        # write as we go, so erroring out doesn't lose progress
+        masterData.to_csv("translation_master.csv", index=False)
+
 def normalize_language_columns(df):
     """
     Convert language column names from underscore to hyphen format.
@@ -3,12 +3,16 @@ import json
 import os
 import shutil
 import subprocess
+import sys
 import tempfile
+import textwrap
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Set, TextIO
 
-from .validator import validate_audio_file, validate_many
+from .metrics import MEANING_BATCH_SIZE
+from .transcript_cache import DEFAULT_CACHE_PATH, TranscriptCache
+from .validator import ValidationSession
 
 # Repo root (parent of validate_audio/)
 _REPO_ROOT = Path(__file__).resolve().parent.parent
@@ -104,6 +108,60 @@ def _publish_validation_file(local_path: Path) -> bool:
     return True
 
 
+def _stream_path_for(out_path: Path) -> Path:
+    """JSONL file results are streamed to: the output itself, or ``<name>.partial.jsonl`` beside it."""
+    if out_path.suffix.lower() == ".jsonl":
+        return out_path
+    return out_path.with_name(f"{out_path.stem}.partial.jsonl")
+
+
+def _load_completed(stream_path: Path) -> Set[str]:
+    """Audio paths already present in a results stream.
+
+    A torn last line (crash mid-write) is cut off so appending resumes on a
+    clean line.
+    """
+    done: Set[str] = set()
+    if not stream_path.exists():
+        return done
+    good_bytes = 0
+    with stream_path.open("rb") as f:
+        for raw in f:
+            if not raw.endswith(b"\n"):
+                break
+            try:
+                record = json.loads(raw)
+            except ValueError:
+                break
+            good_bytes += len(raw)
+            if isinstance(record, dict) and record.get("audio_path"):
+                done.add(str(Path(record["audio_path"])))
+    if good_bytes != stream_path.stat().st_size:
+        with stream_path.open("r+b") as f:
+            f.truncate(good_bytes)
+    return done
+
+
+def _write_json_from_jsonl(stream_path: Path, handle: TextIO, single: bool, indent: Optional[int]) -> None:
+    """Write the stream as a JSON list (or one object when ``single``), one record in memory at a time."""
+    with stream_path.open("r", encoding="utf-8") as f:
+        records = (json.loads(line) for line in f if line.strip())
+        if single:
+            first = next(records, None)
+            json.dump(first, handle, ensure_ascii=False, indent=indent)
+            return
+        handle.write("[")
+        count = 0
+        for record in records:
+            text = json.dumps(record, ensure_ascii=False, indent=indent)
+            if indent is None:
+                handle.write((", " if count else "") + text)
+            else:
+                handle.write(("," if count else "") + "\n" + textwrap.indent(text, " " * indent))
+            count += 1
+        handle.write("\n]" if indent is not None and count else "]")
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     parser = argparse.ArgumentParser(description="Validate audio against expected text using ASR and metrics.")
     parser.add_argument("inputs", nargs="+", help="Audio files, directories, or globs (e.g., 'data/*.mp3')")
@@ -114,6 +172,11 @@ def main(argv: Optional[List[str]] = None) -> int:
     parser.add_argument("--model-size", default="base", help="Whisper model size (tiny, base, small, medium, large)")
     parser.add_argument("--no-quality", action="store_true", help="Skip audio quality assessment.")
     parser.add_argument("--output", help="Path to write results as JSON (list) or JSONL if ends with .jsonl")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip files already in the output's JSONL stream (the .jsonl output, or <name>.partial.jsonl for JSON)",
+    )
     parser.add_argument(
         "--web-dashboard",
         action="store_true",
@@ -121,6 +184,22 @@ def main(argv: Optional[List[str]] = None) -> int:
     )
     parser.add_argument("--pretty", action="store_true", help="Pretty-print JSON to stdout")
     parser.add_argument("--progress", action="store_true", help="Print progress while validating many files")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse stored transcripts/quality for clips whose content is unchanged (keyed by MD5, backend, model size, language)",
+    )
+    parser.add_argument(
+        "--transcript-cache",
+        default=DEFAULT_CACHE_PATH,
+        help=f"SQLite transcript store used by --incremental (default: {DEFAULT_CACHE_PATH})",
+    )
+    parser.add_argument(
+        "--meaning-batch-size",
+        type=int,
+        default=MEANING_BATCH_SIZE,
+        help=f"Files per batched meaning-similarity encode (default: {MEANING_BATCH_SIZE})",
+    )
     parser.add_argument(
         "--skip-publish",
         action="store_true",
@@ -135,34 +214,20 @@ def main(argv: Optional[List[str]] = None) -> int:
         return 2
 
     include_quality = not args.no_quality
+    session = ValidationSession(
+        language=args.language,
+        backend=args.backend,
+        model_size=args.model_size,
+        include_quality=include_quality,
+        id3_preferred_key=args.id3_key,
+        transcript_cache=TranscriptCache(args.transcript_cache) if args.incremental else None,
+        meaning_batch_size=args.meaning_batch_size,
+    )
 
-    if len(audio_paths) == 1:
-        result = validate_audio_file(
-            audio_file_path=audio_paths[0],
-            expected_text=args.expected,
-            language=args.language,
-            backend=args.backend,
-            model_size=args.model_size,
-            include_quality=include_quality,
-            id3_preferred_key=args.id3_key,
-        )
-        results = [result]
-    else:
-        if args.progress:
-            print(f"Validating {len(audio_paths)} files...", flush=True)
-        results = validate_many(
-            audio_paths=audio_paths,
-            expected_texts=[args.expected] * len(audio_paths) if args.expected else None,
-            language=args.language,
-            backend=args.backend,
-            model_size=args.model_size,
-            include_quality=include_quality,
-            id3_preferred_key=args.id3_key,
-            progress=args.progress,
-        )
-
+    # Results are streamed to a JSONL sink as each file finishes, so memory
+    # stays flat and a crash keeps everything validated so far. JSON outputs
+    # (dashboard, --output *.json, stdout) are built from the stream at the end.
     out_path: Optional[Path] = None
-
     if args.web_dashboard:
         # Save to sibling repo ../levante-web-dashboard/public/data/
         date_str = datetime.now().strftime("%b-%d-%Y")  # e.g., Oct-07-2025
@@ -170,20 +235,60 @@ def main(argv: Optional[List[str]] = None) -> int:
         out_name = f"validation-{lang}-{date_str}.json"
         out_path = _DASHBOARD_VALIDATION_DIR / out_name
         out_path.parent.mkdir(parents=True, exist_ok=True)
-        with out_path.open("w", encoding="utf-8") as f:
-            json.dump(results if len(audio_paths) > 1 else results[0], f, ensure_ascii=False, indent=2)
-        print(f"Results saved to: {out_path}")
     elif args.output:
         out_path = Path(args.output)
-        if out_path.suffix.lower() == ".jsonl":
-            with out_path.open("w", encoding="utf-8") as f:
-                for r in results:
-                    f.write(json.dumps(r, ensure_ascii=False) + "\n")
-        else:
-            with out_path.open("w", encoding="utf-8") as f:
-                json.dump(results if len(audio_paths) > 1 else results[0], f, ensure_ascii=False, indent=2 if args.pretty else None)
+
+    temp_dir: Optional[tempfile.TemporaryDirectory] = None
+    if out_path is None:
+        if args.resume:
+            print("⚠️  --resume needs --output or --web-dashboard; validating everything.", file=sys.stderr)
+        temp_dir = tempfile.TemporaryDirectory()
+        stream_path = Path(temp_dir.name) / "results.jsonl"
     else:
-        print(json.dumps(results if len(audio_paths) > 1 else results[0], ensure_ascii=False, indent=2 if args.pretty else None))
+        stream_path = _stream_path_for(out_path)
+
+    done = _load_completed(stream_path) if args.resume else set()
+    todo = [p for p in audio_paths if str(Path(p)) not in done]
+    if args.resume:
+        print(f"[resume] {len(audio_paths) - len(todo)} already validated, {len(todo)} remaining", file=sys.stderr, flush=True)
+
+    if args.progress and len(todo) > 1:
+        print(f"Validating {len(todo)} files...", flush=True)
+    with stream_path.open("a" if args.resume else "w", encoding="utf-8") as sink:
+        if len(audio_paths) == 1:
+            results = (session.validate(p, expected_text=args.expected) for p in todo)
+        else:
+            results = session.iter_validate(
+                todo,
+                expected_texts=[args.expected] * len(todo) if args.expected else None,
+                progress=args.progress,
+            )
+        for result in results:
+            sink.write(json.dumps(result, ensure_ascii=False) + "\n")
+            sink.flush()
+
+    if args.incremental:
+        # stderr keeps stdout clean for the JSON printed below
+        print(
+            f"[incremental] {session.cache_hits} cached transcripts, {session.transcribed} fresh transcriptions",
+            file=sys.stderr,
+            flush=True,
+        )
+
+    single = len(audio_paths) == 1
+    if out_path is None:
+        _write_json_from_jsonl(stream_path, sys.stdout, single=single, indent=2 if args.pretty else None)
+        sys.stdout.write("\n")
+        temp_dir.cleanup()
+    elif out_path != stream_path:
+        tmp_path = out_path.with_name(out_path.name + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            indent = 2 if args.web_dashboard or args.pretty else None
+            _write_json_from_jsonl(stream_path, f, single=single, indent=indent)
+        os.replace(tmp_path, out_path)
+        stream_path.unlink()
+        if args.web_dashboard:
+            print(f"Results saved to: {out_path}")
 
     if args.web_dashboard and out_path and not args.skip_publish:
         _publish_validation_file(out_path)
@@ -1,13 +1,72 @@
 import re
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Sequence, Tuple
 from difflib import SequenceMatcher
 import warnings
 
+import numpy as np
+
+from .transcript_cache import TextEmbeddingCache
+
 # Suppress BLEU score warnings for short texts (common in audio validation)
 warnings.filterwarnings("ignore", message=".*BLEU score evaluates to 0.*")
 warnings.filterwarnings("ignore", message=".*counts of.*gram overlaps.*")
 
 
+# Regexes are compiled once at import instead of on every call
+_POSSESSIVE_RE = re.compile(r"(\w)'s\b")
+_APOSTROPHE_RE = re.compile(r"(\w)'(\w)")
+_HYPHEN_RE = re.compile(r'(\w)-(\w)')
+_PUNCT_RE = re.compile(r'[,;:!?]+')
+_PERIODS_RE = re.compile(r'\.+')
+_SPACE_RE = re.compile(r'\s+')
+_NON_WORD_RE = re.compile(r'[^\w]')
+
+# Phonetic normalization rules, applied in order
+_PHONETIC_RULES = [(re.compile(pattern), replacement) for pattern, replacement in [
+    # Remove spaces and hyphens for compound word matching
+    (r'[\s\-]', ''),
+    # German umlaut normalization
+    (r'ä', 'a'),
+    (r'ö', 'o'),
+    (r'ü', 'u'),
+    (r'ß', 'ss'),
+    # Common spelling variations (double letters and endings)
+    (r'tte', 'tt'),  # omelette -> omelett
+    (r'tt', 't'),    # omelett -> omelet
+    (r'lle', 'll'),  # belle -> bell
+    (r'll', 'l'),    # bell -> bel
+    (r'sse', 'ss'),  # classe -> class
+    (r'ss', 's'),    # class -> clas
+    (r'nne', 'nn'),  # bonne -> bonn
+    (r'nn', 'n'),    # bonn -> bon
+    (r'mme', 'mm'),  # pomme -> pomm
+    (r'mm', 'm'),    # pomm -> pom
+    # Basic phonetic patterns (can be enhanced with phonetic libraries)
+    (r'ph', 'f'),
+    (r'ck', 'k'),
+    (r'qu', 'kw'),
+    (r'x', 'ks'),
+    (r'c([ei])', r's\1'),  # ce, ci -> se, si
+    (r'g([ei])', r'j\1'),  # ge, gi -> je, ji
+]]
+
+
+@lru_cache(maxsize=65536)
+def _clean_word_for_matching(word: str) -> str:
+    """Lowercase a word and strip punctuation."""
+    return _NON_WORD_RE.sub('', word.lower())
+
+
+@lru_cache(maxsize=65536)
+def _phonetic_key(word: str) -> str:
+    """Apply basic phonetic normalization"""
+    normalized = word.lower()
+    for pattern, replacement in _PHONETIC_RULES:
+        normalized = pattern.sub(replacement, normalized)
+    return normalized
+
+
 def preprocess_text_for_comparison(text: str) -> str:
     """
     Normalize text for better similarity comparison by handling common transcription variations
@@ -16,16 +75,16 @@ def preprocess_text_for_comparison(text: str) -> str:
     text = text.lower()
     
     # Normalize possessives (Mika's -> Mikas, etc.)
-    text = re.sub(r"(\w)'s\b", r"\1s", text)
-    text = re.sub(r"(\w)'(\w)", r"\1\2", text)  # Handle other apostrophes
+    text = _POSSESSIVE_RE.sub(r"\1s", text)
+    text = _APOSTROPHE_RE.sub(r"\1\2", text)  # Handle other apostrophes
     
     # Normalize hyphens in compound words (medium-sized -> medium sized)
-    text = re.sub(r'(\w)-(\w)', r'\1 \2', text)
+    text = _HYPHEN_RE.sub(r'\1 \2', text)
     
     # Remove extra punctuation and normalize whitespace
-    text = re.sub(r'[,;:!?]+', ' ', text)  # Replace punctuation with spaces
-    text = re.sub(r'\.+', '.', text)  # Normalize multiple periods
-    text = re.sub(r'\s+', ' ', text)  # Normalize whitespace
+    text = _PUNCT_RE.sub(' ', text)  # Replace punctuation with spaces
+    text = _PERIODS_RE.sub('.', text)  # Normalize multiple periods
+    text = _SPACE_RE.sub(' ', text)  # Normalize whitespace
     
     # Remove leading/trailing whitespace
     text = text.strip()
@@ -80,59 +139,16 @@ def advanced_similarity_with_phonetics(original_text: str, transcribed_text: str
     phonetic_matches = []
     mismatched_words = []
     
-    # Simple phonetic similarity patterns (can be enhanced with phonetic libraries)
-    phonetic_patterns = {
-        r'ph': 'f',
-        r'ck': 'k',
-        r'qu': 'kw',
-        r'x': 'ks',
-        r'c([ei])': r's\1',  # ce, ci -> se, si
-        r'g([ei])': r'j\1',  # ge, gi -> je, ji
-    }
-    
-    def apply_phonetic_normalization(word):
-        """Apply basic phonetic normalization"""
-        normalized = word.lower()
-        
-        # Remove spaces and hyphens for compound word matching
-        normalized = re.sub(r'[\s\-]', '', normalized)
-        
-        # German umlaut normalization
-        normalized = re.sub(r'ä', 'a', normalized)
-        normalized = re.sub(r'ö', 'o', normalized)
-        normalized = re.sub(r'ü', 'u', normalized)
-        normalized = re.sub(r'ß', 'ss', normalized)
-        
-        # Common spelling variations (double letters and endings)
-        normalized = re.sub(r'tte', 'tt', normalized)  # omelette -> omelett
-        normalized = re.sub(r'tt', 't', normalized)    # omelett -> omelet
-        normalized = re.sub(r'lle', 'll', normalized)  # belle -> bell
-        normalized = re.sub(r'll', 'l', normalized)    # bell -> bel
-        normalized = re.sub(r'sse', 'ss', normalized)  # classe -> class
-        normalized = re.sub(r'ss', 's', normalized)    # class -> clas
-        normalized = re.sub(r'nne', 'nn', normalized)  # bonne -> bonn
-        normalized = re.sub(r'nn', 'n', normalized)    # bonn -> bon
-        normalized = re.sub(r'mme', 'mm', normalized)  # pomme -> pomm
-        normalized = re.sub(r'mm', 'm', normalized)    # pomm -> pom
-        
-        # Basic phonetic patterns
-        for pattern, replacement in phonetic_patterns.items():
-            normalized = re.sub(pattern, replacement, normalized)
-        return normalized
-    
     # Compare words with fuzzy matching
     for i, orig_word in enumerate(orig_words):
         best_match = None
         best_score = 0
         
         # Clean word for comparison (remove punctuation, normalize case)
-        def clean_word_for_matching(word):
-            return re.sub(r'[^\w]', '', word.lower())
-        
-        orig_clean_word = clean_word_for_matching(orig_word)
+        orig_clean_word = _clean_word_for_matching(orig_word)
         
         for trans_word in trans_words:
-            trans_clean_word = clean_word_for_matching(trans_word)
+            trans_clean_word = _clean_word_for_matching(trans_word)
             
             # Exact match (case-insensitive, punctuation-insensitive)
             if orig_clean_word == trans_clean_word:
@@ -147,8 +163,8 @@ def advanced_similarity_with_phonetics(original_text: str, transcribed_text: str
                 best_match = (trans_word, fuzzy_score, "fuzzy")
             
             # Phonetic similarity on cleaned words
-            orig_phonetic = apply_phonetic_normalization(orig_clean_word)
-            trans_phonetic = apply_phonetic_normalization(trans_clean_word)
+            orig_phonetic = _phonetic_key(orig_clean_word)
+            trans_phonetic = _phonetic_key(trans_clean_word)
             phonetic_score = SequenceMatcher(None, orig_phonetic, trans_phonetic).ratio()
             
             if phonetic_score > 0.8 and phonetic_score > best_score:
@@ -233,36 +249,7 @@ def validate_elevenlabs_audio(expected_text: str, transcribed_text: str, languag
     """
     Comprehensive audio validation for ElevenLabs generated content
     """
-    # Step 1: Advanced similarity with phonetic awareness
-    similarity_results = advanced_similarity_with_phonetics(expected_text, transcribed_text)
-    
-    # Step 2: Calculate Word Error Rate on cleaned text
-    wer_score = None
-    try:
-        import jiwer  # type: ignore
-        wer_score = jiwer.wer(similarity_results["original_cleaned"], 
-                             similarity_results["transcribed_cleaned"])
-    except Exception:
-        wer_score = 1.0  # Fallback to worst case if jiwer unavailable
-    
-    # Step 3: Determine validation status
-    validation_status = determine_validation_status(similarity_results, wer_score)
-    
-    return {
-        "transcribed_text": transcribed_text,
-        "similarity_score": similarity_results["similarity_ratio"],
-        "word_level_similarity": similarity_results["word_level_similarity"],
-        "perfect_matches": similarity_results["perfect_matches"],
-        "phonetic_matches": similarity_results["phonetic_matches"],
-        "total_words": similarity_results["total_words"],
-        "mismatched_words": similarity_results["mismatched_words"],
-        "word_error_rate": wer_score,
-        "validation_passed": validation_status["passed"],
-        "validation_level": validation_status["level"],
-        "recommendations": validation_status["recommendations"],
-        "original_cleaned": similarity_results["original_cleaned"],
-        "transcribed_cleaned": similarity_results["transcribed_cleaned"]
-    }
+    return get_metrics_engine().elevenlabs_many([(expected_text, transcribed_text)], language)[0]
 
 
 def compute_basic_metrics(expected_text: str, transcribed_text: str) -> Dict[str, Any]:
@@ -270,30 +257,7 @@ def compute_basic_metrics(expected_text: str, transcribed_text: str) -> Dict[str
 
     Returns keys: similarity_ratio, word_error_rate, word_overlap, words_matched, total_unique_words
     """
-    expected_norm = (expected_text or "").strip()
-    transcribed_norm = (transcribed_text or "").strip()
-
-    # Use robust similarity comparison instead of basic SequenceMatcher
-    similarity_results = robust_similarity_comparison(expected_norm, transcribed_norm)
-
-    # Calculate Word Error Rate on cleaned texts (more accurate)
-    wer_score = None
-    try:
-        import jiwer  # type: ignore
-        wer_score = jiwer.wer(similarity_results["original_cleaned"], 
-                             similarity_results["transcribed_cleaned"])
-    except Exception:
-        pass
-
-    return {
-        "similarity_ratio": similarity_results["similarity_ratio"],  # This will now be much more accurate
-        "word_error_rate": wer_score,
-        "word_overlap": similarity_results["word_overlap"],
-        "words_matched": similarity_results["words_matched"],
-        "total_unique_words": similarity_results["total_unique_words"],
-        "original_cleaned": similarity_results["original_cleaned"],
-        "transcribed_cleaned": similarity_results["transcribed_cleaned"],
-    }
+    return get_metrics_engine().basic_many([(expected_text, transcribed_text)])[0]
 
 
 def _ensure_nltk_resource(resource: str) -> None:
@@ -315,73 +279,295 @@ def comprehensive_text_similarity(original_text: str, transcribed_text: str) ->
     Returns keys: fuzzy_ratio, fuzzy_token_ratio, rouge_1_f, rouge_l_f, bleu_score, overall_similarity
     Some metrics may be None if optional dependencies or resources are unavailable.
     """
-    original_norm = (original_text or "").strip()
-    transcribed_norm = (transcribed_text or "").strip()
+    return get_metrics_engine().comprehensive_many([(original_text, transcribed_text)])[0]
 
-    # Use preprocessed text for all comparisons
-    orig_clean = preprocess_text_for_comparison(original_norm)
-    trans_clean = preprocess_text_for_comparison(transcribed_norm)
 
-    # Fuzzy ratios on cleaned text
-    try:
-        from rapidfuzz import fuzz  # type: ignore
-
-        fuzzy_ratio = fuzz.ratio(orig_clean, trans_clean) / 100.0
-        fuzzy_token_ratio = fuzz.token_sort_ratio(orig_clean, trans_clean) / 100.0
-    except Exception:
-        fuzzy_ratio = None
-        fuzzy_token_ratio = None
-
-    # ROUGE on cleaned text
-    rouge_1_f = None
-    rouge_l_f = None
-    try:
-        from rouge import Rouge  # type: ignore
-
-        rouge = Rouge()
-        scores = rouge.get_scores(trans_clean, orig_clean)[0]
-        rouge_1_f = scores.get("rouge-1", {}).get("f")
-        rouge_l_f = scores.get("rouge-l", {}).get("f")
-    except Exception:
-        pass
+# ----------------------------
+# Bulk metrics engine
+# ----------------------------
+WER_CHUNK_PAIRS = 1024
 
-    # BLEU on cleaned text (using lower n-gram order for better performance and accuracy)
-    bleu_score = None
-    try:
-        _ensure_nltk_resource("tokenizers/punkt")
-        from nltk.translate.bleu_score import sentence_bleu, SmoothingFunction  # type: ignore
 
-        reference_tokens = [orig_clean.split()]
-        candidate_tokens = trans_clean.split()
-        
-        # Use smoothing function and lower n-gram order for better results with short texts
-        smoothing = SmoothingFunction().method1
-        bleu_score = sentence_bleu(reference_tokens, candidate_tokens, 
-                                 smoothing_function=smoothing,
-                                 weights=(0.5, 0.5))  # Only use 1-gram and 2-gram
-    except Exception:
-        pass
+def word_error_rates(references: Sequence[str], hypotheses: Sequence[str]) -> np.ndarray:
+    """Word error rate for many (reference, hypothesis) pairs at once.
 
-    # Overall similarity: average available components
-    components = [c for c in [fuzzy_ratio, rouge_1_f, bleu_score] if c is not None]
-    overall_similarity = sum(components) / len(components) if components else None
+    Words are mapped to integer ids and the Levenshtein table is filled one
+    reference word at a time for a whole chunk of pairs, so the Python loop runs
+    over the longest reference rather than over every cell of every pair.
+    Matches ``jiwer.wer`` for non-empty references; pairs with an empty
+    reference get NaN (jiwer raises for those).
+    """
+    n = len(references)
+    rates = np.full(n, np.nan)
+    vocab: Dict[str, int] = {}
+    ref_ids = [[vocab.setdefault(w, len(vocab)) for w in r.split()] for r in references]
+    hyp_ids = [[vocab.setdefault(w, len(vocab)) for w in h.split()] for h in hypotheses]
+    ref_len = np.fromiter((len(r) for r in ref_ids), dtype=np.int64, count=n)
+    hyp_len = np.fromiter((len(h) for h in hyp_ids), dtype=np.int64, count=n)
+
+    # Similar lengths share a chunk so padding stays small
+    order = np.argsort(ref_len + hyp_len, kind="stable")
+    for start in range(0, n, WER_CHUNK_PAIRS):
+        chunk = order[start:start + WER_CHUNK_PAIRS]
+        chunk = chunk[ref_len[chunk] > 0]
+        if len(chunk) == 0:
+            continue
+        r_len, h_len = ref_len[chunk], hyp_len[chunk]
+        max_r, max_h = int(r_len.max()), int(h_len.max())
+        refs = np.full((len(chunk), max_r), -1, dtype=np.int64)
+        hyps = np.full((len(chunk), max_h), -2, dtype=np.int64)
+        for row, idx in enumerate(chunk):
+            refs[row, :r_len[row]] = ref_ids[idx]
+            hyps[row, :h_len[row]] = hyp_ids[idx]
+
+        cols = np.arange(max_h + 1)
+        prev = np.tile(cols, (len(chunk), 1))
+        distance = np.zeros(len(chunk), dtype=np.int64)
+        for i in range(1, max_r + 1):
+            cur = np.empty_like(prev)
+            cur[:, 0] = i
+            # Deletion or substitution/match from the previous row
+            cur[:, 1:] = np.minimum(prev[:, 1:] + 1, prev[:, :-1] + (hyps != refs[:, i - 1:i]))
+            # Insertions chain left to right: cur[j] = min over k <= j of cur[k] + (j - k)
+            cur = np.minimum.accumulate(cur - cols, axis=1) + cols
+            done = r_len == i
+            distance[done] = cur[done, h_len[done]]
+            prev = cur
+        rates[chunk] = distance / r_len
+    return rates
+
+
+def word_overlaps(references: Sequence[str], hypotheses: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Shared and total unique words for many pairs at once.
+
+    Returns ``(matched, union)`` integer arrays; the Jaccard overlap is
+    ``matched / union``. Each unique word of a pair is one ``pair * V + word``
+    key tagged 1 (reference) or 2 (hypothesis); keys whose tags sum to 3 are
+    shared.
+    """
+    n = len(references)
+    vocab: Dict[str, int] = {}
+    keys: List[int] = []
+    sides: List[int] = []
+    for texts, side in ((references, 1), (hypotheses, 2)):
+        for pair, text in enumerate(texts):
+            for word in set(text.split()):
+                keys.append(pair)
+                keys.append(vocab.setdefault(word, len(vocab)))
+                sides.append(side)
+    if not sides:
+        return np.zeros(n, dtype=np.int64), np.zeros(n, dtype=np.int64)
+    pair_word = np.array(keys, dtype=np.int64).reshape(-1, 2)
+    combined = pair_word[:, 0] * len(vocab) + pair_word[:, 1]
+    unique_keys, inverse = np.unique(combined, return_inverse=True)
+    tag = np.bincount(inverse, weights=np.array(sides, dtype=np.float64))
+    key_pair = unique_keys // len(vocab)
+    union = np.bincount(key_pair, minlength=n)
+    matched = np.bincount(key_pair[tag == 3], minlength=n)
+    return matched, union
+
+
+class MetricsEngine:
+    """Text metrics with optional backends resolved once and bulk scoring.
+
+    rapidfuzz, rouge, NLTK BLEU and jiwer used to be re-imported (and ``Rouge()``
+    rebuilt, the NLTK resource re-checked) for every clip. The engine looks them
+    up on first use and keeps them; each pair is preprocessed once for all three
+    metric families, and WER / word overlap are computed for a whole list of
+    pairs with :func:`word_error_rates` and :func:`word_overlaps`.
+
+    Results are identical to the previous per-call functions, which now wrap a
+    shared engine (see :func:`get_metrics_engine`).
+    """
 
-    return {
-        "fuzzy_ratio": fuzzy_ratio,
-        "fuzzy_token_ratio": fuzzy_token_ratio,
-        "rouge_1_f": rouge_1_f,
-        "rouge_l_f": rouge_l_f,
-        "bleu_score": bleu_score,
-        "overall_similarity": overall_similarity,
-    }
+    def __init__(self) -> None:
+        self._fuzz = None
+        self._rouge = None
+        self._bleu = None
+        self._has_jiwer: Optional[bool] = None
+        self._loaded = False
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            from rapidfuzz import fuzz  # type: ignore
+            self._fuzz = fuzz
+        except Exception:
+            self._fuzz = None
+        try:
+            from rouge import Rouge  # type: ignore
+            self._rouge = Rouge()
+        except Exception:
+            self._rouge = None
+        try:
+            _ensure_nltk_resource("tokenizers/punkt")
+            from nltk.translate.bleu_score import sentence_bleu, SmoothingFunction  # type: ignore
+            self._bleu = (sentence_bleu, SmoothingFunction().method1)
+        except Exception:
+            self._bleu = None
+        try:
+            import jiwer  # type: ignore  # noqa: F401
+            self._has_jiwer = True
+        except Exception:
+            self._has_jiwer = False
+
+    @staticmethod
+    def _cleaned(pairs: Sequence[Tuple[str, str]]) -> Tuple[List[str], List[str]]:
+        originals = [preprocess_text_for_comparison((e or "").strip()) for e, _ in pairs]
+        transcribed = [preprocess_text_for_comparison((t or "").strip()) for _, t in pairs]
+        return originals, transcribed
+
+    def _word_error_rates(self, originals: List[str], transcribed: List[str]) -> List[Optional[float]]:
+        """WER per pair, ``None`` where jiwer would not give one."""
+        self._load()
+        if not self._has_jiwer:
+            return [None] * len(originals)
+        return [None if np.isnan(r) else float(r) for r in word_error_rates(originals, transcribed)]
+
+    def basic_many(self, pairs: Sequence[Tuple[str, str]], cleaned=None) -> List[Dict[str, Any]]:
+        """:func:`compute_basic_metrics` for every ``(expected, transcribed)`` pair."""
+        originals, transcribed = cleaned or self._cleaned(pairs)
+        wers = self._word_error_rates(originals, transcribed)
+        matched, union = word_overlaps(originals, transcribed)
+        results = []
+        for i, (orig_clean, trans_clean) in enumerate(zip(originals, transcribed)):
+            results.append({
+                "similarity_ratio": SequenceMatcher(None, orig_clean, trans_clean).ratio(),
+                "word_error_rate": wers[i],
+                "word_overlap": int(matched[i]) / int(union[i]) if union[i] else 0,
+                "words_matched": int(matched[i]),
+                "total_unique_words": int(union[i]),
+                "original_cleaned": orig_clean,
+                "transcribed_cleaned": trans_clean,
+            })
+        return results
+
+    def comprehensive_many(self, pairs: Sequence[Tuple[str, str]], cleaned=None) -> List[Dict[str, Any]]:
+        """:func:`comprehensive_text_similarity` for every ``(original, transcribed)`` pair."""
+        self._load()
+        originals, transcribed = cleaned or self._cleaned(pairs)
+        results = []
+        for orig_clean, trans_clean in zip(originals, transcribed):
+            fuzzy_ratio = fuzzy_token_ratio = None
+            if self._fuzz is not None:
+                try:
+                    fuzzy_ratio = self._fuzz.ratio(orig_clean, trans_clean) / 100.0
+                    fuzzy_token_ratio = self._fuzz.token_sort_ratio(orig_clean, trans_clean) / 100.0
+                except Exception:
+                    fuzzy_ratio = fuzzy_token_ratio = None
+
+            rouge_1_f = rouge_l_f = None
+            if self._rouge is not None:
+                try:
+                    scores = self._rouge.get_scores(trans_clean, orig_clean)[0]
+                    rouge_1_f = scores.get("rouge-1", {}).get("f")
+                    rouge_l_f = scores.get("rouge-l", {}).get("f")
+                except Exception:
+                    pass
+
+            # BLEU with 1- and 2-grams only and smoothing, for short texts
+            bleu_score = None
+            if self._bleu is not None:
+                sentence_bleu, smoothing = self._bleu
+                try:
+                    bleu_score = sentence_bleu([orig_clean.split()], trans_clean.split(),
+                                               smoothing_function=smoothing, weights=(0.5, 0.5))
+                except Exception:
+                    pass
+
+            # Overall similarity: average available components
+            components = [c for c in [fuzzy_ratio, rouge_1_f, bleu_score] if c is not None]
+            results.append({
+                "fuzzy_ratio": fuzzy_ratio,
+                "fuzzy_token_ratio": fuzzy_token_ratio,
+                "rouge_1_f": rouge_1_f,
+                "rouge_l_f": rouge_l_f,
+                "bleu_score": bleu_score,
+                "overall_similarity": sum(components) / len(components) if components else None,
+            })
+        return results
+
+    def elevenlabs_many(self, pairs: Sequence[Tuple[str, str]], language: str = None) -> List[Dict[str, Any]]:
+        """:func:`validate_elevenlabs_audio` for every ``(expected, transcribed)`` pair."""
+        self._load()
+        similarities = [advanced_similarity_with_phonetics(e, t) for e, t in pairs]
+        wers = self._word_error_rates(
+            [s["original_cleaned"] for s in similarities],
+            [s["transcribed_cleaned"] for s in similarities],
+        )
+        results = []
+        for (_, transcribed_text), similarity_results, wer_score in zip(pairs, similarities, wers):
+            if wer_score is None:
+                wer_score = 1.0  # Fallback to worst case if jiwer unavailable
+            validation_status = determine_validation_status(similarity_results, wer_score)
+            results.append({
+                "transcribed_text": transcribed_text,
+                "similarity_score": similarity_results["similarity_ratio"],
+                "word_level_similarity": similarity_results["word_level_similarity"],
+                "perfect_matches": similarity_results["perfect_matches"],
+                "phonetic_matches": similarity_results["phonetic_matches"],
+                "total_words": similarity_results["total_words"],
+                "mismatched_words": similarity_results["mismatched_words"],
+                "word_error_rate": wer_score,
+                "validation_passed": validation_status["passed"],
+                "validation_level": validation_status["level"],
+                "recommendations": validation_status["recommendations"],
+                "original_cleaned": similarity_results["original_cleaned"],
+                "transcribed_cleaned": similarity_results["transcribed_cleaned"],
+            })
+        return results
+
+    def score_many(self, pairs: Sequence[Tuple[str, str]], language: str = None) -> List[Dict[str, Any]]:
+        """All text metrics for every ``(expected, transcribed)`` pair.
+
+        Returns one dict per pair with ``basic_metrics``, ``comprehensive_metrics``
+        and ``elevenlabs_validation`` (the same keys validation results use).
+        """
+        cleaned = self._cleaned(pairs)
+        basic = self.basic_many(pairs, cleaned=cleaned)
+        comp = self.comprehensive_many(pairs, cleaned=cleaned)
+        elevenlabs = self.elevenlabs_many(pairs, language)
+        return [
+            {"basic_metrics": b, "comprehensive_metrics": c, "elevenlabs_validation": e}
+            for b, c, e in zip(basic, comp, elevenlabs)
+        ]
+
+
+_METRICS_ENGINE: Optional[MetricsEngine] = None
+
+
+def get_metrics_engine() -> MetricsEngine:
+    """Process-wide :class:`MetricsEngine` used by the per-pair functions."""
+    global _METRICS_ENGINE
+    if _METRICS_ENGINE is None:
+        _METRICS_ENGINE = MetricsEngine()
+    return _METRICS_ENGINE
 
 
 # ----------------------------
 # Meaning similarity (multilingual)
 # ----------------------------
+MEANING_MODEL_NAME = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+MEANING_BATCH_SIZE = 64
+
 _SBERT_MODEL = None  # Lazy singleton
 _SBERT_MODEL_NAME = None
 _SBERT_WARNED = False
+_EMBEDDING_CACHE: Optional[TextEmbeddingCache] = None
+
+
+def _get_embedding_cache() -> Optional[TextEmbeddingCache]:
+    """Default on-disk expected-text embedding store, opened on first use."""
+    global _EMBEDDING_CACHE
+    if _EMBEDDING_CACHE is None:
+        try:
+            _EMBEDDING_CACHE = TextEmbeddingCache()
+        except Exception as e:
+            print(f"[meaning] embedding cache unavailable: {e}", flush=True)
+            return None
+    return _EMBEDDING_CACHE
 
 
 def _get_sbert_model(model_name: str):
@@ -437,24 +623,80 @@ def _get_sbert_model(model_name: str):
             return None
 
 
-def crosslingual_meaning_similarity(text_a: str, text_b: str, model_name: str = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2") -> Optional[float]:
-    """
-    Compute cosine similarity between two sentences that may be in different languages.
-    Returns None if the model or dependency is unavailable.
-    """
-    try:
-        from sentence_transformers import util as st_util  # type: ignore
-    except Exception:
-        return None
+def _normalized_rows(vectors) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32).reshape(len(vectors), -1)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms > 0, norms, 1.0)
+
+
+def _encode_unique(model, texts: List[str], batch_size: int) -> np.ndarray:
+    return _normalized_rows(model.encode(
+        texts, batch_size=batch_size, convert_to_numpy=True, normalize_embeddings=True, show_progress_bar=False
+    ))
+
+
+def crosslingual_meaning_similarity_batch(
+    pairs: Sequence[Tuple[str, str]],
+    model_name: str = MEANING_MODEL_NAME,
+    batch_size: int = MEANING_BATCH_SIZE,
+    embedding_cache: Optional[TextEmbeddingCache] = None,
+    model: Any = None,
+) -> List[Optional[float]]:
+    """Cosine similarity for many ``(expected, transcribed)`` pairs, possibly in different languages.
 
-    model = _get_sbert_model(model_name)
+    Each distinct text is encoded once, ``batch_size`` sentences per forward
+    pass. Expected-text embeddings are read from and added to
+    ``embedding_cache`` (the default on-disk :class:`TextEmbeddingCache` when
+    not given), so a rerun over the same items only encodes the transcripts.
+
+    Args:
+        pairs: ``(expected_text, transcribed_text)`` tuples.
+        model_name: Sentence-transformer to load (``MEANING_MODEL`` env overrides).
+        batch_size: Sentences per encode call.
+        embedding_cache: Store for expected-text embeddings.
+        model: Pre-loaded model with a sentence-transformers ``encode``.
+
+    Returns:
+        One score per pair; all ``None`` if the model or dependency is unavailable.
+    """
+    if not pairs:
+        return []
     if model is None:
-        return None
+        model = _get_sbert_model(model_name)
+        model_name = _SBERT_MODEL_NAME or model_name
+    if model is None:
+        return [None] * len(pairs)
 
+    expected = [e or "" for e, _ in pairs]
+    transcribed = [t or "" for _, t in pairs]
     try:
-        embeddings = model.encode([text_a or "", text_b or ""], convert_to_tensor=True, normalize_embeddings=True)
-        # Cosine similarity of the two vectors (0 and 1)
-        sim = st_util.cos_sim(embeddings[0:1], embeddings[1:2])[0][0]
-        return float(sim.detach().cpu().item())
-    except Exception:
-        return None
+        if embedding_cache is None:
+            embedding_cache = _get_embedding_cache()
+        unique_expected = list(dict.fromkeys(expected))
+        expected_vecs: Dict[str, np.ndarray] = {}
+        if embedding_cache is not None:
+            expected_vecs = embedding_cache.get_many(model_name, unique_expected)
+        missing = [text for text in unique_expected if text not in expected_vecs]
+        if missing:
+            fresh = _encode_unique(model, missing, batch_size)
+            expected_vecs.update(zip(missing, fresh))
+            if embedding_cache is not None:
+                embedding_cache.put_many(model_name, missing, fresh)
+
+        unique_transcribed = list(dict.fromkeys(transcribed))
+        transcribed_vecs = dict(zip(unique_transcribed, _encode_unique(model, unique_transcribed, batch_size)))
+
+        left = _normalized_rows([expected_vecs[text] for text in expected])
+        right = _normalized_rows([transcribed_vecs[text] for text in transcribed])
+        return [float(score) for score in np.einsum("ij,ij->i", left, right)]
+    except Exception as exc:
+        print(f"[meaning] batch scoring failed: {exc}", flush=True)
+        return [None] * len(pairs)
+
+
+def crosslingual_meaning_similarity(text_a: str, text_b: str, model_name: str = MEANING_MODEL_NAME) -> Optional[float]:
+    """
+    Compute cosine similarity between two sentences that may be in different languages.
+    Returns None if the model or dependency is unavailable.
+    """
+    return crosslingual_meaning_similarity_batch([(text_a, text_b)], model_name=model_name)[0]
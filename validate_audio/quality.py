@@ -1,8 +1,26 @@
-from typing import Dict, Any, List
+from contextlib import nullcontext
+from typing import Dict, Any, List, Optional, Sequence
 
+import numpy as np
+
+CLAP_SAMPLE_RATE = 48000
+CLAP_MODEL_NAME = "laion/larger_clap_music_and_speech"
+
+QUALITY_PROMPTS: List[str] = [
+    "the sound is clear and clean",
+    "the audio has good quality",
+    "the speech is natural and fluent",
+]
+NOISE_PROMPTS: List[str] = [
+    "the sound is noisy and distorted",
+    "the audio has poor quality",
+    "the speech sounds robotic and unnatural",
+]
 
 _CLAP_MODEL = None
 _CLAP_PROCESSOR = None
+# Unit-norm text embeddings for QUALITY_PROMPTS + NOISE_PROMPTS, computed once per process
+_PROMPT_EMBEDS: Optional[np.ndarray] = None
 
 
 def _ensure_clap_model() -> None:
@@ -13,66 +31,97 @@ def _ensure_clap_model() -> None:
     from transformers import ClapModel, ClapProcessor  # type: ignore
 
     device = "cuda" if torch.cuda.is_available() else "cpu"
-    _CLAP_MODEL = ClapModel.from_pretrained("laion/larger_clap_music_and_speech").to(device)
-    _CLAP_PROCESSOR = ClapProcessor.from_pretrained("laion/larger_clap_music_and_speech")
+    _CLAP_MODEL = ClapModel.from_pretrained(CLAP_MODEL_NAME).to(device)
+    _CLAP_PROCESSOR = ClapProcessor.from_pretrained(CLAP_MODEL_NAME)
 
 
-def assess_audio_quality_with_clap(audio_file_path: str) -> Dict[str, Any]:
-    """Assess perceptual audio quality using CLAP similarity prompts.
+def _no_grad():
+    try:
+        import torch  # type: ignore
+    except ImportError:
+        return nullcontext()
+    return torch.no_grad()
 
-    Returns keys: quality_score, noise_score, quality_confidence
-    """
-    import torch  # type: ignore
-    import librosa  # type: ignore
 
+def _on_model_device(inputs) -> Any:
+    device = getattr(_CLAP_MODEL, "device", None)
+    if device is None or not hasattr(inputs, "to"):
+        return inputs
+    return inputs.to(device)
+
+
+def _unit_rows(features) -> np.ndarray:
+    if hasattr(features, "detach"):
+        features = features.detach().cpu().numpy()
+    arr = np.asarray(features, dtype=np.float32)
+    norms = np.linalg.norm(arr, axis=1, keepdims=True)
+    return arr / np.where(norms == 0, 1.0, norms)
+
+
+def prompt_embeddings() -> np.ndarray:
+    """Return the cached unit-norm CLAP text embeddings of all six prompts."""
+    global _PROMPT_EMBEDS
+    if _PROMPT_EMBEDS is None:
+        _ensure_clap_model()
+        inputs = _CLAP_PROCESSOR(text=QUALITY_PROMPTS + NOISE_PROMPTS, return_tensors="pt", padding=True)
+        with _no_grad():
+            _PROMPT_EMBEDS = _unit_rows(_CLAP_MODEL.get_text_features(**_on_model_device(inputs)))
+    return _PROMPT_EMBEDS
+
+
+def embed_audio(audios: Sequence[Any], sample_rate: int = CLAP_SAMPLE_RATE) -> np.ndarray:
+    """One CLAP audio forward pass for a batch of mono clips; returns unit-norm rows."""
     _ensure_clap_model()
+    inputs = _CLAP_PROCESSOR(audios=list(audios), return_tensors="pt", sampling_rate=sample_rate)
+    with _no_grad():
+        return _unit_rows(_CLAP_MODEL.get_audio_features(**_on_model_device(inputs)))
 
-    quality_prompts: List[str] = [
-        "the sound is clear and clean",
-        "the audio has good quality",
-        "the speech is natural and fluent",
-    ]
-    noise_prompts: List[str] = [
-        "the sound is noisy and distorted",
-        "the audio has poor quality",
-        "the speech sounds robotic and unnatural",
+
+def score_audio_embeddings(audio_embeds: np.ndarray, prompt_embeds: np.ndarray) -> List[Dict[str, Any]]:
+    """Score unit-norm audio embeddings against the prompt embeddings with one matrix product.
+
+    Returns one dict per clip with keys: quality_score, noise_score, quality_confidence
+    """
+    sims = np.asarray(audio_embeds, dtype=np.float32) @ np.asarray(prompt_embeds, dtype=np.float32).T
+    n_quality = len(QUALITY_PROMPTS)
+    quality = sims[:, :n_quality].mean(axis=1)
+    noise = sims[:, n_quality:].mean(axis=1)
+    return [
+        {
+            "quality_score": float(q),
+            "noise_score": float(n),
+            "quality_confidence": max(0.0, float(q - n)),
+        }
+        for q, n in zip(quality, noise)
     ]
 
-    audio_data, sample_rate = librosa.load(audio_file_path, sr=48000)
-
-    quality_scores: List[float] = []
-    noise_scores: List[float] = []
-
-    for prompt in quality_prompts:
-        inputs = _CLAP_PROCESSOR(
-            text=[prompt],
-            audios=[audio_data],
-            return_tensors="pt",
-            sampling_rate=sample_rate,
-        )
-        with torch.no_grad():
-            outputs = _CLAP_MODEL(**inputs)
-            score = torch.cosine_similarity(outputs.audio_embeds, outputs.text_embeds).item()
-            quality_scores.append(float(score))
-
-    for prompt in noise_prompts:
-        inputs = _CLAP_PROCESSOR(
-            text=[prompt],
-            audios=[audio_data],
-            return_tensors="pt",
-            sampling_rate=sample_rate,
-        )
-        with torch.no_grad():
-            outputs = _CLAP_MODEL(**inputs)
-            score = torch.cosine_similarity(outputs.audio_embeds, outputs.text_embeds).item()
-            noise_scores.append(float(score))
-
-    quality_score = sum(quality_scores) / len(quality_scores) if quality_scores else 0.0
-    noise_score = sum(noise_scores) / len(noise_scores) if noise_scores else 0.0
-    quality_confidence = max(0.0, (quality_score - noise_score))
-
-    return {
-        "quality_score": quality_score,
-        "noise_score": noise_score,
-        "quality_confidence": quality_confidence,
-    }
+
+def assess_audio_quality_batch(
+    audios: Sequence[Any],
+    sample_rate: int = CLAP_SAMPLE_RATE,
+) -> List[Dict[str, Any]]:
+    """Assess a batch of decoded clips: one audio encode per clip, one matmul for all prompts."""
+    if not len(audios):
+        return []
+    return score_audio_embeddings(embed_audio(audios, sample_rate), prompt_embeddings())
+
+
+def assess_audio_quality_with_clap(
+    audio_file_path: str,
+    audio_data: Optional[Any] = None,
+    sample_rate: int = CLAP_SAMPLE_RATE,
+) -> Dict[str, Any]:
+    """Assess perceptual audio quality using CLAP similarity prompts.
+
+    Pass ``audio_data`` (mono, ``sample_rate`` Hz) to reuse audio that was
+    already decoded; otherwise the file is loaded at 48 kHz. The clip is
+    encoded once and compared with the cached prompt embeddings.
+
+    Returns keys: quality_score, noise_score, quality_confidence
+    """
+    if audio_data is None:
+        import librosa  # type: ignore
+
+        audio_data, sample_rate = librosa.load(audio_file_path, sr=CLAP_SAMPLE_RATE)
+
+    return assess_audio_quality_batch([audio_data], sample_rate)[0]
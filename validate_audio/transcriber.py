@@ -1,5 +1,7 @@
 from typing import Optional, Dict, Any
 
+WHISPER_SAMPLE_RATE = 16000
+
 
 class WhisperTranscriber:
     """Transcribe speech to text using OpenAI Whisper (openai-whisper library)."""
@@ -33,7 +35,9 @@ class WhisperTranscriber:
         language: Optional[str] = None,
         temperature: float = 0.0,
         without_timestamps: bool = True,
+        audio: Optional[Any] = None,
     ) -> Dict[str, Any]:
+        """Transcribe a file; pass ``audio`` (16 kHz mono float32) to skip decoding it again."""
         self._ensure_model()
         try:
             print(f"[whisper] transcribing: {audio_file_path} (model={self._model_size})", flush=True)
@@ -42,7 +46,7 @@ class WhisperTranscriber:
 
         # The openai-whisper API returns a dict with keys like 'text', 'segments', and 'language'
         result = self._model.transcribe(
-            audio=audio_file_path,
+            audio=audio_file_path if audio is None else audio,
             language=language,
             temperature=temperature,
             condition_on_previous_text=False,
@@ -78,7 +82,8 @@ class GoogleSRTranscriber:
         self._recognizer = sr.Recognizer()
         self._language = language
 
-    def transcribe(self, audio_file_path: str, language: Optional[str] = None) -> Dict[str, Any]:
+    def transcribe(self, audio_file_path: str, language: Optional[str] = None, audio: Optional[Any] = None) -> Dict[str, Any]:
+        # SpeechRecognition reads the file itself; pre-decoded audio is ignored
         lang = language or self._language
         with self._sr.AudioFile(audio_file_path) as source:
             audio_data = self._recognizer.record(source)
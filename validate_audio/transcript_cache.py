@@ -0,0 +1,195 @@
+"""
+Persistent ASR transcript store for incremental re-validation.
+
+After a partial regen most clips of a locale are byte-identical, but every
+validation run used to re-transcribe all of them with Whisper. Transcripts
+are stored in SQLite keyed by (content MD5, backend, model_size, language),
+so unchanged clips skip ASR and only the cheap text metrics are recomputed.
+CLAP quality results are stored alongside, keyed by (content MD5, CLAP model).
+
+A regenerated clip has new bytes and therefore a new MD5, so stale entries
+are never returned; they are simply left behind.
+
+:class:`TextEmbeddingCache` keeps sentence embeddings of expected texts for
+the meaning-similarity metric, keyed by (model name, text SHA-256); the
+expected texts of a locale rarely change between runs.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+
+DEFAULT_CACHE_PATH = str(Path(__file__).resolve().parent / ".cache" / "transcripts.sqlite")
+DEFAULT_EMBEDDING_CACHE_PATH = str(Path(__file__).resolve().parent / ".cache" / "text_embeddings.sqlite")
+
+
+def file_md5(path: str, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.md5()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class TranscriptCache:
+    """SQLite-backed transcript and quality store; safe to share between threads."""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH) -> None:
+        self.path = path
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS transcripts (
+                md5 TEXT NOT NULL,
+                backend TEXT NOT NULL,
+                model_size TEXT NOT NULL,
+                language TEXT NOT NULL,
+                text TEXT NOT NULL,
+                detected_language TEXT,
+                confidence REAL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (md5, backend, model_size, language)
+            )
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS quality (
+                md5 TEXT NOT NULL,
+                model_name TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (md5, model_name)
+            )
+            """
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _key(md5: str, backend: str, model_size: Optional[str], language: Optional[str]):
+        # Google SR has no model size; an unset language means auto-detect
+        return (md5, backend, model_size if backend == "whisper" else "", language or "")
+
+    def get_transcript(self, md5: str, backend: str, model_size: Optional[str], language: Optional[str]) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT text, detected_language, confidence FROM transcripts "
+                "WHERE md5 = ? AND backend = ? AND model_size = ? AND language = ?",
+                self._key(md5, backend, model_size, language),
+            ).fetchone()
+        if row is None:
+            return None
+        return {"text": row[0], "segments": [], "language": row[1], "confidence": row[2], "cached": True}
+
+    def put_transcript(
+        self,
+        md5: str,
+        backend: str,
+        model_size: Optional[str],
+        language: Optional[str],
+        result: Dict[str, Any],
+    ) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO transcripts VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    *self._key(md5, backend, model_size, language),
+                    str(result.get("text", "") or ""),
+                    result.get("language"),
+                    result.get("confidence"),
+                    time.time(),
+                ),
+            )
+            self._conn.commit()
+
+    def get_quality(self, md5: str, model_name: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM quality WHERE md5 = ? AND model_name = ?", (md5, model_name)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put_quality(self, md5: str, model_name: str, quality: Dict[str, Any]) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO quality VALUES (?, ?, ?, ?)",
+                (md5, model_name, json.dumps(quality), time.time()),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def text_sha256(text: str) -> str:
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+
+
+class TextEmbeddingCache:
+    """SQLite-backed float32 sentence embeddings per (model, text); safe to share between threads."""
+
+    def __init__(self, path: str = DEFAULT_EMBEDDING_CACHE_PATH) -> None:
+        self.path = path
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                model_name TEXT NOT NULL,
+                text_sha256 TEXT NOT NULL,
+                dim INTEGER NOT NULL,
+                vector BLOB NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (model_name, text_sha256)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get_many(self, model_name: str, texts: Sequence[str]) -> Dict[str, np.ndarray]:
+        """Return ``{text: vector}`` for the texts already stored for this model."""
+        by_hash = {text_sha256(text): text for text in texts}
+        found: Dict[str, np.ndarray] = {}
+        hashes = list(by_hash)
+        with self._lock:
+            for start in range(0, len(hashes), 500):
+                chunk = hashes[start:start + 500]
+                rows = self._conn.execute(
+                    "SELECT text_sha256, dim, vector FROM embeddings WHERE model_name = ? AND text_sha256 IN "
+                    f"({','.join('?' * len(chunk))})",
+                    (model_name, *chunk),
+                ).fetchall()
+                for digest, dim, blob in rows:
+                    found[by_hash[digest]] = np.frombuffer(blob, dtype=np.float32, count=dim)
+        return found
+
+    def put_many(self, model_name: str, texts: Sequence[str], vectors: np.ndarray) -> None:
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?, ?)",
+                [
+                    (model_name, text_sha256(text), int(vector.shape[0]), vector.tobytes(), now)
+                    for text, vector in zip(texts, vectors)
+                ],
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
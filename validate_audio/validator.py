@@ -1,13 +1,368 @@
-from typing import Optional, Dict, Any, List
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Callable, Iterator, Tuple
 from pathlib import Path
 
 from .id3_utils import read_expected_text_from_audio
-from .transcriber import WhisperTranscriber, GoogleSRTranscriber
-from .metrics import compute_basic_metrics, comprehensive_text_similarity, validate_elevenlabs_audio, crosslingual_meaning_similarity
+from .transcriber import WhisperTranscriber, GoogleSRTranscriber, WHISPER_SAMPLE_RATE
+from .transcript_cache import TextEmbeddingCache, TranscriptCache, file_md5
+from .metrics import MetricsEngine, get_metrics_engine, crosslingual_meaning_similarity_batch, MEANING_BATCH_SIZE
 try:
-    from .quality import assess_audio_quality_with_clap
+    from .quality import assess_audio_quality_with_clap, assess_audio_quality_batch, CLAP_SAMPLE_RATE, CLAP_MODEL_NAME
 except Exception:  # pragma: no cover
     assess_audio_quality_with_clap = None  # type: ignore
+    assess_audio_quality_batch = None  # type: ignore
+    CLAP_SAMPLE_RATE = 48000
+    CLAP_MODEL_NAME = "laion/larger_clap_music_and_speech"
+
+
+# Transcribers are cached per (backend, model size, language) so every
+# session in the process shares one loaded Whisper checkpoint.
+_TRANSCRIBERS: Dict[Tuple[str, str, Optional[str]], Any] = {}
+
+
+def get_transcriber(backend: str = "whisper", model_size: str = "base", language: Optional[str] = None):
+    """Return the process-wide transcriber for these settings."""
+    if backend == "google":
+        key = ("google", "", language)
+        if key not in _TRANSCRIBERS:
+            _TRANSCRIBERS[key] = GoogleSRTranscriber(language=language)
+    else:
+        key = ("whisper", model_size, None)
+        if key not in _TRANSCRIBERS:
+            _TRANSCRIBERS[key] = WhisperTranscriber(model_size=model_size)
+    return _TRANSCRIBERS[key]
+
+
+def decode_audio(audio_file_path: str, include_quality: bool = True) -> Dict[str, Any]:
+    """Decode a file once for both ASR and CLAP.
+
+    Returns a dict with ``asr`` (16 kHz mono float32 for Whisper) and, when
+    ``include_quality`` is set, ``clap`` (48 kHz mono) plus ``clap_sr``.
+    Missing decoders yield an empty dict, in which case each stage reads the
+    file itself as before.
+    """
+    try:
+        import librosa  # type: ignore
+    except Exception:
+        librosa = None  # type: ignore
+
+    if librosa is not None:
+        if include_quality:
+            clap, sr = librosa.load(audio_file_path, sr=CLAP_SAMPLE_RATE, mono=True)
+            asr = librosa.resample(clap, orig_sr=sr, target_sr=WHISPER_SAMPLE_RATE)
+            return {"asr": asr.astype("float32", copy=False), "clap": clap, "clap_sr": sr}
+        asr, _sr = librosa.load(audio_file_path, sr=WHISPER_SAMPLE_RATE, mono=True)
+        return {"asr": asr.astype("float32", copy=False)}
+
+    try:
+        from whisper.audio import load_audio  # type: ignore
+    except Exception:
+        return {}
+    return {"asr": load_audio(audio_file_path, sr=WHISPER_SAMPLE_RATE)}
+
+
+class ValidationSession:
+    """Validate many files with models loaded once and decoding overlapped with inference.
+
+    The transcriber, CLAP and the meaning-similarity model are loaded on first
+    use and kept for the whole session. Each file is decoded once (see
+    :func:`decode_audio`) and the same samples feed Whisper and CLAP. In
+    :meth:`iter_validate` a small thread pool decodes the next files while the
+    current one is being transcribed; inference itself stays on the calling
+    thread because the models are not thread-safe. CLAP quality is scored for
+    ``quality_batch_size`` clips at a time (one audio encode per clip, one
+    matrix product against the cached prompt embeddings).
+
+    With a :class:`TranscriptCache`, clips whose content MD5 was already
+    transcribed (same backend, model size and language) skip ASR, and clips
+    with a stored CLAP result skip decoding and quality scoring; only the text
+    metrics are recomputed. ``cache_hits`` / ``transcribed`` count both paths.
+
+    Meaning similarity is scored for ``meaning_batch_size`` results at a time
+    (:func:`crosslingual_meaning_similarity_batch`), with expected-text
+    embeddings kept in ``embedding_cache`` across runs. If a file fails, the
+    results finished before it are still scored and yielded before the error
+    is re-raised.
+    """
+
+    def __init__(
+        self,
+        language: Optional[str] = None,
+        backend: str = "whisper",
+        model_size: str = "base",
+        include_quality: bool = True,
+        id3_preferred_key: Optional[str] = None,
+        decode_workers: int = 2,
+        prefetch: int = 4,
+        transcriber: Optional[Any] = None,
+        audio_loader: Optional[Callable[[str, bool], Dict[str, Any]]] = None,
+        quality_scorer: Optional[Callable[..., Dict[str, Any]]] = None,
+        quality_batch_scorer: Optional[Callable[..., List[Dict[str, Any]]]] = None,
+        quality_batch_size: int = 8,
+        transcript_cache: Optional[TranscriptCache] = None,
+        metrics_engine: Optional[MetricsEngine] = None,
+        meaning_scorer: Optional[Callable[[List[Tuple[str, str]]], List[Optional[float]]]] = None,
+        meaning_batch_size: int = MEANING_BATCH_SIZE,
+        embedding_cache: Optional[TextEmbeddingCache] = None,
+    ) -> None:
+        self.language = language
+        self.backend = backend
+        self.model_size = model_size
+        self.include_quality = include_quality
+        self.id3_preferred_key = id3_preferred_key
+        self.decode_workers = max(1, int(decode_workers))
+        self.prefetch = max(1, int(prefetch))
+        self._transcriber = transcriber
+        self._audio_loader = audio_loader or decode_audio
+        self._quality_scorer = quality_scorer if quality_scorer is not None else assess_audio_quality_with_clap
+        if quality_batch_scorer is None and quality_scorer is None:
+            quality_batch_scorer = assess_audio_quality_batch
+        self._quality_batch_scorer = quality_batch_scorer
+        self.quality_batch_size = max(1, int(quality_batch_size))
+        self.transcript_cache = transcript_cache
+        self.metrics_engine = metrics_engine or get_metrics_engine()
+        self.meaning_batch_size = max(1, int(meaning_batch_size))
+        self.embedding_cache = embedding_cache
+        self._meaning_scorer = meaning_scorer or self._score_meaning_pairs
+        self.cache_hits = 0
+        self.transcribed = 0
+        self.timings: Dict[str, float] = {"decode": 0.0, "asr": 0.0, "quality": 0.0, "metrics": 0.0, "meaning": 0.0}
+
+    @property
+    def transcriber(self):
+        if self._transcriber is None:
+            self._transcriber = get_transcriber(self.backend, self.model_size, self.language)
+        return self._transcriber
+
+    def _cache_lookup(self, audio_file_path: str) -> Dict[str, Any]:
+        if self.transcript_cache is None:
+            return {}
+        try:
+            md5 = file_md5(audio_file_path)
+        except OSError:
+            return {}
+        found: Dict[str, Any] = {"md5": md5}
+        found["transcript"] = self.transcript_cache.get_transcript(md5, self.backend, self.model_size, self.language)
+        if self.include_quality:
+            found["cached_quality"] = self.transcript_cache.get_quality(md5, CLAP_MODEL_NAME)
+        return found
+
+    def decode(self, audio_file_path: str) -> Dict[str, Any]:
+        """Decode one file; decoding errors fall back to per-stage file reads.
+
+        Cached transcript/quality results are looked up first; a clip with
+        nothing left to compute is not decoded at all.
+        """
+        start = time.perf_counter()
+        cached = self._cache_lookup(audio_file_path)
+        needs_asr = cached.get("transcript") is None
+        needs_quality = self.include_quality and cached.get("cached_quality") is None
+        try:
+            if not (needs_asr or needs_quality):
+                return cached
+            decoded = self._audio_loader(audio_file_path, needs_quality) or {}
+            decoded.update(cached)
+            return decoded
+        except Exception as exc:
+            print(f"[validate] decode failed for {audio_file_path}: {exc}", flush=True)
+            return cached
+        finally:
+            self.timings["decode"] += time.perf_counter() - start
+
+    def validate(
+        self,
+        audio_file_path: str,
+        expected_text: Optional[str] = None,
+        decoded: Optional[Dict[str, Any]] = None,
+        quality: Optional[Dict[str, Any]] = None,
+        score_meaning: bool = True,
+    ) -> Dict[str, Any]:
+        """Validate a single audio file against expected text using transcription and metrics.
+
+        ``quality`` may carry a CLAP result already computed for this clip (see
+        :meth:`score_quality_batch`); otherwise it is scored here. With
+        ``score_meaning=False`` the meaning similarity is left ``None`` for
+        :meth:`score_meaning_batch` to fill in.
+        """
+        audio_path = str(Path(audio_file_path))
+        if decoded is None:
+            decoded = self.decode(audio_path)
+
+        # 1) Resolve expected text
+        expected = (expected_text or "").strip() or read_expected_text_from_audio(
+            audio_file_path=audio_path, preferred_key=self.id3_preferred_key
+        ) or ""
+
+        # 2) Transcribe (pre-decoded samples when available), unless this content was already transcribed
+        md5 = decoded.get("md5")
+        result = decoded.get("transcript")
+        if result is not None:
+            self.cache_hits += 1
+        else:
+            start = time.perf_counter()
+            result = self.transcriber.transcribe(audio_path, language=self.language, audio=decoded.get("asr"))
+            self.timings["asr"] += time.perf_counter() - start
+            self.transcribed += 1
+            if self.transcript_cache is not None and md5:
+                self.transcript_cache.put_transcript(md5, self.backend, self.model_size, self.language, result)
+        transcribed_text = result.get("text", "").strip()
+
+        # 3) Enhanced Metrics - Use the new comprehensive validation
+        start = time.perf_counter()
+        # Old basic/comprehensive metrics are kept for backward compatibility; text is preprocessed once for all three
+        metrics = self.metrics_engine.score_many([(expected, transcribed_text)], self.language)[0]
+        self.timings["metrics"] += time.perf_counter() - start
+
+        # 4) Quality (same decoded samples as ASR)
+        if quality is None and self.include_quality:
+            quality = decoded.get("cached_quality")
+        if quality is None and self.include_quality and self._quality_scorer is not None:
+            start = time.perf_counter()
+            try:
+                if decoded.get("clap") is not None:
+                    quality = self._quality_scorer(audio_path, audio_data=decoded["clap"], sample_rate=decoded["clap_sr"])
+                else:
+                    quality = self._quality_scorer(audio_path)
+            except Exception:
+                quality = None
+            self.timings["quality"] += time.perf_counter() - start
+        if quality is not None and self.transcript_cache is not None and md5 and decoded.get("cached_quality") is None:
+            self.transcript_cache.put_quality(md5, CLAP_MODEL_NAME, quality)
+
+        # 5) Aggregate - Include both old and new metrics
+        result = {
+            "audio_path": audio_path,
+            "language": result.get("language") or self.language,
+            "backend": self.backend,
+            "whisper_model_size": self.model_size if self.backend == "whisper" else None,
+            "expected_text": expected,
+            "transcribed_text": transcribed_text,
+            "confidence": result.get("confidence"),
+            "basic_metrics": metrics["basic_metrics"],
+            "comprehensive_metrics": metrics["comprehensive_metrics"],
+            "meaning_similarity": None,
+            "elevenlabs_validation": metrics["elevenlabs_validation"],
+            "quality": quality,
+        }
+
+        # 6) Meaning similarity using multilingual sentence-transformer (optional dependency)
+        if score_meaning:
+            self.score_meaning_batch([result])
+        return result
+
+    def _score_meaning_pairs(self, pairs: List[Tuple[str, str]]) -> List[Optional[float]]:
+        return crosslingual_meaning_similarity_batch(
+            pairs, batch_size=self.meaning_batch_size, embedding_cache=self.embedding_cache
+        )
+
+    def score_meaning_batch(self, results: List[Dict[str, Any]]) -> None:
+        """Fill ``meaning_similarity`` for validation results with one batched encode."""
+        if not results:
+            return
+        start = time.perf_counter()
+        try:
+            scores = self._meaning_scorer([(r["expected_text"], r["transcribed_text"]) for r in results])
+        except Exception as exc:
+            print(f"[meaning] scoring failed: {exc}", flush=True)
+            scores = [None] * len(results)
+        for result, score in zip(results, scores):
+            result["meaning_similarity"] = score
+        self.timings["meaning"] += time.perf_counter() - start
+
+    def score_quality_batch(self, decoded_batch: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """CLAP scores for a block of decoded clips; ``None`` entries are scored per file later."""
+        scores: List[Optional[Dict[str, Any]]] = [None] * len(decoded_batch)
+        if not self.include_quality or self._quality_batch_scorer is None:
+            return scores
+        positions = [i for i, d in enumerate(decoded_batch) if d.get("clap") is not None]
+        if not positions:
+            return scores
+        start = time.perf_counter()
+        try:
+            batch = self._quality_batch_scorer(
+                [decoded_batch[i]["clap"] for i in positions],
+                decoded_batch[positions[0]]["clap_sr"],
+            )
+            for i, result in zip(positions, batch):
+                scores[i] = result
+        except Exception as exc:
+            print(f"[quality] batch scoring failed, scoring per file: {exc}", flush=True)
+        self.timings["quality"] += time.perf_counter() - start
+        return scores
+
+    def iter_validate(
+        self,
+        audio_paths: List[str],
+        expected_texts: Optional[List[Optional[str]]] = None,
+        progress: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield one result per path, in order, decoding up to ``prefetch`` files ahead.
+
+        Results are held back until ``meaning_batch_size`` of them can be
+        scored for meaning similarity together.
+        """
+        finished: List[Dict[str, Any]] = []
+        source = self._iter_unscored(audio_paths, expected_texts, progress)
+        try:
+            while True:
+                try:
+                    result = next(source)
+                except StopIteration:
+                    break
+                except BaseException:
+                    # Keep work already done (e.g. for --resume) before surfacing the error
+                    self.score_meaning_batch(finished)
+                    yield from finished
+                    raise
+                finished.append(result)
+                if len(finished) >= self.meaning_batch_size:
+                    self.score_meaning_batch(finished)
+                    yield from finished
+                    finished = []
+            self.score_meaning_batch(finished)
+            yield from finished
+        finally:
+            source.close()
+
+    def _iter_unscored(
+        self,
+        audio_paths: List[str],
+        expected_texts: Optional[List[Optional[str]]],
+        progress: bool,
+    ) -> Iterator[Dict[str, Any]]:
+        total = len(audio_paths)
+        with ThreadPoolExecutor(max_workers=self.decode_workers) as pool:
+            pending: deque = deque()
+            next_idx = 0
+            for block_start in range(0, total, self.quality_batch_size):
+                block = range(block_start, min(total, block_start + self.quality_batch_size))
+                decoded_block = []
+                for idx in block:
+                    while next_idx < total and next_idx < idx + max(self.prefetch, self.quality_batch_size):
+                        pending.append(pool.submit(self.decode, audio_paths[next_idx]))
+                        next_idx += 1
+                    decoded_block.append(pending.popleft().result())
+                qualities = self.score_quality_batch(decoded_block)
+
+                for idx, decoded, quality in zip(block, decoded_block, qualities):
+                    audio_file = audio_paths[idx]
+                    if progress:
+                        # Print a heartbeat every file, include simple percentage every 10 files
+                        if idx == 0:
+                            print(f"[validate] 1/{total}: {audio_file}", flush=True)
+                        elif (idx + 1) % 10 == 0 or (idx + 1) == total:
+                            pct = int(((idx + 1) / total) * 100)
+                            print(f"[validate] {idx+1}/{total} ({pct}%)", flush=True)
+                        else:
+                            print(f"[validate] {idx+1}/{total}: {audio_file}", flush=True)
+                    expected = None
+                    if expected_texts and idx < len(expected_texts):
+                        expected = expected_texts[idx]
+                    yield self.validate(
+                        audio_file, expected_text=expected, decoded=decoded, quality=quality, score_meaning=False
+                    )
 
 
 def validate_audio_file(
@@ -23,60 +378,14 @@ def validate_audio_file(
 
     backend: "whisper" or "google"
     """
-    audio_path = str(Path(audio_file_path))
-
-    # 1) Resolve expected text
-    expected = (expected_text or "").strip() or read_expected_text_from_audio(
-        audio_file_path=audio_path, preferred_key=id3_preferred_key
-    ) or ""
-
-    # 2) Transcribe
-    if backend == "google":
-        transcriber = GoogleSRTranscriber(language=language)
-        result = transcriber.transcribe(audio_path, language=language)
-    else:
-        transcriber = WhisperTranscriber(model_size=model_size)
-        result = transcriber.transcribe(audio_path, language=language)
-
-    transcribed_text = result.get("text", "").strip()
-
-    # 3) Enhanced Metrics - Use the new comprehensive validation
-    elevenlabs_validation = validate_elevenlabs_audio(expected, transcribed_text, language)
-    
-    # Keep the old metrics for backward compatibility
-    basic = compute_basic_metrics(expected, transcribed_text)
-    comp = comprehensive_text_similarity(expected, transcribed_text)
-
-    # 4) Quality
-    quality: Optional[Dict[str, Any]] = None
-    if include_quality and assess_audio_quality_with_clap is not None:
-        try:
-            quality = assess_audio_quality_with_clap(audio_path)
-        except Exception:
-            quality = None
-
-    # 5) Meaning similarity using multilingual sentence-transformer (optional dependency)
-    meaning_similarity = None
-    try:
-        meaning_similarity = crosslingual_meaning_similarity(expected, transcribed_text)
-    except Exception:
-        meaning_similarity = None
-
-    # 6) Aggregate - Include both old and new metrics
-    return {
-        "audio_path": audio_path,
-        "language": result.get("language") or language,
-        "backend": backend,
-        "whisper_model_size": model_size if backend == "whisper" else None,
-        "expected_text": expected,
-        "transcribed_text": transcribed_text,
-        "confidence": result.get("confidence"),
-        "basic_metrics": basic,
-        "comprehensive_metrics": comp,
-        "meaning_similarity": meaning_similarity,
-        "elevenlabs_validation": elevenlabs_validation,
-        "quality": quality,
-    }
+    session = ValidationSession(
+        language=language,
+        backend=backend,
+        model_size=model_size,
+        include_quality=include_quality,
+        id3_preferred_key=id3_preferred_key,
+    )
+    return session.validate(audio_file_path, expected_text=expected_text)
 
 
 def validate_many(
@@ -88,31 +397,15 @@ def validate_many(
     include_quality: bool = True,
     id3_preferred_key: Optional[str] = None,
     progress: bool = False,
+    session: Optional[ValidationSession] = None,
+    meaning_batch_size: int = MEANING_BATCH_SIZE,
 ) -> List[Dict[str, Any]]:
-    results: List[Dict[str, Any]] = []
-    total = len(audio_paths)
-    for idx, audio_file in enumerate(audio_paths):
-        if progress:
-            # Print a heartbeat every file, include simple percentage every 10 files
-            if idx == 0:
-                print(f"[validate] 1/{total}: {audio_file}", flush=True)
-            elif (idx + 1) % 10 == 0 or (idx + 1) == total:
-                pct = int(((idx + 1) / total) * 100)
-                print(f"[validate] {idx+1}/{total} ({pct}%)", flush=True)
-            else:
-                print(f"[validate] {idx+1}/{total}: {audio_file}", flush=True)
-        expected = None
-        if expected_texts and idx < len(expected_texts):
-            expected = expected_texts[idx]
-        results.append(
-            validate_audio_file(
-                audio_file_path=audio_file,
-                expected_text=expected,
-                language=language,
-                backend=backend,
-                model_size=model_size,
-                include_quality=include_quality,
-                id3_preferred_key=id3_preferred_key,
-            )
-        )
-    return results
+    session = session or ValidationSession(
+        language=language,
+        backend=backend,
+        model_size=model_size,
+        include_quality=include_quality,
+        id3_preferred_key=id3_preferred_key,
+        meaning_batch_size=meaning_batch_size,
+    )
+    return list(session.iter_validate(audio_paths, expected_texts=expected_texts, progress=progress))
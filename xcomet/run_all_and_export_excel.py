@@ -3,12 +3,17 @@ import argparse
 import subprocess
 import re
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 
 import pandas as pd
 from openpyxl import Workbook, load_workbook
 from openpyxl.styles import PatternFill, Font, Alignment
 
+try:
+    from xcomet import run_xcomet as rx
+except ModuleNotFoundError:
+    import run_xcomet as rx
+
 
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description='Run XCOMET/COMETKiwi for all languages and export a multi-sheet Excel with a Summary tab.')
@@ -20,6 +25,9 @@ def parse_args() -> argparse.Namespace:
     p.add_argument('--use_cli', action='store_true', help='Use CLI instead of API')
     p.add_argument('--gpu', action='store_true', help='Use GPU if available (API) or pass --gpus 1 to CLI')
     p.add_argument('--matmul', choices=['medium', 'high'], help='If using GPU (API), set torch.set_float32_matmul_precision to this value')
+    p.add_argument('--subprocess_per_lang', action='store_true', help='API mode: run run_xcomet.py once per language (reloads the model each time) instead of scoring all languages in this process')
+    p.add_argument('--cache_path', default=rx.cc.DEFAULT_CACHE_PATH, help=f'Segment score cache shared across runs (API mode; default: {rx.cc.DEFAULT_CACHE_PATH})')
+    p.add_argument('--no_cache', action='store_true', help='Re-score every segment instead of reusing cached scores')
     p.add_argument('--excel', type=Path, default=Path('xcomet/output/levante_comet_scores.xlsx'), help='Output Excel path')
     return p.parse_args()
 
@@ -58,7 +66,7 @@ def infer_languages(csv_loc: str, source_col: str = 'en') -> List[str]:
     return langs
 
 
-def run_single_language(lang: str, csv_loc: str, out_dir: Path, use_api: bool, gpu: bool, use_cli: bool, matmul: Optional[str], source_col: str = 'en') -> Tuple[Path, Path]:
+def run_single_language(lang: str, csv_loc: str, out_dir: Path, use_api: bool, gpu: bool, use_cli: bool, matmul: Optional[str], source_col: str = 'en', cache_path: Optional[str] = None) -> Tuple[Path, Path]:
     lang_dir = out_dir / lang
     lang_dir.mkdir(parents=True, exist_ok=True)
 
@@ -78,6 +86,10 @@ def run_single_language(lang: str, csv_loc: str, out_dir: Path, use_api: bool, g
         cmd.append('--gpu')
     if matmul:
         cmd.extend(['--matmul', matmul])
+    if cache_path:
+        cmd.extend(['--cache_path', cache_path])
+    else:
+        cmd.append('--no_cache')
 
     print('Running:', ' '.join(cmd))
     subprocess.check_call(cmd)
@@ -86,6 +98,49 @@ def run_single_language(lang: str, csv_loc: str, out_dir: Path, use_api: bool, g
     return lang_dir / 'segment_scores.csv', lang_dir / 'segment_scores.md'
 
 
+def run_languages_in_process(langs: List[str], csv_loc: str, out_dir: Path, gpu: bool, matmul: Optional[str], source_col: str = 'en', model: str = 'Unbabel/XCOMET-XL', cache_path: Optional[str] = None) -> Dict[str, Path]:
+    """
+    API mode for all languages in one process: load the COMET model once and
+    score every language in a single length-sorted ``predict`` call.
+    With ``cache_path``, segments scored by an earlier run are reused and only
+    new or edited ones are sent to the model.
+
+    Writes the same per-language files as ``run_xcomet.py --use_api
+    --allow_qe_fallback`` and returns each language's segment_scores.csv.
+    """
+    if gpu and matmul:
+        try:
+            import torch
+            if hasattr(torch, 'set_float32_matmul_precision'):
+                torch.set_float32_matmul_precision(matmul)
+                print(f"Set torch.set_float32_matmul_precision('{matmul}')")
+        except Exception as e:
+            print(f"Warning: could not set matmul precision: {e}")
+
+    # No references in the Levante CSV, so this resolves to the QE model as in the per-language runs
+    model = rx.resolve_model(model, has_ref=False, allow_qe_fallback=True)
+    inputs_by_lang: Dict[str, rx.Inputs] = {}
+    scores_jsons: Dict[str, Path] = {}
+    for lang in langs:
+        item_ids, src, hyp = rx.load_csv_rows(csv_loc, lang, source_col=source_col)
+        lang_dir = out_dir / lang
+        inputs = rx.Inputs(src=src, hyp=hyp, ref=None, item_ids=item_ids)
+        rx.write_parallel_texts(lang_dir, inputs)
+        inputs_by_lang[lang] = inputs
+        scores_jsons[lang] = lang_dir / 'scores.json'
+
+    print(f'Scoring {sum(len(i.src) for i in inputs_by_lang.values())} segments in {len(langs)} languages with {model} (one model load)')
+    cache = rx.cc.CometScoreCache(cache_path, model) if cache_path else None
+    rx.run_api_multi(model, inputs_by_lang, scores_jsons, spans=False, force_gpu=gpu, matmul=matmul, cache=cache)
+
+    csv_paths = {}
+    for lang in langs:
+        _, table_csv, _ = rx.write_language_outputs(out_dir / lang, inputs_by_lang[lang].item_ids, scores_jsons[lang])
+        print(f'Wrote: {table_csv}')
+        csv_paths[lang] = table_csv
+    return csv_paths
+
+
 def color_code_worksheet(ws):
     headers = [cell.value for cell in ws[1]]
     try:
@@ -209,11 +264,19 @@ def main():
     if not langs:
         raise SystemExit('No language columns detected. Use --langs to specify, e.g., es-CO,de,fr-CA')
 
+    use_api = args.use_api or not args.use_cli
+    cache_path = None if args.no_cache else args.cache_path
+    if use_api and not args.subprocess_per_lang:
+        csv_paths = run_languages_in_process(langs, csv_loc, args.out_dir, gpu=args.gpu, matmul=args.matmul, source_col=args.source_col, cache_path=cache_path)
+    else:
+        csv_paths = {}
+        for lang in langs:
+            csv_paths[lang], _ = run_single_language(lang, csv_loc, args.out_dir, use_api=use_api, gpu=args.gpu, use_cli=args.use_cli, matmul=args.matmul, source_col=args.source_col, cache_path=cache_path)
+
     # Collect per-language DataFrames and summary stats
     per_lang = []
     for lang in langs:
-        csv_path, _ = run_single_language(lang, csv_loc, args.out_dir, use_api=args.use_api or not args.use_cli, gpu=args.gpu, use_cli=args.use_cli, matmul=args.matmul, source_col=args.source_col)
-        df = pd.read_csv(csv_path)
+        df = pd.read_csv(csv_paths[lang])
         # Rename columns
         rename_map = {}
         if 'source' in df.columns:
@@ -4,13 +4,21 @@ import csv
 import json
 import os
 import subprocess
+import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 from tqdm import tqdm
 
+try:
+    from translation_grading import comet_cache as cc
+except ModuleNotFoundError:
+    # Run as a script from xcomet/: make the repo root importable
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    from translation_grading import comet_cache as cc
+
 
 @dataclass
 class Inputs:
@@ -85,22 +93,49 @@ def run_cli(model: str, src: Path, hyp: Path, ref: Optional[Path], out_json: Pat
     subprocess.check_call(cmd)
 
 
-def run_api(model: str, inputs: Inputs, out_json: Path, spans: bool, force_gpu: Optional[bool] = None, matmul: Optional[str] = None):
+QE_CANDIDATES = ['Unbabel/wmt22-cometkiwi-da', 'Unbabel/wmt21-comet-qe-da']
+
+
+def load_comet_model(model: str):
     from comet import download_model, load_from_checkpoint
     model_path = download_model(model)
-    comet_model = load_from_checkpoint(model_path)
+    return load_from_checkpoint(model_path)
+
+
+def resolve_model(model: str, has_ref: bool, allow_qe_fallback: bool) -> str:
+    """Pick the model to score with: ``model`` itself, or the first downloadable QE model when there are no references."""
+    if not has_ref and not allow_qe_fallback and model == 'Unbabel/XCOMET-XL':
+        raise SystemExit('XCOMET-XL is reference-based. Provide --ref_csv/--ref_txt or use --allow_qe_fallback to switch to QE model.')
+    if has_ref or not allow_qe_fallback:
+        return model
+    # Try gated wmt22 QE first, then public wmt21 QE as a fallback
+    for cand in QE_CANDIDATES:
+        try:
+            from comet import download_model
+            print(f'Trying QE model: {cand}')
+            download_model(cand)
+            print(f'No references provided. Falling back to QE model: {cand}')
+            return cand
+        except Exception as e:
+            print(f'  -> Could not use {cand}: {e}')
+            continue
+    raise SystemExit('No QE model could be downloaded. Accept the model card on HF and `huggingface-cli login`, or provide references for XCOMET-XL.')
+
 
+def build_samples(inputs: Inputs) -> List[dict]:
     data = []
     for i in range(len(inputs.src)):
         sample = {
             'src': inputs.src[i],
             'mt': inputs.hyp[i],
         }
-        
         if inputs.ref is not None:
             sample['ref'] = inputs.ref[i]
         data.append(sample)
+    return data
 
+
+def predict(comet_model, data: List[dict], force_gpu: Optional[bool] = None, matmul: Optional[str] = None):
     # Decide on GPU usage
     use_gpu = False
     if force_gpu is not None:
@@ -125,12 +160,14 @@ def run_api(model: str, inputs: Inputs, out_json: Path, spans: bool, force_gpu:
             kwargs.update({'accelerator': 'gpu', 'devices': 1})
         else:
             kwargs.update({'accelerator': 'cpu', 'devices': 1})
-        predictions = comet_model.predict(data, **kwargs)
+        return comet_model.predict(data, **kwargs)
     except TypeError:
         # Older signature
-        predictions = comet_model.predict(data, batch_size=8, gpus=(1 if use_gpu else 0), progress_bar=True)
+        return comet_model.predict(data, batch_size=8, gpus=(1 if use_gpu else 0), progress_bar=True)
+
 
-    # Normalize output to always include per-segment entries
+def build_result(predictions, inputs: Inputs, spans: bool) -> dict:
+    """Normalize COMET predictions to ``{'system_score', 'segments'}`` (plus ``metadata`` with spans)."""
     system_score = predictions.get('system_score')
     segments_out = predictions.get('segments') or []
     scores_list = predictions.get('scores') or []
@@ -160,10 +197,129 @@ def run_api(model: str, inputs: Inputs, out_json: Path, spans: bool, force_gpu:
         # Keep entire object if available
         if 'metadata' in predictions:
             result['metadata'] = predictions.get('metadata')
+    return result
+
 
+def run_api(model: str, inputs: Inputs, out_json: Path, spans: bool, force_gpu: Optional[bool] = None, matmul: Optional[str] = None, comet_model=None, cache: Optional[cc.CometScoreCache] = None):
+    if cache is not None and not spans:
+        run_api_multi(model, {'_': inputs}, {'_': out_json}, spans, force_gpu=force_gpu, matmul=matmul, comet_model=comet_model, cache=cache)
+        return
+    comet_model = comet_model or load_comet_model(model)
+    predictions = predict(comet_model, build_samples(inputs), force_gpu=force_gpu, matmul=matmul)
+    result = build_result(predictions, inputs, spans)
     out_json.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding='utf-8')
 
 
+def _sample_length(sample: dict) -> int:
+    return len(sample['src']) + len(sample['mt']) + len(sample.get('ref', ''))
+
+
+def predict_by_length(comet_model, samples: List[dict], force_gpu: Optional[bool] = None, matmul: Optional[str] = None) -> Tuple[List[float], Optional[dict]]:
+    """
+    Score samples sorted longest first (little padding per batch) and return results in input order.
+
+    Returns:
+        tuple: (score per sample, prediction metadata with per-sample lists reordered to match)
+    """
+    if not samples:
+        return [], None
+    order = sorted(range(len(samples)), key=lambda k: -_sample_length(samples[k]))
+    predictions = predict(comet_model, [samples[k] for k in order], force_gpu=force_gpu, matmul=matmul)
+
+    scores_sorted = list(predictions.get('scores') or [])
+    if len(scores_sorted) != len(samples):
+        raise RuntimeError(f'COMET returned {len(scores_sorted)} scores for {len(samples)} segments')
+    position = [0] * len(samples)
+    for rank, k in enumerate(order):
+        position[k] = rank
+    metadata = predictions.get('metadata')
+    if isinstance(metadata, dict):
+        # Per-segment metadata lists (e.g. error_spans) follow the sorted order
+        metadata = {
+            key: [value[position[k]] for k in range(len(samples))]
+            if isinstance(value, list) and len(value) == len(samples) else value
+            for key, value in metadata.items()
+        }
+    return [scores_sorted[position[k]] for k in range(len(samples))], metadata
+
+
+def run_api_multi(model: str, inputs_by_lang: Dict[str, Inputs], out_jsons: Dict[str, Path], spans: bool, force_gpu: Optional[bool] = None, matmul: Optional[str] = None, comet_model=None, cache: Optional[cc.CometScoreCache] = None):
+    """
+    Score several languages with one model load and one ``predict`` call.
+
+    All segments are pooled and sorted longest first, so batches hold
+    segments of similar length (little padding) regardless of language; the
+    scores are then put back in order and split per language. Each
+    language's ``scores.json`` has the same layout as :func:`run_api` writes,
+    with the system score being the mean of that language's segment scores.
+
+    With a ``cache`` (ignored when ``spans`` is set, since spans are not
+    cached) only segments without a stored score are sent to the model, which
+    is not loaded at all when every segment is cached; the cache statistics
+    are written to each ``scores.json`` under ``cache``.
+
+    Args:
+        model: COMET model name (loaded once unless ``comet_model`` is given)
+        inputs_by_lang: Segments per language
+        out_jsons: ``scores.json`` path per language
+        spans: Also export per-segment error-span metadata, if the model provides it
+        force_gpu: Force GPU on/off (None = use it when available)
+        matmul: torch float32 matmul precision when using GPU
+        comet_model: Already-loaded model to use instead of loading ``model``
+        cache: Segment score cache for ``model``
+    """
+    samples = []
+    for inputs in inputs_by_lang.values():
+        samples.extend(build_samples(inputs))
+
+    def score(todo: List[dict]) -> List[float]:
+        nonlocal comet_model
+        comet_model = comet_model or load_comet_model(model)
+        return predict_by_length(comet_model, todo, force_gpu=force_gpu, matmul=matmul)[0]
+
+    metadata = None
+    from_cache = None
+    if cache is not None and not spans:
+        scores, from_cache, cache_stats = cc.score_samples(samples, score, cache)
+        print(f"[cache] {cache_stats['segments']} segments: {cache_stats['cached']} cached, {cache_stats['scored']} scored")
+    else:
+        comet_model = comet_model or load_comet_model(model)
+        scores, metadata = predict_by_length(comet_model, samples, force_gpu=force_gpu, matmul=matmul)
+        metadata = metadata if spans else None
+
+    offset = 0
+    for lang, inputs in inputs_by_lang.items():
+        n = len(inputs.src)
+        lang_scores = scores[offset:offset + n]
+        lang_predictions = {
+            'scores': lang_scores,
+            'system_score': sum(lang_scores) / float(n) if n else None,
+        }
+        if isinstance(metadata, dict):
+            lang_predictions['metadata'] = {
+                key: value[offset:offset + n] if isinstance(value, list) and len(value) == len(samples) else value
+                for key, value in metadata.items()
+            }
+        result = build_result(lang_predictions, inputs, spans)
+        if from_cache is not None:
+            cached = sum(from_cache[offset:offset + n])
+            result['cache'] = {'segments': n, 'cached': cached, 'scored': n - cached, 'cache_path': cache_stats['cache_path']}
+        out_jsons[lang].write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding='utf-8')
+        offset += n
+
+
+def write_language_outputs(lang_dir: Path, item_ids: List[str], scores_json: Path) -> Tuple[Path, Path, Path]:
+    """Write report.md, segment_scores.csv and segment_scores.md for one language; returns their paths."""
+    report_md = lang_dir / 'report.md'
+    generate_report(item_ids, scores_json, report_md)
+
+    # New: export per-segment tables (CSV and Markdown)
+    table_csv = lang_dir / 'segment_scores.csv'
+    table_md = lang_dir / 'segment_scores.md'
+    export_segments_table(item_ids, scores_json, table_csv, table_md)
+    return report_md, table_csv, table_md
+
+
 def _load_segments(scores_json: Path) -> Tuple[float, List[dict]]:
     """Load segments flexibly from JSON (handles CLI and API formats)."""
     data = json.loads(scores_json.read_text(encoding='utf-8'))
@@ -223,6 +379,9 @@ def generate_report(item_ids: List[str], scores_json: Path, out_md: Path):
     lines = []
     lines.append(f"# XCOMET Report\n")
     lines.append(f"System score: {system_score}\n")
+    cache = data.get('cache')
+    if cache:
+        lines.append(f"Score cache: {cache['cached']} of {cache['segments']} segments reused, {cache['scored']} scored ({cache['cache_path']})\n")
     lines.append("\n## Worst 25 segments\n")
     for s in worst:
         iid = s.get('item_id', f'idx:{segments.index(s)}')
@@ -271,6 +430,8 @@ def main():
     p.add_argument('--allow_qe_fallback', action='store_true', help='If no ref, allow fallback to QE model')
     p.add_argument('--gpu', action='store_true', help='Force GPU if available (Python API); CLI path adds --gpus 1')
     p.add_argument('--matmul', choices=['medium','high'], help="If using GPU (API), set torch.set_float32_matmul_precision to this value for Tensor Cores")
+    p.add_argument('--cache_path', default=cc.DEFAULT_CACHE_PATH, help=f'Segment score cache shared across runs (Python API only; default: {cc.DEFAULT_CACHE_PATH})')
+    p.add_argument('--no_cache', action='store_true', help='Re-score every segment instead of reusing cached scores')
 
     args = p.parse_args()
 
@@ -295,28 +456,7 @@ def main():
             raise ValueError(f'Ref CSV missing {args.lang} column')
         ref = df_ref[args.lang].astype(str).fillna('').tolist()
 
-    if ref is None and not args.allow_qe_fallback and args.model == 'Unbabel/XCOMET-XL':
-        raise SystemExit('XCOMET-XL is reference-based. Provide --ref_csv/--ref_txt or use --allow_qe_fallback to switch to QE model.')
-
-    model = args.model
-    if ref is None and args.allow_qe_fallback:
-        # Try gated wmt22 QE first, then public wmt21 QE as a fallback
-        qe_candidates = ['Unbabel/wmt22-cometkiwi-da', 'Unbabel/wmt21-comet-qe-da']
-        chosen = None
-        for cand in qe_candidates:
-            try:
-                from comet import download_model
-                print(f'Trying QE model: {cand}')
-                download_model(cand)
-                chosen = cand
-                break
-            except Exception as e:
-                print(f'  -> Could not use {cand}: {e}')
-                continue
-        if not chosen:
-            raise SystemExit('No QE model could be downloaded. Accept the model card on HF and `huggingface-cli login`, or provide references for XCOMET-XL.')
-        model = chosen
-        print(f'No references provided. Falling back to QE model: {model}')
+    model = resolve_model(args.model, has_ref=ref is not None, allow_qe_fallback=args.allow_qe_fallback)
 
     lang_dir = args.out_dir / args.lang
     lang_dir.mkdir(parents=True, exist_ok=True)
@@ -329,15 +469,10 @@ def main():
     if args.use_cli:
         run_cli(model, src_path, hyp_path, ref_path, scores_json, use_gpu=args.gpu)
     else:
-        run_api(model, inputs, scores_json, spans=args.spans, force_gpu=args.gpu, matmul=args.matmul)
-
-    report_md = lang_dir / 'report.md'
-    generate_report(item_ids, scores_json, report_md)
+        cache = None if args.no_cache else cc.CometScoreCache(args.cache_path, model)
+        run_api(model, inputs, scores_json, spans=args.spans, force_gpu=args.gpu, matmul=args.matmul, cache=cache)
 
-    # New: export per-segment tables (CSV and Markdown)
-    table_csv = lang_dir / 'segment_scores.csv'
-    table_md = lang_dir / 'segment_scores.md'
-    export_segments_table(item_ids, scores_json, table_csv, table_md)
+    report_md, table_csv, table_md = write_language_outputs(lang_dir, item_ids, scores_json)
 
     print(f'Wrote: {scores_json}')
     print(f'Wrote: {report_md}')